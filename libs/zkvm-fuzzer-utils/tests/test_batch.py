@@ -0,0 +1,54 @@
+from zkvm_fuzzer_utils.batch import split_batch_exec_status
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.record import record_from_exec_status
+
+MOCK_STDOUT = """
+<batch>{"index":0, "status":"start"}</batch>
+<record>{"context": "Prover", "status": "start"}</record>
+<record>{"context": "Prover", "status": "success", "output": "1"}</record>
+<batch>{"index":0, "status":"ok", "time":1.5}</batch>
+<batch>{"index":1, "status":"start"}</batch>
+<record>{"context": "Prover", "status": "start"}</record>
+<batch>{"index":1, "status":"panic", "time":0.5}</batch>
+<batch>{"index":2, "status":"start"}</batch>
+<record>{"context": "Prover", "status": "start"}</record>
+"""
+
+MOCK_STDERR = """
+<batch>{"index":0, "status":"start"}</batch>
+<batch>{"index":0, "status":"ok", "time":1.5}</batch>
+<batch>{"index":1, "status":"start"}</batch>
+thread 'main' panicked at src/main.rs:3:5:
+boom
+note: run with `RUST_BACKTRACE=1` environment variable to display a backtrace
+<batch>{"index":1, "status":"panic", "time":0.5}</batch>
+<batch>{"index":2, "status":"start"}</batch>
+"""
+
+
+def test_split_batch_exec_status():
+    mock_exec = ExecStatus("host --batch b", MOCK_STDOUT, MOCK_STDERR, None, None, 124, 10, True)
+    statuses = split_batch_exec_status(mock_exec, 4)
+
+    assert len(statuses) == 4
+    first, second, third, fourth = statuses
+    assert first is not None and second is not None and third is not None
+    assert fourth is None
+
+    assert not first.is_failure()
+    assert first.delta_time == 1.5
+    assert record_from_exec_status(first).search_by_key("output") == "1"
+    assert "panicked" not in first.stderr
+
+    assert second.returncode == 101
+    assert not second.is_timeout
+    assert len(record_from_exec_status(second).panics) == 1
+
+    assert third.is_timeout
+    assert third.returncode == 124
+    assert third.delta_time == 8.0
+
+
+def test_split_empty_batch_exec_status():
+    mock_exec = ExecStatus("host --batch b", "", "", None, None, 1, 1)
+    assert split_batch_exec_status(mock_exec, 2) == [None, None]
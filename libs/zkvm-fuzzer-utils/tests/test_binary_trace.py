@@ -0,0 +1,56 @@
+import struct
+from enum import StrEnum
+
+import pytest
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.rust.common import trace_channel_definitions
+from zkvm_fuzzer_utils.trace import (
+    TRACE_RECORD_FORMAT,
+    TRACE_RECORD_SIZE,
+    trace_from_exec,
+)
+
+
+class InstrKind(StrEnum):
+    ADD = "add"
+    ADDI = "addi"
+    SW = "sw"
+
+
+class InjectionKind(StrEnum):
+    INSTR_WORD_MOD = "INSTR_WORD_MOD"
+
+
+def pack_records(records: list[tuple[int, int, int, int]]) -> bytes:
+    return b"".join(struct.pack(TRACE_RECORD_FORMAT, *record) for record in records)
+
+
+def test_trace_from_binary_records():
+    assert TRACE_RECORD_SIZE == 18
+
+    # NOTE: steps are repeated by some emulators and a killed host truncates the last record
+    data = pack_records([(0, 136, 1, 0x13), (1, 140, 2, 0x00112623), (1, 140, 2, 0x00112623)])
+    stdout = '<fault>{"step":1, "pc":140, "kind":"INSTR_WORD_MOD", "info":"sw"}</fault>\n'
+    status = ExecStatus("host --trace", stdout, "", None, None, 0, 1.0, trace_raw=data + b"\0\0")
+
+    trace = trace_from_exec(status, InstrKind, InjectionKind)
+    assert [(s.step, s.pc, s.instruction) for s in trace.steps] == [
+        (0, 136, InstrKind.ADDI),
+        (1, 140, InstrKind.SW),
+    ]
+    assert trace.steps[1].assembly == "sw x1, 12(x2)" and trace.steps[1].word == 0x00112623
+    assert [(f.step, f.kind) for f in trace.faults] == [(1, InjectionKind.INSTR_WORD_MOD)]
+
+
+def test_trace_from_binary_unknown_instruction():
+    status = ExecStatus("", "", "", None, None, 0, 1.0, trace_raw=pack_records([(0, 0, 0xFFFF, 0)]))
+    with pytest.raises(ValueError):
+        trace_from_exec(status, InstrKind, InjectionKind)
+
+
+def test_trace_instruction_ids():
+    definitions = trace_channel_definitions(InstrKind)
+    # NOTE: the ids are the indices parsed back by `trace_from_exec`
+    for index, kind in enumerate(InstrKind):
+        assert f"pub const TRACE_INSTRUCTION_{kind.name}: u16 = {index};" in definitions
+    assert "pub fn write_trace_record(step: u64, pc: u32, instruction_id: u16" in definitions
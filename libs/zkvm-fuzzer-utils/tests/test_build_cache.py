@@ -0,0 +1,79 @@
+import json
+import shutil
+from pathlib import Path
+
+from zkvm_fuzzer_utils.build_cache import BuildCache
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.file import create_file
+from zkvm_fuzzer_utils.rust.cargo import host_executable_from_builds
+
+TEST_DIR = Path("out") / "zkvm-fuzzer-utils" / "test" / "build-cache"
+
+
+def create_test_project(name: str, main_rs: str) -> Path:
+    project_dir = TEST_DIR / name
+    create_file(project_dir / "Cargo.toml", "[package]\nname = 'host'\n")
+    create_file(project_dir / "src" / "main.rs", main_rs)
+    return project_dir
+
+
+def fake_build(project_dir: Path, builds: list[Path]):
+    def build() -> list[ExecStatus]:
+        host = (project_dir / "target" / "release" / "host").absolute()
+        create_file(host, f"binary of {project_dir.name}")
+        create_file(project_dir / "elf" / "guest", f"elf of {project_dir.name}")
+        builds.append(project_dir)
+        message = {
+            "reason": "compiler-artifact",
+            "target": {"kind": ["bin"]},
+            "executable": str(host),
+        }
+        return [ExecStatus("cargo build", json.dumps(message), "", None, None, 0, 1.0)]
+
+    return build
+
+
+def test_build_cache():
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+    cache = BuildCache(TEST_DIR / "cache", 1024 * 1024, ["zkvm@commit"])
+    artifacts = [Path("elf") / "guest"]
+    builds = []
+
+    project_a = create_test_project("a", "fn main() {}\n")
+    cache.build(project_a, fake_build(project_a, builds), artifacts)
+    assert (cache.hits, cache.misses, len(builds)) == (0, 1, 1)
+
+    # identical sources in another project directory restore the cached artifacts
+    project_b = create_test_project("b", "fn main() {}\n")
+    status = cache.build(project_b, fake_build(project_b, builds), artifacts)
+    assert (cache.hits, cache.misses, len(builds)) == (1, 1, 1)
+    assert (project_b / "elf" / "guest").read_text() == "elf of a"
+    host = host_executable_from_builds(status)
+    assert host is not None and host.read_text() == "binary of a"
+
+    # the restored executable belongs to the project and survives an eviction
+    assert host == (project_b / "target" / "release" / "host").absolute()
+    shutil.rmtree(TEST_DIR / "cache" / cache.key(project_b))
+    assert host.read_text() == "binary of a"
+
+    # changed sources or context miss the cache
+    project_c = create_test_project("c", "fn main() { println!(); }\n")
+    cache.build(project_c, fake_build(project_c, builds), artifacts)
+    assert cache.key(project_a) != BuildCache(TEST_DIR / "cache", 0, ["other"]).key(project_a)
+    assert (cache.hits, cache.misses, len(builds)) == (1, 2, 2)
+
+
+def test_build_cache_eviction():
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+    cache = BuildCache(TEST_DIR / "cache", 0, [])
+    builds = []
+
+    for index in range(4):
+        project_dir = create_test_project(f"p{index}", f"fn main() {{ {index}; }}\n")
+        cache.build(project_dir, fake_build(project_dir, builds), [])
+
+    # the most recently used entries are never evicted
+    entries = [e for e in (TEST_DIR / "cache").iterdir() if not e.name.startswith(".")]
+    assert len(entries) == 2
+    cache.build(TEST_DIR / "p3", fake_build(TEST_DIR / "p3", builds), [])
+    assert (cache.hits, len(builds)) == (1, 4)
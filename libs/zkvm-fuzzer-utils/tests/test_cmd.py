@@ -0,0 +1,141 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import psutil
+import pytest
+from zkvm_fuzzer_utils.cmd import (
+    ProcessGroupTracker,
+    ResourceUsage,
+    invoke_command,
+    read_cgroup_usage,
+    wrap_command_in_cgroup,
+)
+from zkvm_fuzzer_utils.stream import STDERR, STDOUT, OutputPattern
+
+
+def is_process_alive(pid: int, timeout: float = 1.0) -> bool:
+    # NOTE: a killed process exits asynchronously and is reaped by init
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if psutil.Process(pid).status() == psutil.STATUS_ZOMBIE:
+                return False
+        except psutil.NoSuchProcess:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_concurrent_process_group_cleanup():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow = executor.submit(invoke_command, ["sleep", "1"])
+        fast = executor.submit(invoke_command, ["true"])
+        assert fast.result().returncode == 0
+        # the slow command must not be terminated by the cleanup of the fast command
+        assert slow.result().returncode == 0
+
+
+def test_process_group_cleanup():
+    # NOTE: the background process does not hold the pipes, so the command returns
+    status = invoke_command(["sh", "-c", "sleep 30 > /dev/null 2>&1 & echo $!"])
+    assert status.returncode == 0
+    assert not is_process_alive(int(status.stdout))
+
+
+def test_process_group_tracker_kill():
+    tracker = ProcessGroupTracker()
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        running = executor.submit(
+            invoke_command, ["sh", "-c", "sleep 30 & wait"], process_group_tracker=tracker
+        )
+        time.sleep(0.5)
+        tracker.kill()
+        assert running.result().returncode != 0
+    assert time.time() - start_time < 10
+
+    # the command started after the kill is killed immediately
+    status = invoke_command(["sleep", "30"], process_group_tracker=tracker)
+    assert status.returncode != 0
+    assert time.time() - start_time < 10
+
+
+@pytest.mark.parametrize("is_streamed", [False, True])
+def test_process_group_timeout(is_streamed: bool):
+    start_time = time.time()
+    status = invoke_command(
+        ["sh", "-c", "sleep 30 > /dev/null 2>&1 & echo $!; wait"],
+        timeout=1,
+        abort_predicates=[OutputPattern("never", ["never"])] if is_streamed else None,
+    )
+    assert status.is_timeout and status.returncode == 124
+    assert time.time() - start_time < 10
+    assert not is_process_alive(int(status.stdout))
+
+
+@pytest.mark.parametrize("is_streamed", [False, True])
+def test_memory_limit(is_streamed: bool):
+    # NOTE: the limit is applied after the spawn, the closed stdin releases the command
+    status = invoke_command(
+        ["sh", "-c", "read line; ulimit -v"],
+        memory=512,
+        abort_predicates=[OutputPattern("never", ["never"])] if is_streamed else None,
+    )
+    assert status.returncode == 0 and status.stdout.strip() == str(512 * 1024)
+
+
+def test_cgroup_exec_wrapper(tmp_path: Path):
+    # NOTE: the wrapper joins the cgroup and is replaced by the command
+    status = invoke_command(wrap_command_in_cgroup(tmp_path, ["sh", "-c", "echo $$"]))
+    assert status.returncode == 0
+    assert (tmp_path / "cgroup.procs").read_text().strip() == status.stdout.strip()
+
+
+def test_cgroup_usage(tmp_path: Path):
+    (tmp_path / "memory.peak").write_text("1048576\n")
+    (tmp_path / "cpu.stat").write_text("usage_usec 1500000\nuser_usec 1000000\n")
+    (tmp_path / "memory.events").write_text("low 0\nhigh 0\nmax 3\noom 1\noom_kill 1\n")
+    usage = read_cgroup_usage(tmp_path)
+    assert usage == ResourceUsage(1048576, 1.5, 1) and usage.is_oom_killed()
+
+    # NOTE: `memory.peak` is missing before Linux 5.19
+    (tmp_path / "memory.peak").unlink()
+    assert usage.combine(read_cgroup_usage(tmp_path)) == ResourceUsage(1048576, 3.0, 2)
+
+
+def test_output_pattern():
+    pattern = OutputPattern("known error", ["divide by zero", "panicked"], STDERR)
+    assert pattern(STDOUT, "divide by zero panicked") is None
+    assert pattern(STDERR, "attempt to div") is None
+    assert pattern(STDERR, "ide by zero\n") is None  # match spanning two chunks
+    assert pattern(STDERR, "thread 'main' panicked") == "known error"
+
+
+def test_abort_predicate():
+    start_time = time.time()
+    status = invoke_command(
+        ["sh", "-c", "echo start; sleep 30 & echo decided; wait"],
+        timeout=20,
+        abort_predicates=[OutputPattern("decided", ["decided"])],
+    )
+    assert status.is_aborted() and status.abort_reason == "decided"
+    assert status.is_failure() and not status.is_timeout
+    assert time.time() - start_time < 10
+
+    # the whole process tree is terminated
+    assert not any(p.name() == "sleep" for p in psutil.Process().children(recursive=True))
+
+
+def test_abort_drains_output():
+    # NOTE: the output written while the process terminates is still consumed
+    status = invoke_command(
+        [
+            "sh",
+            "-c",
+            "trap 'echo terminated; exit 1' TERM; echo decided; while :; do sleep 0.1; done",
+        ],
+        timeout=20,
+        abort_predicates=[OutputPattern("decided", ["decided"])],
+    )
+    assert status.is_aborted() and status.stdout == "decided\nterminated\n"
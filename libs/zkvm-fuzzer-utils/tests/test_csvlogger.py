@@ -0,0 +1,51 @@
+import shutil
+from pathlib import Path
+from uuid import uuid4
+
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.csvlogger import log_build_csv, log_pipeline_csv
+from zkvm_fuzzer_utils.file import create_dir, create_file
+from zkvm_fuzzer_utils.record import record_from_exec_status
+
+TEST_DIR = Path("out") / "zkvm-fuzzer-utils" / "test" / "csvlogger"
+
+
+def test_build_csv_rotation():
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+    build_csv = TEST_DIR / "build.csv"
+    create_file(build_csv, "fuzzer_id,run_id,build_num,build_time,build_success\n")
+
+    build = ExecStatus("cargo build", "", "", None, None, 0, 1.0)
+    log_build_csv(TEST_DIR / "project", uuid4(), 0, [build], [])
+    log_build_csv(TEST_DIR / "project", uuid4(), 1, [build], [])
+
+    # the file with outdated columns is kept and the new columns are appended
+    rotated = [p for p in TEST_DIR.iterdir() if p.name.startswith("build.csv.")]
+    assert len(rotated) == 1
+    assert rotated[0].read_text() == "fuzzer_id,run_id,build_num,build_time,build_success\n"
+    lines = build_csv.read_text().splitlines()
+    assert lines[0].split(",")[5:] == [
+        "changed_num",
+        "changed_files",
+        "build_memory_peak",
+        "build_cpu_time",
+        "build_oom_kills",
+    ]
+    assert len(lines) == 3
+    assert all([len(line.split(",")) == len(lines[0].split(",")) for line in lines])
+
+
+def test_pipeline_csv_alignment():
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+    pipeline_csv = create_dir(TEST_DIR) / "pipeline.csv"
+
+    def log(stdout: str):
+        status = ExecStatus("host", stdout, "", None, None, 0, 3.0)
+        log_pipeline_csv(TEST_DIR / "project", uuid4(), 0, 0, record_from_exec_status(status))
+
+    log('<record>{"context": "Setup", "time": "1.0"}</record>\n')
+    # later records with other stages are aligned to the header by name
+    log('<record>{"context": "Prove", "time": "2.0"}</record>\n')
+
+    lines = [line.split(",")[3:] for line in pipeline_csv.read_text().splitlines()]
+    assert lines == [["Setup", "full"], ["1.0", "3.0"], ["", "3.0"]]
@@ -0,0 +1,61 @@
+import struct
+
+import pytest
+from zkvm_fuzzer_utils.elf import (
+    circuit_pc_ranges,
+    read_elf_symbols,
+    unqualified_function_name,
+)
+
+# (name, address, size, info) with info 0x12 a global function and 0x11 a global object
+SYMBOLS = [
+    ("main", 0x1000, 0x80, 0x12),
+    ("_ZN10pico_guest2c017h0123456789abcdefE", 0x2000, 0x40, 0x12),
+    ("c1", 0x2040, 0x20, 0x12),
+    ("_ZN10pico_guest12circuit_AB1217h0123456789abcdefE.llvm.42", 0x3000, 0x10, 0x12),
+    ("c2", 0x4000, 0x10, 0x11),
+]
+
+
+def create_elf32(symbols: list[tuple[str, int, int, int]]) -> bytes:
+    """Returns a little endian ELF32 file with a symbol table and its string table"""
+
+    strings = b"\0"
+    symbol_table = bytes(16)  # NOTE: the first symbol is always undefined
+    for name, address, size, info in symbols:
+        symbol_table += struct.pack("<IIIBBH", len(strings), address, size, info, 0, 1)
+        strings += name.encode() + b"\0"
+
+    symbol_table_offset = 0x34
+    strings_offset = symbol_table_offset + len(symbol_table)
+    section_offset = strings_offset + len(strings)
+    sections = bytes(40)
+    sections += struct.pack(
+        "<IIIIIIIIII", 0, 2, 0, 0, symbol_table_offset, len(symbol_table), 2, 1, 4, 16
+    )
+    sections += struct.pack("<IIIIIIIIII", 0, 3, 0, 0, strings_offset, len(strings), 0, 0, 1, 0)
+
+    header = b"\x7fELF\x01\x01\x01" + bytes(9)
+    header += struct.pack("<HHIIIIIHHHHHH", 2, 0xF3, 1, 0, 0, section_offset, 0, 52, 0, 0, 40, 3, 2)
+    return header + symbol_table + strings + sections
+
+
+def test_read_elf_symbols():
+    symbols = read_elf_symbols(create_elf32(SYMBOLS))
+    assert [(s.name, s.address, s.size) for s in symbols[1:]] == [s[:3] for s in SYMBOLS]
+    assert [s.is_function for s in symbols[1:]] == [True, True, True, True, False]
+
+    with pytest.raises(ValueError):
+        read_elf_symbols(b"\x7fELF\x01\x01")
+    with pytest.raises(ValueError):
+        read_elf_symbols(b"MZ" + bytes(64))
+
+
+def test_circuit_pc_ranges(tmp_path):
+    assert unqualified_function_name(SYMBOLS[1][0]) == "c0"
+    assert unqualified_function_name(SYMBOLS[3][0]) == "circuit_AB12"
+    assert unqualified_function_name("main") == "main"
+
+    elf_path = tmp_path / "guest.elf"
+    elf_path.write_bytes(create_elf32(SYMBOLS))
+    assert circuit_pc_ranges(elf_path) == [(0x2000, 0x2060), (0x3000, 0x3010)]
@@ -1,7 +1,10 @@
+import os
 import re
+import stat
+import threading
 from pathlib import Path
 
-from zkvm_fuzzer_utils.file import create_file, replace_in_file
+from zkvm_fuzzer_utils.file import create_file, file_lock, replace_in_file
 
 
 def generate_test_file(name: str, content: str) -> Path:
@@ -143,3 +146,75 @@ std::array<Val, 5> extern_getMemoryTxn(ExecContext& ctx, Val addrElem) {
 }
 """,  # noqa: E501
     )
+
+
+def test_create_file_if_changed():
+    testfile = Path("out") / "zkvm-fuzzer-utils" / "test" / "test_create_file_if_changed.rs"
+    if testfile.exists():
+        testfile.unlink()
+
+    assert create_file(testfile, "fn main() {}\n")
+    modification_time = testfile.stat().st_mtime_ns
+    assert not create_file(testfile, "fn main() {}\n")
+    assert testfile.stat().st_mtime_ns == modification_time
+
+    assert create_file(testfile, "fn main() { println!(); }\n")
+    compare_test_file_to_content(testfile, "fn main() { println!(); }\n")
+    assert [p.name for p in testfile.parent.iterdir() if p.name.startswith(".")] == []
+
+    # same size, but different content
+    assert create_file(testfile, "fn main() { println?(); }\n")
+    compare_test_file_to_content(testfile, "fn main() { println?(); }\n")
+
+
+def test_create_file_respects_umask():
+    testfile = Path("out") / "zkvm-fuzzer-utils" / "test" / "test_create_file_umask.rs"
+    if testfile.exists():
+        testfile.unlink()
+
+    umask = os.umask(0o027)
+    try:
+        assert create_file(testfile, "fn main() {}\n")
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(testfile.stat().st_mode) == 0o640
+
+
+def test_file_lock():
+    lock_file = Path("out") / "zkvm-fuzzer-utils" / "test" / "test_file_lock.lock"
+    events = []
+
+    def worker():
+        with file_lock(lock_file):
+            events.append("worker")
+
+    with file_lock(lock_file):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join(timeout=0.2)
+        assert thread.is_alive()  # blocked by the held lock
+        events.append("main")
+    thread.join()
+    assert events == ["main", "worker"]
+
+
+def test_shared_file_lock():
+    lock_file = Path("out") / "zkvm-fuzzer-utils" / "test" / "test_shared_file_lock.lock"
+    events = []
+
+    def worker(is_shared: bool):
+        with file_lock(lock_file, is_shared=is_shared):
+            events.append("shared" if is_shared else "exclusive")
+
+    with file_lock(lock_file, is_shared=True):
+        shared = threading.Thread(target=worker, args=(True,))
+        shared.start()
+        shared.join(timeout=0.2)
+        assert not shared.is_alive()  # shared locks are held concurrently
+        exclusive = threading.Thread(target=worker, args=(False,))
+        exclusive.start()
+        exclusive.join(timeout=0.2)
+        assert exclusive.is_alive()  # blocked by the held shared lock
+        events.append("main")
+    exclusive.join()
+    assert events == ["shared", "main", "exclusive"]
@@ -0,0 +1,107 @@
+from enum import StrEnum
+
+import pytest
+from zkvm_fuzzer_utils.cmd import ExecStatus, invoke_command
+from zkvm_fuzzer_utils.common import (
+    STEP_BOUND_CONTEXT,
+    STEP_BOUND_FLAG,
+    STEP_OVERFLOW_FLAG,
+    StepOverflow,
+    is_trace_sparse,
+)
+from zkvm_fuzzer_utils.output import OutputParser, output_from_exec, trace_step_limit
+from zkvm_fuzzer_utils.record import record_from_exec_status
+from zkvm_fuzzer_utils.trace import trace_from_str
+
+
+class InstrKind(StrEnum):
+    ADDI = "addi"
+    SW = "sw"
+
+
+class InjectionKind(StrEnum):
+    INSTR_WORD_MOD = "INSTR_WORD_MOD"
+
+
+STDOUT = """<record>{"context": "main", "status": "start"}</record>
+<trace>{"step":0, "pc":0, "instruction":"ADDI", "assembly":"addi x1, x0, 1"}</trace>
+noise <trace>{"step":1, "pc":4, "instruction":"SW", "assembly":"sw x1, 0(x2)"}</trace>
+<fault>{"step":1, "pc":4, "kind":"INSTR_WORD_MOD", "info":"sw"}</fault>
+<trace>{"step":1, "pc":4, "instruction":"SW", "assembly":"sw x1, 0(x2)"}</trace>
+<record>{"context": "main", "status": "ok", "output": "1"}</record>"""
+
+STDERR = """thread 'main' panicked at src/main.rs:3:5:
+pan
+ic
+note: run with `RUST_BACKTRACE=1` environment variable to display a backtrace
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_output_parser_chunks(chunk_size: int):
+    status = ExecStatus("host", STDOUT, STDERR, None, None, 101, 1.0)
+    parser = OutputParser(InstrKind, InjectionKind)
+    for start in range(0, max(len(STDOUT), len(STDERR)), chunk_size):
+        parser.feed_stdout(STDOUT[start : start + chunk_size])  # noqa: E203
+        parser.feed_stderr(STDERR[start : start + chunk_size])  # noqa: E203
+    parser.finish()
+
+    record = parser.record(status)
+    assert record == record_from_exec_status(status)
+    assert (
+        record.search_by_key("output") == "1" and record.panics[0].rust_panic.message == "pan\nic"
+    )
+    assert parser.trace() == trace_from_str(STDOUT, InstrKind, InjectionKind)
+    assert [step.instruction for step in parser.trace().steps] == [InstrKind.ADDI, InstrKind.SW]
+
+
+def test_output_parser_deferred_error():
+    stdout = STDOUT + '\n<trace>{"step":5, "pc":8, "instruction":"SW", "assembly":"sw"}</trace>\n'
+    parser = output_from_exec(
+        ExecStatus("host", stdout, "", None, None, 0, 1.0), InstrKind, InjectionKind
+    )
+    assert parser.record(ExecStatus("host", stdout, "", None, None, 0, 1.0)).entries
+    with pytest.raises(ValueError):
+        parser.trace()
+
+
+def test_invoke_command_output_consumer():
+    parser = OutputParser(InstrKind, InjectionKind)
+    command = ["sh", "-c", 'printf "%s" "$OUT"; printf "%s" "$ERR" >&2']
+    status = invoke_command(command, env={"OUT": STDOUT, "ERR": STDERR}, output_consumer=parser)
+    assert status.stdout == STDOUT and status.output_consumer is parser
+    assert output_from_exec(status, InstrKind, InjectionKind) is parser
+    assert len(parser.record(status).panics) == 1 and len(parser.trace().faults) == 1
+
+    status = invoke_command(["sleep", "5"], timeout=0.2, output_consumer=OutputParser())
+    assert status.is_timeout and status.returncode == 124
+
+
+def test_trace_step_limit():
+    parser = OutputParser(InstrKind, InjectionKind)
+    is_exceeded = trace_step_limit(parser, 1)
+    parser.feed_stdout(STDOUT.split("noise")[0])
+    assert parser.step_count == 1 and is_exceeded("stdout", "") is None
+    parser.feed_stdout("noise" + STDOUT.split("noise")[1])
+    assert is_exceeded("stdout", "") == "trace exceeded 1 steps"
+
+
+def test_step_bound_sampled_trace():
+    arguments = ["--trace", STEP_BOUND_FLAG, "1", STEP_OVERFLOW_FLAG, StepOverflow.SAMPLE]
+    assert is_trace_sparse(arguments)
+    assert not is_trace_sparse(arguments[:-1] + [StepOverflow.STOP_TRACING])
+
+    # NOTE: past the step bound only every n-th step is traced
+    stdout = "".join(
+        f'<trace>{{"step":{step}, "pc":{4 * step}, "instruction":"ADDI", "assembly":"addi"}}'
+        "</trace>"
+        for step in (0, 1, 64, 128)
+    )
+    stdout += f'<record>{{"context":"{STEP_BOUND_CONTEXT}", "status":"exceeded", "bound":"1"}}'
+    stdout += "</record>"
+    status = ExecStatus("host", stdout, "", None, None, 0, 1.0)
+    output = output_from_exec(
+        status, InstrKind, InjectionKind, trace_sparse=is_trace_sparse(arguments)
+    )
+    assert [step.step for step in output.trace().steps] == [0, 1, 64, 128]
+    assert output.record(status).get_entry_by_context(STEP_BOUND_CONTEXT).entries["bound"] == "1"
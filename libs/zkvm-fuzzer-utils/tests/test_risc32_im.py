@@ -0,0 +1,38 @@
+import pytest
+from zkvm_fuzzer_utils import risc32_im
+from zkvm_fuzzer_utils.risc32_im import (
+    RV32IM_ENCODINGS,
+    decode_rv32im,
+    disassemble_rv32im,
+    rv32im_encoding_indices,
+)
+
+WORDS = {
+    0x00000013: "addi x0, x0, 0",
+    0xFFF10093: "addi x1, x2, -1",
+    0x00112623: "sw x1, 12(x2)",
+    0x00C12083: "lw x1, 12(x2)",
+    0x12345537: "lui x10, 0x12345",
+    0xFE000AE3: "beq x0, x0, -12",
+    0x02B50533: "mul x10, x10, x11",
+    0x40B50533: "sub x10, x10, x11",
+    0x00351513: "slli x10, x10, 3",
+    0x40355513: "srai x10, x10, 3",
+    0x00000073: "ecall",
+}
+
+
+def test_disassemble_rv32im():
+    for word, assembly in WORDS.items():
+        assert disassemble_rv32im(word) == assembly
+    assert decode_rv32im(0x00000000) is None
+    assert disassemble_rv32im(0x00000000) == "0x00000000"
+
+
+def test_rv32im_encoding_indices():
+    if risc32_im.np is None:
+        pytest.skip("numpy is not installed")
+    words = list(WORDS.keys()) + [0x00000000]
+    indices = rv32im_encoding_indices(risc32_im.np.array(words, dtype=risc32_im.np.uint32))
+    mnemonics = [RV32IM_ENCODINGS[index].mnemonic if index >= 0 else None for index in indices]
+    assert mnemonics == [decode_rv32im(word) and decode_rv32im(word).mnemonic for word in words]
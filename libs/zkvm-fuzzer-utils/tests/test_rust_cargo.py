@@ -0,0 +1,122 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.file import create_dir, create_file
+from zkvm_fuzzer_utils.rust.cargo import (
+    CARGO,
+    IONICE,
+    NICE,
+    CargoCmd,
+    executables_from_build,
+    execute_builds_in_shared_target_dir,
+    host_executable_from_builds,
+    relocate_executables,
+    relocate_guest_elf,
+    rust_toolchain_versions,
+)
+
+MOCK_BUILD_STDOUT = """
+{"reason":"compiler-artifact","target":{"kind":["custom-build"],"name":"build-script-build"},"executable":null}
+{"reason":"compiler-artifact","target":{"kind":["lib"],"name":"fuzzer_utils"},"executable":null}
+{"reason":"compiler-artifact","target":{"kind":["bin"],"name":"host"},"executable":"/tmp/target/release/host"}
+{"reason":"build-finished","success":true}
+"""
+
+
+def test_executables_from_build():
+    mock_exec = ExecStatus("no-command", MOCK_BUILD_STDOUT, "", None, None, 0, -1)
+    assert executables_from_build(mock_exec) == [Path("/tmp/target/release/host")]
+    assert host_executable_from_builds([mock_exec]) == Path("/tmp/target/release/host")
+
+    empty_exec = ExecStatus("no-command", "", "", None, None, 0, -1)
+    assert executables_from_build(empty_exec) == []
+    assert host_executable_from_builds([empty_exec]) is None
+    assert host_executable_from_builds([mock_exec, empty_exec]) == Path("/tmp/target/release/host")
+
+
+def test_direct_execution_fallback():
+    missing = Path("/this/executable/does/not/exist")
+    command = CargoCmd.run().with_executable(missing).with_args(["--trace"]).get_command()
+    assert command[-2:] == ["--", "--trace"]
+    assert str(missing) not in command
+
+    existing = Path(__file__)
+    command = CargoCmd.run().with_executable(existing).with_args(["--trace"]).get_command()
+    assert command == [f"{existing}", "--trace"]
+
+
+def test_low_priority_prefix():
+    command = CargoCmd.build().with_low_priority().get_command()
+    assert command[-1] == "build"
+    if IONICE:
+        assert command[:3] == [IONICE, "-c", "3"]
+    if NICE:
+        nice_index = command.index(NICE)
+        assert command[nice_index + 1] == "-n" and command[nice_index + 2] == "19"
+    assert CargoCmd.build().get_command()[0] == CARGO
+
+
+def test_relocate_executables():
+    host = Path("out") / "zkvm-fuzzer-utils" / "test" / "shared-target" / "release" / "host"
+    create_file(host, "binary")
+    stdout = MOCK_BUILD_STDOUT.replace("/tmp/target/release/host", f"{host.absolute()}")
+    mock_exec = ExecStatus("no-command", stdout, "", None, None, 0, -1)
+
+    destination = Path("out") / "zkvm-fuzzer-utils" / "test" / "relocated"
+    relocated = relocate_executables(mock_exec, destination)
+    assert host_executable_from_builds([relocated]) == (destination / "host").absolute()
+    assert '"build-finished"' in relocated.stdout
+
+    # a build of another fuzzer in the shared target directory keeps the relocated copy
+    create_file(host, "other binary")
+    assert (destination / "host").read_text() == "binary"
+
+
+def test_relocate_guest_elf():
+    target_dir = Path("out") / "zkvm-fuzzer-utils" / "test" / "guest-target"
+    shutil.rmtree(target_dir, ignore_errors=True)
+    pattern = "riscv-guest/**/release/guest"
+    destination = Path("out") / "zkvm-fuzzer-utils" / "test" / "guest.elf"
+    create_file(destination, "stale elf")
+    assert relocate_guest_elf(target_dir, pattern, destination) is None
+    assert not destination.exists()
+
+    guest = target_dir / "riscv-guest" / "methods" / "release" / "guest"
+    create_file(guest, "elf")
+    assert relocate_guest_elf(target_dir, pattern, destination) == destination
+    assert destination.read_text() == "elf"
+
+
+@pytest.mark.skipif(shutil.which("rustc") is None, reason="rustc is not installed")
+def test_rust_toolchain_versions():
+    # NOTE: a project directory that is not created yet uses the toolchain of its parent
+    project_dir = Path("out") / "zkvm-fuzzer-utils" / "test" / "missing" / "project"
+    rustc_version, cargo_version = rust_toolchain_versions(project_dir)
+    assert rustc_version.startswith("rustc ") and "\nrelease: " in rustc_version
+    assert cargo_version.startswith("cargo ")
+    assert rust_toolchain_versions(project_dir) == [rustc_version, cargo_version]
+
+
+def create_fake_build_cmd(target_dir: Path, mtime: str) -> CargoCmd:
+    # NOTE: the executable mtime after the build simulates an overwrite by another build
+    host = (target_dir / "release" / "host").absolute()
+    message = MOCK_BUILD_STDOUT.replace("/tmp/target/release/host", f"{host}")
+    script = f"echo build >> {target_dir.absolute()}/builds && echo binary > {host}"
+    script += f" && touch -d '{mtime}' {host} && printf '%s' '{message}'"
+    return CargoCmd.run().with_executable(Path("/bin/sh")).with_args(["-c", script])
+
+
+@pytest.mark.parametrize("mtime,num_builds", [("1 hour ago", 1), ("1 hour", 2)])
+def test_shared_target_dir_overwrite(mtime: str, num_builds: int):
+    test_dir = Path("out") / "zkvm-fuzzer-utils" / "test" / "shared-target-overwrite"
+    shutil.rmtree(test_dir, ignore_errors=True)
+    target_dir = create_dir(test_dir / "target" / "release").parent
+
+    builds = execute_builds_in_shared_target_dir(
+        [create_fake_build_cmd(target_dir, mtime)], target_dir, test_dir / "relocated"
+    )
+    assert host_executable_from_builds(builds) == (test_dir / "relocated" / "host").absolute()
+    # an overwritten executable is rebuilt holding the lock exclusively
+    assert len((target_dir / "builds").read_text().splitlines()) == num_builds
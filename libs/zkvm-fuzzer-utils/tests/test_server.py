@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+from zkvm_fuzzer_utils.server import HostServer
+
+MOCK_SERVER = """
+import sys
+
+for index, line in enumerate(sys.stdin):
+    for stream in [sys.stdout, sys.stderr]:
+        stream.write('<batch>{"index":%d, "status":"start"}</batch>\\n' % index)
+        stream.flush()
+    if line.strip() == "crash":
+        sys.exit(3)
+    if line.strip() == "panic":
+        sys.stderr.write("thread 'main' panicked at src/main.rs:3:5:\\nboom\\n")
+    status = "panic" if line.strip() == "panic" else "ok"
+    print("output " + line.strip(), flush=True)
+    for stream in [sys.stdout, sys.stderr]:
+        stream.write('<batch>{"index":%d, "status":"%s", "time":0.5}</batch>\\n' % (index, status))
+        stream.flush()
+"""
+
+
+def spawn_mock_server() -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", MOCK_SERVER],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+
+
+def test_host_server_requests():
+    server = HostServer(spawn_mock_server)
+    try:
+        first = server.execute(["a", "1"], timeout=10)
+        second = server.execute(["b"], timeout=10)
+        assert not first.is_failure() and not second.is_failure()
+        assert first.stdout.strip() == "output a 1"
+        assert second.stdout.strip() == "output b"
+        assert second.delta_time == 0.5
+        assert server.restarts == 0
+
+        panic = server.execute(["panic"], timeout=10)
+        assert panic.returncode == 101
+        assert "panicked" in panic.stderr
+        assert not server.is_running
+
+        crash = server.execute(["crash"], timeout=10)
+        assert crash.returncode == 3
+        assert server.restarts == 1
+
+        after = server.execute(["c"], timeout=10)
+        assert after.stdout.strip() == "output c"
+        assert server.restarts == 2
+    finally:
+        server.stop()
+
+
+def test_isolated_host_server_requests():
+    server = HostServer(spawn_mock_server, is_isolated=True)
+    try:
+        panic = server.execute(["panic"], timeout=10)
+        assert panic.returncode == 101
+        assert server.is_running
+
+        after = server.execute(["a"], timeout=10)
+        assert after.stdout.strip() == "output a"
+        assert server.restarts == 0
+
+        crash = server.execute(["crash"], timeout=10)
+        assert crash.returncode == 3
+        assert not server.is_running
+    finally:
+        server.stop()
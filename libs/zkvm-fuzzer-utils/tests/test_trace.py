@@ -0,0 +1,295 @@
+import json
+import struct
+import sys
+from enum import StrEnum
+from pathlib import Path
+from random import Random
+
+import pytest
+from zkvm_fuzzer_utils import trace as trace_module
+from zkvm_fuzzer_utils.cmd import invoke_command
+from zkvm_fuzzer_utils.common import StepOverflow
+from zkvm_fuzzer_utils.fuzzer import FuzzerConfig, FuzzerCore
+from zkvm_fuzzer_utils.injection import InjectionContext, injection_sampling_from_str
+from zkvm_fuzzer_utils.output import OutputParser
+from zkvm_fuzzer_utils.record import record_from_exec_status
+from zkvm_fuzzer_utils.risc32_im import disassemble_rv32im
+from zkvm_fuzzer_utils.trace import (
+    TRACE_RECORD_FORMAT,
+    Trace,
+    TraceBuilder,
+    TraceStep,
+    trace_from_str,
+)
+
+
+class InstrKind(StrEnum):
+    ADD = "add"
+    ADDI = "addi"
+    SW = "sw"
+
+
+class InjectionKind(StrEnum):
+    INSTR_WORD_MOD = "INSTR_WORD_MOD"
+
+
+@pytest.fixture(params=["numpy", "python"])
+def columns_backend(request, monkeypatch):
+    if request.param == "numpy" and trace_module.np is None:
+        pytest.skip("numpy is not installed")
+    if request.param == "python":
+        monkeypatch.setattr(trace_module, "np", None)
+    return request.param
+
+
+def create_steps() -> list[TraceStep]:
+    instructions = [InstrKind.SW, InstrKind.ADDI, InstrKind.SW, InstrKind.ADDI, InstrKind.SW]
+    return [
+        TraceStep(step, 4 * step, instruction, f"{instruction} x{step}")
+        for step, instruction in enumerate(instructions)
+    ]
+
+
+def test_trace_columns(columns_backend):
+    steps = create_steps()
+    trace = Trace(steps, [], InstrKind, InjectionKind)
+
+    assert len(trace.steps) == 5 and trace.steps == steps
+    assert trace.steps[-1] == steps[-1] and trace.steps[1:3] == steps[1:3]
+    assert trace.as_instruction_to_count() == {
+        InstrKind.ADD: 0,
+        InstrKind.ADDI: 2,
+        InstrKind.SW: 3,
+    }
+
+    # instructions are ordered by first occurrence and their steps ascending
+    lookup = trace.as_instruction_to_indices()
+    assert list(lookup.keys()) == [InstrKind.SW, InstrKind.ADDI]
+    assert [list(map(int, indices)) for indices in lookup.values()] == [[0, 2, 4], [1, 3]]
+    assert trace.as_instruction_to_steps()[InstrKind.ADDI] == [steps[1], steps[3]]
+
+    arguments = InjectionContext(
+        {InstrKind.ADDI: [InjectionKind.INSTR_WORD_MOD]}
+    ).arguments_from_trace(trace, Random(0))
+    assert arguments is not None and arguments.step in (1, 3)
+
+    # multiple injections target distinct steps until the candidates run out
+    context = InjectionContext(
+        {
+            InstrKind.ADDI: [InjectionKind.INSTR_WORD_MOD],
+            InstrKind.SW: [InjectionKind.INSTR_WORD_MOD],
+        }
+    )
+    arguments_list = context.arguments_list_from_trace(trace, Random(0), 4)
+    assert len({arguments.step for arguments in arguments_list}) == 4
+    arguments_list = context.arguments_list_from_trace(trace, Random(0), 10)
+    assert sorted(arguments.step for arguments in arguments_list) == [0, 1, 2, 3, 4]
+
+
+def test_trace_columns_from_binary(columns_backend):
+    records = [(step, 4 * step, step % 3, (0x13, 0x00112623)[step % 2]) for step in range(1000)]
+    data = b"".join(struct.pack(TRACE_RECORD_FORMAT, *record) for record in records)
+
+    trace = trace_from_str("", InstrKind, InjectionKind, data)
+    assert trace == Trace(
+        [TraceStep(s, pc, list(InstrKind)[c], disassemble_rv32im(w), w) for s, pc, c, w in records],
+        [],
+        InstrKind,
+        InjectionKind,
+    )
+    # NOTE: the assembly is disassembled from the word on access and never interned
+    assert trace.columns.assembly_table == []
+    assert trace.steps[1].assembly == "sw x1, 12(x2)"
+    assert sys.getsizeof(trace.columns.step) < 9 * len(records)
+
+    # repeated steps have to match the recorded step
+    diverging = data + struct.pack(TRACE_RECORD_FORMAT, 10, 40, 2, 0x13)
+    with pytest.raises(ValueError):
+        trace_from_str("", InstrKind, InjectionKind, diverging)
+
+
+def trace_tag_payload(step: TraceStep) -> str:
+    return json.dumps(
+        {
+            "step": step.step,
+            "pc": step.pc,
+            "instruction": step.instruction_as_str,
+            "assembly": step.assembly,
+            "word": step.word,
+        }
+    )
+
+
+def test_trace_suffix(columns_backend):
+    steps = create_steps()
+    original = Trace(steps, [], InstrKind, InjectionKind)
+
+    builder = TraceBuilder(InstrKind, InjectionKind, 3)
+    for step in steps[3:]:
+        builder.add_tag("trace", trace_tag_payload(step))
+    suffix = builder.build()
+    assert suffix.start_step == 3 and suffix.steps == steps[3:]
+
+    # the full view shares the prefix of the original trace
+    trace = suffix.with_prefix(original)
+    assert trace.columns is suffix.columns
+    assert trace == original and trace.steps[-1] == steps[-1] and trace.steps[2:4] == steps[2:4]
+    assert trace.as_instruction_to_count() == original.as_instruction_to_count()
+    assert trace.as_instruction_to_steps() == original.as_instruction_to_steps()
+    with pytest.raises(ValueError):
+        suffix.with_prefix(Trace(steps[:2], [], InstrKind, InjectionKind))
+
+    # steps before the start step are never traced
+    with pytest.raises(ValueError):
+        TraceBuilder(InstrKind, InjectionKind, 3).add_tag("trace", trace_tag_payload(steps[2]))
+
+    records = [(step, 4 * step, step % 3, 0x13) for step in range(3, 1000)]
+    data = b"".join(struct.pack(TRACE_RECORD_FORMAT, *record) for record in records)
+    binary_suffix = TraceBuilder(InstrKind, InjectionKind, 3).build(data)
+    assert binary_suffix.start_step == 3 and binary_suffix.steps[0].step == 3
+    assert len(binary_suffix.steps) == len(records)
+
+
+def test_sparse_trace(columns_backend):
+    # NOTE: a host only tracing some pc ranges skips steps, but keeps counting them
+    records = [(step, 0x2000 + 4 * step, step % 3, 0x13) for step in range(0, 1000, 7)]
+    data = b"".join(struct.pack(TRACE_RECORD_FORMAT, *record) for record in records)
+    sparse = TraceBuilder(InstrKind, InjectionKind, 0, True).build(data + data[:36])
+    assert [step.step for step in sparse.steps[:3]] == [0, 7, 14]
+    assert sparse.columns.row_of(14) == 2 and sparse.columns.row_of(15) is None
+    assert sparse.columns.end_step == 995
+    with pytest.raises(ValueError):
+        TraceBuilder(InstrKind, InjectionKind).build(data)
+
+    # a suffix of a sparse trace shares the recorded steps before its start step
+    builder = TraceBuilder(InstrKind, InjectionKind, 500, True)
+    for step in sparse.steps[72:]:
+        builder.add_tag("trace", trace_tag_payload(step))
+    trace = builder.build().with_prefix(sparse)
+    assert trace == sparse and trace.steps.prefix_length == 72
+
+    # only the steps of the pc ranges are injection candidates
+    lookup = trace.as_instruction_to_indices([(0x2000 + 4 * 500, 0x2000 + 4 * 600)])
+    indices = sorted(int(index) for indices in lookup.values() for index in indices)
+    assert [trace.steps[index].step for index in indices] == list(range(504, 600, 7))
+
+    context = InjectionContext({InstrKind.SW: [InjectionKind.INSTR_WORD_MOD]})
+    context.set_pc_ranges([(0x2000 + 4 * 500, 0x2000 + 4 * 600)])
+    arguments = context.arguments_from_trace(trace, Random(0))
+    assert arguments is not None and 500 <= arguments.step < 600
+
+
+def test_injection_sampling():
+    rng = Random(0)
+    sampling = injection_sampling_from_str("all")
+    assert all(sampling.is_sampled(iteration_id, rng) for iteration_id in range(1, 10))
+
+    sampling = injection_sampling_from_str("2/5")
+    sampled = [i for i in range(1, 11) if sampling.is_sampled(i, rng)]
+    assert sampled == [1, 2, 6, 7] and str(sampling) == "2/5"
+
+    sampling = injection_sampling_from_str("0.25")
+    assert 150 < sum(sampling.is_sampled(i, rng) for i in range(1000)) < 350
+    assert not injection_sampling_from_str("0").is_sampled(1, rng)
+
+    for value in ("3/2", "1/0", "1.5", "some"):
+        with pytest.raises(ValueError):
+            injection_sampling_from_str(value)
+
+
+class SamplingFuzzer(FuzzerCore[InstrKind, InjectionKind]):
+    def __init__(self, input_iterations: int):
+        config = FuzzerConfig(input_iterations, {}, [], 0, 0, InstrKind, InjectionKind, None)
+        super().__init__(Path("out"), Path("zkvm"), config, Random(0))
+        self.sampled: list[bool] = []
+
+    def execute_without_injection(self):
+        self.sampled.append(self.is_iteration_sampled)
+        return None
+
+    def create_project(self):
+        raise NotImplementedError()
+
+    def is_ignored_execution_error(self, exec_status):
+        raise NotImplementedError()
+
+    def is_skip_fault_injection_inspection(self, exec_status):
+        raise NotImplementedError()
+
+    def create_execution_arguments(self, *args):
+        raise NotImplementedError()
+
+    def get_outputs_from_record(self, record):
+        raise NotImplementedError()
+
+
+def test_injection_sampling_across_runs():
+    fuzzer = SamplingFuzzer(3)
+    fuzzer.enable_trace_collection()
+    fuzzer.set_injection_sampling(injection_sampling_from_str("1/4"))
+    for _ in range(3):
+        fuzzer.run_iterations()
+
+    # the stride spans the runs although every run restarts its iteration ids
+    assert fuzzer.sampled == [True, False, False, False, True, False, False, False, True]
+    assert (fuzzer.iteration_id, fuzzer.iteration_count) == (3, 9)
+
+
+def test_trace_circuits_only_requires_guest_elf():
+    fuzzer = SamplingFuzzer(1)
+    with pytest.raises(ValueError):
+        fuzzer.enable_trace_circuits_only()
+    assert not fuzzer.is_trace_circuits_only
+    fuzzer.set_trace_circuits_only(False)
+
+
+def test_step_limit_predicates():
+    fuzzer = SamplingFuzzer(1)
+    fuzzer.set_step_bound(1)
+    parser = OutputParser(InstrKind, InjectionKind)
+    steps = "".join(
+        f'<trace>{{"step":{step}, "pc":{4 * step}, "instruction":"addi", "assembly":"nop"}}'
+        "</trace>\n"
+        for step in range(3)
+    )
+    status = invoke_command(
+        ["sh", "-c", 'printf "%s" "$OUT"; sleep 5'],
+        env={"OUT": steps},
+        output_consumer=parser,
+        abort_predicates=fuzzer.create_step_limit_predicates(parser),
+    )
+    assert status.abort_reason == "trace exceeded 1 steps"
+    assert fuzzer.is_step_bound_exceeded(record_from_exec_status(status))
+
+    fuzzer.set_step_overflow(StepOverflow.SAMPLE)
+    assert fuzzer.create_step_limit_predicates(parser) == []
+
+
+class BinaryTraceFuzzer(SamplingFuzzer):
+    def is_binary_trace_supported(self) -> bool:
+        return True
+
+
+def test_binary_trace_requires_trace_records():
+    fuzzer = SamplingFuzzer(1)
+    with pytest.raises(ValueError):
+        fuzzer.enable_binary_trace()
+    assert not fuzzer.is_binary_trace
+    fuzzer = BinaryTraceFuzzer(1)
+    fuzzer.enable_binary_trace()
+    assert fuzzer.is_binary_trace
+
+
+class GuestElfFuzzer(SamplingFuzzer):
+    def get_target_guest_elf(self) -> str:
+        return "riscv-guest/**/guest"
+
+    def is_guest_elf_loaded_by_host(self) -> bool:
+        return True
+
+
+def test_guest_elf_arguments():
+    assert SamplingFuzzer(1).create_guest_elf_arguments() == []
+    fuzzer = GuestElfFuzzer(1)
+    guest_elf = (fuzzer.project_dir / "target" / "guest.elf").absolute()
+    assert fuzzer.create_guest_elf_arguments() == ["--elf", f"{guest_elf}"]
@@ -0,0 +1,85 @@
+from enum import StrEnum
+
+import pytest
+from zkvm_fuzzer_utils import trace as trace_module
+from zkvm_fuzzer_utils import trace_diff as trace_diff_module
+from zkvm_fuzzer_utils.trace import Trace, TraceColumns, TraceStep
+from zkvm_fuzzer_utils.trace_diff import context_as_str, diff_traces
+
+
+class InstrKind(StrEnum):
+    ADD = "add"
+    ADDI = "addi"
+
+
+class InjectionKind(StrEnum):
+    INSTR_WORD_MOD = "INSTR_WORD_MOD"
+
+
+@pytest.fixture(params=["numpy", "python"])
+def diff_backend(request, monkeypatch):
+    if request.param == "numpy" and trace_diff_module.np is None:
+        pytest.skip("numpy is not installed")
+    if request.param == "python":
+        monkeypatch.setattr(trace_module, "np", None)
+        monkeypatch.setattr(trace_diff_module, "np", None)
+    return request.param
+
+
+def create_trace(assembly: list[str], start_step: int = 0, skipped: set[int] = set()) -> Trace:
+    columns = TraceColumns(InstrKind, start_step, len(skipped) > 0)
+    for step, value in enumerate(assembly, start_step):
+        if step not in skipped:
+            columns.append_step(TraceStep(step, 4 * step, InstrKind.ADD, value))
+    return Trace(columns, [], InstrKind, InjectionKind)
+
+
+def test_diff_traces(diff_backend):
+    original = create_trace([f"add x{step}" for step in range(20)])
+    assert not diff_traces(original, original).has_divergence()
+
+    assembly = [f"add x{step}" for step in range(20)]
+    for step in (5, 6, 7, 12):
+        assembly[step] = "addi x0"
+    injection = create_trace(assembly)
+
+    diff = diff_traces(original, injection, context=2)
+    assert (diff.first_divergence, diff.count, diff.range_count) == (5, 4, 2)
+    assert diff.ranges == [(5, 8), (12, 13)] and diff.ranges_as_str() == "5-7 12-12"
+    assert [step.step for step in diff.original_context] == [3, 4, 5, 6, 7]
+    assert diff.injection_context[2].assembly == "addi x0"
+    assert context_as_str(diff.original_context[:2]) == "3:0xc:add x3; 4:0x10:add x4"
+
+    # only the steps recorded by the suffix of an injection trace are compared
+    suffix = create_trace(assembly[10:], 10)
+    diff = diff_traces(original, suffix.with_prefix(original))
+    assert (diff.first_divergence, diff.count, diff.ranges) == (12, 1, [(12, 13)])
+
+
+def test_diff_sparse_traces(diff_backend):
+    assembly = [f"add x{step}" for step in range(20)]
+    original = create_trace(assembly, skipped={2, 3, 4})
+    assert not diff_traces(original, original).has_divergence()
+
+    # steps recorded by only one of the traces differ as well
+    assembly[12] = "addi x0"
+    injection = create_trace(assembly, skipped={2, 3, 9})
+    diff = diff_traces(original, injection, context=1)
+    assert (diff.first_divergence, diff.count, diff.ranges) == (4, 3, [(4, 5), (9, 10), (12, 13)])
+    assert [step.step for step in diff.original_context] == [1, 5, 6]
+    assert [step.step for step in diff.injection_context] == [1, 4, 5]
+
+
+@pytest.mark.parametrize("skipped", [set(), {2, 3}])
+def test_diff_traces_instruction(diff_backend, skipped):
+    def create_trace_with(instructions: dict[int, InstrKind]) -> Trace:
+        columns = TraceColumns(InstrKind, 0, len(skipped) > 0)
+        for step in range(10):
+            if step not in skipped:
+                instruction = instructions.get(step, InstrKind.ADD)
+                columns.append_step(TraceStep(step, 4 * step, instruction, "add x1", 0x13))
+        return Trace(columns, [], InstrKind, InjectionKind)
+
+    # steps only differing in their instruction id differ as well
+    diff = diff_traces(create_trace_with({}), create_trace_with({6: InstrKind.ADDI}))
+    assert (diff.first_divergence, diff.count, diff.ranges) == (6, 1, [(6, 7)])
@@ -0,0 +1,16 @@
+from circil.ir.node import Assignment, Circuit, Identifier
+from circil.ir.type import IRType
+from zkvm_fuzzer_utils.common import convert_input_to_typed_flags
+
+
+def test_convert_input_to_typed_flags():
+    circuit = Circuit(
+        "test",
+        11,
+        [Identifier("in0"), Identifier("in1", IRType.Bool), Identifier("in2", IRType.Bool)],
+        [Identifier("out0")],
+        [Assignment(Identifier("out0"), Identifier("in0"))],
+    )
+
+    flags = convert_input_to_typed_flags(circuit, {"in0": 5, "in1": True, "in2": False}, 3)
+    assert flags == ["--circuits", "3", "--inputs", "u32:5,bool:1,bool:0"]
@@ -0,0 +1,148 @@
+import json
+import logging
+import re
+from pathlib import Path
+
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.file import create_file
+
+logger = logging.getLogger("fuzzer")
+
+# ---------------------------------------------------------------------------- #
+#                                   Constants                                  #
+# ---------------------------------------------------------------------------- #
+
+
+BATCH_FLAG = "--batch"
+SERVE_FLAG = "--serve"
+FORK_SERVE_FLAG = "--fork-serve"
+BATCH_PATTERN = re.compile(r"\<batch\>(.+?)\<\/batch\>")
+
+# exit code used by rust if the main thread panics
+PANIC_RETURNCODE = 101
+
+# exit code used by clap for invalid arguments
+INVALID_RETURNCODE = 2
+
+
+# ---------------------------------------------------------------------------- #
+#                                Batch Helpers                                 #
+# ---------------------------------------------------------------------------- #
+
+
+def create_batch_line(arguments: list[str]) -> str:
+    """Returns the host arguments of a single execution as whitespace separated line."""
+    for argument in arguments:
+        if len(argument.split()) != 1:
+            raise ValueError(f"batch argument '{argument}' must not contain whitespaces")
+    return " ".join(arguments) + "\n"
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def create_batch_file(filepath: Path, arguments_list: list[list[str]]):
+    """Writes one line of whitespace separated host arguments per execution."""
+    create_file(filepath, "".join(create_batch_line(arguments) for arguments in arguments_list))
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def returncode_from_batch_status(status: str) -> int:
+    """Maps the status of a finished batch entry to the equivalent process returncode."""
+    match status:
+        case "ok":
+            return 0
+        case "invalid":
+            return INVALID_RETURNCODE
+        case _:
+            return PANIC_RETURNCODE
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def split_output_into_batch_sections(output: str) -> tuple[dict[int, str], dict[int, dict]]:
+    """Splits the output of a batched host execution along the `<batch>` markers.
+    Returns the output of every started section and the end marker information of
+    every finished section, both indexed by the batch index."""
+
+    sections: dict[int, str] = {}
+    finished: dict[int, dict] = {}
+
+    active_index = None
+    active_start = 0
+    for match in re.finditer(BATCH_PATTERN, output):
+        info = json.loads(match.group(1))
+        index = int(info["index"])
+        if info["status"] == "start":
+            active_index = index
+            active_start = match.end()
+            sections[index] = ""
+        elif active_index == index:
+            active_end = match.start()
+            sections[index] = output[active_start:active_end]
+            finished[index] = info
+            active_index = None
+
+    # the process stopped in the middle of a section
+    if active_index is not None:
+        sections[active_index] = output[active_start:]
+
+    return (sections, finished)
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def split_batch_exec_status(exec_status: ExecStatus, count: int) -> list[ExecStatus | None]:
+    """Splits the status of a batched host execution into one status per batch
+    entry. Entries that were never started, e.g. because an earlier entry
+    crashed the process, are `None`."""
+
+    stdout_sections, finished = split_output_into_batch_sections(exec_status.stdout)
+    stderr_sections, _ = split_output_into_batch_sections(exec_status.stderr)
+
+    result: list[ExecStatus | None] = []
+    consumed_time = 0.0
+    for index in range(count):
+        if index not in stdout_sections:
+            result.append(None)
+            continue
+
+        if index in finished:
+            returncode = returncode_from_batch_status(finished[index]["status"])
+            delta_time = float(finished[index]["time"])
+            is_timeout = False
+        else:
+            returncode = exec_status.returncode if exec_status.is_failure() else PANIC_RETURNCODE
+            delta_time = max(exec_status.delta_time - consumed_time, 0.0)
+            is_timeout = exec_status.is_timeout
+        consumed_time += delta_time
+
+        stdout = stdout_sections[index]
+        stderr = stderr_sections.get(index, "")
+        result.append(
+            ExecStatus(
+                f"{exec_status.command} # batch entry {index}",
+                stdout,
+                stderr,
+                stdout.encode("utf-8"),
+                stderr.encode("utf-8"),
+                returncode,
+                delta_time,
+                is_timeout,
+                exec_status.env,
+                exec_status.cwd,
+            )
+        )
+
+    missing = sum(1 for e in result if e is None)
+    if missing > 0:
+        logger.warning(f"batch execution stopped early, {missing} of {count} entries missing")
+
+    return result
+
+
+# ---------------------------------------------------------------------------- #
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable
+
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.file import create_dir
+from zkvm_fuzzer_utils.rust.cargo import host_executable_from_builds
+
+logger = logging.getLogger("fuzzer")
+
+BUILD_CACHE_MANIFEST = "manifest.json"
+BUILD_CACHE_SOURCE_SUFFIXES = (".rs", ".toml")
+
+# NOTE: the entries of the current and the build ahead run are likely hit again
+BUILD_CACHE_PROTECTED_ENTRIES = 2
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Source Helper                                #
+# ---------------------------------------------------------------------------- #
+
+
+def project_source_files(project_dir: Path) -> list[Path]:
+    """Returns the sorted rust sources and manifests of a generated project, skipping
+    cargo `target` and hidden directories."""
+
+    source_files = []
+    for dirpath, dirnames, filenames in os.walk(project_dir):
+        dirnames[:] = [d for d in dirnames if d != "target" and not d.startswith(".")]
+        for filename in filenames:
+            if filename.endswith(BUILD_CACHE_SOURCE_SUFFIXES):
+                source_files.append(Path(dirpath) / filename)
+    return sorted(source_files)
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def directory_size(path: Path) -> int:
+    """Returns the accumulated size of all files in the directory in bytes"""
+    return sum(
+        (Path(dirpath) / filename).stat().st_size
+        for dirpath, _, filenames in os.walk(path)
+        for filename in filenames
+    )
+
+
+# ---------------------------------------------------------------------------- #
+#                                  Build Cache                                 #
+# ---------------------------------------------------------------------------- #
+
+
+class BuildCache:
+    """Content addressed store for build artifacts. An entry is keyed by the hash of all
+    generated sources of a project and the `context` (e.g. zkvm commit), and holds the host
+    executable plus additional artifacts required at runtime (e.g. a guest ELF). Entries
+    are evicted in least recently used order once the cache exceeds its disk `quota`.
+    """
+
+    __cache_dir: Path
+    __quota: int
+    __context: list[str]
+    __hits: int
+    __misses: int
+
+    def __init__(self, cache_dir: Path, quota: int, context: list[str] | None = None):
+        self.__cache_dir = create_dir(cache_dir)
+        self.__quota = quota
+        self.__context = context or []
+        self.__hits = 0
+        self.__misses = 0
+
+    def key(self, project_dir: Path) -> str:
+        """Returns the content hash of the project sources and the cache context"""
+        sha256 = hashlib.sha256()
+        for context in self.__context:
+            sha256.update(context.encode() + b"\0")
+        for source_file in project_source_files(project_dir):
+            sha256.update(str(source_file.relative_to(project_dir)).encode() + b"\0")
+            sha256.update(hashlib.sha256(source_file.read_bytes()).digest())
+        return sha256.hexdigest()
+
+    def build(
+        self,
+        project_dir: Path,
+        build: Callable[[], list[ExecStatus]],
+        artifacts: list[Path],
+    ) -> list[ExecStatus]:
+        """Returns the build status of the project. If the cache holds an entry for the
+        project sources, its artifacts are restored and `build` is skipped. Otherwise the
+        project is built and the artifacts of a successful build are stored. The `artifacts`
+        are paths relative to `project_dir` besides the host executable.
+        """
+
+        key = self.key(project_dir)
+        status = self.restore(key, project_dir)
+        if status is not None:
+            self.__hits += 1
+            logger.info(f"build cache hit {key[:16]} for {project_dir}")
+            return [status]
+
+        self.__misses += 1
+        builds = build()
+        if len(builds) > 0 and not any([b.is_failure() for b in builds]):
+            host_executable = host_executable_from_builds(builds)
+            if host_executable is not None:
+                self.store(key, project_dir, host_executable, artifacts)
+        return builds
+
+    def restore(self, key: str, project_dir: Path) -> ExecStatus | None:
+        """Restores the host executable and artifacts of the entry into the project and
+        returns a build status referencing the restored host executable, or `None` if there
+        is no usable entry. The project owns the copies, so a concurrent eviction of the
+        entry (e.g. by another fuzzer sharing the cache) does not affect the run.
+
+        NOTE: The status mimics the artifact message of `cargo build --message-format=json`,
+              so the host executable is resolved the same way as for a regular build.
+        """
+
+        entry = self.__cache_dir / key
+        manifest_file = entry / BUILD_CACHE_MANIFEST
+        if not manifest_file.is_file():
+            return None
+
+        timer = time.time()
+        try:
+            manifest = json.loads(manifest_file.read_text())
+            host_executable = create_dir(project_dir / "target" / "release") / manifest["host"]
+            shutil.copy2(entry / manifest["host"], host_executable)
+            for artifact in manifest["artifacts"]:
+                create_dir((project_dir / artifact).parent)
+                shutil.copy2(entry / "artifacts" / artifact, project_dir / artifact)
+            os.utime(manifest_file)  # mark as recently used
+        except (OSError, KeyError, json.JSONDecodeError) as e:
+            logger.warning(f"unable to restore build cache entry {key}: {e}")
+            return None
+
+        message = {
+            "reason": "compiler-artifact",
+            "target": {"kind": ["bin"]},
+            "executable": str(host_executable.absolute()),
+            "fresh": True,
+        }
+        return ExecStatus(
+            f"build cache restore {key}",
+            json.dumps(message) + "\n",
+            "",
+            None,
+            None,
+            0,
+            time.time() - timer,
+            cwd=project_dir,
+        )
+
+    def store(self, key: str, project_dir: Path, host_executable: Path, artifacts: list[Path]):
+        """Stores the host executable and artifacts of a successful build as entry"""
+
+        entry = self.__cache_dir / key
+        if entry.is_dir():
+            return  # already stored, e.g. by another fuzzer sharing the cache
+
+        # NOTE: the entry is assembled next to its destination and renamed atomically
+        tmp_entry = self.__cache_dir / f".{key}.{os.getpid()}"
+        try:
+            create_dir(tmp_entry / "artifacts")
+            shutil.copy2(host_executable, tmp_entry / host_executable.name)
+            for artifact in artifacts:
+                create_dir((tmp_entry / "artifacts" / artifact).parent)
+                shutil.copy2(project_dir / artifact, tmp_entry / "artifacts" / artifact)
+            manifest = {"host": host_executable.name, "artifacts": [str(a) for a in artifacts]}
+            (tmp_entry / BUILD_CACHE_MANIFEST).write_text(json.dumps(manifest))
+            os.rename(tmp_entry, entry)
+        except OSError as e:
+            logger.warning(f"unable to store build cache entry {key}: {e}")
+            return
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+        try:
+            self.evict()
+        except OSError as e:  # e.g. concurrent eviction by another fuzzer sharing the cache
+            logger.warning(f"unable to evict build cache entries: {e}")
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits into its quota"""
+
+        entries = [e for e in self.__cache_dir.iterdir() if (e / BUILD_CACHE_MANIFEST).is_file()]
+        entries.sort(key=lambda e: (e / BUILD_CACHE_MANIFEST).stat().st_mtime, reverse=True)
+        sizes = {entry: directory_size(entry) for entry in entries}
+        total_size = sum(sizes.values())
+
+        for entry in reversed(entries[BUILD_CACHE_PROTECTED_ENTRIES:]):
+            if total_size <= self.__quota:
+                break
+            logger.info(f"build cache evicts {entry.name[:16]}")
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= sizes[entry]
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.__cache_dir
+
+    @property
+    def quota(self) -> int:
+        """Disk quota of the cache in bytes"""
+        return self.__quota
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
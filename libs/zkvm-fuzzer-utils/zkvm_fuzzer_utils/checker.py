@@ -5,7 +5,9 @@ from pathlib import Path
 from typing import Generic, Type
 
 from circil.ir.node import Circuit
+from zkvm_fuzzer_utils.build_cache import BuildCache
 from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.common import is_trace_sparse, trace_start_step
 from zkvm_fuzzer_utils.csvlogger import (
     ParsedFinding,
     create_empty_checked_findings_csv,
@@ -17,9 +19,13 @@ from zkvm_fuzzer_utils.fuzzer import (
     generate_metamorphic_bundle_from_config,
 )
 from zkvm_fuzzer_utils.kinds import InjectionKind, InstrKind
-from zkvm_fuzzer_utils.record import Record, record_from_exec_status
-from zkvm_fuzzer_utils.rust.cargo import CargoCmd
-from zkvm_fuzzer_utils.trace import trace_from_exec
+from zkvm_fuzzer_utils.output import OutputParser, output_from_exec
+from zkvm_fuzzer_utils.record import Record
+from zkvm_fuzzer_utils.rust.cargo import (
+    CargoCmd,
+    execute_builds_in_shared_target_dir,
+    host_executable_from_builds,
+)
 
 logger = logging.getLogger("fuzzer")
 
@@ -60,6 +66,9 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
 
     __outputs_for_execution: dict[str, str] | None
     __active_finding: ParsedFinding | None
+    __host_executable: Path | None
+    __build_cache: BuildCache | None
+    __shared_target_dir: Path | None
 
     def __init__(
         self, project_dir: Path, zkvm_dir: Path, findings_csv: Path, checker_config: CheckerConfig
@@ -70,6 +79,9 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
         self.__checker_config = checker_config
         self.__outputs_for_execution = None
         self.__active_finding = None
+        self.__host_executable = None
+        self.__build_cache = None
+        self.__shared_target_dir = None
 
     def loop(self):
         """Starts the checker loop"""
@@ -117,6 +129,9 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
                     logger.error(f"zkvm build timed out with {self.checker_config.build_timeout}")
                 raise FuzzerInternalError("unable to build zkvm host build!")
 
+        self.__host_executable = host_executable_from_builds(build_status_list)
+        logger.debug(f"host executable: {self.__host_executable}")
+
         self.__outputs_for_execution = None
 
         is_fixed = False
@@ -133,7 +148,7 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
         execution_status = self.execute_project(self.active_finding.input_flags)
 
         # get trace and record data from execution
-        record = record_from_exec_status(execution_status)
+        record = output_from_exec(execution_status).record(execution_status)
         self.__outputs_for_execution = self.get_outputs_from_record(record)
         logger.debug(f"record output: {self.__outputs_for_execution}")
 
@@ -169,12 +184,15 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
         host_execution = self.execute_project(self.active_finding.input_flags)
 
         # get trace and record data from execution
-        record = record_from_exec_status(host_execution)
-        trace = trace_from_exec(
+        output = output_from_exec(
             host_execution,
             self.checker_config.instr_kind_enum,
             self.checker_config.injection_kind_enum,
+            trace_start_step(self.active_finding.input_flags),
+            is_trace_sparse(self.active_finding.input_flags),
         )
+        record = output.record(host_execution)
+        trace = output.trace(host_execution.trace_raw)
         self.__outputs_for_execution = self.get_outputs_from_record(record)
         logger.debug(f"record output: {self.outputs_for_execution}")
 
@@ -199,19 +217,51 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
         return True
 
     @abstractmethod
-    def create_project(self):
-        """Updates or creates the zkvm host and guest code based"""
+    def create_project(self) -> list[Path]:
+        """Updates or creates the zkvm host and guest code and returns the changed files"""
         raise NotImplementedError()
 
     def build_project(self) -> list[ExecStatus]:
-        """Builds the zkvm host and guest code and returns the status"""
-        return [
+        """Builds the zkvm host and guest code and returns the status. If a build cache
+        is set and holds the artifacts of identical sources, they are restored instead.
+        If a shared target directory is set, the build reuses its compiled dependencies."""
+        build_cmd = (
             CargoCmd.build()
             .with_cd(self.project_dir)
             .in_release()
+            .with_message_format_json()
             .with_timeout(self.checker_config.build_timeout)
-            .execute()
-        ]
+        )
+
+        def build() -> list[ExecStatus]:
+            if self.__shared_target_dir is None:
+                return [build_cmd.execute()]
+            return execute_builds_in_shared_target_dir(
+                [build_cmd], self.__shared_target_dir, self.project_dir / "target" / "release"
+            )
+
+        if self.__build_cache is None:
+            return build()
+        return self.__build_cache.build(self.project_dir, build, self.get_build_artifacts())
+
+    def get_build_artifacts(self) -> list[Path]:
+        """Returns the build artifacts required by the host executable at runtime, relative
+        to the project directory (e.g. a guest ELF loaded from disk)"""
+        return []
+
+    def set_build_cache(self, build_cache: BuildCache | None):
+        self.__build_cache = build_cache
+
+    @property
+    def build_cache(self) -> BuildCache | None:
+        return self.__build_cache
+
+    def set_shared_target_dir(self, shared_target_dir: Path | None):
+        self.__shared_target_dir = shared_target_dir
+
+    @property
+    def shared_target_dir(self) -> Path | None:
+        return self.__shared_target_dir
 
     def execute_project(self, arguments: list[str]) -> ExecStatus:
         """Executes the zkvm host and guest code with the provided arguments
@@ -219,10 +269,18 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
         return (
             CargoCmd.run()
             .with_cd(self.project_dir)
+            .with_executable(self.host_executable)
             .with_args(arguments)
             .with_timeout(self.checker_config.execution_timeout)
             .in_release()
-            .with_explicit_clean_zombies()
+            .with_output_consumer(
+                OutputParser(
+                    self.checker_config.instr_kind_enum,
+                    self.checker_config.injection_kind_enum,
+                    trace_start_step(arguments),
+                    is_trace_sparse(arguments),
+                )
+            )
             .execute()
         )
 
@@ -245,6 +303,11 @@ class CheckerCore(ABC, Generic[InstrKind, InjectionKind]):
     def zkvm_dir(self) -> Path:
         return self.__zkvm_dir
 
+    @property
+    def host_executable(self) -> Path | None:
+        """Host executable of the last successful build, if it could be determined"""
+        return self.__host_executable
+
     @property
     def active_finding(self) -> ParsedFinding:
         assert self.__active_finding, "no active finding"
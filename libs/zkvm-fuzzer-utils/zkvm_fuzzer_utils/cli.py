@@ -5,7 +5,12 @@ from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+from zkvm_fuzzer_utils.build_cache import BuildCache
+from zkvm_fuzzer_utils.common import DEFAULT_STEP_BOUND, StepOverflow
 from zkvm_fuzzer_utils.file import create_dir
+from zkvm_fuzzer_utils.git import git_head_revision
+from zkvm_fuzzer_utils.injection import InjectionSampling, injection_sampling_from_str
+from zkvm_fuzzer_utils.rust.cargo import rust_toolchain_versions
 
 
 class FuzzerClient(ABC):
@@ -31,6 +36,24 @@ class FuzzerClient(ABC):
     only_modify_word: bool
     no_inline_assembly: bool
     no_schedular: bool
+    batch_execution: bool
+    server_execution: bool
+    fork_server_execution: bool
+    parallel_executions: int
+    memory_budget: int | None
+    build_ahead: bool
+    binary_trace: bool
+    trace_suffix: int | None
+    trace_circuits_only: bool
+    injection_sampling: InjectionSampling
+    injections_per_trace: int
+    step_bound: int
+    step_overflow: StepOverflow
+    cgroup_root: Path | None
+    cgroup_cpus: float | None
+    build_cache_dir: Path | None
+    build_cache_quota: int
+    shared_target_dir: Path | None
 
     argument_parser: argparse.ArgumentParser
     args: argparse.Namespace
@@ -59,6 +82,24 @@ class FuzzerClient(ABC):
         self.only_modify_word = False
         self.no_inline_assembly = False
         self.no_schedular = False
+        self.batch_execution = False
+        self.server_execution = False
+        self.fork_server_execution = False
+        self.parallel_executions = 1
+        self.memory_budget = None
+        self.build_ahead = False
+        self.binary_trace = False
+        self.trace_suffix = None
+        self.trace_circuits_only = False
+        self.injection_sampling = InjectionSampling()
+        self.injections_per_trace = 1
+        self.step_bound = DEFAULT_STEP_BOUND
+        self.step_overflow = StepOverflow.PANIC
+        self.cgroup_root = None
+        self.cgroup_cpus = None
+        self.build_cache_dir = None
+        self.build_cache_quota = 10240
+        self.shared_target_dir = None
         self.argument_parser = self.generate_parser()
         self.args = argparse.Namespace()  # default empty namespace
 
@@ -178,6 +219,26 @@ class FuzzerClient(ABC):
             "-z", "--zkvm", metavar="ZKVM_DIR", type=str, help="path to the zkvm repository"
         )
 
+    def add_shared_parser_flags_build(self, subparser: argparse.ArgumentParser):
+        subparser.add_argument(
+            "--build-cache",
+            metavar="CACHE_DIR",
+            type=str,
+            help="reuses the build artifacts of identical projects from this directory",
+        )
+        subparser.add_argument(
+            "--build-cache-quota",
+            type=int,
+            default=self.build_cache_quota,
+            help="disk quota in MB of the build cache",
+        )
+        subparser.add_argument(
+            "--shared-target-dir",
+            metavar="TARGET_DIR",
+            type=str,
+            help="shares the compiled dependencies with concurrent fuzzers using this directory",
+        )
+
     def generate_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(
             prog=f"{self.backend_name} Fuzzer",
@@ -223,8 +284,91 @@ class FuzzerClient(ABC):
             action="store_true",
             help="disables instruction schedular for injections and picks instructions at random",
         )
+        fuzzer_subparser.add_argument(
+            "--batch-execution",
+            action="store_true",
+            help="executes all input iterations without injection in a single host process",
+        )
+        fuzzer_subparser.add_argument(
+            "--server-execution",
+            action="store_true",
+            help="keeps the host process alive and sends every execution as request",
+        )
+        fuzzer_subparser.add_argument(
+            "--fork-server-execution",
+            action="store_true",
+            help="like --server-execution, but forks an isolated host process per request",
+        )
+        fuzzer_subparser.add_argument(
+            "--parallel-executions",
+            type=int,
+            default=1,
+            help="maximal number of concurrent host executions",
+        )
+        fuzzer_subparser.add_argument(
+            "--memory-budget",
+            type=int,
+            help="memory budget in MB shared by all concurrent host executions",
+        )
+        fuzzer_subparser.add_argument(
+            "--build-ahead",
+            action="store_true",
+            help="creates and builds the next project in the background during execution",
+        )
+        fuzzer_subparser.add_argument(
+            "--binary-trace",
+            action="store_true",
+            help="receives the trace steps as binary records instead of parsing the stdout",
+        )
+        fuzzer_subparser.add_argument(
+            "--trace-suffix",
+            type=int,
+            help="injection runs only trace the given number of steps before the injection",
+        )
+        fuzzer_subparser.add_argument(
+            "--trace-circuits-only",
+            action="store_true",
+            help="only traces and injects the circuit functions found in the guest ELF",
+        )
+        fuzzer_subparser.add_argument(
+            "--injection-sampling",
+            type=injection_sampling_from_str,
+            default=InjectionSampling(),
+            help="iterations traced and injected, 'all', '<k>/<n>' or a probability",
+        )
+        fuzzer_subparser.add_argument(
+            "--injections-per-trace",
+            type=int,
+            default=1,
+            help="number of injection runs drawn from every traced execution",
+        )
+        fuzzer_subparser.add_argument(
+            "--step-bound",
+            type=int,
+            default=DEFAULT_STEP_BOUND,
+            help="number of steps after which an execution is considered endless",
+        )
+        fuzzer_subparser.add_argument(
+            "--step-overflow",
+            type=StepOverflow,
+            default=StepOverflow.PANIC,
+            choices=list(StepOverflow),
+            help="behavior of an execution exceeding the step bound",
+        )
+        fuzzer_subparser.add_argument(
+            "--cgroup-root",
+            metavar="CGROUP_DIR",
+            type=str,
+            help="runs every build and execution in its own cgroup below this cgroup v2 directory",
+        )
+        fuzzer_subparser.add_argument(
+            "--cgroup-cpus",
+            type=float,
+            help="number of cpus a build or execution in a cgroup may use",
+        )
         self.add_shared_parser_flags_logging(fuzzer_subparser)
         self.add_shared_parser_flags_runtime(fuzzer_subparser)
+        self.add_shared_parser_flags_build(fuzzer_subparser)
 
         # ---------------------------------- checker --------------------------------- #
 
@@ -234,6 +378,7 @@ class FuzzerClient(ABC):
         check_subparser.add_argument("csv_file", help="Path to the CSV Bug Finding file")
         self.add_shared_parser_flags_logging(check_subparser)
         self.add_shared_parser_flags_runtime(check_subparser)
+        self.add_shared_parser_flags_build(check_subparser)
 
         # --------------------------------- generator -------------------------------- #
 
@@ -282,6 +427,14 @@ class FuzzerClient(ABC):
             # do not use inline assembly
             self.no_inline_assembly = self.args.no_inline_assembly
 
+        # run and check build artifact cache and shared compilation
+        if self.args.command in ["run", "check"]:
+            if self.args.build_cache:
+                self.build_cache_dir = Path(self.args.build_cache).absolute()
+            self.build_cache_quota = self.args.build_cache_quota
+            if self.args.shared_target_dir:
+                self.shared_target_dir = Path(self.args.shared_target_dir).absolute()
+
         # execute client behavior
         match self.args.command:
             case "install":
@@ -294,6 +447,22 @@ class FuzzerClient(ABC):
                 )
                 self.timeout = self.args.timeout
                 self.no_schedular = self.args.no_schedular
+                self.batch_execution = self.args.batch_execution
+                self.server_execution = self.args.server_execution
+                self.fork_server_execution = self.args.fork_server_execution
+                self.parallel_executions = self.args.parallel_executions
+                self.memory_budget = self.args.memory_budget
+                self.build_ahead = self.args.build_ahead
+                self.binary_trace = self.args.binary_trace
+                self.trace_suffix = self.args.trace_suffix
+                self.trace_circuits_only = self.args.trace_circuits_only
+                self.injection_sampling = self.args.injection_sampling
+                self.injections_per_trace = self.args.injections_per_trace
+                self.step_bound = self.args.step_bound
+                self.step_overflow = self.args.step_overflow
+                if self.args.cgroup_root:
+                    self.cgroup_root = Path(self.args.cgroup_root).absolute()
+                self.cgroup_cpus = self.args.cgroup_cpus
                 self.run()
             case "check":
                 self.findings_csv = self.extract_findings_csv()
@@ -332,6 +501,47 @@ class FuzzerClient(ABC):
     def is_no_schedular(self) -> bool:
         return self.no_schedular
 
+    @property
+    def is_batch_execution(self) -> bool:
+        return self.batch_execution
+
+    @property
+    def is_server_execution(self) -> bool:
+        return self.server_execution
+
+    @property
+    def is_fork_server_execution(self) -> bool:
+        return self.fork_server_execution
+
+    @property
+    def is_build_ahead(self) -> bool:
+        return self.build_ahead
+
+    @property
+    def is_binary_trace(self) -> bool:
+        return self.binary_trace
+
+    @property
+    def is_trace_circuits_only(self) -> bool:
+        return self.trace_circuits_only
+
+    def create_build_cache(self) -> BuildCache | None:
+        """Returns the build cache if enabled. Entries are specific to the zkvm
+        installation, its checked out revision and the rust toolchain building the project."""
+        if self.build_cache_dir is None:
+            return None
+        assert self.zkvm_dir, "no zkvm library"
+        return BuildCache(
+            self.build_cache_dir,
+            self.build_cache_quota * 1024 * 1024,
+            [
+                f"{self.zkvm_dir}",
+                self.commit_or_branch,
+                git_head_revision(self.zkvm_dir) or "",
+            ]
+            + rust_toolchain_versions(self.out_dir or Path.cwd()),
+        )
+
     @abstractmethod
     def install(self):
         raise NotImplementedError()
@@ -1,18 +1,45 @@
+import codecs
+import contextlib
 import logging
 import os
 import re
 import resource
+import selectors
+import signal
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Iterator, Protocol
+from uuid import uuid4
 
-import psutil
+from zkvm_fuzzer_utils.stream import (
+    OUTPUT_CHUNK_SIZE,
+    STDERR,
+    STDOUT,
+    AbortPredicate,
+    first_abort_reason,
+)
 
 logger = logging.getLogger("fuzzer")
 
+# seconds a terminated process group has to exit before it is killed
+PROCESS_TERMINATE_GRACE_PERIOD = 5.0
+
+# seconds between two probes of a process group that is expected to exit
+PROCESS_GROUP_POLL_INTERVAL = 0.01
+
+# cgroup v2 controllers required by the cgroups of sandboxed commands
+CGROUP_CONTROLLERS = ["memory", "cpu"]
+
+# period of the cpu bandwidth limit of a sandboxed command in microseconds
+CGROUP_CPU_PERIOD = 100_000
+
+# shell moving itself into the cgroup passed as `$0` before it executes the command
+CGROUP_EXEC_WRAPPER = ["sh", "-c", 'echo $$ > "$0/cgroup.procs" && exec "$@"']
+
 # ---------------------------------------------------------------------------- #
 #                               Helper Functions                               #
 # ---------------------------------------------------------------------------- #
@@ -55,13 +82,15 @@ def stdout_and_stderr_to_printable(
 # ---------------------------------------------------------------------------- #
 
 
-def generate_preexec_fn_memory_limit(limit_memory: int | None) -> Callable[[], Any] | None:
+def limit_process_memory(pid: int, limit_memory: int | None):
+    """Limits the virtual memory of a spawned process in MB. The limit is applied after
+    the spawn instead of by a `preexec_fn`, which would force the slow and thread unsafe
+    fork path of `subprocess`. Memory mapped before the limit was applied is kept."""
     if limit_memory is None:
-        return None
+        return
     max_virtual_memory = limit_memory * 1024 * 1024  # limit_memory in MB
-    return lambda: resource.setrlimit(
-        resource.RLIMIT_AS, (max_virtual_memory, resource.RLIM_INFINITY)
-    )
+    with contextlib.suppress(ProcessLookupError):  # NOTE: the process already exited
+        resource.prlimit(pid, resource.RLIMIT_AS, (max_virtual_memory, resource.RLIM_INFINITY))
 
 
 # ---------------------------------------------------------------------------- #
@@ -72,11 +101,50 @@ def remove_ansi_escape_sequences(string: str) -> str:
     return ansi_escape_pattern.sub("", string)
 
 
+# ---------------------------------------------------------------------------- #
+#                                Output Consumer                               #
+# ---------------------------------------------------------------------------- #
+
+
+class OutputConsumer(Protocol):
+    """Receives the printable output of a command chunk by chunk while it is running"""
+
+    def feed_stdout(self, chunk: str): ...
+
+    def feed_stderr(self, chunk: str): ...
+
+    def finish(self): ...
+
+
 # ---------------------------------------------------------------------------- #
 #                            Execution Status Class                            #
 # ---------------------------------------------------------------------------- #
 
 
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Resources accounted by the cgroup of a sandboxed command and all of its processes"""
+
+    memory_peak: int | None  # in bytes, `None` if the kernel does not record the peak
+    cpu_time: float  # user and system time in seconds
+    oom_kills: int
+
+    def is_oom_killed(self) -> bool:
+        return self.oom_kills > 0
+
+    def combine(self, other: "ResourceUsage") -> "ResourceUsage":
+        """Accumulates the usage of two commands, the memory peak is the larger one"""
+        memory_peaks = [p for p in (self.memory_peak, other.memory_peak) if p is not None]
+        return ResourceUsage(
+            max(memory_peaks, default=None),
+            self.cpu_time + other.cpu_time,
+            self.oom_kills + other.oom_kills,
+        )
+
+
+# ---------------------------------------------------------------------------- #
+
+
 @dataclass
 class ExecStatus:
     command: str
@@ -89,9 +157,20 @@ class ExecStatus:
     is_timeout: bool = False
     env: dict[str, str] | None = None
     cwd: Path | None = None
+    trace_raw: bytes | None = None  # records of a binary trace channel, if any
+    output_consumer: OutputConsumer | None = None  # consumed the output live, if any
+    abort_reason: str | None = None  # reason of an early termination, if any
+    resource_usage: ResourceUsage | None = None  # accounted by a cgroup sandbox, if any
 
     def is_failure(self):
-        return not self.returncode == 0
+        # NOTE: an aborted command did not run to completion, whatever it returned
+        return not self.returncode == 0 or self.is_aborted()
+
+    def is_aborted(self) -> bool:
+        return self.abort_reason is not None
+
+    def is_oom_killed(self) -> bool:
+        return self.resource_usage is not None and self.resource_usage.is_oom_killed()
 
     def is_failure_strict(self):
         return self.is_failure() or len(self.stderr) > 0
@@ -119,11 +198,391 @@ time: {self.delta_time}s
         return "\n".join(script_lines)
 
 
+# ---------------------------------------------------------------------------- #
+#                                Process Groups                                #
+# ---------------------------------------------------------------------------- #
+
+
+def signal_process_group(pgid: int, sig: int) -> bool:
+    """Sends the signal to every process of the group. Returns `False` if the group has
+    no process left, the signal `0` only probes the group."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # NOTE: a member changed its credentials, the others received the signal
+    return True
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def reap_process_group(pgid: int):
+    """Reaps the exited processes of the group that became children of this process,
+    e.g. orphans if the fuzzer runs as init of a container. Must not be called before
+    the group leader was reaped by its `Popen`, which would lose its returncode."""
+    with contextlib.suppress(ChildProcessError):
+        while os.waitpid(-pgid, os.WNOHANG)[0] > 0:
+            pass
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def open_pidfd(pid: int) -> int | None:
+    """Returns a pidfd of the process, which is readable once the process exited, or
+    `None` if the kernel or platform does not support it."""
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def wait_for_exit(process: subprocess.Popen, timeout: float) -> bool:
+    """Waits up to `timeout` seconds for the process to exit and reaps it. Returns `True`
+    if the process exited. The wait blocks on a pidfd if supported instead of polling."""
+
+    if process.poll() is not None:
+        return True
+    pidfd = open_pidfd(process.pid)
+    if pidfd is None:
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            is_exited = len(selector.select(timeout)) > 0
+    finally:
+        os.close(pidfd)
+    if is_exited:
+        process.wait()
+    return is_exited
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def terminate_process_group(
+    process: subprocess.Popen, grace_period: float = PROCESS_TERMINATE_GRACE_PERIOD
+):
+    """Terminates the process group led by the process, i.e. the process and all of its
+    descendants that did not start their own session. The group is killed if the process
+    does not exit within the grace period or once it exited."""
+
+    # NOTE: the process itself is reaped by `Popen` to keep its returncode
+    if process.poll() is None:
+        signal_process_group(process.pid, signal.SIGTERM)
+        wait_for_exit(process, grace_period)
+    signal_process_group(process.pid, signal.SIGKILL)
+    process.wait()
+    reap_process_group(process.pid)
+
+
+def cleanup_process_group(
+    process: subprocess.Popen, grace_period: float = PROCESS_TERMINATE_GRACE_PERIOD
+):
+    """Terminates the processes left in the group of an exited process, e.g. daemonized
+    grandchildren. A single `killpg` probes the group, so an empty group costs nothing.
+    Processes that are alive after the grace period are killed."""
+
+    assert process.returncode is not None, "process group leader was not reaped"
+    pgid = process.pid
+    if not signal_process_group(pgid, signal.SIGTERM):
+        return
+    logger.debug(f"terminate remaining processes of group {pgid} ...")
+    deadline = time.time() + grace_period
+    while True:
+        reap_process_group(pgid)
+        if not signal_process_group(pgid, 0):
+            return
+        if time.time() >= deadline:
+            break
+        time.sleep(PROCESS_GROUP_POLL_INTERVAL)
+    logger.debug(f"kill remaining processes of group {pgid}")
+    signal_process_group(pgid, signal.SIGKILL)
+    reap_process_group(pgid)
+
+
+# ---------------------------------------------------------------------------- #
+
+
+class ProcessGroupTracker:
+    """Tracks the process groups of commands running in other threads, so they can be
+    killed from the outside, e.g. as a command in its own session does not receive the
+    Ctrl-C of the fuzzer. Once killed, the groups of later commands are killed on start.
+
+    NOTE: The thread running a command still reaps it and cleans up its group.
+    """
+
+    __lock: threading.Lock
+    __processes: set[subprocess.Popen]
+    __is_killed: bool
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__processes = set()
+        self.__is_killed = False
+
+    def track(self, process: subprocess.Popen):
+        with self.__lock:
+            self.__processes.add(process)
+            if self.__is_killed:
+                signal_process_group(process.pid, signal.SIGKILL)
+
+    def untrack(self, process: subprocess.Popen):
+        with self.__lock:
+            self.__processes.discard(process)
+
+    def kill(self):
+        """Kills the process groups of all running and future commands"""
+        with self.__lock:
+            self.__is_killed = True
+            for process in self.__processes:
+                logger.debug(f"kill process group {process.pid}")
+                signal_process_group(process.pid, signal.SIGKILL)
+
+    @property
+    def is_killed(self) -> bool:
+        return self.__is_killed
+
+
+# ---------------------------------------------------------------------------- #
+#                                Cgroup Sandbox                                #
+# ---------------------------------------------------------------------------- #
+
+
+def prepare_cgroup_root(root: Path):
+    """Enables the controllers required by sandboxed commands for the children of the
+    delegated cgroup v2 directory `root`, which must not contain processes itself. A
+    `ValueError` is raised if this is not possible."""
+
+    controllers_file = root / "cgroup.controllers"
+    if not controllers_file.is_file():
+        raise ValueError(f"'{root}' is no cgroup v2 directory")
+    available = controllers_file.read_text().split()
+    missing = [controller for controller in CGROUP_CONTROLLERS if controller not in available]
+    if len(missing) > 0:
+        raise ValueError(f"cgroup controllers {missing} are not delegated to '{root}'")
+    subtree_control_file = root / "cgroup.subtree_control"
+    if all(c in subtree_control_file.read_text().split() for c in CGROUP_CONTROLLERS):
+        return
+    try:
+        subtree_control_file.write_text(" ".join(f"+{c}" for c in CGROUP_CONTROLLERS))
+    except OSError as e:
+        raise ValueError(f"unable to enable the cgroup controllers of '{root}': {e}") from e
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def read_cgroup_keyed_file(path: Path) -> dict[str, int]:
+    """Reads a flat keyed cgroup file, e.g. `cpu.stat`. A missing file is empty."""
+    try:
+        lines = path.read_text().splitlines()
+    except FileNotFoundError:
+        return {}
+    entries = {}
+    for line in lines:
+        key, _, value = line.partition(" ")
+        if value.strip().isdigit():
+            entries[key] = int(value)
+    return entries
+
+
+def read_cgroup_usage(cgroup: Path) -> ResourceUsage:
+    """Reads the resources used by all processes that ever ran in the cgroup"""
+    memory_peak = None
+    with contextlib.suppress(FileNotFoundError, ValueError):  # NOTE: requires Linux 5.19
+        memory_peak = int((cgroup / "memory.peak").read_text())
+    cpu_stat = read_cgroup_keyed_file(cgroup / "cpu.stat")
+    memory_events = read_cgroup_keyed_file(cgroup / "memory.events")
+    return ResourceUsage(
+        memory_peak, cpu_stat.get("usage_usec", 0) / 1_000_000, memory_events.get("oom_kill", 0)
+    )
+
+
+# ---------------------------------------------------------------------------- #
+
+
+class CgroupSandbox:
+    """Runs every command in a transient cgroup below a delegated cgroup v2 directory,
+    prepared by `prepare_cgroup_root`. The cgroup caps the memory and cpu of the command
+    and accounts the resources of all of its processes. No systemd is required."""
+
+    __root: Path
+    __memory: int | None
+    __cpus: float | None
+
+    def __init__(self, root: Path, memory: int | None = None, cpus: float | None = None):
+        self.__root = root
+        self.__memory = memory
+        self.__cpus = cpus
+
+    @property
+    def root(self) -> Path:
+        return self.__root
+
+    @property
+    def memory(self) -> int | None:
+        """Memory limit of a command in MB, `None` if unlimited"""
+        return self.__memory
+
+    @property
+    def cpus(self) -> float | None:
+        """Number of cpus a command may use, `None` if unlimited"""
+        return self.__cpus
+
+    def create_cgroup(self) -> Path:
+        cgroup = self.__root / f"exec-{uuid4().hex}"
+        cgroup.mkdir()
+        try:
+            if self.__memory is not None:
+                (cgroup / "memory.max").write_text(f"{self.__memory * 1024 * 1024}")
+                # NOTE: an out of memory event kills the whole command, not a single process
+                (cgroup / "memory.oom.group").write_text("1")
+            if self.__cpus is not None:
+                quota = max(1000, int(self.__cpus * CGROUP_CPU_PERIOD))
+                (cgroup / "cpu.max").write_text(f"{quota} {CGROUP_CPU_PERIOD}")
+        except BaseException:
+            self.remove_cgroup(cgroup)
+            raise
+        return cgroup
+
+    def remove_cgroup(self, cgroup: Path, grace_period: float = PROCESS_TERMINATE_GRACE_PERIOD):
+        """Kills the processes left in the cgroup, e.g. ones that started their own
+        session, and removes the cgroup once they exited"""
+
+        kill_file = cgroup / "cgroup.kill"
+        if kill_file.is_file():  # NOTE: requires Linux 5.14
+            with contextlib.suppress(OSError):
+                kill_file.write_text("1")
+        deadline = time.time() + grace_period
+        while True:
+            try:
+                cgroup.rmdir()
+                return
+            except FileNotFoundError:
+                return
+            except OSError as e:  # NOTE: busy until the killed processes exited
+                if time.time() >= deadline:
+                    logger.warning(f"unable to remove cgroup {cgroup}: {e}")
+                    return
+            time.sleep(PROCESS_GROUP_POLL_INTERVAL)
+
+    @contextlib.contextmanager
+    def cgroup(self) -> Iterator[Path]:
+        """Provides a new cgroup, which is removed when the context is left"""
+        cgroup = self.create_cgroup()
+        try:
+            yield cgroup
+        finally:
+            self.remove_cgroup(cgroup)
+
+
+def wrap_command_in_cgroup(cgroup: Path, command: list[str]) -> list[str]:
+    """Returns the command joining the cgroup before it executes, so none of its
+    processes runs outside of the cgroup and no `preexec_fn` is required"""
+    return CGROUP_EXEC_WRAPPER + [f"{cgroup}"] + command
+
+
 # ---------------------------------------------------------------------------- #
 #                       Core Command Invocation Function                       #
 # ---------------------------------------------------------------------------- #
 
 
+def combine_environment(env: dict[str, str] | None) -> dict[str, str] | None:
+    """Returns the current environment extended by `env` or `None` if nothing is added."""
+    if env is None:
+        return None
+    combined_env = os.environ.copy()
+    for key in env:
+        combined_env[key] = env[key]
+    return combined_env
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def stream_process_output(
+    process: subprocess.Popen,
+    consumer: OutputConsumer | None,
+    timeout: float | None,
+    abort_predicates: list[AbortPredicate] | None = None,
+) -> tuple[bytes, bytes, bool, str | None]:
+    """Reads stdout and stderr of the process until both are closed and feeds the printable
+    chunks to the consumer and the abort predicates as they arrive. The process group is
+    terminated if the timeout expires or a predicate fires, afterwards the remaining output
+    is drained until both are closed, at most for the grace period. Returns the raw stdout,
+    stderr, whether the timeout expired and the reason of the first fired predicate."""
+
+    assert process.stdin and process.stdout and process.stderr, "missing pipes"
+    process.stdin.close()  # NOTE: same as `subprocess.run` without input
+
+    start_time = time.time()
+    drain_deadline = None
+    is_timeout = False
+    abort_reason = None
+    stdout_buffer = bytearray()
+    stderr_buffer = bytearray()
+    feed_stdout = None if consumer is None else consumer.feed_stdout
+    feed_stderr = None if consumer is None else consumer.feed_stderr
+    streams = {
+        process.stdout.fileno(): (STDOUT, stdout_buffer, feed_stdout),
+        process.stderr.fileno(): (STDERR, stderr_buffer, feed_stderr),
+    }
+    decoders = {fd: codecs.getincrementaldecoder("utf-8")(errors="ignore") for fd in streams}
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ)
+        selector.register(process.stderr, selectors.EVENT_READ)
+
+        while len(selector.get_map()) > 0:
+            remaining = None
+            if drain_deadline is not None:
+                # NOTE: a pipe may be held open by a process that left the group
+                remaining = drain_deadline - time.time()
+                if remaining <= 0:
+                    break
+            elif timeout is not None:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    is_timeout = True
+                    terminate_process_group(process)
+                    drain_deadline = time.time() + PROCESS_TERMINATE_GRACE_PERIOD
+                    continue
+
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, OUTPUT_CHUNK_SIZE)
+                stream, buffer, feed = streams[key.fd]
+                if not data:
+                    selector.unregister(key.fileobj)
+                buffer.extend(data)
+                chunk = make_printable(decoders[key.fd].decode(data, final=not data))
+                if feed:
+                    feed(chunk)
+                if abort_predicates and abort_reason is None and drain_deadline is None:
+                    abort_reason = first_abort_reason(abort_predicates, stream, chunk)
+
+            if abort_reason is not None and drain_deadline is None:
+                logger.info(f"  => abort: {abort_reason}")
+                terminate_process_group(process)
+                drain_deadline = time.time() + PROCESS_TERMINATE_GRACE_PERIOD
+
+    process.wait()
+    if consumer is not None:
+        consumer.finish()
+    return bytes(stdout_buffer), bytes(stderr_buffer), is_timeout, abort_reason
+
+
+# ---------------------------------------------------------------------------- #
+
+
 def invoke_command(
     command: list[str],
     cwd: Path | None = None,
@@ -131,8 +590,18 @@ def invoke_command(
     timeout: float | None = None,
     memory: int | None = None,
     is_log_debug: bool = True,
-    explicit_clean_zombies=False,
+    output_consumer: OutputConsumer | None = None,
+    abort_predicates: list[AbortPredicate] | None = None,
+    cgroup_sandbox: CgroupSandbox | None = None,
+    process_group_tracker: ProcessGroupTracker | None = None,
 ) -> ExecStatus:
+    """Runs the command to completion and returns its status. If an `output_consumer` is
+    provided, the output is fed to it while the command is running. The command is
+    terminated early once one of the `abort_predicates` fires. The command runs in its
+    own session, so its whole process group is terminated on a timeout and the processes
+    it left behind are cleaned up afterwards, independent of concurrent commands. With a
+    `cgroup_sandbox` the command runs in its own cgroup and its resource usage is kept.
+    The process group is registered at the `process_group_tracker` while it is running."""
 
     # ------------------------- debug initial information ------------------------ #
 
@@ -141,28 +610,21 @@ def invoke_command(
     logger.debug(f"  - env     : {env}")
     logger.debug(f"  - timeout : {timeout}")
     logger.debug(f"  - memory  : {memory}")
+    logger.debug(f"  - cgroup  : {None if cgroup_sandbox is None else cgroup_sandbox.root}")
 
     # ------------ combine current environment with passed environment ----------- #
 
-    combined_env = None
-    if env is not None:
-        combined_env = os.environ.copy()
-        for key in env:
-            combined_env[key] = env[key]
-
-    # ----------------- preprocessing for zombie process cleanup ----------------- #
-
-    pre_call_active_children = None
-    if explicit_clean_zombies:
-        pre_call_active_children = set(p.pid for p in psutil.Process().children(recursive=True))
+    combined_env = combine_environment(env)
 
     # ------------------------------ call subprocess ----------------------------- #
 
-    start_time = time.time()
-    is_timeout = False
-    try:
-        complete_proc = subprocess.run(
-            command,
+    cgroup_context = contextlib.nullcontext() if cgroup_sandbox is None else cgroup_sandbox.cgroup()
+    with cgroup_context as cgroup:
+        start_time = time.time()
+        is_timeout = False
+        abort_reason = None
+        with subprocess.Popen(
+            command if cgroup is None else wrap_command_in_cgroup(cgroup, command),
             close_fds=True,
             shell=False,
             stdin=subprocess.PIPE,
@@ -170,18 +632,37 @@ def invoke_command(
             stderr=subprocess.PIPE,
             bufsize=-1,
             cwd=cwd,
-            preexec_fn=generate_preexec_fn_memory_limit(memory),
-            timeout=timeout,
+            start_new_session=True,
             env=combined_env,
-        )
-        stdout_bytes, stderr_bytes = complete_proc.stdout, complete_proc.stderr
-        returncode = complete_proc.returncode
-    except subprocess.TimeoutExpired as timeErr:
-        stdout_bytes, stderr_bytes = timeErr.stdout, timeErr.stderr
-        returncode = 124  # timeout return status
-        is_timeout = True
-
-    end_time = time.time()
+        ) as process:
+            if process_group_tracker is not None:
+                process_group_tracker.track(process)
+            try:
+                limit_process_memory(process.pid, memory)
+                if output_consumer is None and not abort_predicates:
+                    try:
+                        stdout_bytes, stderr_bytes = process.communicate(timeout=timeout)
+                    except subprocess.TimeoutExpired:
+                        is_timeout = True
+                        terminate_process_group(process)
+                        stdout_bytes, stderr_bytes = process.communicate()
+                else:
+                    stdout_bytes, stderr_bytes, is_timeout, abort_reason = stream_process_output(
+                        process, output_consumer, timeout, abort_predicates
+                    )
+            except BaseException:
+                # NOTE: e.g. a `KeyboardInterrupt`, which the session does not receive
+                terminate_process_group(process)
+                raise
+            finally:
+                if process_group_tracker is not None:
+                    process_group_tracker.untrack(process)
+            if not is_timeout and abort_reason is None:  # otherwise the group was killed
+                cleanup_process_group(process)
+        returncode = 124 if is_timeout else process.returncode  # 124 is the timeout status
+        end_time = time.time()
+        resource_usage = None if cgroup is None else read_cgroup_usage(cgroup)
+
     delta_time = end_time - start_time
 
     # ------------------------------ process output ------------------------------ #
@@ -192,6 +673,8 @@ def invoke_command(
     # --------------------------- debug process output --------------------------- #
 
     logger.info(f"  => exit {returncode}")
+    if resource_usage is not None:
+        logger.debug(f"  - usage   : {resource_usage}")
     if is_log_debug:
         logger.debug("========== START STDOUT ==========")
         logger.debug(stdout)
@@ -214,28 +697,48 @@ def invoke_command(
         is_timeout,
         env,
         cwd,
+        output_consumer=output_consumer,
+        abort_reason=abort_reason,
+        resource_usage=resource_usage,
     )
 
-    # ----------------- postprocessing for zombie process cleanup ---------------- #
+    return status
+
 
-    if explicit_clean_zombies:
-        assert pre_call_active_children is not None, "unexpected value of child process list"
+# ---------------------------------------------------------------------------- #
+#                      Long Running Process Spawn Function                     #
+# ---------------------------------------------------------------------------- #
 
-        post_call_active_children = psutil.Process().children(recursive=True)
-        possible_zombies = [
-            p for p in post_call_active_children if p.pid not in pre_call_active_children
-        ]
 
-        for possible_zombie in possible_zombies:
-            z_pid = possible_zombie.pid
-            logger.debug(f"possible zombie detected, waiting for {z_pid} ...")
-            try:
-                if possible_zombie.status() == psutil.STATUS_ZOMBIE:
-                    possible_zombie.wait()
-                elif possible_zombie.is_running():
-                    possible_zombie.terminate()
-                    possible_zombie.wait(timeout=5)
-            except (psutil.NoSuchProcess, psutil.TimeoutExpired):
-                logger.error(f"unable to clean up possible zombie {z_pid}")
+def spawn_command(
+    command: list[str],
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    memory: int | None = None,
+) -> subprocess.Popen:
+    """Spawns a long running process with piped stdin, stdout and stderr in its own
+    session and returns the process handle without waiting for it. The process group
+    is stopped by `terminate_process_group`."""
 
-    return status
+    logger.info("spawn command: " + " ".join(command))
+    logger.debug(f"  - cwd     : {cwd}")
+    logger.debug(f"  - env     : {env}")
+    logger.debug(f"  - memory  : {memory}")
+
+    process = subprocess.Popen(
+        command,
+        close_fds=True,
+        shell=False,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+        cwd=cwd,
+        start_new_session=True,
+        env=combine_environment(env),
+    )
+    limit_process_memory(process.pid, memory)
+    return process
+
+
+# ---------------------------------------------------------------------------- #
@@ -1,5 +1,6 @@
 import logging
 import re
+from enum import StrEnum
 from random import Random
 
 from circil.fuzzer.config import FuzzerConfig
@@ -136,6 +137,93 @@ def random_inputs(
 # ---------------------------------------------------------------------------- #
 
 
+CIRCUITS_FLAG = "--circuits"
+INPUTS_FLAG = "--inputs"
+GUEST_ELF_FLAG = "--elf"
+TRACE_FLAG = "--trace"
+TRACE_OUTPUT_FLAG = "--trace-output"
+TRACE_FROM_FLAG = "--trace-from"
+TRACE_PC_RANGES_FLAG = "--trace-pc-ranges"
+STEP_BOUND_FLAG = "--step-bound"
+STEP_OVERFLOW_FLAG = "--step-overflow"
+
+# step bound of the endless loop detection of the patched zkvm executors
+DEFAULT_STEP_BOUND = 1_000_000
+
+# only every n-th step past the step bound is traced by `StepOverflow.SAMPLE`
+STEP_OVERFLOW_SAMPLE_STRIDE = 64
+
+# record context printed by a host once an execution exceeds the step bound
+STEP_BOUND_CONTEXT = "Step Bound"
+
+
+class StepOverflow(StrEnum):
+    """Behavior of an execution exceeding the step bound"""
+
+    PANIC = "panic"  # aborts the execution like the endless loop detection
+    STOP_TRACING = "stop-tracing"  # keeps executing and counting without tracing
+    SAMPLE = "sample"  # keeps executing and only traces every n-th step
+
+
+def trace_start_step(arguments: list[str]) -> int:
+    """Returns the first step traced by an execution with the provided arguments"""
+    if TRACE_FROM_FLAG in arguments:
+        return int(arguments[arguments.index(TRACE_FROM_FLAG) + 1])
+    return 0
+
+
+def is_trace_pc_filtered(arguments: list[str]) -> bool:
+    """Returns `True` if an execution with the provided arguments only traces the steps
+    of some pc ranges, so its trace skips steps"""
+    return TRACE_PC_RANGES_FLAG in arguments
+
+
+def is_trace_sparse(arguments: list[str]) -> bool:
+    """Returns `True` if the trace of an execution with the provided arguments skips
+    steps, i.e. it only traces some pc ranges or samples the steps past the step bound"""
+    if TRACE_PC_RANGES_FLAG in arguments:
+        return True
+    if STEP_OVERFLOW_FLAG in arguments:
+        return arguments[arguments.index(STEP_OVERFLOW_FLAG) + 1] == StepOverflow.SAMPLE
+    return False
+
+
+def pc_ranges_to_str(pc_ranges: list[tuple[int, int]]) -> str:
+    """Converts [start, end) pc ranges into the value of `TRACE_PC_RANGES_FLAG`, e.g.
+    `0x200c-0x2100,0x2200-0x2310`."""
+    return ",".join(f"{start:#x}-{end:#x}" for start, end in pc_ranges)
+
+
+def convert_input_to_typed_vector(circuit: Circuit, inputs: dict[str, bool | int]) -> str:
+    """Converts the inputs into the typed input vector of the host, e.g. `u32:5,bool:1`."""
+
+    values = []
+    for e in circuit.inputs:
+        assert e.name in inputs, f"missing input '{e.name}'"
+        match e.ty_hint:
+            case IRType.Bool:
+                values.append(f"bool:{int(bool(inputs[e.name]))}")
+            case IRType.Field:
+                values.append(f"u32:{inputs[e.name]}")
+            case _:
+                raise NotImplementedError(f"unknown IRType '{e.ty_hint}'")
+    return ",".join(values)
+
+
+def convert_input_to_typed_flags(
+    circuit: Circuit, inputs: dict[str, bool | int], circuit_count: int
+) -> list[str]:
+    """Converts the inputs into the bundle independent host flags. The host writes the typed
+    input vector once for each of the `circuit_count` circuits of the bundle.
+    """
+
+    flags = [CIRCUITS_FLAG, str(circuit_count)]
+    typed_vector = convert_input_to_typed_vector(circuit, inputs)
+    if typed_vector:
+        flags += [INPUTS_FLAG, typed_vector]
+    return flags
+
+
 def convert_input_to_flags(circuit: Circuit, inputs: dict[str, bool | int]) -> list[str]:
     flags = []
     for e in circuit.inputs:
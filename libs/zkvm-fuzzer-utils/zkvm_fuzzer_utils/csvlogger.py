@@ -5,10 +5,11 @@ from pathlib import Path
 from uuid import UUID
 
 from zkvm_fuzzer_utils.circil import Circuit
-from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.cmd import ExecStatus, ResourceUsage
 from zkvm_fuzzer_utils.common import to_clean_quoted_entry, validate_circuits_arguments
 from zkvm_fuzzer_utils.record import Record
 from zkvm_fuzzer_utils.trace import Trace
+from zkvm_fuzzer_utils.trace_diff import TraceDiff, context_as_str, diff_traces
 
 logger = logging.getLogger("fuzzer")
 
@@ -18,12 +19,46 @@ logger = logging.getLogger("fuzzer")
 
 PANIC_MESSAGE_MAX_LINE = 150
 
+# NOTE: csv files whose header was checked, so it is only read once per file
+_PREPARED_CSV_FILES: set[Path] = set()
+
 
 def _process_panic_message(message: str) -> str:
     result = to_clean_quoted_entry(message, max_msg_len=PANIC_MESSAGE_MAX_LINE)
     return result
 
 
+def _prepare_csv(csv_file: Path, header: str):
+    """Creates the csv file with the header if it does not exist. An existing file with
+    another header (e.g. written by a previous fuzzer version) is rotated to a timestamp
+    suffixed name first, as new rows would not align with its columns."""
+
+    if csv_file in _PREPARED_CSV_FILES and csv_file.is_file():
+        return
+    if csv_file.is_file():
+        with open(csv_file) as fp:
+            existing_header = fp.readline().rstrip("\n")
+        if existing_header == header:
+            _PREPARED_CSV_FILES.add(csv_file)
+            return
+        timestamp = int(datetime.now().timestamp())
+        rotated_csv = csv_file.with_name(f"{csv_file.name}.{timestamp}")
+        logger.warning(f"columns of log file {csv_file} changed, rotate it to {rotated_csv}")
+        csv_file.rename(rotated_csv)
+    logger.info(f"create log file: {csv_file}")
+    with open(csv_file, "w") as fp:
+        fp.write(header + "\n")
+    _PREPARED_CSV_FILES.add(csv_file)
+
+
+def _resource_usage_entries(resource_usage: ResourceUsage | None) -> str:
+    """Returns the memory peak, cpu time and oom kills entries, empty without a cgroup"""
+    if resource_usage is None:
+        return ",,"
+    memory_peak = "" if resource_usage.memory_peak is None else f"{resource_usage.memory_peak}"
+    return f"{memory_peak},{resource_usage.cpu_time},{resource_usage.oom_kills}"
+
+
 # ---------------------------------------------------------------------------- #
 #                                 Circuit Helper                               #
 # ---------------------------------------------------------------------------- #
@@ -64,25 +99,23 @@ def log_normal_csv(
 ):
     normal_csv = project_dir.parent.absolute() / "normal.csv"
 
-    if not normal_csv.is_file():
-        logger.info(f"create log file: {normal_csv}")
-        with open(normal_csv, "w") as fp:
-            fp.write(
-                "fuzzer_id,"
-                "run_id,"
-                "iteration_id,"
-                "timestamp,"
-                "execution_exitcode,"
-                "execution_time,"
-                "execution_is_timeout,"
-                "last_context,"
-                "panic_message,"
-                "panic_location,"
-                "circuits_accumulated_size,"
-                "circuits_count,"
-                "circuits_inputs,"
-                "circuits_outputs\n"
-            )
+    _prepare_csv(
+        normal_csv,
+        "fuzzer_id,"
+        "run_id,"
+        "iteration_id,"
+        "timestamp,"
+        "execution_exitcode,"
+        "execution_time,"
+        "execution_is_timeout,"
+        "last_context,"
+        "panic_message,"
+        "panic_location,"
+        "circuits_accumulated_size,"
+        "circuits_count,"
+        "circuits_inputs,"
+        "circuits_outputs",
+    )
 
     last_context = ""
     last_record_entry = record.get_last_entry()
@@ -145,11 +178,7 @@ def log_summary_csv(
     sorted_instructions = sorted(all_available_instructions)
     recorded_instructions = trace.as_instruction_to_count()
 
-    if not summary_csv.is_file():
-        logger.info(f"create log file: {summary_csv}")
-        with open(summary_csv, "w") as fp:
-            fp.write("fuzzer_id,run_id,iteration_id,")
-            fp.write(",".join([e for e in sorted_instructions]) + "\n")
+    _prepare_csv(summary_csv, ",".join(["fuzzer_id,run_id,iteration_id"] + sorted_instructions))
 
     with open(summary_csv, "a") as fp:
         fp.write(f"{fuzzer_id},{run_id},{iteration_id},")
@@ -164,41 +193,50 @@ def log_injection_csv(
     fuzzer_id: UUID,
     run_id: int,
     iteration_id: int,
+    injection_index: int,
     record: Record,
     injection_trace: Trace,
     original_trace: Trace,
     is_correct_output: bool,
     opt_circuit_data: CircuitDataHelper | None = None,
+    opt_trace_diff: TraceDiff | None = None,
 ):
+    """Logs an injection run. The trace diff is computed if not provided."""
+
     injection_csv = project_dir.parent.absolute() / "injection.csv"
 
-    if not injection_csv.is_file():
-        logger.info(f"create log file: {injection_csv}")
-        with open(injection_csv, "w") as fp:
-            fp.write(
-                "fuzzer_id,"
-                "run_id,"
-                "iteration_id,"
-                "timestamp,"
-                "execution_exitcode,"
-                "execution_time,"
-                "execution_is_timeout,"
-                "execution_is_correct_output,"
-                "last_context,"
-                "panic_message,"
-                "panic_location,"
-                "circuits_accumulated_size,"
-                "circuits_inputs,"
-                "circuits_outputs,"
-                "fault_original_trace_size,"
-                "fault_injection_trace_size,"
-                "fault_injection_step,"
-                "fault_injection_pc,"
-                "fault_injection_kind,"
-                "fault_injection_info,"
-                "fault_injection_instruction,"
-                "fault_original_instruction\n"
-            )
+    _prepare_csv(
+        injection_csv,
+        "fuzzer_id,"
+        "run_id,"
+        "iteration_id,"
+        "timestamp,"
+        "execution_exitcode,"
+        "execution_time,"
+        "execution_is_timeout,"
+        "execution_is_correct_output,"
+        "last_context,"
+        "panic_message,"
+        "panic_location,"
+        "circuits_accumulated_size,"
+        "circuits_inputs,"
+        "circuits_outputs,"
+        "fault_original_trace_size,"
+        "fault_injection_trace_size,"
+        "fault_injection_step,"
+        "fault_injection_pc,"
+        "fault_injection_kind,"
+        "fault_injection_info,"
+        "fault_injection_instruction,"
+        "fault_original_instruction,"
+        "trace_diff_first_step,"
+        "trace_diff_count,"
+        "trace_diff_range_count,"
+        "trace_diff_ranges,"
+        "trace_diff_original_context,"
+        "trace_diff_injection_context,"
+        "injection_index",
+    )
 
     last_context = ""
     last_record_entry = record.get_last_entry()
@@ -248,6 +286,16 @@ def log_injection_csv(
     original_trace_size = len(original_trace.steps)
     injection_trace_size = len(injection_trace.steps)
 
+    trace_diff = opt_trace_diff or diff_traces(original_trace, injection_trace)
+    trace_diff_first_step = ""
+    if trace_diff.first_divergence is not None:
+        trace_diff_first_step = f"{trace_diff.first_divergence}"
+    trace_diff_ranges = trace_diff.ranges_as_str()
+    trace_diff_original_context = to_clean_quoted_entry(context_as_str(trace_diff.original_context))
+    trace_diff_injection_context = to_clean_quoted_entry(
+        context_as_str(trace_diff.injection_context)
+    )
+
     unix_timestamp = int(datetime.now().timestamp())
 
     with open(injection_csv, "a") as fp:
@@ -274,44 +322,93 @@ def log_injection_csv(
             f"{injection_kind},"
             f"{injection_info},"
             f"{injection_instr},"
-            f"{original_instr}\n"
+            f"{original_instr},"
+            f"{trace_diff_first_step},"
+            f"{trace_diff.count},"
+            f"{trace_diff.range_count},"
+            f"{trace_diff_ranges},"
+            f"{trace_diff_original_context},"
+            f"{trace_diff_injection_context},"
+            f"{injection_index}\n"
         )
 
 
 # ---------------------------------------------------------------------------- #
 
 
-def log_build_csv(project_dir: Path, fuzzer_id: UUID, run_id: int, builds: list[ExecStatus]):
+def log_build_csv(
+    project_dir: Path,
+    fuzzer_id: UUID,
+    run_id: int,
+    builds: list[ExecStatus],
+    changed_files: list[Path],
+):
     build_csv = project_dir.parent.absolute() / "build.csv"
 
-    if not build_csv.is_file():
-        logger.info(f"create log file: {build_csv}")
-        with open(build_csv, "w") as fp:
-            fp.write("fuzzer_id,run_id,build_num,build_time,build_success\n")
+    _prepare_csv(
+        build_csv,
+        "fuzzer_id,run_id,build_num,build_time,build_success,"
+        "changed_num,changed_files,"
+        "build_memory_peak,build_cpu_time,build_oom_kills",
+    )
 
     build_num = f"{len(builds)}"
     build_time = 0 if len(builds) == 0 else sum([build.delta_time for build in builds])
     build_success = False if len(builds) == 0 else not any([build.is_failure() for build in builds])
 
+    build_resource_usage = None
+    for build in builds:
+        if build.resource_usage is None:
+            continue
+        if build_resource_usage is None:
+            build_resource_usage = build.resource_usage
+        else:
+            build_resource_usage = build_resource_usage.combine(build.resource_usage)
+
+    # NOTE: paths are relative to the project directory and separated by ';'
+    changed_num = f"{len(changed_files)}"
+    changed_paths = ";".join(
+        [
+            str(path.relative_to(project_dir)) if path.is_relative_to(project_dir) else str(path)
+            for path in changed_files
+        ]
+    )
+
     with open(build_csv, "a") as fp:
-        fp.write(f"{fuzzer_id},{run_id},{build_num},{build_time},{build_success}\n")
+        fp.write(
+            f"{fuzzer_id},{run_id},{build_num},{build_time},{build_success},"
+            f"{changed_num},{changed_paths},"
+            f"{_resource_usage_entries(build_resource_usage)}\n"
+        )
 
 
 # ---------------------------------------------------------------------------- #
 
 
 def log_run_csv(
-    project_dir: Path, fuzzer_id: UUID, run_id: int, iteration_id: int, run_time: float
+    project_dir: Path,
+    fuzzer_id: UUID,
+    run_id: int,
+    iteration_id: int,
+    run_time: float,
+    step_bound_exceeded: int = 0,
+    resource_usage: ResourceUsage | None = None,
 ):
+    """Logs a run, the resource usage accumulates the sandboxed host executions"""
+
     run_csv = project_dir.parent.absolute() / "run.csv"
 
-    if not run_csv.is_file():
-        logger.info(f"create log file: {run_csv}")
-        with open(run_csv, "w") as fp:
-            fp.write("fuzzer_id,run_id,iterations,run_time\n")
+    _prepare_csv(
+        run_csv,
+        "fuzzer_id,run_id,iterations,run_time,step_bound_exceeded,"
+        "execution_memory_peak,execution_cpu_time,execution_oom_kills",
+    )
 
     with open(run_csv, "a") as fp:
-        fp.write(f"{fuzzer_id},{run_id},{iteration_id},{run_time}\n")
+        fp.write(
+            f"{fuzzer_id},{run_id},{iteration_id},{run_time},{step_bound_exceeded},"
+            f"{_resource_usage_entries(resource_usage)}\n"
+        )
 
 
 # ---------------------------------------------------------------------------- #
@@ -332,17 +429,22 @@ def log_pipeline_csv(
             time_data[context] = time
 
     time_data["full"] = f"{record.exec_status.delta_time}"
-    stage_names = time_data.keys()
 
-    if not pipeline_csv.is_file():
-        logger.info(f"create log file: {pipeline_csv}")
-        with open(pipeline_csv, "w") as fp:
-            fp.write("fuzzer_id,run_id,iteration_id,")
-            fp.write(",".join([key for key in stage_names]) + "\n")
+    # NOTE: the stages are fixed by the first record, the values of later records are
+    #       aligned to them by name and stages unknown to the header are dropped
+    if pipeline_csv.is_file():
+        with open(pipeline_csv) as fp:
+            stage_names = fp.readline().rstrip("\n").split(",")[3:]
+    else:
+        stage_names = list(time_data.keys())
+        _prepare_csv(pipeline_csv, ",".join(["fuzzer_id,run_id,iteration_id"] + stage_names))
+    unknown_stage_names = [key for key in time_data if key not in stage_names]
+    if len(unknown_stage_names) > 0:
+        logger.warning(f"drop pipeline stages missing in {pipeline_csv}: {unknown_stage_names}")
 
     with open(pipeline_csv, "a") as fp:
         fp.write(f"{fuzzer_id},{run_id},{iteration_id},")
-        fp.write(",".join([time_data[key] for key in stage_names]) + "\n")
+        fp.write(",".join([time_data.get(key, "") for key in stage_names]) + "\n")
 
 
 # ---------------------------------------------------------------------------- #
@@ -415,19 +517,17 @@ def log_findings_csv(
 ):
     findings_csv = project_dir.parent.absolute() / "findings.csv"
 
-    if not findings_csv.is_file():
-        logger.info(f"create log file: {findings_csv}")
-        with open(findings_csv, "w") as fp:
-            fp.write(
-                "fuzzer_id,"
-                "run_id,"
-                "iteration_id,"
-                "timestamp,"
-                "runtime,"
-                "circuit_seed,"
-                "input_flags,"
-                "is_injection\n"
-            )
+    _prepare_csv(
+        findings_csv,
+        "fuzzer_id,"
+        "run_id,"
+        "iteration_id,"
+        "timestamp,"
+        "runtime,"
+        "circuit_seed,"
+        "input_flags,"
+        "is_injection",
+    )
 
     unix_timestamp = int(datetime.now().timestamp())
     concat_input_flags = " ".join(input_flags)
@@ -450,20 +550,18 @@ def log_findings_csv(
 def create_empty_checked_findings_csv(project_dir: Path):
     checked_findings_csv = project_dir.parent.absolute() / "checked_findings.csv"
 
-    if not checked_findings_csv.is_file():
-        logger.info(f"create log file: {checked_findings_csv}")
-        with open(checked_findings_csv, "w") as fp:
-            fp.write(
-                "fuzzer_id,"
-                "run_id,"
-                "iteration_id,"
-                "timestamp,"
-                "runtime,"
-                "circuit_seed,"
-                "input_flags,"
-                "is_injection,"
-                "fixed\n"
-            )
+    _prepare_csv(
+        checked_findings_csv,
+        "fuzzer_id,"
+        "run_id,"
+        "iteration_id,"
+        "timestamp,"
+        "runtime,"
+        "circuit_seed,"
+        "input_flags,"
+        "is_injection,"
+        "fixed",
+    )
 
 
 # ---------------------------------------------------------------------------- #
@@ -472,20 +570,18 @@ def create_empty_checked_findings_csv(project_dir: Path):
 def log_checked_findings_csv(project_dir: Path, finding: ParsedFinding, fixed: bool):
     checked_findings_csv = project_dir.parent.absolute() / "checked_findings.csv"
 
-    if not checked_findings_csv.is_file():
-        logger.info(f"create log file: {checked_findings_csv}")
-        with open(checked_findings_csv, "w") as fp:
-            fp.write(
-                "fuzzer_id,"
-                "run_id,"
-                "iteration_id,"
-                "timestamp,"
-                "runtime,"
-                "circuit_seed,"
-                "input_flags,"
-                "is_injection,"
-                "fixed\n"
-            )
+    _prepare_csv(
+        checked_findings_csv,
+        "fuzzer_id,"
+        "run_id,"
+        "iteration_id,"
+        "timestamp,"
+        "runtime,"
+        "circuit_seed,"
+        "input_flags,"
+        "is_injection,"
+        "fixed",
+    )
 
     concat_input_flags = " ".join(finding.input_flags)
     with open(checked_findings_csv, "a") as fp:
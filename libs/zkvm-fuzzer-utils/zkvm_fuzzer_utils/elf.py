@@ -0,0 +1,131 @@
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+ELF_MAGIC = b"\x7fELF"
+
+# section header types holding a symbol table
+SHT_SYMTAB = 2
+SHT_DYNSYM = 11
+
+# symbol type of functions, the low nibble of the symbol info
+STT_FUNC = 2
+
+# unqualified names of the generated circuit functions before and after renaming
+CIRCUIT_FUNCTION_NAME = re.compile(r"circuit_[A-Za-z0-9_]+|c[0-9]+")
+
+
+# ---------------------------------------------------------------------------- #
+#                                  ELF Symbols                                 #
+# ---------------------------------------------------------------------------- #
+
+
+@dataclass(frozen=True)
+class ElfSymbol:
+    name: str
+    address: int
+    size: int
+    is_function: bool
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def read_elf_symbols(data: bytes) -> list[ElfSymbol]:
+    """Returns the symbols of the symbol tables of a 32 or 64 bit ELF file. A `ValueError`
+    is raised if the data is no (complete) ELF file."""
+
+    if data[:4] != ELF_MAGIC or data[4:5] not in (b"\1", b"\2") or data[5:6] not in (b"\1", b"\2"):
+        raise ValueError("invalid ELF header")
+    try:
+        return _read_elf_symbols(data)
+    except (struct.error, IndexError) as e:
+        raise ValueError("truncated ELF file") from e
+
+
+def _read_elf_symbols(data: bytes) -> list[ElfSymbol]:
+    is_64_bit = data[4] == 2
+    endian = "<" if data[5] == 1 else ">"
+
+    if is_64_bit:
+        section_offset = struct.unpack_from(f"{endian}Q", data, 0x28)[0]
+        section_size, section_count = struct.unpack_from(f"{endian}HH", data, 0x3A)
+        section_format = f"{endian}IIQQQQIIQQ"
+        symbol_format = f"{endian}IBBHQQ"
+    else:
+        section_offset = struct.unpack_from(f"{endian}I", data, 0x20)[0]
+        section_size, section_count = struct.unpack_from(f"{endian}HH", data, 0x2E)
+        section_format = f"{endian}IIIIIIIIII"
+        symbol_format = f"{endian}IIIBBH"
+
+    # NOTE: (type, offset, size, link, entry size) of every section
+    sections = []
+    for index in range(section_count):
+        fields = struct.unpack_from(section_format, data, section_offset + index * section_size)
+        sections.append((fields[1], fields[4], fields[5], fields[6], fields[9]))
+
+    symbols = []
+    for section_type, offset, size, link, entry_size in sections:
+        if section_type not in (SHT_SYMTAB, SHT_DYNSYM) or entry_size == 0:
+            continue
+        strings_offset = sections[link][1]
+        for entry_offset in range(offset, offset + size - entry_size + 1, entry_size):
+            fields = struct.unpack_from(symbol_format, data, entry_offset)
+            if is_64_bit:
+                name_offset, info, _, _, address, symbol_size = fields
+            else:
+                name_offset, address, symbol_size, info, _, _ = fields
+            name_start = strings_offset + name_offset
+            name_end = data.index(b"\0", name_start)
+            name = data[name_start:name_end].decode(errors="replace")
+            symbols.append(ElfSymbol(name, address, symbol_size, info & 0xF == STT_FUNC))
+    return symbols
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def unqualified_function_name(symbol_name: str) -> str:
+    """Returns the unqualified function name of a legacy mangled rust symbol, e.g. `c0`
+    for `_ZN10jolt_guest2c017h0123456789abcdefE`. Other symbols are returned as is."""
+
+    symbol_name = symbol_name.split(".llvm.")[0]  # NOTE: suffix of local LLVM symbols
+    if symbol_name.startswith("_ZN") and symbol_name.endswith("E"):
+        components = []
+        index = 3
+        while index < len(symbol_name) - 1:
+            match = re.match(r"[0-9]+", symbol_name[index:])
+            if match is None:
+                return symbol_name
+            index += len(match.group())
+            end = index + int(match.group())
+            components.append(symbol_name[index:end])
+            index = end
+        if len(components) > 1 and re.fullmatch(r"h[0-9a-f]{16}", components[-1]):
+            components.pop()  # NOTE: the hash of the legacy mangling
+        return components[-1] if len(components) > 0 else symbol_name
+    return symbol_name
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def circuit_pc_ranges(elf_path: Path) -> list[tuple[int, int]]:
+    """Returns the sorted and merged [start, end) pc ranges of the generated circuit
+    functions in the guest ELF. Circuits inlined by the compiler have no symbol."""
+
+    pc_ranges = sorted(
+        (symbol.address, symbol.address + symbol.size)
+        for symbol in read_elf_symbols(elf_path.read_bytes())
+        if symbol.is_function
+        and symbol.size > 0
+        and CIRCUIT_FUNCTION_NAME.fullmatch(unqualified_function_name(symbol.name))
+    )
+    merged: list[tuple[int, int]] = []
+    for start, end in pc_ranges:
+        if len(merged) > 0 and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
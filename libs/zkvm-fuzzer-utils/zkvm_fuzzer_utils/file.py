@@ -1,7 +1,11 @@
+import contextlib
+import fcntl
 import os
 import re
 import shutil
+import tempfile
 from pathlib import Path
+from typing import Iterator
 
 # ---------------------------------------------------------------------------- #
 #                                  File Helper                                 #
@@ -39,23 +43,75 @@ def create_dir(dirpath: Path) -> Path:
 # ---------------------------------------------------------------------------- #
 
 
-def create_file(filepath: Path, content: str):
-    """Creates a file at a certain position including non existing parent folders"""
-    absolute_filepath = filepath.absolute()
-    create_dir(absolute_filepath.parent)
-    with open(absolute_filepath, "w") as file_handler:
-        file_handler.write(content)
+def current_umask() -> int:
+    """Returns the umask of the process without changing it if possible"""
+    with contextlib.suppress(OSError, ValueError):
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("Umask:"):
+                return int(line.split()[1], 8)
+    # NOTE: reading the umask by setting it races with files created by other threads
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
 
 
 # ---------------------------------------------------------------------------- #
 
 
-def create_binary_file(filepath: Path, content: bytes):
-    """Creates a file at a certain position including non existing parent folders"""
+def write_file_if_changed(filepath: Path, content: bytes) -> bool:
+    """Writes the content to a file including non existing parent folders, unless the file
+    already has the same content. Changed files are replaced atomically, so readers
+    never see a partially written file. Returns `True` if the file was written.
+
+    NOTE: Skipping identical writes keeps the modification time of the file, which
+          keeps incremental builds (e.g. cargo fingerprints) of unchanged files warm.
+    """
+
     absolute_filepath = filepath.absolute()
+    if (
+        absolute_filepath.is_file()
+        and absolute_filepath.stat().st_size == len(content)
+        and absolute_filepath.read_bytes() == content
+    ):
+        return False
+
     create_dir(absolute_filepath.parent)
-    with open(absolute_filepath, "wb") as file_handler:
-        file_handler.write(content)
+    fd, tmp_filepath = tempfile.mkstemp(
+        dir=absolute_filepath.parent, prefix=f".{absolute_filepath.name}."
+    )
+    try:
+        with os.fdopen(fd, "wb") as file_handler:
+            file_handler.write(content)
+        if absolute_filepath.is_file():
+            shutil.copymode(absolute_filepath, tmp_filepath)
+        else:
+            # NOTE: `mkstemp` creates the file with 0o600 regardless of the umask
+            os.chmod(tmp_filepath, 0o666 & ~current_umask())
+        os.replace(tmp_filepath, absolute_filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+
+    return True
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def create_file(filepath: Path, content: str) -> bool:
+    """Creates a file at a certain position including non existing parent folders.
+    Returns `True` if the content changed (see `write_file_if_changed`)."""
+    return write_file_if_changed(filepath, content.encode())
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def create_binary_file(filepath: Path, content: bytes) -> bool:
+    """Creates a file at a certain position including non existing parent folders.
+    Returns `True` if the content changed (see `write_file_if_changed`)."""
+    return write_file_if_changed(filepath, content)
 
 
 # ---------------------------------------------------------------------------- #
@@ -156,3 +212,22 @@ def prepend_file(filepath: Path, content: str, skip_comments: bool = True):
 
 
 # ---------------------------------------------------------------------------- #
+
+
+@contextlib.contextmanager
+def file_lock(filepath: Path, is_shared: bool = False) -> Iterator[None]:
+    """Holds an exclusive advisory lock (`flock`) on the file, creating it if necessary,
+    while the context is active. The lock is shared with other processes and threads
+    opening the same file, e.g. fuzzers sharing a directory through a volume. If
+    `is_shared` is set, other shared locks are held concurrently."""
+
+    create_dir(filepath.parent)
+    with open(filepath.absolute(), "a") as file_handler:
+        fcntl.flock(file_handler, fcntl.LOCK_SH if is_shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file_handler, fcntl.LOCK_UN)
+
+
+# ---------------------------------------------------------------------------- #
@@ -1,6 +1,13 @@
+import contextlib
+import dataclasses
 import logging
+import os
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from random import Random
@@ -10,12 +17,39 @@ from uuid import UUID, uuid4
 from circil.fuzzer.config import FuzzerConfig as CircilFuzzerConfig
 from circil.ir.node import Circuit
 from circil.rewrite.rule import Rule
+from zkvm_fuzzer_utils.batch import (
+    BATCH_FLAG,
+    FORK_SERVE_FLAG,
+    SERVE_FLAG,
+    create_batch_file,
+    split_batch_exec_status,
+)
+from zkvm_fuzzer_utils.build_cache import BuildCache
 from zkvm_fuzzer_utils.circil import SafeRemAndDivTransformer
-from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.cmd import (
+    CgroupSandbox,
+    ExecStatus,
+    ProcessGroupTracker,
+    ResourceUsage,
+    prepare_cgroup_root,
+)
 from zkvm_fuzzer_utils.common import (
-    convert_input_to_flags,
+    DEFAULT_STEP_BOUND,
+    GUEST_ELF_FLAG,
+    STEP_BOUND_CONTEXT,
+    STEP_BOUND_FLAG,
+    STEP_OVERFLOW_FLAG,
+    TRACE_FLAG,
+    TRACE_FROM_FLAG,
+    TRACE_OUTPUT_FLAG,
+    TRACE_PC_RANGES_FLAG,
+    StepOverflow,
+    convert_input_to_typed_flags,
     generate_metamorphic_bundle,
+    is_trace_sparse,
+    pc_ranges_to_str,
     random_inputs,
+    trace_start_step,
     validate_circuits_arguments,
 )
 from zkvm_fuzzer_utils.csvlogger import (
@@ -28,14 +62,36 @@ from zkvm_fuzzer_utils.csvlogger import (
     log_run_csv,
     log_summary_csv,
 )
-from zkvm_fuzzer_utils.injection import InjectionArguments, InjectionContext
+from zkvm_fuzzer_utils.elf import circuit_pc_ranges
+from zkvm_fuzzer_utils.injection import (
+    InjectionArguments,
+    InjectionContext,
+    InjectionSampling,
+)
 from zkvm_fuzzer_utils.kinds import InjectionKind, InstrKind
-from zkvm_fuzzer_utils.record import Record, record_from_exec_status
-from zkvm_fuzzer_utils.rust.cargo import CargoCmd
-from zkvm_fuzzer_utils.trace import Trace, trace_from_exec
+from zkvm_fuzzer_utils.output import (
+    TRACE_STEP_LIMIT_ABORT,
+    OutputParser,
+    output_from_exec,
+    trace_step_limit,
+)
+from zkvm_fuzzer_utils.record import Record
+from zkvm_fuzzer_utils.rust.cargo import (
+    CargoCmd,
+    execute_builds_in_shared_target_dir,
+    host_executable_from_builds,
+    relocate_guest_elf,
+)
+from zkvm_fuzzer_utils.server import HostServer
+from zkvm_fuzzer_utils.stream import AbortPredicate
+from zkvm_fuzzer_utils.trace import Trace
+from zkvm_fuzzer_utils.trace_diff import TraceDiff, diff_traces
 
 logger = logging.getLogger("fuzzer")
 
+# NOTE: destination of a guest ELF compiled into the cargo target directory by the host build
+GUEST_ELF = Path("target") / "guest.elf"
+
 # ---------------------------------------------------------------------------- #
 #                                  Exceptions                                  #
 # ---------------------------------------------------------------------------- #
@@ -161,9 +217,42 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
     __injection_context: InjectionContext
     __outputs_for_execution_without_injection: dict[str, str] | None
     __outputs_for_execution_with_injection: dict[str, str] | None
+    __trace_diff_for_execution_with_injection: TraceDiff | None
     __is_fault_injection: bool
     __is_trace_collection: bool
     __timeout: int | None
+    __host_executable: Path | None
+    __is_batch_execution: bool
+    __is_server_execution: bool
+    __is_fork_server_execution: bool
+    __host_server: HostServer | None
+    __parallel_executions: int
+    __memory_budget: int | None
+    __execution_slots: threading.BoundedSemaphore | None
+    __is_build_ahead: bool
+    __project_dirs: tuple[Path, Path]
+    __build_executor: ThreadPoolExecutor | None
+    __build_process_group_tracker: ProcessGroupTracker | None
+    __prepared_run: tuple[Path, object, list[Path], Future[list[ExecStatus]]] | None
+    __changed_files: list[Path]
+    __build_cache: BuildCache | None
+    __shared_target_dir: Path | None
+    __is_binary_trace: bool
+    __trace_suffix: int | None
+    __is_trace_circuits_only: bool
+    __trace_pc_ranges: list[tuple[int, int]] | None
+    __injection_sampling: InjectionSampling
+    __is_iteration_sampled: bool
+    __injections_per_trace: int
+    __injection_index: int
+    __execution_arguments_for_execution_with_injection: list[str] | None
+    __step_bound: int
+    __step_overflow: StepOverflow
+    __step_bound_exceeded_count: int
+    __cgroup_root: Path | None
+    __cgroup_cpus: float | None
+    __resource_usage: ResourceUsage | None
+    __resource_usage_lock: threading.Lock
 
     #
     # constant fuzzer UUID and Incrementing IDs
@@ -172,6 +261,7 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
     __fuzzer_id: UUID
     __run_id: int
     __iteration_id: int
+    __iteration_count: int  # iterations over the fuzzer lifetime, unlike `iteration_id`
 
     def __init__(
         self, project_dir: Path, zkvm_dir: Path, fuzzer_config: FuzzerConfig, random: Random
@@ -197,10 +287,44 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
         )
         self.__outputs_for_execution_without_injection = None
         self.__outputs_for_execution_with_injection = None
+        self.__trace_diff_for_execution_with_injection = None
         self.__run_id = 0
         self.__iteration_id = 0
+        self.__iteration_count = 0
         self.__fuzzer_id = uuid4()
         self.__timeout = None
+        self.__host_executable = None
+        self.__is_batch_execution = False
+        self.__is_server_execution = False
+        self.__is_fork_server_execution = False
+        self.__host_server = None
+        self.__parallel_executions = 1
+        self.__memory_budget = None
+        self.__execution_slots = None
+        self.__is_build_ahead = False
+        self.__project_dirs = (project_dir, project_dir.with_name(f"{project_dir.name}-ahead"))
+        self.__build_executor = None
+        self.__build_process_group_tracker = None
+        self.__prepared_run = None
+        self.__changed_files = []
+        self.__build_cache = None
+        self.__shared_target_dir = None
+        self.__is_binary_trace = False
+        self.__trace_suffix = None
+        self.__is_trace_circuits_only = False
+        self.__trace_pc_ranges = None
+        self.__injection_sampling = InjectionSampling()
+        self.__is_iteration_sampled = True
+        self.__injections_per_trace = 1
+        self.__injection_index = 0
+        self.__execution_arguments_for_execution_with_injection = None
+        self.__step_bound = DEFAULT_STEP_BOUND
+        self.__step_overflow = StepOverflow.PANIC
+        self.__step_bound_exceeded_count = 0
+        self.__cgroup_root = None
+        self.__cgroup_cpus = None
+        self.__resource_usage = None
+        self.__resource_usage_lock = threading.Lock()
 
     def loop(self):
         """Starts the fuzzing loop"""
@@ -228,6 +352,8 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
             logger.error("Fuzzer stopped because of an unexpected internal exception!")
             logger.critical(e, exc_info=True)
 
+        self.stop_host_server()
+        self.stop_build_ahead()
         self.__loop_timer = None
 
     def run(self):
@@ -236,16 +362,26 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
         run_timer = time.time()
         self.__run_id += 1
         self.__iteration_id = 0
+        self.__step_bound_exceeded_count = 0
+        self.__resource_usage = None
 
-        for callback in self.__run_setup_callbacks:
-            callback()
+        if self.__prepared_run is None:
+            for callback in self.__run_setup_callbacks:
+                callback()
 
-        self.create_project()
+            self.__changed_files = self.create_project()
 
-        for callback in self.__build_setup_callbacks:
-            callback()
+            for callback in self.__build_setup_callbacks:
+                callback()
 
-        build_status_list = self.build_project()
+            build_status_list = self.build_project()
+
+        else:  # the project of this run was already created and built ahead
+            self.__project_dir, run_state, self.__changed_files, build_future = self.__prepared_run
+            self.__prepared_run = None
+            self.set_run_state(run_state)
+            logger.info(f"wait for build ahead in {self.__project_dir}")
+            build_status_list = build_future.result()
 
         for callback in self.__build_teardown_callbacks:
             callback(build_status_list)
@@ -257,11 +393,55 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
                     logger.error(f"zkvm build timed out with {self.fuzzer_config.build_timeout}")
                 raise FuzzerInternalError("unable to build zkvm host build!")
 
+        self.__host_executable = host_executable_from_builds(build_status_list)
+        logger.debug(f"host executable: {self.__host_executable}")
+        self.__trace_pc_ranges = self.read_trace_pc_ranges()
+        self.__injection_context.set_pc_ranges(self.__trace_pc_ranges)
+
+        if self.__is_build_ahead and not self.is_timeout():
+            self.prepare_next_run()
+
+        # NOTE: the server of the previous run still uses the old host executable
+        self.stop_host_server()
+        if self.__parallel_executions > 1:
+            if self.__is_server_execution or self.__is_fork_server_execution:
+                logger.warning("server execution is not supported for parallel executions")
+        elif self.__is_fork_server_execution:
+            self.__host_server = HostServer(
+                lambda: self.create_execution_cmd([FORK_SERVE_FLAG])
+                .with_memory(self.execution_memory_limit)
+                .spawn(),
+                is_isolated=True,
+            )
+        elif self.__is_server_execution:
+            self.__host_server = HostServer(
+                lambda: self.create_execution_cmd([SERVE_FLAG])
+                .with_memory(self.execution_memory_limit)
+                .spawn()
+            )
+
+        if self.__is_batch_execution:
+            self.run_batched_iterations()
+        elif self.__parallel_executions > 1:
+            self.run_parallel_iterations()
+        else:
+            self.run_iterations()
+
+        run_delta_time = time.time() - run_timer
+
+        for callback in self.__run_teardown_callbacks:
+            callback(run_delta_time)
+
+    def run_iterations(self):
+        """Runs every input iteration with its own host executions"""
+
         for iteration_idx in range(self.fuzzer_config.input_iterations):
             if not self.is_timeout():
                 self.__iteration_id = iteration_idx + 1
                 self.__outputs_for_execution_without_injection = None
                 self.__outputs_for_execution_with_injection = None
+                self.__trace_diff_for_execution_with_injection = None
+                self.sample_iteration()
 
                 for callback in self.__iteration_setup_callbacks:
                     callback()
@@ -274,10 +454,122 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
                 for callback in self.__iteration_teardown_callbacks:
                     callback()
 
-        run_delta_time = time.time() - run_timer
+    def run_batched_iterations(self):
+        """Runs the executions without injection of all input iterations in a
+        single host process. The iteration setup callbacks are invoked upfront
+        for every iteration and the iteration state is restored afterwards. Fault
+        injection executions still run in their own host process, as they leave
+        the global state of the host in an undefined condition."""
 
-        for callback in self.__run_teardown_callbacks:
-            callback(run_delta_time)
+        prepared: list[tuple[object, bool, list[str]]] = []
+        for iteration_idx in range(self.fuzzer_config.input_iterations):
+            if self.is_timeout():
+                break
+            self.__iteration_id = iteration_idx + 1
+            self.sample_iteration()
+            for callback in self.__iteration_setup_callbacks:
+                callback()
+            arguments = self.create_execution_arguments()
+            prepared.append((self.get_iteration_state(), self.__is_iteration_sampled, arguments))
+
+        execution_status_list = self.execute_project_batch([e[2] for e in prepared])
+
+        for iteration_idx, ((iteration_state, is_sampled, _), execution_status) in enumerate(
+            zip(prepared, execution_status_list)
+        ):
+            self.__iteration_id = iteration_idx + 1
+            self.__outputs_for_execution_without_injection = None
+            self.__outputs_for_execution_with_injection = None
+            self.__trace_diff_for_execution_with_injection = None
+            self.__is_iteration_sampled = is_sampled
+            self.set_iteration_state(iteration_state)
+
+            optional_trace = self.execute_without_injection(execution_status)
+
+            if self.__is_fault_injection and optional_trace and not self.is_timeout():
+                self.execute_with_injection(optional_trace)
+
+            for callback in self.__iteration_teardown_callbacks:
+                callback()
+
+    def run_parallel_iterations(self):
+        """Runs the input iterations with up to `parallel_executions` concurrent host
+        executions. The executions without injection of the following iterations are
+        started ahead in a worker pool, while the current iteration is inspected and
+        its injection execution is running. The iteration setup callbacks are invoked
+        when an iteration is started ahead, all other callbacks are invoked strictly in
+        iteration order and the iteration state is restored beforehand."""
+
+        input_iterations = self.fuzzer_config.input_iterations
+        pending: deque[tuple[int, object, bool, Future[ExecStatus]]] = deque()
+        next_iteration_idx = 0
+
+        self.__execution_slots = threading.BoundedSemaphore(self.__parallel_executions)
+        executor = ThreadPoolExecutor(max_workers=self.__parallel_executions)
+
+        def start_ahead():
+            nonlocal next_iteration_idx
+            while (
+                len(pending) < self.__parallel_executions
+                and next_iteration_idx < input_iterations
+                and not self.is_timeout()
+            ):
+                next_iteration_idx += 1
+                self.__iteration_id = next_iteration_idx
+                self.sample_iteration()
+                for callback in self.__iteration_setup_callbacks:
+                    callback()
+                arguments = self.create_execution_arguments()
+                future = executor.submit(self.execute_project, arguments)
+                pending.append(
+                    (
+                        next_iteration_idx,
+                        self.get_iteration_state(),
+                        self.__is_iteration_sampled,
+                        future,
+                    )
+                )
+
+        try:
+            start_ahead()
+            while len(pending) > 0:
+                iteration_id, iteration_state, is_sampled, future = pending.popleft()
+                start_ahead()
+
+                self.__iteration_id = iteration_id
+                self.__outputs_for_execution_without_injection = None
+                self.__outputs_for_execution_with_injection = None
+                self.__trace_diff_for_execution_with_injection = None
+                self.__is_iteration_sampled = is_sampled
+                self.set_iteration_state(iteration_state)
+
+                optional_trace = self.execute_without_injection(future.result())
+
+                if self.__is_fault_injection and optional_trace and not self.is_timeout():
+                    self.execute_with_injection(optional_trace)
+
+                for callback in self.__iteration_teardown_callbacks:
+                    callback()
+
+        finally:
+            for _, _, _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.__execution_slots = None
+
+    def sample_iteration(self):
+        """Decides with the injection sampling policy whether the current iteration is
+        traced and injected. It is called before the iteration setup callbacks.
+
+        NOTE: The policy counts the iterations over the fuzzer lifetime, as the iteration
+              id restarts with every run and e.g. a stride beyond the input iterations of
+              a run would otherwise always sample the same iterations."""
+        self.__iteration_count += 1
+        self.__is_iteration_sampled = self.__is_trace_collection and (
+            self.__injection_sampling.is_sampled(self.__iteration_count, self.__random)
+        )
+        if self.__is_trace_collection and not self.__is_iteration_sampled:
+            logger.debug(f"iteration {self.__iteration_id} is not traced")
 
     def register_run_setup_callback(self, callback: Callable[[], None]):
         self.__run_setup_callbacks.append(callback)
@@ -310,21 +602,28 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
     def register_on_error_callback(self, callback: Callable[[bool], None]):
         self.__on_error_callbacks.append(callback)
 
-    def execute_without_injection(self) -> Trace | None:
-        """Executes the zkvm project without fault injection"""
+    def execute_without_injection(self, execution_status: ExecStatus | None = None) -> Trace | None:
+        """Executes the zkvm project without fault injection. If `execution_status`
+        is provided, e.g. from a batched execution, it is used instead of a new execution."""
 
         # execute
-        execution_status = self.execute_project(self.create_execution_arguments())
+        if execution_status is None:
+            execution_status = self.execute_project(self.create_execution_arguments())
 
         # get trace and record data from execution
-        record = record_from_exec_status(execution_status)
+        output = output_from_exec(
+            execution_status,
+            self.fuzzer_config.instr_kind_enum,
+            self.fuzzer_config.injection_kind_enum,
+            trace_sparse=is_trace_sparse(
+                self.create_trace_arguments() + self.create_step_bound_arguments()
+            ),
+        )
+        record = output.record(execution_status)
+        self.count_step_bound_exceeded(record)
         trace = None
-        if self.__is_trace_collection:
-            trace = trace_from_exec(
-                execution_status,
-                self.fuzzer_config.instr_kind_enum,
-                self.fuzzer_config.injection_kind_enum,
-            )
+        if self.__is_trace_collection and self.__is_iteration_sampled:
+            trace = output.trace(execution_status.trace_raw)
 
         self.__outputs_for_execution_without_injection = self.get_outputs_from_record(record)
         logger.debug(f"record output: {self.__outputs_for_execution_without_injection}")
@@ -342,6 +641,24 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
                     " Consider increasing the timeout or change the prover setup..."
                 )
                 return None  # stop execution
+            # if the execution ran out of memory in its cgroup it is no completeness violation
+            if execution_status.is_oom_killed():
+                logger.warning(
+                    f"Host program exceeded the memory limit of {self.execution_memory_limit}MB!"
+                    " Consider increasing the memory budget or reduce the parallel executions..."
+                )
+                return None  # stop execution
+            # if the execution exceeded the step bound it is no completeness violation
+            if self.is_step_bound_exceeded(record):
+                logger.warning(
+                    f"Host program exceeded the step bound of {self.__step_bound} steps!"
+                    " Consider increasing the step bound or change the step overflow..."
+                )
+                return None  # stop execution
+            # if an abort predicate decided the execution early we also continue
+            if execution_status.is_aborted():
+                logger.info(f"Host program was aborted early: {execution_status.abort_reason}")
+                return None  # stop execution
             # if it was a known error we also continue
             if self.is_ignored_execution_error(execution_status):
                 logger.info("Host program failed with an expected error...")
@@ -383,32 +700,73 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
         return trace
 
     def execute_with_injection(self, original_trace: Trace):
-        """Executes the zkvm project with fault injection"""
+        """Executes the zkvm project with up to `injections_per_trace` fault injections
+        targeting distinct steps of the original trace. The injection runs are executed
+        concurrently and inspected one after another in the order they were drawn."""
 
         assert (
             self.__is_fault_injection
         ), "execute with injection called although fault injection is disabled!"
 
         # Generate injection arguments from original trace
-        injection_arguments = self.injection_context.arguments_from_trace(
-            original_trace, self.random
+        injection_arguments_list = self.injection_context.arguments_list_from_trace(
+            original_trace, self.random, self.__injections_per_trace
         )
-        if injection_arguments is None:
+        if len(injection_arguments_list) == 0:
             logger.warning("unable to build an injection environment! Skipping injection ...")
             return  # unable to execute as injection -> skip
 
         # execute the program in injection mode
-        host_execution = self.execute_project(self.create_execution_arguments(injection_arguments))
+        arguments_list = [self.create_execution_arguments(e) for e in injection_arguments_list]
+        host_executions = self.execute_injection_runs(arguments_list)
+
+        for injection_index, (injection_arguments, arguments, host_execution) in enumerate(
+            zip(injection_arguments_list, arguments_list, host_executions)
+        ):
+            self.__injection_index = injection_index
+            self.__execution_arguments_for_execution_with_injection = arguments
+            self.__outputs_for_execution_with_injection = None
+            self.__trace_diff_for_execution_with_injection = None
+            self.inspect_injection(original_trace, injection_arguments, arguments, host_execution)
+
+    def execute_injection_runs(self, arguments_list: list[list[str]]) -> list[ExecStatus]:
+        """Executes the injection runs by up to `parallel_executions` workers. A host
+        server handles a single request at a time, so its runs are executed in order."""
+
+        workers = min(len(arguments_list), self.__parallel_executions)
+        if workers <= 1 or self.__host_server is not None:
+            return [self.execute_project(arguments) for arguments in arguments_list]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.execute_project, arguments_list))
+
+    def inspect_injection(
+        self,
+        original_trace: Trace,
+        injection_arguments: InjectionArguments,
+        arguments: list[str],
+        host_execution: ExecStatus,
+    ):
+        """Checks a single injection run against the original run"""
 
         # get trace and record data from execution
-        record = record_from_exec_status(host_execution)
-        trace = trace_from_exec(
+        output = output_from_exec(
             host_execution,
             self.fuzzer_config.instr_kind_enum,
             self.fuzzer_config.injection_kind_enum,
+            trace_start_step(arguments),
+            is_trace_sparse(arguments),
         )
+        record = output.record(host_execution)
+        self.count_step_bound_exceeded(record)
+        trace = output.trace(host_execution.trace_raw)
+        if trace.start_step > 0:
+            # NOTE: the injection run repeats the original run up to the injection step,
+            #       so the untraced prefix is shared with the original trace
+            trace = trace.with_prefix(original_trace)
         self.__outputs_for_execution_with_injection = self.get_outputs_from_record(record)
         logger.debug(f"record output: {self.__outputs_for_execution_with_injection}")
+        trace_diff = diff_traces(original_trace, trace)
+        self.__trace_diff_for_execution_with_injection = trace_diff
 
         # iterate over callbacks
         for callback in self.__execution_with_injection_callbacks:
@@ -431,8 +789,8 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
 
         # compare the selected step from the original trace with the
         # fault step parsed by the actual fault injection execution
-        if fault.step != self.injection_context.targeted_trace_step.step:
-            logger.info(f"{self.injection_context.targeted_trace_step}")
+        if fault.step != injection_arguments.step:
+            logger.info(f"{injection_arguments}")
             logger.info(f"{fault}")
             logger.critical("Something went wrong regarding the fault injection!")
             raise FuzzerInternalError("Injection info miss-match between chosen and actual!")
@@ -463,10 +821,8 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
                 return  # stop
 
             # Create some helper variables for faster lookup
-            original_trace_steps = original_trace.steps
-            fault_trace_steps = trace.steps
-            original_trace_steps_num = len(original_trace_steps)
-            fault_trace_steps_num = len(fault_trace_steps)
+            original_trace_steps_num = len(original_trace.steps)
+            fault_trace_steps_num = len(trace.steps)
 
             # Check if the original trace has the same amount of steps
             # as the fault injection trace
@@ -489,24 +845,11 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
 
             # Check if the original trace contains the same steps
             # as the fault injection trace
-            diff_count = 0
-            for step_idx in range(original_trace_steps_num):
-                original_step_1 = original_trace_steps[step_idx]
-                fault_step_1 = fault_trace_steps[step_idx]
-
-                # NOTE: we compare assembly as this is the only thing that actually makes
-                #       a visible difference!
-                if not original_step_1.assembly == fault_step_1.assembly:
-                    logger.info("step 1:")
-                    logger.info(original_step_1)
-                    logger.info(fault_step_1)
-                    logger.warning(
-                        "Fault injection did not trigger an error although trace step differs!"
-                    )
-                    diff_count += 1
-
+            # NOTE: the differing steps are reported in the injection csv instead of the log
+            diff_count = trace_diff.count
             logger.warning(
                 f"Fault injection did not change the behavior! Differences detected: {diff_count}"
+                f" (first at step {trace_diff.first_divergence})"
             )
 
             # To avoid too many false positives we check if least 1 other instruction
@@ -531,33 +874,325 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
             #       at this point and we ignore this case for now...
 
     @abstractmethod
-    def create_project(self):
-        """Updates or creates the zkvm host and guest code based"""
+    def create_project(self) -> list[Path]:
+        """Updates or creates the zkvm host and guest code and returns the changed files"""
         raise NotImplementedError()
 
-    def build_project(self) -> list[ExecStatus]:
-        """Builds the zkvm host and guest code and returns the status"""
+    def create_build_cmds(self) -> list[CargoCmd]:
+        """Returns the commands building the zkvm host and guest code in order"""
         return [
             CargoCmd.build()
             .with_cd(self.project_dir)
             .in_release()
+            .with_message_format_json()
             .with_timeout(self.fuzzer_config.build_timeout)
-            .execute()
         ]
 
-    def execute_project(self, arguments: list[str]) -> ExecStatus:
-        """Executes the zkvm host and guest code with the provided arguments
-        and returns the status"""
+    def build_project(self) -> list[ExecStatus]:
+        """Builds the zkvm host and guest code and returns the status"""
+        return self.execute_build_cmds(self.project_dir, self.create_build_cmds())
+
+    def execute_build_cmds(self, project_dir: Path, build_cmds: list[CargoCmd]) -> list[ExecStatus]:
+        """Executes the build commands of the project in `project_dir`. If a build cache
+        is set and holds the artifacts of identical sources, they are restored instead.
+        If a shared target directory is set, the build reuses its compiled dependencies."""
+
+        cgroup_sandbox = self.create_cgroup_sandbox(self.__memory_budget)
+        build_cmds = [build_cmd.with_cgroup_sandbox(cgroup_sandbox) for build_cmd in build_cmds]
+
+        guest_elf_pattern = self.get_target_guest_elf()
+        guest_elf = None if guest_elf_pattern is None else project_dir / self.get_guest_elf()
+
+        def build() -> list[ExecStatus]:
+            if self.__shared_target_dir is not None:
+                return execute_builds_in_shared_target_dir(
+                    build_cmds,
+                    self.__shared_target_dir,
+                    project_dir / "target" / "release",
+                    guest_elf_pattern,
+                    guest_elf,
+                )
+            builds = [build_cmd.execute() for build_cmd in build_cmds]
+            if guest_elf_pattern is not None and not any([b.is_failure() for b in builds]):
+                relocate_guest_elf(project_dir / "target", guest_elf_pattern, guest_elf)
+            return builds
+
+        if self.__build_cache is None:
+            return build()
+        return self.__build_cache.build(project_dir, build, self.get_build_artifacts())
+
+    def get_build_artifacts(self) -> list[Path]:
+        """Returns the build artifacts required by the host executable at runtime, relative
+        to the project directory (e.g. a guest ELF loaded from disk)"""
+        if self.get_target_guest_elf() is None:
+            return []
+        return [self.get_guest_elf()]
+
+    def get_target_guest_elf(self) -> str | None:
+        """Returns the glob pattern of the guest ELF compiled by the host build, relative to
+        the cargo target directory, or `None` if the build does not produce one"""
+        return None
+
+    def get_guest_elf(self) -> Path | None:
+        """Returns the guest ELF of the build relative to the project directory, or `None`
+        if it is not available before the execution (e.g. compiled by the host)
+
+        NOTE: A guest ELF matching `get_target_guest_elf` is relocated here by the build.
+        """
+        if self.get_target_guest_elf() is None:
+            return None
+        return GUEST_ELF
+
+    def read_trace_pc_ranges(self) -> list[tuple[int, int]] | None:
+        """Returns the pc ranges of the circuit functions in the guest ELF of the current
+        build if only circuits are traced, or `None` if every pc is traced."""
+
+        if not self.__is_trace_circuits_only:
+            return None
+        guest_elf = self.get_guest_elf()
+        if guest_elf is None:
+            logger.warning("no guest ELF available, tracing all instructions")
+            return None
+        try:
+            pc_ranges = circuit_pc_ranges(self.__project_dir / guest_elf)
+        except (OSError, ValueError) as e:
+            logger.warning(f"unable to read guest ELF {guest_elf}, tracing all instructions: {e}")
+            return None
+        if len(pc_ranges) == 0:
+            logger.warning("no circuit functions in the guest ELF, tracing all instructions")
+            return None
+        logger.info(f"trace pc ranges: {pc_ranges_to_str(pc_ranges)}")
+        return pc_ranges
+
+    def prepare_next_run(self):
+        """Creates the project of the next run in the alternate project directory and
+        builds it in the background with low priority. The run setup callbacks of the
+        next run are invoked immediately and the run state is restored afterwards."""
+
+        current_project_dir = self.__project_dir
+        current_run_state = self.get_run_state()
+
+        self.__project_dir = next(d for d in self.__project_dirs if d != current_project_dir)
+        try:
+            for callback in self.__run_setup_callbacks:
+                callback()
+
+            changed_files = self.create_project()
+
+            for callback in self.__build_setup_callbacks:
+                callback()
+
+            if self.__build_executor is None:
+                self.__build_executor = ThreadPoolExecutor(max_workers=1)
+                self.__build_process_group_tracker = ProcessGroupTracker()
+            build_cmds = [
+                build_cmd.with_low_priority().with_process_group_tracker(
+                    self.__build_process_group_tracker
+                )
+                for build_cmd in self.create_build_cmds()
+            ]
+            build_future = self.__build_executor.submit(
+                self.execute_build_cmds, self.__project_dir, build_cmds
+            )
+            self.__prepared_run = (
+                self.__project_dir,
+                self.get_run_state(),
+                changed_files,
+                build_future,
+            )
+            logger.info(f"build ahead in {self.__project_dir}")
+
+        finally:
+            self.__project_dir = current_project_dir
+            self.set_run_state(current_run_state)
+
+    def stop_build_ahead(self):
+        """Drops the prepared next run and kills a running build ahead
+
+        NOTE: The build runs in its own session and does not receive a Ctrl-C, so its
+              process group is killed before waiting for the executor.
+        """
+        self.__prepared_run = None
+        if self.__build_process_group_tracker is not None:
+            self.__build_process_group_tracker.kill()
+            self.__build_process_group_tracker = None
+        if self.__build_executor is not None:
+            self.__build_executor.shutdown(wait=True, cancel_futures=True)
+            self.__build_executor = None
+
+    def create_execution_cmd(self, arguments: list[str], timeout: float | None = None) -> CargoCmd:
+        """Returns the command executing the zkvm host and guest code with the
+        provided arguments. If no `timeout` is provided, the execution timeout
+        of the fuzzer configuration is used."""
         return (
             CargoCmd.run()
             .with_cd(self.project_dir)
+            .with_executable(self.host_executable)
             .with_args(arguments)
-            .with_timeout(self.fuzzer_config.execution_timeout)
+            .with_timeout(timeout or self.fuzzer_config.execution_timeout)
             .in_release()
-            .with_explicit_clean_zombies()
-            .execute()
         )
 
+    def execute_project(self, arguments: list[str], timeout: float | None = None) -> ExecStatus:
+        """Executes the zkvm host and guest code with the provided arguments
+        and returns the status. In server mode the request is send to the
+        persistent host server instead of spawning a new process."""
+        trace_output = self.create_trace_output(arguments)
+        arguments = self.with_trace_output(arguments, trace_output)
+        if self.__host_server is not None:
+            return self.read_trace_output(
+                self.__host_server.execute(
+                    arguments, timeout or self.fuzzer_config.execution_timeout
+                ),
+                trace_output,
+            )
+        # NOTE: a batch output is split per entry before it is parsed and must not be
+        #       aborted by a single entry
+        output_parser = None
+        abort_predicates = []
+        if BATCH_FLAG not in arguments:
+            output_parser = OutputParser(
+                self.fuzzer_config.instr_kind_enum,
+                self.fuzzer_config.injection_kind_enum,
+                trace_start_step(arguments),
+                is_trace_sparse(arguments),
+            )
+            abort_predicates = self.create_abort_predicates(output_parser)
+            abort_predicates += self.create_step_limit_predicates(output_parser)
+        with self.__execution_slots or contextlib.nullcontext():
+            exec_status = (
+                self.create_execution_cmd(arguments, timeout)
+                .with_memory(self.execution_memory_limit)
+                .with_output_consumer(output_parser)
+                .with_abort_predicates(abort_predicates)
+                .with_cgroup_sandbox(self.create_cgroup_sandbox(self.execution_memory_limit))
+                .execute()
+            )
+        self.account_resource_usage(exec_status)
+        return self.read_trace_output(exec_status, trace_output)
+
+    def create_cgroup_sandbox(self, memory: int | None) -> CgroupSandbox | None:
+        """Returns the sandbox of a command with the memory limit in MB, or `None` if no
+        cgroup root is set"""
+        if self.__cgroup_root is None:
+            return None
+        return CgroupSandbox(self.__cgroup_root, memory, self.__cgroup_cpus)
+
+    def account_resource_usage(self, exec_status: ExecStatus):
+        # NOTE: concurrent executions account their usage from their worker threads
+        if exec_status.resource_usage is None:
+            return
+        with self.__resource_usage_lock:
+            if self.__resource_usage is None:
+                self.__resource_usage = exec_status.resource_usage
+            else:
+                self.__resource_usage = self.__resource_usage.combine(exec_status.resource_usage)
+
+    def create_trace_output(self, arguments: list[str]) -> Path | None:
+        """Returns a new file receiving the binary trace of an execution with the provided
+        arguments, or `None` if the binary trace is disabled or no trace is collected."""
+        if not self.__is_binary_trace or TRACE_FLAG not in arguments:
+            return None
+        fd, trace_output = tempfile.mkstemp(
+            dir=self.project_dir.absolute(), prefix=".trace-", suffix=".bin"
+        )
+        os.close(fd)
+        return Path(trace_output)
+
+    def with_trace_output(self, arguments: list[str], trace_output: Path | None) -> list[str]:
+        if trace_output is None:
+            return arguments
+        return arguments + [TRACE_OUTPUT_FLAG, f"{trace_output}"]
+
+    def read_trace_output(self, exec_status: ExecStatus, trace_output: Path | None) -> ExecStatus:
+        """Attaches the records of the binary trace to the status and removes the file"""
+        if trace_output is None:
+            return exec_status
+        try:
+            return dataclasses.replace(exec_status, trace_raw=trace_output.read_bytes())
+        finally:
+            trace_output.unlink(missing_ok=True)
+
+    def stop_host_server(self):
+        """Stops the persistent host server if one is running"""
+        if self.__host_server is not None:
+            self.__host_server.stop()
+            self.__host_server = None
+
+    def execute_project_batch(self, arguments_list: list[list[str]]) -> list[ExecStatus]:
+        """Executes the zkvm host once for all provided arguments and splits the
+        status per arguments. Entries missing from the batch, e.g. because the host
+        crashed, are executed again on their own."""
+
+        if len(arguments_list) == 0:
+            return []
+
+        # NOTE: the host server already avoids the startup cost of every execution
+        if self.__host_server is not None:
+            return [self.execute_project(arguments) for arguments in arguments_list]
+
+        trace_outputs = [self.create_trace_output(arguments) for arguments in arguments_list]
+        batch_file = self.project_dir.absolute() / "batch.txt"
+        create_batch_file(
+            batch_file,
+            [self.with_trace_output(a, t) for a, t in zip(arguments_list, trace_outputs)],
+        )
+        batch_status = self.execute_project(
+            [BATCH_FLAG, f"{batch_file}"],
+            timeout=self.fuzzer_config.execution_timeout * len(arguments_list),
+        )
+
+        result = []
+        for arguments, trace_output, optional_status in zip(
+            arguments_list,
+            trace_outputs,
+            split_batch_exec_status(batch_status, len(arguments_list)),
+        ):
+            if optional_status is None:
+                if trace_output is not None:
+                    trace_output.unlink(missing_ok=True)
+                optional_status = self.execute_project(arguments)
+            else:
+                optional_status = self.read_trace_output(optional_status, trace_output)
+            result.append(optional_status)
+        return result
+
+    def get_run_state(self) -> object:
+        """Returns the state of the current run created by the run setup callbacks.
+        This is used to prepare the next run during a build ahead."""
+        return None
+
+    def set_run_state(self, state: object):
+        """Restores a run state returned by `get_run_state`"""
+        pass
+
+    def get_iteration_state(self) -> object:
+        """Returns the state of the current input iteration. This is used to
+        restore an iteration during batched executions."""
+        return None
+
+    def set_iteration_state(self, state: object):
+        """Restores an iteration state returned by `get_iteration_state`"""
+        pass
+
+    def create_abort_predicates(self, output_parser: OutputParser) -> list[AbortPredicate]:
+        """Returns the predicates terminating a single execution early once its outcome is
+        decided, e.g. by a known ignored error. The `output_parser` consumes the output of
+        the execution before the predicates are called."""
+        return []
+
+    def create_step_limit_predicates(self, output_parser: OutputParser) -> list[AbortPredicate]:
+        """Returns the predicate aborting an execution whose trace exceeds the step bound,
+        if the step overflow panics anyway. Other overflows keep executing on purpose.
+
+        NOTE: A run diverging from the original run after its fault is not decided, as the
+              oracle needs the outputs and the verdict of the prover, so there is no such
+              predicate.
+        """
+        if self.__step_overflow != StepOverflow.PANIC:
+            return []
+        return [trace_step_limit(output_parser, self.__step_bound)]
+
     @abstractmethod
     def is_ignored_execution_error(self, exec_status: ExecStatus) -> bool:
         """Given a failed command `ExecStatus` this function returns
@@ -581,6 +1216,63 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
         the arguments are used for a fault injection."""
         raise NotImplementedError()
 
+    def create_trace_arguments(
+        self, injection_arguments: InjectionArguments | None = None
+    ) -> list[str]:
+        """Returns the arguments enabling trace logging if traces are collected and the
+        current iteration is sampled. An injection run is only traced from `trace_suffix`
+        steps before its injection step and only the circuit functions are traced if their
+        pc ranges are known."""
+
+        if not self.__is_trace_collection or not self.__is_iteration_sampled:
+            return []
+        arguments = [TRACE_FLAG]
+        if self.__trace_suffix is not None and injection_arguments is not None:
+            first_step = max(0, injection_arguments.step - self.__trace_suffix)
+            arguments += [TRACE_FROM_FLAG, f"{first_step}"]
+        if self.__trace_pc_ranges is not None:
+            arguments += [TRACE_PC_RANGES_FLAG, pc_ranges_to_str(self.__trace_pc_ranges)]
+        return arguments
+
+    def is_binary_trace_supported(self) -> bool:
+        """Returns `True` if the trace emitters of the zkvm write records into the trace
+        channel, otherwise every step is printed regardless of the binary trace"""
+        return False
+
+    def is_guest_elf_loaded_by_host(self) -> bool:
+        """Returns `True` if the host loads the guest ELF passed by argument at runtime
+        instead of embedding it, so a new bundle only rebuilds the guest"""
+        return False
+
+    def create_guest_elf_arguments(self) -> list[str]:
+        """Returns the arguments passing the guest ELF of the current build to the host"""
+
+        if not self.is_guest_elf_loaded_by_host():
+            return []
+        guest_elf = self.get_guest_elf()
+        assert guest_elf is not None, "host loads a missing guest ELF"
+        return [GUEST_ELF_FLAG, f"{(self.project_dir / guest_elf).absolute()}"]
+
+    def create_step_bound_arguments(self) -> list[str]:
+        """Returns the arguments configuring the step bound of the patched zkvm executors,
+        which are only available if the host uses the `fuzzer_utils` crate"""
+
+        if not self.__is_fault_injection and not self.__is_trace_collection:
+            return []
+        if self.__step_bound == DEFAULT_STEP_BOUND and self.__step_overflow == StepOverflow.PANIC:
+            return []
+        return [STEP_BOUND_FLAG, f"{self.__step_bound}", STEP_OVERFLOW_FLAG, self.__step_overflow]
+
+    def is_step_bound_exceeded(self, record: Record) -> bool:
+        abort_reason = record.exec_status.abort_reason
+        return record.get_entry_by_context(STEP_BOUND_CONTEXT) is not None or (
+            abort_reason is not None and abort_reason.startswith(TRACE_STEP_LIMIT_ABORT)
+        )
+
+    def count_step_bound_exceeded(self, record: Record):
+        if self.is_step_bound_exceeded(record):
+            self.__step_bound_exceeded_count += 1
+
     @abstractmethod
     def get_outputs_from_record(self, record: Record) -> dict[str, str]:
         """Given a `Record` this function returns a dictionary containing
@@ -608,6 +1300,16 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
     def random(self) -> Random:
         return self.__random
 
+    @property
+    def changed_files(self) -> list[Path]:
+        """Generated files of the current run whose content changed, i.e. the rebuild scope"""
+        return self.__changed_files
+
+    @property
+    def host_executable(self) -> Path | None:
+        """Host executable of the last successful build, if it could be determined"""
+        return self.__host_executable
+
     @property
     def outputs_for_execution_without_injection(self) -> dict[str, str] | None:
         return self.__outputs_for_execution_without_injection
@@ -616,6 +1318,19 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
     def outputs_for_execution_with_injection(self) -> dict[str, str] | None:
         return self.__outputs_for_execution_with_injection
 
+    @property
+    def trace_diff_for_execution_with_injection(self) -> TraceDiff | None:
+        return self.__trace_diff_for_execution_with_injection
+
+    @property
+    def execution_arguments_for_execution_with_injection(self) -> list[str] | None:
+        return self.__execution_arguments_for_execution_with_injection
+
+    @property
+    def injection_index(self) -> int:
+        """Index of the current injection run among the runs of the original trace"""
+        return self.__injection_index
+
     @property
     def fuzzer_id(self) -> UUID:
         return self.__fuzzer_id
@@ -628,6 +1343,10 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
     def iteration_id(self) -> int:
         return self.__iteration_id
 
+    @property
+    def iteration_count(self) -> int:
+        return self.__iteration_count
+
     def set_fault_injection(self, value: bool):
         if value:
             self.enable_fault_injection()
@@ -678,6 +1397,211 @@ class FuzzerCore(ABC, Generic[InstrKind, InjectionKind]):
             return False
         return self.__timeout <= self.loop_runtime
 
+    def set_batch_execution(self, value: bool):
+        self.__is_batch_execution = value
+
+    def enable_batch_execution(self):
+        self.__is_batch_execution = True
+
+    def disable_batch_execution(self):
+        self.__is_batch_execution = False
+
+    @property
+    def is_batch_execution(self) -> bool:
+        return self.__is_batch_execution
+
+    def set_server_execution(self, value: bool):
+        self.__is_server_execution = value
+
+    def enable_server_execution(self):
+        self.__is_server_execution = True
+
+    def disable_server_execution(self):
+        self.__is_server_execution = False
+
+    @property
+    def is_server_execution(self) -> bool:
+        return self.__is_server_execution
+
+    def set_parallel_executions(self, value: int):
+        if value < 1:
+            raise ValueError(f"parallel executions must be at least 1, but was {value}")
+        self.__parallel_executions = value
+
+    @property
+    def parallel_executions(self) -> int:
+        return self.__parallel_executions
+
+    def set_memory_budget(self, value: int | None):
+        """Sets the memory budget in MB shared by all concurrent host executions"""
+        self.__memory_budget = value
+
+    @property
+    def memory_budget(self) -> int | None:
+        return self.__memory_budget
+
+    @property
+    def execution_memory_limit(self) -> int | None:
+        """Returns the memory limit of a single host execution in MB"""
+        if self.__memory_budget is None:
+            return None
+        return self.__memory_budget // self.__parallel_executions
+
+    def set_build_ahead(self, value: bool):
+        self.__is_build_ahead = value
+
+    def enable_build_ahead(self):
+        self.__is_build_ahead = True
+
+    def disable_build_ahead(self):
+        self.__is_build_ahead = False
+
+    @property
+    def is_build_ahead(self) -> bool:
+        return self.__is_build_ahead
+
+    def set_build_cache(self, build_cache: BuildCache | None):
+        self.__build_cache = build_cache
+
+    @property
+    def build_cache(self) -> BuildCache | None:
+        return self.__build_cache
+
+    def set_shared_target_dir(self, shared_target_dir: Path | None):
+        self.__shared_target_dir = shared_target_dir
+
+    @property
+    def shared_target_dir(self) -> Path | None:
+        return self.__shared_target_dir
+
+    def set_binary_trace(self, value: bool):
+        if value and not self.is_binary_trace_supported():
+            raise ValueError("binary trace is not supported, the zkvm only prints the trace")
+        self.__is_binary_trace = value
+
+    def enable_binary_trace(self):
+        self.set_binary_trace(True)
+
+    def disable_binary_trace(self):
+        self.__is_binary_trace = False
+
+    @property
+    def is_binary_trace(self) -> bool:
+        return self.__is_binary_trace
+
+    def set_trace_suffix(self, value: int | None):
+        self.__trace_suffix = value
+
+    @property
+    def trace_suffix(self) -> int | None:
+        """Number of steps traced before the injection step of an injection run, the
+        run is traced from its start if `None`"""
+        return self.__trace_suffix
+
+    def set_trace_circuits_only(self, value: bool):
+        if value and self.get_guest_elf() is None:
+            raise ValueError("tracing circuits only requires a guest ELF, but there is none")
+        self.__is_trace_circuits_only = value
+
+    def enable_trace_circuits_only(self):
+        self.set_trace_circuits_only(True)
+
+    def disable_trace_circuits_only(self):
+        self.__is_trace_circuits_only = False
+
+    @property
+    def is_trace_circuits_only(self) -> bool:
+        return self.__is_trace_circuits_only
+
+    @property
+    def trace_pc_ranges(self) -> list[tuple[int, int]] | None:
+        """Pc ranges of the circuit functions traced in the current run, `None` if every
+        pc is traced"""
+        return self.__trace_pc_ranges
+
+    def set_injection_sampling(self, sampling: InjectionSampling):
+        self.__injection_sampling = sampling
+
+    @property
+    def injection_sampling(self) -> InjectionSampling:
+        """Policy deciding per iteration whether it is traced and injected"""
+        return self.__injection_sampling
+
+    @property
+    def is_iteration_sampled(self) -> bool:
+        return self.__is_iteration_sampled
+
+    def set_injections_per_trace(self, value: int):
+        if value < 1:
+            raise ValueError(f"injections per trace must be at least 1, but was {value}")
+        self.__injections_per_trace = value
+
+    @property
+    def injections_per_trace(self) -> int:
+        return self.__injections_per_trace
+
+    def set_step_bound(self, value: int):
+        if value < 1:
+            raise ValueError(f"step bound must be at least 1, but was {value}")
+        self.__step_bound = value
+
+    @property
+    def step_bound(self) -> int:
+        """Number of steps after which an execution overflows, i.e. is considered endless"""
+        return self.__step_bound
+
+    def set_step_overflow(self, value: StepOverflow):
+        self.__step_overflow = value
+
+    @property
+    def step_overflow(self) -> StepOverflow:
+        return self.__step_overflow
+
+    @property
+    def step_bound_exceeded_count(self) -> int:
+        """Number of executions of the current run that exceeded the step bound"""
+        return self.__step_bound_exceeded_count
+
+    def set_cgroup_root(self, cgroup_root: Path | None):
+        """Runs every build and host execution in a transient cgroup below the delegated
+        cgroup v2 directory, a `ValueError` is raised if it cannot be used"""
+        if cgroup_root is not None:
+            prepare_cgroup_root(cgroup_root)
+        self.__cgroup_root = cgroup_root
+
+    @property
+    def cgroup_root(self) -> Path | None:
+        return self.__cgroup_root
+
+    def set_cgroup_cpus(self, value: float | None):
+        if value is not None and value <= 0:
+            raise ValueError(f"cgroup cpus must be positive, but was {value}")
+        self.__cgroup_cpus = value
+
+    @property
+    def cgroup_cpus(self) -> float | None:
+        """Number of cpus a sandboxed build or host execution may use, `None` if unlimited"""
+        return self.__cgroup_cpus
+
+    @property
+    def resource_usage(self) -> ResourceUsage | None:
+        """Accumulated resource usage of the host executions of the current run, `None`
+        if no execution ran in a cgroup"""
+        return self.__resource_usage
+
+    def set_fork_server_execution(self, value: bool):
+        self.__is_fork_server_execution = value
+
+    def enable_fork_server_execution(self):
+        self.__is_fork_server_execution = True
+
+    def disable_fork_server_execution(self):
+        self.__is_fork_server_execution = False
+
+    @property
+    def is_fork_server_execution(self) -> bool:
+        return self.__is_fork_server_execution
+
     def disable_injection_schedular(self):
         self.__injection_context.disable_schedular()
 
@@ -739,7 +1663,10 @@ class CircuitFuzzerBase(FuzzerCore[InstrKind, InjectionKind]):
     def create_execution_arguments(
         self, injection_arguments: InjectionArguments | None = None
     ) -> list[str]:
-        flags = convert_input_to_flags(self.circuit_candidate, self.circuit_inputs)
+        flags = convert_input_to_typed_flags(
+            self.circuit_candidate, self.circuit_inputs, len(self.circuits)
+        )
+        flags += self.create_guest_elf_arguments()
         if self.is_fault_injection and injection_arguments is not None:
             flags += [
                 "--inject",  # enable injection
@@ -750,18 +1677,38 @@ class CircuitFuzzerBase(FuzzerCore[InstrKind, InjectionKind]):
                 "--inject-kind",
                 f"{injection_arguments.kind}",  # injection kind
             ]
-        if self.is_trace_collection:
-            flags += [
-                "--trace",  # enable trace logging
-            ]
+        flags += self.create_trace_arguments(injection_arguments)
+        flags += self.create_step_bound_arguments()
         self.__cached_execution_arguments = flags
         return flags
 
+    def get_run_state(self) -> object:
+        return (self.__circuits, self.__circuits_seed)
+
+    def set_run_state(self, state: object):
+        assert isinstance(state, tuple), "unexpected run state"
+        self.__circuits, self.__circuits_seed = state
+
+    def get_iteration_state(self) -> object:
+        return (dict(self.__circuit_inputs), self.__cached_execution_arguments)
+
+    def set_iteration_state(self, state: object):
+        assert isinstance(state, tuple), "unexpected iteration state"
+        self.__circuit_inputs, self.__cached_execution_arguments = state
+
     def process_run(self, run_time: float):
-        log_run_csv(self.project_dir, self.fuzzer_id, self.run_id, self.iteration_id, run_time)
+        log_run_csv(
+            self.project_dir,
+            self.fuzzer_id,
+            self.run_id,
+            self.iteration_id,
+            run_time,
+            self.step_bound_exceeded_count,
+            self.resource_usage,
+        )
 
     def process_build(self, builds: list[ExecStatus]):
-        log_build_csv(self.project_dir, self.fuzzer_id, self.run_id, builds)
+        log_build_csv(self.project_dir, self.fuzzer_id, self.run_id, builds, self.changed_files)
 
     def process_execution_without_injection(self, record: Record, trace: Trace | None):
         # save data as csv
@@ -791,12 +1738,14 @@ class CircuitFuzzerBase(FuzzerCore[InstrKind, InjectionKind]):
             self.fuzzer_id,
             self.run_id,
             self.iteration_id,
+            self.injection_index,
             record,
             trace,
             original_trace,
             self.outputs_for_execution_without_injection
             == self.outputs_for_execution_with_injection,
             CircuitDataHelper(self.circuits),
+            self.trace_diff_for_execution_with_injection,
         )
 
     def get_outputs_from_record(self, record: Record) -> dict[str, str]:
@@ -807,7 +1756,11 @@ class CircuitFuzzerBase(FuzzerCore[InstrKind, InjectionKind]):
         return output
 
     def record_finding(self, is_injection: bool):
-        assert self.__cached_execution_arguments is not None, "impossible that this is not sets!"
+        execution_arguments = self.__cached_execution_arguments
+        if is_injection:
+            # NOTE: the arguments of all injection runs are created before their inspection
+            execution_arguments = self.execution_arguments_for_execution_with_injection
+        assert execution_arguments is not None, "impossible that this is not sets!"
         log_findings_csv(
             self.project_dir,
             self.fuzzer_id,
@@ -815,7 +1768,7 @@ class CircuitFuzzerBase(FuzzerCore[InstrKind, InjectionKind]):
             self.iteration_id,
             self.loop_runtime,
             self.circuits_seed,
-            self.__cached_execution_arguments,
+            execution_arguments,
             is_injection,
         )
 
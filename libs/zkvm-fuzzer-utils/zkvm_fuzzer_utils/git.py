@@ -46,6 +46,17 @@ def is_git_repository(path: Path) -> bool:
 # ---------------------------------------------------------------------------- #
 
 
+def git_head_revision(repo_dir: Path) -> str | None:
+    """Returns the commit hash of `HEAD` or `None` if it cannot be determined"""
+    status = invoke_command(["git", "rev-parse", "HEAD"], cwd=repo_dir)
+    if status.is_failure():
+        return None
+    return status.stdout.strip()
+
+
+# ---------------------------------------------------------------------------- #
+
+
 def git_clone(repo_url: str, target: Path, branch: str | None = None):
     cmd = ["git", "clone"]
     if branch:
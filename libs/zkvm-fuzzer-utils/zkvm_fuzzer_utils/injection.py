@@ -24,6 +24,9 @@ class InjectionContext(Generic[InstrKind, InjectionKind]):
     _disable_schedular: bool
     _preferred_instructions: list[InstrKind]
 
+    # if set, only steps with a pc in one of the [start, end) ranges are injected
+    _pc_ranges: list[tuple[int, int]] | None
+
     # variable to keep track of the last injection
     _targeted_trace_step: TraceStep | None
     _selected_injection_kind: InjectionKind | None
@@ -37,23 +40,46 @@ class InjectionContext(Generic[InstrKind, InjectionKind]):
         self._disable_schedular = False
         self._preferred_instructions = preferred_instructions
         self._instruction_kind_counter = {}
+        self._pc_ranges = None
         self._targeted_trace_step = None
         self._selected_injection_kind = None
 
     def arguments_from_trace(self, trace: Trace, rng: Random) -> InjectionArguments | None:
-        instr_step_lookup = trace.as_instruction_to_steps()
+        arguments_list = self.arguments_list_from_trace(trace, rng, 1)
+        return arguments_list[0] if len(arguments_list) > 0 else None
+
+    def arguments_list_from_trace(
+        self, trace: Trace, rng: Random, count: int
+    ) -> list[InjectionArguments]:
+        """Draws up to `count` injections from the trace without replacement, i.e. every
+        injection targets another step. Fewer are returned if the candidates run out."""
+
+        instr_index_lookup = trace.as_instruction_to_indices(self._pc_ranges)
         candidates = [
             candidate
-            for candidate in instr_step_lookup.keys()
+            for candidate in instr_index_lookup.keys()
             if len(self._available_injections_lookup.get(candidate, [])) > 0
         ]
 
         if len(candidates) == 0:
             self._targeted_trace_step = None
-            return None  # unable to create a trace
-
-        instr_kind = self.select_injection_candidate(candidates, rng)
-        return self.arguments_from_step(rng.choice(instr_step_lookup[instr_kind]), rng)
+            return []  # unable to create a trace
+
+        arguments_list = []
+        drawn: dict[InstrKind, set[int]] = {candidate: set() for candidate in candidates}
+        while len(arguments_list) < count and len(candidates) > 0:
+            instr_kind = self.select_injection_candidate(candidates, rng)
+            indices = instr_index_lookup[instr_kind]
+            # NOTE: the drawn positions are few compared to the trace, so redrawing is cheap
+            position = rng.randrange(len(indices))
+            while position in drawn[instr_kind]:
+                position = rng.randrange(len(indices))
+            drawn[instr_kind].add(position)
+            if len(drawn[instr_kind]) == len(indices):
+                candidates.remove(instr_kind)
+            step_index = int(indices[position])
+            arguments_list.append(self.arguments_from_step(trace.steps[step_index], rng))
+        return arguments_list
 
     def select_injection_candidate(self, candidates: list[InstrKind], rng: Random) -> InstrKind:
 
@@ -133,6 +159,13 @@ class InjectionContext(Generic[InstrKind, InjectionKind]):
             raise ValueError("unable to access 'last_injection_kind'!")
         return self._selected_injection_kind
 
+    def set_pc_ranges(self, pc_ranges: list[tuple[int, int]] | None):
+        self._pc_ranges = pc_ranges
+
+    @property
+    def pc_ranges(self) -> list[tuple[int, int]] | None:
+        return self._pc_ranges
+
     def disable_schedular(self):
         self._disable_schedular = True
 
@@ -141,3 +174,80 @@ class InjectionContext(Generic[InstrKind, InjectionKind]):
 
     def is_schedular(self) -> bool:
         return not self._disable_schedular
+
+
+# ---------------------------------------------------------------------------- #
+#                              Injection Sampling                              #
+# ---------------------------------------------------------------------------- #
+
+
+class InjectionSampling:
+    """Decides per iteration whether its execution is traced and injected. By default
+    every iteration is sampled, the other iterations run without any tracing overhead.
+    The iterations are numbered from 1 over the fuzzer lifetime, i.e. across runs."""
+
+    def is_sampled(self, iteration: int, rng: Random) -> bool:
+        return True
+
+    def __str__(self) -> str:
+        return "all"
+
+
+class ProbabilitySampling(InjectionSampling):
+    """Samples every iteration with the given probability"""
+
+    __probability: float
+
+    def __init__(self, probability: float):
+        if not 0 <= probability <= 1:
+            raise ValueError(f"sampling probability '{probability}' is not in [0, 1]")
+        self.__probability = probability
+
+    def is_sampled(self, iteration: int, rng: Random) -> bool:
+        return rng.random() < self.__probability
+
+    @property
+    def probability(self) -> float:
+        return self.__probability
+
+    def __str__(self) -> str:
+        return f"{self.__probability}"
+
+
+class StrideSampling(InjectionSampling):
+    """Samples the first `count` of every `stride` consecutive iterations"""
+
+    __count: int
+    __stride: int
+
+    def __init__(self, count: int, stride: int):
+        if stride < 1 or not 0 <= count <= stride:
+            raise ValueError(f"unable to sample {count} of {stride} iterations")
+        self.__count = count
+        self.__stride = stride
+
+    def is_sampled(self, iteration: int, rng: Random) -> bool:
+        return (iteration - 1) % self.__stride < self.__count
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def stride(self) -> int:
+        return self.__stride
+
+    def __str__(self) -> str:
+        return f"{self.__count}/{self.__stride}"
+
+
+def injection_sampling_from_str(value: str) -> InjectionSampling:
+    """Parses a sampling policy, either `all`, `<k>/<n>` for k of n iterations or a
+    probability. A `ValueError` is raised for any other value."""
+
+    if value == "all":
+        return InjectionSampling()
+    if "/" in value:
+        count, stride = value.split("/", 1)
+        return StrideSampling(int(count), int(stride))
+    return ProbabilitySampling(float(value))
@@ -0,0 +1,175 @@
+import json
+from typing import Generic, Type
+
+from zkvm_fuzzer_utils.cmd import ExecStatus
+from zkvm_fuzzer_utils.kinds import InjectionKind, InstrKind
+from zkvm_fuzzer_utils.record import Record, RecordEntry, record_from_parts
+from zkvm_fuzzer_utils.rust.panics import RustPanicParser
+from zkvm_fuzzer_utils.stream import AbortPredicate, TagTokenizer, feed_in_chunks
+from zkvm_fuzzer_utils.trace import Trace, TraceBuilder
+
+# ---------------------------------------------------------------------------- #
+#                                 Output Parser                                #
+# ---------------------------------------------------------------------------- #
+
+
+class OutputParser(Generic[InstrKind, InjectionKind]):
+    """Single pass parser of a host execution. The record, trace and fault tags of
+    stdout and the rust panics of stderr are parsed chunk by chunk, e.g. live from the
+    pipes of `invoke_command`, so the parser never holds the output as one string. The
+    trace of an execution only tracing a suffix starts at `trace_start_step`, the trace
+    of an execution only tracing some pc ranges is `trace_sparse`, i.e. skips steps.
+
+    NOTE: Errors are kept until the record or trace is requested, as the output is
+          usually consumed before the caller knows if it needs them.
+    """
+
+    __tokenizer: TagTokenizer
+    __panic_parser: RustPanicParser
+    __entries: list[RecordEntry]
+    __trace_builder: TraceBuilder[InstrKind, InjectionKind] | None
+    __record_error: Exception | None
+    __trace_error: Exception | None
+    __is_finished: bool
+
+    __instr_kind_enum: Type[InstrKind] | None
+    __injection_kind_enum: Type[InjectionKind] | None
+    __trace_start_step: int
+    __trace_sparse: bool
+
+    def __init__(
+        self,
+        instr_kind_enum: Type[InstrKind] | None = None,
+        injection_kind_enum: Type[InjectionKind] | None = None,
+        trace_start_step: int = 0,
+        trace_sparse: bool = False,
+    ):
+        self.__instr_kind_enum = instr_kind_enum
+        self.__injection_kind_enum = injection_kind_enum
+        self.__trace_start_step = trace_start_step
+        self.__trace_sparse = trace_sparse
+        self.__trace_builder = None
+        tags = ["record"]
+        if instr_kind_enum is not None and injection_kind_enum is not None:
+            self.__trace_builder = TraceBuilder(
+                instr_kind_enum, injection_kind_enum, trace_start_step, trace_sparse
+            )
+            tags += ["trace", "fault"]
+        self.__tokenizer = TagTokenizer(tags, self.add_tag)
+        self.__panic_parser = RustPanicParser()
+        self.__entries = []
+        self.__record_error = None
+        self.__trace_error = None
+        self.__is_finished = False
+
+    def feed_stdout(self, chunk: str):
+        self.__tokenizer.feed(chunk)
+
+    def feed_stderr(self, chunk: str):
+        self.__panic_parser.feed(chunk)
+
+    def finish(self):
+        """Parses the held back last lines after the output was closed"""
+        if not self.__is_finished:
+            self.__is_finished = True
+            self.__tokenizer.finish()
+            self.__panic_parser.finish()
+
+    def add_tag(self, tag: str, payload: str):
+        if tag == "record":
+            if self.__record_error is None:
+                try:
+                    self.__entries.append(RecordEntry.from_dict(json.loads(payload)))
+                except json.JSONDecodeError as e:
+                    self.__record_error = e
+        elif self.__trace_builder is not None and self.__trace_error is None:
+            try:
+                self.__trace_builder.add_tag(tag, payload)
+            except Exception as e:
+                self.__trace_error = e
+
+    @property
+    def step_count(self) -> int:
+        """Number of trace steps parsed so far"""
+        return 0 if self.__trace_builder is None else self.__trace_builder.step_count
+
+    def is_parsing_trace_of(
+        self,
+        instr_kind_enum: Type[InstrKind],
+        injection_kind_enum: Type[InjectionKind],
+        trace_start_step: int = 0,
+        trace_sparse: bool = False,
+    ) -> bool:
+        return (
+            self.__instr_kind_enum == instr_kind_enum
+            and self.__injection_kind_enum == injection_kind_enum
+            and self.__trace_start_step == trace_start_step
+            and self.__trace_sparse == trace_sparse
+        )
+
+    def record(self, exec_status: ExecStatus) -> Record:
+        self.finish()
+        if self.__record_error is not None:
+            raise self.__record_error
+        return record_from_parts(self.__entries, self.__panic_parser.panics, exec_status)
+
+    def trace(self, binary_data: bytes | None = None) -> Trace[InstrKind, InjectionKind]:
+        """Returns the parsed trace. The records of a binary trace channel are read from
+        `binary_data` if provided."""
+        self.finish()
+        if self.__trace_builder is None:
+            raise ValueError("output parser was created without trace parsing!")
+        if self.__trace_error is not None:
+            raise self.__trace_error
+        return self.__trace_builder.build(binary_data)
+
+
+# ---------------------------------------------------------------------------- #
+
+
+# prefix of the abort reason of `trace_step_limit`
+TRACE_STEP_LIMIT_ABORT = "trace exceeded"
+
+
+def trace_step_limit(parser: OutputParser, limit: int) -> AbortPredicate:
+    """Returns an abort predicate firing once the parser consumed more than `limit` trace
+    steps. The parser has to consume the output before the predicates are called, as done
+    by `invoke_command`."""
+
+    def is_exceeded(stream: str, chunk: str) -> str | None:
+        if parser.step_count > limit:
+            return f"{TRACE_STEP_LIMIT_ABORT} {limit} steps"
+        return None
+
+    return is_exceeded
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def output_from_exec(
+    exec_status: ExecStatus,
+    instr_kind_enum: Type[InstrKind] | None = None,
+    injection_kind_enum: Type[InjectionKind] | None = None,
+    trace_start_step: int = 0,
+    trace_sparse: bool = False,
+) -> OutputParser[InstrKind, InjectionKind]:
+    """Returns the parser that consumed the output live during the execution or parses
+    the captured output of the status if there is none, e.g. for a batch entry."""
+
+    parser = exec_status.output_consumer
+    if isinstance(parser, OutputParser) and (
+        instr_kind_enum is None
+        or injection_kind_enum is None
+        or parser.is_parsing_trace_of(
+            instr_kind_enum, injection_kind_enum, trace_start_step, trace_sparse
+        )
+    ):
+        parser.finish()
+        return parser
+
+    parser = OutputParser(instr_kind_enum, injection_kind_enum, trace_start_step, trace_sparse)
+    feed_in_chunks(exec_status.stdout, parser.feed_stdout)
+    feed_in_chunks(exec_status.stderr, parser.feed_stderr)
+    parser.finish()
+    return parser
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from circil.ir.node import Circuit
 from zkvm_fuzzer_utils.common import validate_circuits_arguments
+from zkvm_fuzzer_utils.file import create_file
 
 # ---------------------------------------------------------------------------- #
 #                               Project Generators                             #
@@ -12,15 +13,27 @@ from zkvm_fuzzer_utils.common import validate_circuits_arguments
 class AbstractProjectGenerator(ABC):
     __root: Path
     __zkvm_path: Path
+    __changed_files: list[Path]
 
     def __init__(self, root: Path, zkvm_path: Path):
         self.__root = root
         self.__zkvm_path = zkvm_path
+        self.__changed_files = []
 
     @abstractmethod
     def create(self):
         raise NotImplementedError()
 
+    def create_file(self, filepath: Path, content: str):
+        """Creates a project file, skipping identical writes, and records changed files"""
+        if create_file(filepath, content):
+            self.__changed_files.append(filepath)
+
+    @property
+    def changed_files(self) -> list[Path]:
+        """Files whose content changed since the last time the project was created"""
+        return self.__changed_files
+
     @property
     def zkvm_path(self) -> Path:
         return self.__zkvm_path
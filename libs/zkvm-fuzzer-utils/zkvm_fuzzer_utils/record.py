@@ -1,10 +1,10 @@
 import json
-import re
 from dataclasses import dataclass
 from typing import Any
 
 from zkvm_fuzzer_utils.cmd import ExecStatus
 from zkvm_fuzzer_utils.rust.panics import RustPanicInfo, parse_panic_info
+from zkvm_fuzzer_utils.stream import TagTokenizer, feed_in_chunks
 
 
 @dataclass(frozen=True)
@@ -84,22 +84,26 @@ class Record:
         return self.exec_status.is_timeout
 
 
+def record_from_parts(
+    entries: list[RecordEntry], rust_panics: list[RustPanicInfo], exec_status: ExecStatus
+) -> Record:
+    """Bundles the parsed entries and panics. The panics are assigned to the last context."""
+    context = entries[-1].context if len(entries) > 0 else "<no context>"
+    panics = [RecordPanic(context, rust_panic) for rust_panic in rust_panics]
+    return Record(entries, panics, exec_status)
+
+
 def record_from_exec_status(exec_status: ExecStatus) -> Record:
     # first step is to parse the stdout to get the last context
 
     entries = []
-    system_pattern = re.compile(r"\<record\>(.+?)\<\/record\>")
-    for entry_match in re.finditer(system_pattern, exec_status.stdout):
-        json_data = entry_match.group(1)
-        entry_dict = json.loads(json_data)
-        entries.append(RecordEntry.from_dict(entry_dict))
+    tokenizer = TagTokenizer(
+        ["record"], lambda _, payload: entries.append(RecordEntry.from_dict(json.loads(payload)))
+    )
+    feed_in_chunks(exec_status.stdout, tokenizer.feed)
+    tokenizer.finish()
 
     # finally we parse the stderr to see if we have a panic
     rust_panics = parse_panic_info(exec_status.stderr)
 
-    panics = []
-    context = entries[-1].context if len(entries) > 0 else "<no context>"
-    for rust_panic in rust_panics:
-        panics.append(RecordPanic(context, rust_panic))
-
-    return Record(entries, panics, exec_status)
+    return record_from_parts(entries, rust_panics, exec_status)
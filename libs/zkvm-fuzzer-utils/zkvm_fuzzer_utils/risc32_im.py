@@ -1,7 +1,16 @@
+import functools
+from dataclasses import dataclass
+from enum import StrEnum
 from random import Random
+from typing import Any
 
 from circil.ir.node import FunctionDefinition, Identifier
 
+try:
+    import numpy as np
+except ImportError:  # NOTE: numpy is optional, only vectorized decoding requires it
+    np = None
+
 # ---------------------------------------------------------------------------- #
 #                           Global List Of Extensions                          #
 # ---------------------------------------------------------------------------- #
@@ -374,4 +383,217 @@ macro_rules! jal {
             raise ValueError(f"unable to get rust asm function / macro for {builtin.name}")
 
 
+# ---------------------------------------------------------------------------- #
+#                                RV32IM Decoder                                #
+# ---------------------------------------------------------------------------- #
+
+
+class Risc32Format(StrEnum):
+    REG = "reg"  # rd, rs1, rs2
+    IMM = "imm"  # rd, rs1, imm
+    SHIFT = "shift"  # rd, rs1, shamt
+    LOAD = "load"  # rd, imm(rs1)
+    STORE = "store"  # rs2, imm(rs1)
+    BRANCH = "branch"  # rs1, rs2, imm
+    UPPER = "upper"  # rd, imm
+    JAL = "jal"  # rd, imm
+    JALR = "jalr"  # rd, imm(rs1)
+    SYSTEM = "system"  # no operands
+
+
+@dataclass(frozen=True)
+class Risc32Encoding:
+    mnemonic: str
+    format: Risc32Format
+    mask: int
+    match: int
+
+
+def _encoding(
+    mnemonic: str, format: Risc32Format, opcode: int, funct3: int | None = None, funct7: int = 0
+) -> Risc32Encoding:
+    if format in (Risc32Format.UPPER, Risc32Format.JAL):
+        return Risc32Encoding(mnemonic, format, 0x7F, opcode)
+    if format in (Risc32Format.REG, Risc32Format.SHIFT):
+        return Risc32Encoding(mnemonic, format, 0xFE00707F, opcode | funct3 << 12 | funct7 << 25)
+    return Risc32Encoding(mnemonic, format, 0x707F, opcode | (funct3 or 0) << 12)
+
+
+# NOTE: The encodings are disjoint, so a word matches at most one entry.
+RV32IM_ENCODINGS = [
+    _encoding("lui", Risc32Format.UPPER, 0x37),
+    _encoding("auipc", Risc32Format.UPPER, 0x17),
+    _encoding("jal", Risc32Format.JAL, 0x6F),
+    _encoding("jalr", Risc32Format.JALR, 0x67, 0),
+    *[
+        _encoding(mnemonic, Risc32Format.BRANCH, 0x63, funct3)
+        for mnemonic, funct3 in [
+            ("beq", 0),
+            ("bne", 1),
+            ("blt", 4),
+            ("bge", 5),
+            ("bltu", 6),
+            ("bgeu", 7),
+        ]
+    ],
+    *[
+        _encoding(mnemonic, Risc32Format.LOAD, 0x03, funct3)
+        for mnemonic, funct3 in [("lb", 0), ("lh", 1), ("lw", 2), ("lbu", 4), ("lhu", 5)]
+    ],
+    *[
+        _encoding(mnemonic, Risc32Format.STORE, 0x23, funct3)
+        for mnemonic, funct3 in [("sb", 0), ("sh", 1), ("sw", 2)]
+    ],
+    *[
+        _encoding(mnemonic, Risc32Format.IMM, 0x13, funct3)
+        for mnemonic, funct3 in [
+            ("addi", 0),
+            ("slti", 2),
+            ("sltiu", 3),
+            ("xori", 4),
+            ("ori", 6),
+            ("andi", 7),
+        ]
+    ],
+    _encoding("slli", Risc32Format.SHIFT, 0x13, 1, 0x00),
+    _encoding("srli", Risc32Format.SHIFT, 0x13, 5, 0x00),
+    _encoding("srai", Risc32Format.SHIFT, 0x13, 5, 0x20),
+    *[
+        _encoding(mnemonic, Risc32Format.REG, 0x33, funct3, funct7)
+        for mnemonic, funct3, funct7 in [
+            ("add", 0, 0x00),
+            ("sub", 0, 0x20),
+            ("sll", 1, 0x00),
+            ("slt", 2, 0x00),
+            ("sltu", 3, 0x00),
+            ("xor", 4, 0x00),
+            ("srl", 5, 0x00),
+            ("sra", 5, 0x20),
+            ("or", 6, 0x00),
+            ("and", 7, 0x00),
+            ("mul", 0, 0x01),
+            ("mulh", 1, 0x01),
+            ("mulhsu", 2, 0x01),
+            ("mulhu", 3, 0x01),
+            ("div", 4, 0x01),
+            ("divu", 5, 0x01),
+            ("rem", 6, 0x01),
+            ("remu", 7, 0x01),
+        ]
+    ],
+    _encoding("fence", Risc32Format.SYSTEM, 0x0F, 0),
+    Risc32Encoding("ecall", Risc32Format.SYSTEM, 0xFFFFFFFF, 0x00000073),
+    Risc32Encoding("ebreak", Risc32Format.SYSTEM, 0xFFFFFFFF, 0x00100073),
+]
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def _sign_extend(value: int, bits: int) -> int:
+    return value - (1 << bits) if value & (1 << (bits - 1)) else value
+
+
+def _immediate(word: int, format: Risc32Format) -> int:
+    match format:
+        case Risc32Format.IMM | Risc32Format.LOAD | Risc32Format.JALR:
+            return _sign_extend(word >> 20, 12)
+        case Risc32Format.SHIFT:
+            return (word >> 20) & 0x1F
+        case Risc32Format.STORE:
+            return _sign_extend((word >> 25) << 5 | (word >> 7) & 0x1F, 12)
+        case Risc32Format.BRANCH:
+            value = (
+                (word >> 31) << 12
+                | ((word >> 7) & 0x1) << 11
+                | ((word >> 25) & 0x3F) << 5
+                | ((word >> 8) & 0xF) << 1
+            )
+            return _sign_extend(value, 13)
+        case Risc32Format.UPPER:
+            return word >> 12
+        case Risc32Format.JAL:
+            value = (
+                (word >> 31) << 20
+                | ((word >> 12) & 0xFF) << 12
+                | ((word >> 20) & 0x1) << 11
+                | ((word >> 21) & 0x3FF) << 1
+            )
+            return _sign_extend(value, 21)
+        case _:
+            return 0
+
+
+@dataclass(frozen=True)
+class Risc32Instruction:
+    mnemonic: str
+    format: Risc32Format
+    rd: int
+    rs1: int
+    rs2: int
+    imm: int
+
+    def __str__(self) -> str:
+        rd, rs1, rs2, imm = f"x{self.rd}", f"x{self.rs1}", f"x{self.rs2}", self.imm
+        match self.format:
+            case Risc32Format.REG:
+                return f"{self.mnemonic} {rd}, {rs1}, {rs2}"
+            case Risc32Format.IMM | Risc32Format.SHIFT:
+                return f"{self.mnemonic} {rd}, {rs1}, {imm}"
+            case Risc32Format.LOAD | Risc32Format.JALR:
+                return f"{self.mnemonic} {rd}, {imm}({rs1})"
+            case Risc32Format.STORE:
+                return f"{self.mnemonic} {rs2}, {imm}({rs1})"
+            case Risc32Format.BRANCH:
+                return f"{self.mnemonic} {rs1}, {rs2}, {imm}"
+            case Risc32Format.UPPER:
+                return f"{self.mnemonic} {rd}, {imm:#x}"
+            case Risc32Format.JAL:
+                return f"{self.mnemonic} {rd}, {imm}"
+            case _:
+                return self.mnemonic
+
+
+def rv32im_encoding(word: int) -> Risc32Encoding | None:
+    for encoding in RV32IM_ENCODINGS:
+        if word & encoding.mask == encoding.match:
+            return encoding
+    return None
+
+
+def decode_rv32im(word: int) -> Risc32Instruction | None:
+    """Decodes the instruction word, or returns `None` if it is no RV32IM instruction"""
+    encoding = rv32im_encoding(word)
+    if encoding is None:
+        return None
+    return Risc32Instruction(
+        encoding.mnemonic,
+        encoding.format,
+        (word >> 7) & 0x1F,
+        (word >> 15) & 0x1F,
+        (word >> 20) & 0x1F,
+        _immediate(word, encoding.format),
+    )
+
+
+@functools.lru_cache(maxsize=1 << 14)
+def disassemble_rv32im(word: int) -> str:
+    """Returns the assembly of the instruction word, or the word itself in hex if it is
+    no RV32IM instruction (e.g. a word of `0` for emitters without instruction words)."""
+    instruction = decode_rv32im(word)
+    return f"{word:#010x}" if instruction is None else str(instruction)
+
+
+def rv32im_encoding_indices(words: Any) -> Any:
+    """Returns the index into `RV32IM_ENCODINGS` of every word of a numpy array, `-1` for
+    words that are no RV32IM instruction."""
+    if np is None:
+        raise RuntimeError("vectorized decoding requires numpy!")
+    words = np.asarray(words, dtype=np.uint32)
+    indices = np.full(len(words), -1, dtype=np.int16)
+    for index, encoding in enumerate(RV32IM_ENCODINGS):
+        indices[(words & np.uint32(encoding.mask)) == np.uint32(encoding.match)] = index
+    return indices
+
+
 # ---------------------------------------------------------------------------- #
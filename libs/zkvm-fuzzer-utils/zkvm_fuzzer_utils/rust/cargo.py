@@ -1,9 +1,32 @@
+import dataclasses
+import json
+import logging
+import shutil
+import subprocess
+import time
 from pathlib import Path
 
-from zkvm_fuzzer_utils.cmd import ExecStatus, invoke_command
-from zkvm_fuzzer_utils.file import path_to_binary
+from zkvm_fuzzer_utils.cmd import (
+    CgroupSandbox,
+    ExecStatus,
+    OutputConsumer,
+    ProcessGroupTracker,
+    invoke_command,
+    spawn_command,
+)
+from zkvm_fuzzer_utils.file import create_dir, file_lock, path_to_binary
+from zkvm_fuzzer_utils.stream import AbortPredicate
+
+logger = logging.getLogger("fuzzer")
 
 CARGO = path_to_binary("cargo")
+
+# optional binaries to lower the scheduling priority of background commands
+NICE = shutil.which("nice")
+IONICE = shutil.which("ionice")
+
+# lock file coordinating builds of fuzzers sharing a cargo target directory
+SHARED_TARGET_DIR_LOCK = ".fuzzer-build.lock"
 # RUSTUP = path_to_binary("rustup")
 
 
@@ -19,7 +42,7 @@ class CargoCmd:
     __release: bool = False
     __force: bool = False
     __locked: bool = False
-    __explicit_clean_zombies: bool = False
+    __message_format_json: bool = False
     __toolchain: str | None = None
     __environment: dict[str, str] | None = None
     __binary: str | None = None
@@ -27,7 +50,14 @@ class CargoCmd:
     __path: Path | None = None
     __cwd: Path | None = None
     __timeout: float | None = None
+    __memory: int | None = None
     __sub_cli: str | None = None
+    __executable: Path | None = None
+    __low_priority: bool = False
+    __output_consumer: OutputConsumer | None = None
+    __abort_predicates: list[AbortPredicate] | None = None
+    __cgroup_sandbox: CgroupSandbox | None = None
+    __process_group_tracker: ProcessGroupTracker | None = None
 
     def __init__(self, action: str):
         self.__cargo = CARGO
@@ -67,6 +97,10 @@ class CargoCmd:
                 self.__environment[key] = value
         return self
 
+    def with_target_dir(self, target_dir: Path) -> "CargoCmd":
+        """Places the build artifacts into `target_dir` instead of the project `target`"""
+        return self.with_env({"CARGO_TARGET_DIR": f"{target_dir.absolute()}"})
+
     def with_rustflags(self, value_str: str) -> "CargoCmd":
         return self.with_env({"RUSTFLAGS": value_str})
 
@@ -101,16 +135,76 @@ class CargoCmd:
         self.__timeout = timeout
         return self
 
-    def with_explicit_clean_zombies(self) -> "CargoCmd":
-        self.__explicit_clean_zombies = True
+    def with_memory(self, memory: int | None) -> "CargoCmd":
+        """Limits the virtual memory of the spawned process in MB"""
+        self.__memory = memory
         return self
 
     def with_sub_cli(self, name: str) -> "CargoCmd":
         self.__sub_cli = name
         return self
 
+    def with_message_format_json(self) -> "CargoCmd":
+        """Emits the cargo messages as json lines on stdout. The rendered
+        diagnostics are still written to stderr."""
+        self.__message_format_json = True
+        return self
+
+    def with_executable(self, executable: Path | None) -> "CargoCmd":
+        """Spawns the provided, already built executable directly instead of
+        going through `cargo run`. If the executable is missing, cargo is used
+        as a fallback."""
+        self.__executable = executable
+        return self
+
+    def with_low_priority(self) -> "CargoCmd":
+        """Runs the command with the lowest cpu and io scheduling priority using
+        `nice` and `ionice`, if they are available."""
+        self.__low_priority = True
+        return self
+
+    def with_output_consumer(self, output_consumer: OutputConsumer | None) -> "CargoCmd":
+        """Feeds the output to the consumer while the command is running"""
+        self.__output_consumer = output_consumer
+        return self
+
+    def with_abort_predicates(self, abort_predicates: list[AbortPredicate]) -> "CargoCmd":
+        """Terminates the command early once one of the predicates fires on its output"""
+        self.__abort_predicates = abort_predicates
+        return self
+
+    def with_cgroup_sandbox(self, cgroup_sandbox: CgroupSandbox | None) -> "CargoCmd":
+        """Runs the command in its own cgroup capping and accounting its resources"""
+        self.__cgroup_sandbox = cgroup_sandbox
+        return self
+
+    def with_process_group_tracker(self, tracker: ProcessGroupTracker | None) -> "CargoCmd":
+        """Registers the process group of the command at the tracker while it is running"""
+        self.__process_group_tracker = tracker
+        return self
+
+    def get_priority_prefix(self) -> list[str]:
+        prefix = []
+        if self.__low_priority and IONICE:
+            prefix += [IONICE, "-c", "3"]
+        if self.__low_priority and NICE:
+            prefix += [NICE, "-n", "19"]
+        return prefix
+
+    def is_direct_execution(self) -> bool:
+        return (
+            self.__action == "run" and self.__executable is not None and self.__executable.is_file()
+        )
+
     def get_command(self) -> list[str]:
-        command = [self.__cargo]
+        if self.is_direct_execution():
+            assert self.__executable is not None, "unexpected missing executable"
+            return self.get_priority_prefix() + [f"{self.__executable}"] + (self.__arguments or [])
+
+        if self.__executable is not None:
+            logger.warning(f"executable {self.__executable} is missing, falling back to cargo")
+
+        command = self.get_priority_prefix() + [self.__cargo]
         if self.__sub_cli:
             command.append(self.__sub_cli)
         if self.__toolchain:
@@ -126,6 +220,8 @@ class CargoCmd:
             command += ["--path", f"{self.__path}"]
         if self.__binary:
             command += ["--bin", f"{self.__binary}"]
+        if self.__message_format_json:
+            command.append("--message-format=json-render-diagnostics")
         if self.__arguments:
             command += ["--"] + self.__arguments
         return command
@@ -136,8 +232,216 @@ class CargoCmd:
             env=self.__environment,
             cwd=self.__cwd,
             timeout=self.__timeout,
-            explicit_clean_zombies=self.__explicit_clean_zombies,
+            memory=self.__memory,
+            output_consumer=self.__output_consumer,
+            abort_predicates=self.__abort_predicates,
+            cgroup_sandbox=self.__cgroup_sandbox,
+            process_group_tracker=self.__process_group_tracker,
+        )
+
+    def spawn(self) -> subprocess.Popen:
+        """Spawns the command as long running process, see `spawn_command`.
+        The timeout and the cgroup sandbox of the builder are ignored."""
+        return spawn_command(
+            self.get_command(), env=self.__environment, cwd=self.__cwd, memory=self.__memory
+        )
+
+
+# ---------------------------------------------------------------------------- #
+#                               Toolchain Helpers                              #
+# ---------------------------------------------------------------------------- #
+
+
+def rust_toolchain_versions(cwd: Path) -> list[str]:
+    """Returns the output of `rustc -vV` and `cargo --version` for the toolchain selected in
+    `cwd`, e.g. by a `rust-toolchain.toml`, or empty strings for unavailable tools.
+
+    NOTE: `cwd` may not exist yet, so the nearest existing parent selects the toolchain.
+    """
+
+    cwd = cwd.absolute()
+    while not cwd.is_dir():
+        cwd = cwd.parent
+    versions = []
+    for command in [["rustc", "-vV"], ["cargo", "--version"]]:
+        if shutil.which(command[0]) is None:
+            versions.append("")
+            continue
+        status = invoke_command(command, cwd=cwd)
+        versions.append("" if status.is_failure() else status.stdout.strip())
+    return versions
+
+
+# ---------------------------------------------------------------------------- #
+#                               Artifact Helpers                               #
+# ---------------------------------------------------------------------------- #
+
+
+def executables_from_build(exec_status: ExecStatus) -> list[Path]:
+    """Extracts the paths of all binary executables from the json messages of
+    a `cargo build --message-format=json` invocation."""
+
+    executables = []
+    for line in exec_status.stdout.splitlines():
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if message.get("reason") != "compiler-artifact":
+            continue
+        executable = message.get("executable")
+        if executable is None or "bin" not in message.get("target", {}).get("kind", []):
+            continue
+        path = Path(executable)
+        if path not in executables:
+            executables.append(path)
+    return executables
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def host_executable_from_builds(builds: list[ExecStatus]) -> Path | None:
+    """Returns the host executable produced by the last build providing
+    artifact information, or `None` if it cannot be determined uniquely."""
+
+    for build in reversed(builds):
+        executables = executables_from_build(build)
+        if len(executables) == 1:
+            return executables[0]
+        if len(executables) > 1:
+            logger.warning(f"ambiguous host executables: {[f'{e}' for e in executables]}")
+            return None
+    return None
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def relocate_executables(exec_status: ExecStatus, destination: Path) -> ExecStatus:
+    """Copies the binary executables of a `cargo build --message-format=json` invocation
+    into `destination` and returns the status with the artifact messages pointing to the
+    copies. Lines which are no artifact messages are kept as they are."""
+
+    lines = []
+    for line in exec_status.stdout.splitlines():
+        try:
+            message = json.loads(line) if line.strip().startswith("{") else None
+        except json.JSONDecodeError:
+            message = None
+        if (
+            message is None
+            or message.get("reason") != "compiler-artifact"
+            or message.get("executable") is None
+            or "bin" not in message.get("target", {}).get("kind", [])
+        ):
+            lines.append(line)
+            continue
+        executable = create_dir(destination) / Path(message["executable"]).name
+        shutil.copy2(message["executable"], executable)
+        message["executable"] = f"{executable}"
+        lines.append(json.dumps(message))
+
+    return dataclasses.replace(exec_status, stdout="\n".join(lines) + "\n")
+
+
+def relocate_guest_elf(target_dir: Path, pattern: str, destination: Path) -> Path | None:
+    """Copies the most recently built guest ELF matching the glob `pattern` in the cargo
+    `target_dir` to `destination` and returns it, or `None` if there is no match."""
+
+    destination.unlink(missing_ok=True)  # NOTE: never keep the ELF of a previous build
+    guest_elfs = [p for p in target_dir.glob(pattern) if p.is_file()]
+    if len(guest_elfs) == 0:
+        logger.warning(f"no guest ELF matches {pattern} in {target_dir}")
+        return None
+    guest_elf = max(guest_elfs, key=lambda p: p.stat().st_mtime)
+    create_dir(destination.parent)
+    shutil.copy2(guest_elf, destination)
+    return destination
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def is_modified_after(path: Path, timestamp: float) -> bool:
+    """Returns `True` if the file was modified after the `timestamp` or is missing"""
+    try:
+        return path.stat().st_mtime > timestamp
+    except FileNotFoundError:
+        return True
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def execute_and_relocate_builds(
+    build_cmds: list[CargoCmd],
+    target_dir: Path,
+    executable_dir: Path,
+    guest_elf_pattern: str | None,
+    guest_elf: Path | None,
+    is_exclusive: bool,
+) -> list[ExecStatus] | None:
+    """Executes the build commands targeting the shared directory and relocates their
+    outputs while holding its lock. Returns `None` for a shared lock if an output was
+    modified by a concurrent build after the build producing it finished."""
+
+    builds = []
+    is_overwritten = False
+    timer = time.time()
+    with file_lock(target_dir / SHARED_TARGET_DIR_LOCK, is_shared=not is_exclusive):
+        logger.debug(f"acquired shared target dir {target_dir} after {time.time() - timer:.2f}s")
+        for build_cmd in build_cmds:
+            build = build_cmd.execute()
+            build_end = time.time()
+            if not build.is_failure():
+                executables = executables_from_build(build)
+                build = relocate_executables(build, executable_dir)
+                is_overwritten |= any([is_modified_after(e, build_end) for e in executables])
+            builds.append(build)
+        if guest_elf_pattern is not None and guest_elf is not None:
+            if not any([b.is_failure() for b in builds]):
+                relocate_guest_elf(target_dir, guest_elf_pattern, guest_elf)
+                is_overwritten |= any(
+                    [is_modified_after(p, build_end) for p in target_dir.glob(guest_elf_pattern)]
+                )
+    if is_overwritten and not is_exclusive:
+        return None
+    return builds
+
+
+def execute_builds_in_shared_target_dir(
+    build_cmds: list[CargoCmd],
+    target_dir: Path,
+    executable_dir: Path,
+    guest_elf_pattern: str | None = None,
+    guest_elf: Path | None = None,
+) -> list[ExecStatus]:
+    """Executes the build commands with a cargo target directory shared by concurrent
+    fuzzers, so the dependencies of the zkvm are compiled only once. Cargo serializes the
+    builds in the target directory itself, so the builds only hold a shared lock on it.
+    The produced executables are relocated into `executable_dir`, as the next build of
+    another fuzzer overwrites them. The same holds for a guest ELF matching
+    `guest_elf_pattern`, which is relocated to `guest_elf`. If an output was overwritten
+    before its relocation, the builds are repeated holding the lock exclusively.
+
+    NOTE: An output is overwritten if it was modified after its build finished, as cargo
+          releases the target directory to the next build only once a build finished.
+    """
+
+    build_cmds = [build_cmd.with_target_dir(target_dir) for build_cmd in build_cmds]
+    builds = execute_and_relocate_builds(
+        build_cmds, target_dir, executable_dir, guest_elf_pattern, guest_elf, False
+    )
+    if builds is None:
+        logger.info(f"outputs overwritten in shared target dir {target_dir}, rebuild exclusively")
+        builds = execute_and_relocate_builds(
+            build_cmds, target_dir, executable_dir, guest_elf_pattern, guest_elf, True
         )
+    return builds
 
 
 # ---------------------------------------------------------------------------- #
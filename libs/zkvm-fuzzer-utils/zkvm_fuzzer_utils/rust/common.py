@@ -1,12 +1,35 @@
 import io
 import re
-from typing import Callable
+from typing import Callable, Type
 
 from circil.ir.node import (
     Circuit,
     Identifier,
     IRType,
 )
+from zkvm_fuzzer_utils.batch import (
+    BATCH_FLAG,
+    FORK_SERVE_FLAG,
+    INVALID_RETURNCODE,
+    PANIC_RETURNCODE,
+    SERVE_FLAG,
+)
+from zkvm_fuzzer_utils.common import (
+    CIRCUITS_FLAG,
+    DEFAULT_STEP_BOUND,
+    INPUTS_FLAG,
+    STEP_BOUND_CONTEXT,
+    STEP_BOUND_FLAG,
+    STEP_OVERFLOW_FLAG,
+    STEP_OVERFLOW_SAMPLE_STRIDE,
+    TRACE_FLAG,
+    TRACE_FROM_FLAG,
+    TRACE_OUTPUT_FLAG,
+    TRACE_PC_RANGES_FLAG,
+    StepOverflow,
+)
+from zkvm_fuzzer_utils.kinds import InstrKind
+from zkvm_fuzzer_utils.trace import TRACE_RECORD_SIZE, TRACE_UNKNOWN_INSTRUCTION_ID
 
 # ---------------------------------------------------------------------------- #
 #                            Function Commenter Util                           #
@@ -238,3 +261,626 @@ def stream_circuit_output_and_compare_routine(
 
 
 # ---------------------------------------------------------------------------- #
+
+
+def stream_batch_main_routine(
+    buffer: io.StringIO, setup_statements: list[str], reset_fuzzer_utils: bool
+):
+    """Prints the rust `main` function of a host program supporting batched executions.
+
+    Invoked as `<host> --batch <file>` the host reads one line of arguments per execution
+    from `<file>` (or stdin for `-`) and runs them sequentially in the same process. Invoked
+    as `<host> --serve` the host keeps running and executes every line received on stdin as
+    soon as it arrives. Invoked as `<host> --fork-serve` the host does the same, but runs
+    every execution in a forked child, isolating its state and panics from the server
+    process. Every execution is delimited by `<batch>` markers on stdout and
+    stderr and panics are caught per execution. Any other invocation runs a single execution
+    with the parsed `Args`.
+
+    `setup_statements` are executed exactly once at the start of `main`. The caller has to
+    continue with the body of `fn setup_session() -> impl Fn(Args)`, which prepares the
+    state depending only on the guest (e.g. clients and keys) once per process, followed
+    by `stream_session_run_routine`, the body of the execution and `stream_session_end`.
+    The fork server sets up the session before it forks, so the children inherit it. If
+    the host uses the `fuzzer_utils` crate, its state is reset and its trace channel is
+    closed after every execution.
+    """
+
+    close_trace_channel = ""
+    if reset_fuzzer_utils:
+        close_trace_channel = "\n        fuzzer_utils::close_trace_channel();"
+
+    buffer.write("fn main() {\n")
+    for statement in setup_statements:
+        buffer.write(f"    {statement}\n")
+    buffer.write(
+        f"""
+    let argv: Vec<String> = std::env::args().collect();
+    if argv.len() == 3 && argv[1] == "{BATCH_FLAG}" {{
+        run_batch(&setup_session(), &argv[0], &argv[2]);
+    }} else if argv.len() == 2 && argv[1] == "{SERVE_FLAG}" {{
+        run_server(&setup_session(), &argv[0]);
+    }} else if argv.len() == 2 && argv[1] == "{FORK_SERVE_FLAG}" {{
+        // NOTE: A forked child only inherits the forking thread, so the workers of a global
+        //       rayon pool used by the setup would be missing in every child. The session
+        //       is set up in a dedicated pool instead, leaving the global pool to the child.
+        let setup_pool = rayon::ThreadPoolBuilder::new().build().expect("unable to build pool");
+        let run = setup_pool.install(setup_session);
+        drop(setup_pool);
+        run_fork_server(&run, &argv[0]);
+    }} else {{
+        let args = Args::parse();
+        setup_session()(args);{close_trace_channel}
+    }}
+}}
+
+fn set_batch_panic_hook() {{
+    // NOTE: The default hook prints the backtrace note only for the first panic of a
+    //       process, which is required to parse the panic information per execution.
+    std::panic::set_hook(Box::new(|info| {{
+        let thread = std::thread::current();
+        let location = info.location().map(|l| l.to_string()).unwrap_or_default();
+        let message = match info.payload().downcast_ref::<&str>() {{
+            Some(message) => message.to_string(),
+            None => info.payload().downcast_ref::<String>().cloned().unwrap_or_default(),
+        }};
+        eprintln!(
+            "thread '{{}}' panicked at {{}}:\\n{{}}\\n\\
+            note: run with `RUST_BACKTRACE=1` environment variable to display a backtrace",
+            thread.name().unwrap_or("<unnamed>"),
+            location,
+            message
+        );
+    }}));
+}}
+
+fn run_batch<F: Fn(Args)>(run: &F, program: &str, batch: &str) {{
+    set_batch_panic_hook();
+    let content = if batch == "-" {{
+        std::io::read_to_string(std::io::stdin()).expect("unable to read batch from stdin")
+    }} else {{
+        std::fs::read_to_string(batch).expect("unable to read batch file")
+    }};
+    for (index, line) in content.lines().enumerate() {{
+        run_batch_entry(run, program, index, line);
+    }}
+}}
+
+fn run_server<F: Fn(Args)>(run: &F, program: &str) {{
+    use std::io::BufRead;
+    set_batch_panic_hook();
+    for (index, line) in std::io::stdin().lock().lines().enumerate() {{
+        run_batch_entry(run, program, index, &line.expect("unable to read request"));
+    }}
+}}
+
+fn run_fork_server<F: Fn(Args)>(run: &F, program: &str) {{
+    use std::io::{{BufRead, Write}};
+    extern "C" {{
+        fn fork() -> i32;
+        fn waitpid(pid: i32, status: *mut i32, options: i32) -> i32;
+        fn prctl(option: i32, ...) -> i32;
+    }}
+    set_batch_panic_hook();
+    for (index, line) in std::io::stdin().lock().lines().enumerate() {{
+        let line = line.expect("unable to read request");
+        std::io::stdout().flush().expect("unable to flush stdout");
+        let timer = std::time::Instant::now();
+        let pid = unsafe {{ fork() }};
+        if pid == 0 {{
+            // PR_SET_PDEATHSIG with SIGKILL, the child must not outlive the server
+            unsafe {{ prctl(1, 9u64) }};
+            let code = match run_batch_entry(run, program, index, &line) {{
+                "ok" => 0,
+                "invalid" => {INVALID_RETURNCODE},
+                _ => {PANIC_RETURNCODE},
+            }};
+            std::process::exit(code);
+        }}
+        assert!(pid > 0, "unable to fork execution");
+        let mut status = 0;
+        unsafe {{ waitpid(pid, &mut status, 0) }};
+        let is_exited = status & 0x7f == 0;
+        let code = (status >> 8) & 0xff;
+        if !is_exited || ![0, {INVALID_RETURNCODE}, {PANIC_RETURNCODE}].contains(&code) {{
+            // the child was killed or exited before writing its end markers
+            eprintln!("fork server child {{}} terminated with wait status {{}}", pid, status);
+            print_batch_end(index, "panic", timer.elapsed().as_secs_f64());
+        }}
+    }}
+}}
+
+fn run_batch_entry<F: Fn(Args)>(
+    run: &F,
+    program: &str,
+    index: usize,
+    line: &str,
+) -> &'static str {{
+"""
+    )
+    if reset_fuzzer_utils:
+        buffer.write("    fuzzer_utils::reset_state();\n")
+    buffer.write(
+        """    println!("<batch>{{\\"index\\":{}, \\"status\\":\\"start\\"}}</batch>", index);
+    eprintln!("<batch>{{\\"index\\":{}, \\"status\\":\\"start\\"}}</batch>", index);
+    let timer = std::time::Instant::now();
+    let arguments = std::iter::once(program.to_string())
+        .chain(line.split_whitespace().map(String::from));
+    let status = match Args::try_parse_from(arguments) {
+        Ok(args) => match std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| run(args))) {
+            Ok(_) => "ok",
+            Err(_) => "panic",
+        },
+        Err(error) => {
+            eprintln!("{}", error);
+            "invalid"
+        }
+    };
+"""
+    )
+    if reset_fuzzer_utils:
+        buffer.write("    fuzzer_utils::close_trace_channel();\n")
+    buffer.write(
+        """    print_batch_end(index, status, timer.elapsed().as_secs_f64());
+    status
+}
+
+fn print_batch_end(index: usize, status: &str, time: f64) {
+    println!(
+        "<batch>{{\\"index\\":{}, \\"status\\":\\"{}\\", \\"time\\":{}}}</batch>",
+        index, status, time
+    );
+    eprintln!(
+        "<batch>{{\\"index\\":{}, \\"status\\":\\"{}\\", \\"time\\":{}}}</batch>",
+        index, status, time
+    );
+}
+
+fn setup_session() -> impl Fn(Args) {
+"""
+    )
+
+
+def stream_session_run_routine(buffer: io.StringIO):
+    """Prints the start of the execution closure returned by `setup_session`, which
+    captures the state of the session. The caller continues with its body."""
+    buffer.write("\n    move |args: Args| {\n")
+
+
+def stream_session_end(buffer: io.StringIO):
+    """Closes the execution closure and `setup_session`"""
+    buffer.write("    }\n}\n")
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def stream_typed_inputs_definitions(buffer: io.StringIO):
+    """Prints the rust `Input` and `Inputs` types parsing the typed input vector of a host,
+    e.g. `u32:5,bool:1`. Hosts using them are independent of the circuit bundle.
+    """
+
+    buffer.write(
+        """#[derive(Clone, Copy, Debug)]
+enum Input {
+    U32(u32),
+    Bool(bool),
+}
+
+impl Input {
+    fn as_u32(&self) -> u32 {
+        match *self {
+            Input::U32(value) => value,
+            Input::Bool(value) => value as u32,
+        }
+    }
+}
+
+#[derive(Clone, Debug, Default)]
+struct Inputs(Vec<Input>);
+
+#[allow(dead_code)]
+impl Inputs {
+    fn as_u32_array<const N: usize>(&self) -> [u32; N] {
+        let values: Vec<u32> = self.0.iter().map(Input::as_u32).collect();
+        values.try_into().unwrap_or_else(|values: Vec<u32>| {
+            panic!("expected {} inputs, but got {}", N, values.len())
+        })
+    }
+}
+
+impl std::str::FromStr for Inputs {
+    type Err = String;
+
+    fn from_str(value: &str) -> Result<Self, Self::Err> {
+        let mut inputs = Vec::new();
+        for entry in value.split(',').filter(|entry| !entry.is_empty()) {
+            let input = match entry.split_once(':') {
+                Some(("u32", raw)) => {
+                    Input::U32(raw.parse().map_err(|e| format!("'{entry}': {e}"))?)
+                }
+                Some(("bool", "0")) => Input::Bool(false),
+                Some(("bool", "1")) => Input::Bool(true),
+                _ => return Err(format!("invalid typed input '{entry}'")),
+            };
+            inputs.push(input);
+        }
+        Ok(Inputs(inputs))
+    }
+}
+
+"""
+    )
+
+
+def stream_typed_inputs_fields(buffer: io.StringIO):
+    """Prints the `Args` fields holding the circuit count and the typed input vector."""
+
+    buffer.write(f'    #[clap(long = "{CIRCUITS_FLAG[2:]}", default_value_t = 1)]\n')
+    buffer.write("    circuits: usize,\n\n")
+    buffer.write(f'    #[clap(long = "{INPUTS_FLAG[2:]}", default_value = "")]\n')
+    buffer.write("    inputs: Inputs,\n\n")
+
+
+def stream_typed_inputs_writes(buffer: io.StringIO, write_statement: str, indent: int = 4):
+    """Prints a loop writing the typed input vector once per circuit. The `write_statement`
+    writes the reference `&value` of the current input, e.g. `stdin.write(&value);`.
+    """
+
+    pad = " " * indent
+    buffer.write(f"{pad}for _ in 0..args.circuits {{\n")
+    buffer.write(f"{pad}    for input in args.inputs.0.iter() {{\n")
+    buffer.write(f"{pad}        match *input {{\n")
+    buffer.write(f"{pad}            Input::U32(value) => {{ {write_statement} }}\n")
+    buffer.write(f"{pad}            Input::Bool(value) => {{ {write_statement} }}\n")
+    buffer.write(f"{pad}        }}\n")
+    buffer.write(f"{pad}    }}\n")
+    buffer.write(f"{pad}}}\n")
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def stream_trace_fields(buffer: io.StringIO):
+    """Prints the `Args` fields enabling trace logging, the binary trace channel, the
+    first traced step and the traced pc ranges."""
+
+    buffer.write(f'    #[clap(long = "{TRACE_FLAG[2:]}")]\n')
+    buffer.write("    trace: bool,\n\n")
+    buffer.write(f'    #[clap(long = "{TRACE_OUTPUT_FLAG[2:]}")]\n')
+    buffer.write("    trace_output: Option<String>,\n\n")
+    buffer.write(f'    #[clap(long = "{TRACE_FROM_FLAG[2:]}", default_value_t = 0)]\n')
+    buffer.write("    trace_from: u64,\n\n")
+    buffer.write(f'    #[clap(long = "{TRACE_PC_RANGES_FLAG[2:]}", default_value = "")]\n')
+    buffer.write("    trace_pc_ranges: String,\n\n")
+
+
+def stream_trace_setup(buffer: io.StringIO):
+    """Prints the statements enabling trace logging. If a trace output is provided, the
+    trace steps are written as binary records into it instead of stdout. Steps before the
+    first traced step or outside the traced pc ranges are not emitted at all."""
+
+    buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
+    buffer.write("    fuzzer_utils::set_trace_from_step(args.trace_from);\n")
+    buffer.write("    fuzzer_utils::set_trace_pc_ranges(&args.trace_pc_ranges);\n")
+    buffer.write("    if let Some(trace_output) = &args.trace_output {\n")
+    buffer.write("        fuzzer_utils::open_trace_channel(trace_output);\n")
+    buffer.write("    }\n")
+
+
+def stream_step_bound_fields(buffer: io.StringIO):
+    """Prints the `Args` fields of the step bound and the behavior past it"""
+
+    buffer.write(f'    #[clap(long = "{STEP_BOUND_FLAG[2:]}", ')
+    buffer.write(f"default_value_t = {DEFAULT_STEP_BOUND})]\n")
+    buffer.write("    step_bound: u64,\n\n")
+    buffer.write(f'    #[clap(long = "{STEP_OVERFLOW_FLAG[2:]}", ')
+    buffer.write(f'default_value = "{StepOverflow.PANIC}")]\n')
+    buffer.write("    step_overflow: String,\n\n")
+
+
+def stream_step_bound_setup(buffer: io.StringIO):
+    """Prints the statements configuring the step bound of the patched zkvm executors"""
+
+    buffer.write("    fuzzer_utils::set_step_bound(args.step_bound);\n")
+    buffer.write("    fuzzer_utils::set_step_overflow(&args.step_overflow);\n")
+
+
+# ---------------------------------------------------------------------------- #
+
+
+TRACE_CHANNEL_CAPACITY = 1 << 20
+
+
+def trace_channel_definitions(instr_kind_enum: Type[InstrKind]) -> str:
+    """Returns the rust definitions of the binary trace channel of a `fuzzer_utils` crate.
+    A record is written by `write_trace_record`, which returns `false` if the channel is
+    closed, so the caller can fall back to printing the step. A record carries no assembly,
+    so emitters without the instruction word of a step always print it. Instruction ids are
+    the indices in `instr_kind_enum`, exported as `TRACE_INSTRUCTION_<KIND>` constants.
+    Emitters pass a precomputed id, e.g. by matching their own instruction enum on these
+    constants, or map a name once per thread with `trace_static_instruction_id` and
+    `trace_encoded_instruction_id`, which ignore case, `_` and `.` like the text parser.
+    Emitters skip the steps rejected by `is_trace_step`, e.g. the prefix of an injection
+    run that repeats the original execution, and by `is_trace_pc`, e.g. boot and runtime
+    code outside the circuit functions. The step counter keeps counting skipped steps.
+    The crate has to include the `step_bound_definitions` as well.
+    """
+
+    instruction_consts = "".join(
+        f"pub const TRACE_INSTRUCTION_{kind.name}: u16 = {index};\n"
+        for index, kind in enumerate(instr_kind_enum)
+    )
+    instruction_arms = "".join(
+        f'        b"{kind.value}" => TRACE_INSTRUCTION_{kind.name},\n' for kind in instr_kind_enum
+    )
+
+    return f"""
+////////////////
+// BINARY TRACE CHANNEL
+/////////
+
+/// Size of a trace record in bytes: step (u64), pc (u32), instruction id (u16) and
+/// instruction word (u32), little endian without padding.
+pub const TRACE_RECORD_SIZE: usize = {TRACE_RECORD_SIZE};
+
+/// Id of an instruction name without a kind.
+pub const TRACE_UNKNOWN_INSTRUCTION_ID: u16 = {TRACE_UNKNOWN_INSTRUCTION_ID};
+
+{instruction_consts}
+const TRACE_CHANNEL_CAPACITY: usize = {TRACE_CHANNEL_CAPACITY};
+
+const TRACE_INSTRUCTION_CACHE_SLOTS: usize = 256;
+
+// NOTE: slots of the (key, id) pairs, where a key is the address and length of a name or
+//       the encoding word of an instruction
+type TraceInstructionCache = [(usize, usize, u16); TRACE_INSTRUCTION_CACHE_SLOTS];
+
+static TRACE_CHANNEL: std::sync::Mutex<Option<std::io::BufWriter<std::fs::File>>> =
+    std::sync::Mutex::new(None);
+
+// NOTE: mirrors whether the channel is open, so closed channels are checked without a lock
+static TRACE_CHANNEL_OPEN: std::sync::atomic::AtomicBool =
+    std::sync::atomic::AtomicBool::new(false);
+
+static TRACE_CHANNEL_PANIC_HOOK: std::sync::Once = std::sync::Once::new();
+
+static TRACE_FROM_STEP: std::sync::atomic::AtomicU64 = std::sync::atomic::AtomicU64::new(0);
+
+static TRACE_PC_RANGES: std::sync::RwLock<Vec<(u32, u32)>> = std::sync::RwLock::new(Vec::new());
+
+// NOTE: mirrors whether there is a pc range, so unfiltered pcs are checked without a lock
+static TRACE_PC_FILTERED: std::sync::atomic::AtomicBool = std::sync::atomic::AtomicBool::new(false);
+
+thread_local! {{
+    static TRACE_INSTRUCTION_CACHE: std::cell::RefCell<TraceInstructionCache> =
+        const {{ std::cell::RefCell::new([(0, 0, 0); TRACE_INSTRUCTION_CACHE_SLOTS]) }};
+}}
+
+/// Writes the trace records into the file at `path` (e.g. `/dev/fd/3`) instead of stdout.
+pub fn open_trace_channel(path: &str) {{
+    let file = std::fs::File::create(path).expect("unable to create trace channel");
+    let writer = std::io::BufWriter::with_capacity(TRACE_CHANNEL_CAPACITY, file);
+    let previous = TRACE_CHANNEL.lock().unwrap_or_else(|e| e.into_inner()).replace(writer);
+    TRACE_CHANNEL_OPEN.store(true, std::sync::atomic::Ordering::Relaxed);
+    if let Some(mut previous) = previous {{
+        std::io::Write::flush(&mut previous).expect("unable to flush trace channel");
+    }}
+    // NOTE: the buffered records are flushed on a panic before the previous hook runs
+    TRACE_CHANNEL_PANIC_HOOK.call_once(|| {{
+        let previous_hook = std::panic::take_hook();
+        std::panic::set_hook(Box::new(move |info| {{
+            if let Ok(mut channel) = TRACE_CHANNEL.try_lock() {{
+                if let Some(writer) = channel.as_mut() {{
+                    let _ = std::io::Write::flush(writer);
+                }}
+            }}
+            previous_hook(info);
+        }}));
+    }});
+}}
+
+/// Flushes and closes the trace channel, following steps are printed to stdout again.
+pub fn close_trace_channel() {{
+    TRACE_CHANNEL_OPEN.store(false, std::sync::atomic::Ordering::Relaxed);
+    let writer = TRACE_CHANNEL.lock().unwrap_or_else(|e| e.into_inner()).take();
+    if let Some(mut writer) = writer {{
+        std::io::Write::flush(&mut writer).expect("unable to flush trace channel");
+    }}
+}}
+
+/// Returns `true` if the trace records are written into the trace channel.
+pub fn is_trace_channel_open() -> bool {{
+    TRACE_CHANNEL_OPEN.load(std::sync::atomic::Ordering::Relaxed)
+}}
+
+/// Writes a trace record if the trace channel is open and returns `true` in that case.
+pub fn write_trace_record(step: u64, pc: u32, instruction_id: u16, word: u32) -> bool {{
+    if !is_trace_channel_open() {{
+        return false;
+    }}
+    let mut channel = TRACE_CHANNEL.lock().unwrap_or_else(|e| e.into_inner());
+    let Some(writer) = channel.as_mut() else {{
+        return false;
+    }};
+    let mut record = [0u8; TRACE_RECORD_SIZE];
+    record[0..8].copy_from_slice(&step.to_le_bytes());
+    record[8..12].copy_from_slice(&pc.to_le_bytes());
+    record[12..14].copy_from_slice(&instruction_id.to_le_bytes());
+    record[14..18].copy_from_slice(&word.to_le_bytes());
+    std::io::Write::write_all(writer, &record).expect("unable to write trace record");
+    true
+}}
+
+/// Only steps from `step` onward are traced, text and binary alike.
+pub fn set_trace_from_step(step: u64) {{
+    TRACE_FROM_STEP.store(step, std::sync::atomic::Ordering::Relaxed);
+}}
+
+/// Returns `true` if the step has to be traced.
+pub fn is_trace_step(step: u64) -> bool {{
+    step >= TRACE_FROM_STEP.load(std::sync::atomic::Ordering::Relaxed)
+        && is_step_bound_trace_step(step)
+}}
+
+/// Only steps with a pc in one of the `[start, end)` ranges are traced, text and binary
+/// alike, e.g. `0x200c-0x2100,0x2200-0x2310`. Every pc is traced if there is no range.
+pub fn set_trace_pc_ranges(ranges: &str) {{
+    let parse_pc = |pc: &str| {{
+        u32::from_str_radix(pc.trim_start_matches("0x"), 16).expect("invalid trace pc")
+    }};
+    let ranges = ranges
+        .split(',')
+        .filter(|range| !range.is_empty())
+        .map(|range| {{
+            let (start, end) = range.split_once('-').expect("invalid trace pc range");
+            (parse_pc(start), parse_pc(end))
+        }})
+        .collect::<Vec<_>>();
+    TRACE_PC_FILTERED.store(!ranges.is_empty(), std::sync::atomic::Ordering::Relaxed);
+    *TRACE_PC_RANGES.write().unwrap_or_else(|e| e.into_inner()) = ranges;
+}}
+
+/// Returns `true` if the step at the pc has to be traced.
+pub fn is_trace_pc(pc: u32) -> bool {{
+    if !TRACE_PC_FILTERED.load(std::sync::atomic::Ordering::Relaxed) {{
+        return true;
+    }}
+    let ranges = TRACE_PC_RANGES.read().unwrap_or_else(|e| e.into_inner());
+    ranges.iter().any(|(start, end)| *start <= pc && pc < *end)
+}}
+
+/// Returns the id of the instruction name used by the trace records.
+pub fn trace_instruction_id(instruction: &str) -> u16 {{
+    let mut name = [0u8; 32];
+    let mut length = 0;
+    for byte in instruction.bytes().filter(|b| *b != b'_' && *b != b'.') {{
+        if length == name.len() {{
+            return TRACE_UNKNOWN_INSTRUCTION_ID;
+        }}
+        name[length] = byte.to_ascii_lowercase();
+        length += 1;
+    }}
+    match &name[..length] {{
+{instruction_arms}        _ => TRACE_UNKNOWN_INSTRUCTION_ID,
+    }}
+}}
+
+// NOTE: direct mapped, a colliding key only evicts the slot and maps its name again
+fn cached_trace_instruction_id(key: (usize, usize), instruction: &str) -> u16 {{
+    TRACE_INSTRUCTION_CACHE.with(|cache| {{
+        let mut cache = cache.borrow_mut();
+        let slot = &mut cache[(key.0 ^ key.1) % TRACE_INSTRUCTION_CACHE_SLOTS];
+        if (slot.0, slot.1) != key {{
+            *slot = (key.0, key.1, trace_instruction_id(instruction));
+        }}
+        slot.2
+    }})
+}}
+
+/// Returns the id of a static instruction name, mapped once per thread by its address.
+pub fn trace_static_instruction_id(instruction: &'static str) -> u16 {{
+    cached_trace_instruction_id((instruction.as_ptr() as usize, instruction.len()), instruction)
+}}
+
+/// Returns the id of the instruction encoded by `word`, mapped once per thread by the word.
+pub fn trace_encoded_instruction_id(word: u32, instruction: &str) -> u16 {{
+    cached_trace_instruction_id((word as usize, usize::MAX), instruction)
+}}
+"""
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def step_bound_definitions() -> str:
+    """Returns the rust definitions of the step bound of a `fuzzer_utils` crate. The
+    executors call `check_step_bound` after every step, which prints a record with the
+    `STEP_BOUND_CONTEXT` once the bound is exceeded. Past the bound the execution either
+    panics, keeps running without tracing or only traces every
+    `STEP_OVERFLOW_SAMPLE_STRIDE`-th step, see `is_trace_step`.
+    """
+
+    overflow_consts = "".join(
+        f"const STEP_OVERFLOW_{overflow.name}: u8 = {index};\n"
+        for index, overflow in enumerate(StepOverflow)
+    )
+    overflow_arms = "".join(
+        f'        "{overflow}" => STEP_OVERFLOW_{overflow.name},\n' for overflow in StepOverflow
+    )
+
+    return f"""
+////////////////
+// STEP BOUND
+/////////
+
+{overflow_consts}
+const STEP_OVERFLOW_SAMPLE_STRIDE: u64 = {STEP_OVERFLOW_SAMPLE_STRIDE};
+
+static STEP_BOUND: std::sync::atomic::AtomicU64 =
+    std::sync::atomic::AtomicU64::new({DEFAULT_STEP_BOUND});
+
+static STEP_OVERFLOW: std::sync::atomic::AtomicU8 =
+    std::sync::atomic::AtomicU8::new(STEP_OVERFLOW_PANIC);
+
+static STEP_BOUND_EXCEEDED: std::sync::atomic::AtomicBool =
+    std::sync::atomic::AtomicBool::new(false);
+
+/// Sets the step bound of the endless loop detection for the next execution.
+pub fn set_step_bound(bound: u64) {{
+    STEP_BOUND.store(bound, std::sync::atomic::Ordering::Relaxed);
+    STEP_BOUND_EXCEEDED.store(false, std::sync::atomic::Ordering::Relaxed);
+}}
+
+/// Sets the behavior past the step bound, i.e. `panic`, `stop-tracing` or `sample`.
+pub fn set_step_overflow(overflow: &str) {{
+    let overflow = match overflow {{
+{overflow_arms}        _ => panic!("invalid step overflow '{{}}'", overflow),
+    }};
+    STEP_OVERFLOW.store(overflow, std::sync::atomic::Ordering::Relaxed);
+}}
+
+/// Restores the default step bound, which panics past {DEFAULT_STEP_BOUND} steps.
+pub fn reset_step_bound() {{
+    set_step_bound({DEFAULT_STEP_BOUND});
+    STEP_OVERFLOW.store(STEP_OVERFLOW_PANIC, std::sync::atomic::Ordering::Relaxed);
+}}
+
+/// Checks the current step of an executor against the step bound.
+pub fn check_step_bound(step: u64) {{
+    let bound = STEP_BOUND.load(std::sync::atomic::Ordering::Relaxed);
+    if step <= bound {{
+        return;
+    }}
+    let overflow = STEP_OVERFLOW.load(std::sync::atomic::Ordering::Relaxed);
+    // NOTE: an execution may run several executors, the record is printed only once
+    if !STEP_BOUND_EXCEEDED.swap(true, std::sync::atomic::Ordering::Relaxed) {{
+        println!(
+            "<record>{{{{\\
+                \\"context\\":\\"{STEP_BOUND_CONTEXT}\\", \\
+                \\"status\\":\\"exceeded\\", \\
+                \\"bound\\":\\"{{}}\\"\\
+            }}}}</record>",
+            bound
+        );
+    }}
+    if overflow == STEP_OVERFLOW_PANIC {{
+        panic!("Endless loop detection step bound triggered! Bound: {{}} steps", bound);
+    }}
+}}
+
+/// Returns `true` if the step is traced with respect to the step bound.
+pub fn is_step_bound_trace_step(step: u64) -> bool {{
+    if step <= STEP_BOUND.load(std::sync::atomic::Ordering::Relaxed) {{
+        return true;
+    }}
+    match STEP_OVERFLOW.load(std::sync::atomic::Ordering::Relaxed) {{
+        STEP_OVERFLOW_STOP_TRACING => false,
+        STEP_OVERFLOW_SAMPLE => step % STEP_OVERFLOW_SAMPLE_STRIDE == 0,
+        _ => true,
+    }}
+}}
+"""
+
+
+# ---------------------------------------------------------------------------- #
@@ -2,6 +2,11 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+RUST_PANIC_HEADER_PATTERN = re.compile(
+    r"thread '(.+?)' panicked at ([^\n\r\t]+?)/([^/\n\r\t]+?):([0-9]+):([0-9]+):$"
+)
+RUST_PANIC_END_PREFIXES = ("note: run with `RUST_BACKTRACE=", "stack backtrace:")
+
 # ---------------------------------------------------------------------------- #
 #                               Rust Panic Parser                              #
 # ---------------------------------------------------------------------------- #
@@ -28,31 +33,80 @@ class RustPanicInfo:
 # -------------------------- Common Library Sources -------------------------- #
 
 
+class RustPanicParser:
+    """Incremental parser of the common rust panic format. A panic starts with a
+    `thread '...' panicked at <file>:<line>:<column>:` line, followed by the message
+    lines up to the backtrace note. The output is consumed line by line, so only the
+    message of the current panic and an incomplete last line are held back."""
+
+    __panics: list[RustPanicInfo]
+    __header: re.Match | None
+    __message: list[str]
+    __pending: str
+
+    def __init__(self):
+        self.__panics = []
+        self.__header = None
+        self.__message = []
+        self.__pending = ""
+
+    def feed(self, chunk: str):
+        lines = (self.__pending + chunk).split("\n")
+        self.__pending = lines.pop()
+        for line in lines:
+            self.parse_line(line)
+
+    def finish(self):
+        """Parses the held back last line of the output"""
+        line, self.__pending = self.__pending, ""
+        self.parse_line(line)
+
+    def parse_line(self, line: str):
+        if self.__header is None:
+            if " panicked at " in line:
+                self.__header = RUST_PANIC_HEADER_PATTERN.search(line)
+            return
+
+        # NOTE: the message consists of at least one character
+        if line.startswith(RUST_PANIC_END_PREFIXES):
+            message = "\n".join(self.__message)
+            if len(message) > 0:
+                self.__panics.append(
+                    RustPanicInfo(
+                        thread=self.__header.group(1),
+                        # trusts that rust reports it in path format
+                        file_dir=Path(self.__header.group(2)),
+                        file_name=self.__header.group(3),
+                        # can be casted based on regex format
+                        file_line=int(self.__header.group(4)),
+                        file_column=int(self.__header.group(5)),
+                        message=message,
+                    )
+                )
+                self.__header = None
+                self.__message = []
+                return
+
+        self.__message.append(line)
+
+    @property
+    def panics(self) -> list[RustPanicInfo]:
+        return self.__panics
+
+
+# ---------------------------------------------------------------------------- #
+
+
 def parse_panic_info(msg: str) -> list[RustPanicInfo]:
     """
     This function tries to detect the common rust panic format inside of a string.
     It parses each occurrence and returns a list of `RustPanicInfo` objects
     summarizing them.
     """
-    summaries: list[RustPanicInfo] = []
-    pattern = re.compile(
-        r"thread '(.+?)' panicked at ([^\n\r\t]+?)/([^/\n\r\t]+?):([0-9]+):([0-9]+):\n"
-        r"(.+?)\n"
-        r"((note: run with `RUST_BACKTRACE=)|(stack backtrace:))",
-        flags=re.DOTALL | re.MULTILINE,
-    )
-    for re_match in re.finditer(pattern, msg):
-        summaries.append(
-            RustPanicInfo(
-                thread=re_match.group(1),
-                file_dir=Path(re_match.group(2)),  # trusts that rust reports it in path format
-                file_name=re_match.group(3),
-                file_line=int(re_match.group(4)),  # can be casted based on regex format
-                file_column=int(re_match.group(5)),  # can be casted based on regex format
-                message=re_match.group(6),
-            )
-        )
-    return summaries
+    parser = RustPanicParser()
+    parser.feed(msg)
+    parser.finish()
+    return parser.panics
 
 
 # -------------------------- Common Library Sources -------------------------- #
@@ -0,0 +1,184 @@
+import logging
+import os
+import re
+import selectors
+import subprocess
+import time
+from typing import Callable
+
+from zkvm_fuzzer_utils.batch import (
+    PANIC_RETURNCODE,
+    create_batch_line,
+    returncode_from_batch_status,
+    split_output_into_batch_sections,
+)
+from zkvm_fuzzer_utils.cmd import (
+    ExecStatus,
+    stdout_and_stderr_to_printable,
+    terminate_process_group,
+)
+
+logger = logging.getLogger("fuzzer")
+
+# ---------------------------------------------------------------------------- #
+#                               Host Server Client                             #
+# ---------------------------------------------------------------------------- #
+
+
+class HostServer:
+    """Client for a host program running in server mode (`--serve`). Every request
+    is a line of host arguments written to stdin, the response is the delimited
+    `<batch>` section of stdout and stderr. The host process is spawned lazily and
+    restarted automatically if it died, timed out or panicked during a request, as
+    a panic can leave the process in a poisoned state. A fork server (`--fork-serve`)
+    isolates every request in its own child process and is therefore only restarted
+    if it died or timed out."""
+
+    __spawn: Callable[[], subprocess.Popen]
+    __process: subprocess.Popen | None
+    __request_index: int
+    __restarts: int
+    __is_started: bool
+    __is_isolated: bool
+
+    def __init__(self, spawn: Callable[[], subprocess.Popen], is_isolated: bool = False):
+        self.__spawn = spawn
+        self.__is_isolated = is_isolated
+        self.__process = None
+        self.__request_index = 0
+        self.__restarts = 0
+        self.__is_started = False
+
+    def start(self):
+        if self.is_running:
+            return
+        self.stop()  # cleans up a dead process
+        self.__process = self.__spawn()
+        self.__request_index = 0
+        if self.__is_started:
+            self.__restarts += 1
+            logger.info(f"restart host server (restarts: {self.__restarts})")
+        self.__is_started = True
+
+    def stop(self):
+        if self.__process is None:
+            return
+        process = self.__process
+        self.__process = None
+        if process.stdin:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        # NOTE: the group includes the children of a fork server
+        terminate_process_group(process)
+        for stream in [process.stdout, process.stderr]:
+            if stream:
+                stream.close()
+
+    @property
+    def is_running(self) -> bool:
+        return self.__process is not None and self.__process.poll() is None
+
+    @property
+    def restarts(self) -> int:
+        return self.__restarts
+
+    def execute(self, arguments: list[str], timeout: float | None = None) -> ExecStatus:
+        """Sends a single execution request to the host server and waits for its
+        response. Returns an `ExecStatus` equivalent to a single host execution."""
+
+        if not self.is_running:
+            self.start()
+        process = self.__process
+        assert process is not None, "host server is not running"
+        assert process.stdin and process.stdout and process.stderr, "missing pipes"
+
+        index = self.__request_index
+        self.__request_index += 1
+        command = f"{' '.join(str(e) for e in process.args)} # request {index}"  # type: ignore
+        end_pattern = re.compile(rf'<batch>\{{"index":{index}, "status":"(?!start)'.encode())
+
+        start_time = time.time()
+        is_timeout = False
+        stdout_buffer = bytearray()
+        stderr_buffer = bytearray()
+        stdout_finished = False
+        stderr_finished = False
+
+        try:
+            process.stdin.write(create_batch_line(arguments).encode("utf-8"))
+            process.stdin.flush()
+        except BrokenPipeError:
+            logger.error("host server closed its stdin unexpectedly")
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ, stdout_buffer)
+            selector.register(process.stderr, selectors.EVENT_READ, stderr_buffer)
+
+            while not (stdout_finished and stderr_finished) and len(selector.get_map()) > 0:
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (time.time() - start_time)
+                    if remaining <= 0:
+                        is_timeout = True
+                        break
+
+                for key, _ in selector.select(remaining):
+                    data = os.read(key.fd, 1 << 16)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                        continue
+                    # only the new data and a small overlap has to be searched
+                    search_start = max(len(key.data) - 128, 0)
+                    key.data.extend(data)
+                    if end_pattern.search(key.data, search_start):
+                        if key.fileobj is process.stdout:
+                            stdout_finished = True
+                        else:
+                            stderr_finished = True
+
+        delta_time = time.time() - start_time
+        stdout, stderr = stdout_and_stderr_to_printable(bytes(stdout_buffer), bytes(stderr_buffer))
+        stdout_sections, finished = split_output_into_batch_sections(stdout)
+        stderr_sections, _ = split_output_into_batch_sections(stderr)
+
+        if index in finished:
+            returncode = returncode_from_batch_status(finished[index]["status"])
+            delta_time = float(finished[index]["time"])
+        elif is_timeout:
+            returncode = 124  # timeout return status
+        else:
+            try:
+                # NOTE: the pipes are closed slightly before the process is reaped
+                returncode = process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                returncode = None
+            if returncode is None or returncode == 0:
+                returncode = PANIC_RETURNCODE
+            logger.error(f"host server died during request {index} with {returncode}")
+
+        # NOTE: a section is missing if the process died before the request was started,
+        #       in that case the raw output is the best information we have.
+        stdout = stdout_sections.get(index, stdout)
+        stderr = stderr_sections.get(index, stderr)
+
+        logger.info(f"  => request {index} exit {returncode}")
+
+        # anything but a successful request might poison a non isolated server
+        if is_timeout or not self.is_running or (returncode != 0 and not self.__is_isolated):
+            self.stop()
+
+        return ExecStatus(
+            command,
+            stdout,
+            stderr,
+            stdout.encode("utf-8"),
+            stderr.encode("utf-8"),
+            returncode,
+            delta_time,
+            is_timeout,
+        )
+
+
+# ---------------------------------------------------------------------------- #
@@ -0,0 +1,110 @@
+import re
+from typing import Callable
+
+# size of the chunks read from a pipe or fed from an already captured output
+OUTPUT_CHUNK_SIZE = 1 << 16
+
+# names of the output streams passed to abort predicates
+STDOUT = "stdout"
+STDERR = "stderr"
+
+# An abort predicate receives the stream name and a new printable chunk of a running
+# command and returns a reason if the command is already decided and can be terminated.
+AbortPredicate = Callable[[str, str], str | None]
+
+# maximal length of a pattern match spanning two chunks
+OUTPUT_PATTERN_OVERLAP = 256
+
+# ---------------------------------------------------------------------------- #
+#                                 Tag Tokenizer                                #
+# ---------------------------------------------------------------------------- #
+
+
+class TagTokenizer:
+    """Incremental tokenizer of `<tag>payload</tag>` entries in a process output. A tag
+    never spans multiple lines, so a chunk is scanned up to its last line break and only
+    the incomplete last line is held back until the next chunk arrives."""
+
+    __pattern: re.Pattern
+    __on_tag: Callable[[str, str], None]
+    __pending: str
+
+    def __init__(self, tags: list[str], on_tag: Callable[[str, str], None]):
+        names = "|".join(re.escape(tag) for tag in tags)
+        self.__pattern = re.compile(rf"\<({names})\>(.+?)\<\/\1\>")
+        self.__on_tag = on_tag
+        self.__pending = ""
+
+    def feed(self, chunk: str):
+        end = chunk.rfind("\n")
+        if end < 0:
+            self.__pending += chunk
+            return
+        end += 1  # keep the line break
+        data = self.__pending + chunk[:end]
+        self.__pending = chunk[end:]
+        self.scan(data)
+
+    def finish(self):
+        """Scans the held back last line of the output"""
+        data, self.__pending = self.__pending, ""
+        self.scan(data)
+
+    def scan(self, data: str):
+        for tag_match in self.__pattern.finditer(data):
+            self.__on_tag(tag_match.group(1), tag_match.group(2))
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def feed_in_chunks(data: str, feed: Callable[[str], None]):
+    """Feeds an already captured output chunk by chunk"""
+    for start in range(0, len(data), OUTPUT_CHUNK_SIZE):
+        end = start + OUTPUT_CHUNK_SIZE
+        feed(data[start:end])
+
+
+# ---------------------------------------------------------------------------- #
+#                               Abort Predicates                               #
+# ---------------------------------------------------------------------------- #
+
+
+class OutputPattern:
+    """Abort predicate firing once all `patterns` occurred in a stream of the command
+    output, e.g. a known error message. The tail of the previous chunk is searched as
+    well, so matches spanning two chunks are found."""
+
+    __reason: str
+    __patterns: list[re.Pattern]
+    __stream: str
+    __is_found: list[bool]
+    __tail: str
+
+    def __init__(self, reason: str, patterns: list[str], stream: str = STDOUT):
+        self.__reason = reason
+        self.__patterns = [re.compile(pattern) for pattern in patterns]
+        self.__stream = stream
+        self.__is_found = [False] * len(patterns)
+        self.__tail = ""
+
+    def __call__(self, stream: str, chunk: str) -> str | None:
+        if stream != self.__stream:
+            return None
+        data = self.__tail + chunk
+        self.__tail = data[-OUTPUT_PATTERN_OVERLAP:]
+        for index, pattern in enumerate(self.__patterns):
+            if not self.__is_found[index] and pattern.search(data):
+                self.__is_found[index] = True
+        return self.__reason if all(self.__is_found) else None
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def first_abort_reason(predicates: list[AbortPredicate], stream: str, chunk: str) -> str | None:
+    for predicate in predicates:
+        reason = predicate(stream, chunk)
+        if reason is not None:
+            return reason
+    return None
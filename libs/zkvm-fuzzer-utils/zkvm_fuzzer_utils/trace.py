@@ -1,13 +1,38 @@
+import array
+import bisect
+import itertools
 import json
 import logging
 import re
-from typing import Any, Generic, Type
+import struct
+from collections import Counter
+from typing import Any, Generic, Iterator, Sequence, Type, overload
 
 from zkvm_fuzzer_utils.cmd import ExecStatus
 from zkvm_fuzzer_utils.kinds import InjectionKind, InstrKind
+from zkvm_fuzzer_utils.risc32_im import disassemble_rv32im
+from zkvm_fuzzer_utils.stream import TagTokenizer, feed_in_chunks
+
+try:
+    import numpy as np
+except ImportError:  # NOTE: numpy is optional, the trace columns fall back to pure python
+    np = None
 
 logger = logging.getLogger("fuzzer")
 
+# binary trace record: step (u64), pc (u32), instruction id (u16) and instruction word (u32)
+TRACE_RECORD_FORMAT = "<QIHI"
+TRACE_RECORD_SIZE = struct.calcsize(TRACE_RECORD_FORMAT)
+TRACE_UNKNOWN_INSTRUCTION_ID = 0xFFFF
+TRACE_RECORD_DTYPE = (
+    None
+    if np is None
+    else np.dtype([("step", "<u8"), ("pc", "<u4"), ("instruction", "<u2"), ("word", "<u4")])
+)
+
+# assembly index of a step whose assembly is disassembled from its instruction word
+TRACE_WORD_ASSEMBLY = 0xFFFFFFFF
+
 
 # ---------------------------------------------------------------------------- #
 #                               Single Trace Step                              #
@@ -19,12 +44,14 @@ class TraceStep(Generic[InstrKind]):
     __pc: int
     __instruction: InstrKind
     __assembly: str
+    __word: int
 
-    def __init__(self, step: int, pc: int, instruction: InstrKind, assembly: str):
+    def __init__(self, step: int, pc: int, instruction: InstrKind, assembly: str, word: int = 0):
         self.__step = step
         self.__pc = pc
         self.__instruction = instruction
         self.__assembly = assembly
+        self.__word = word
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -33,7 +60,7 @@ class TraceStep(Generic[InstrKind]):
         return (
             f"TraceStep(step={self.__step}, "
             f"pc={self.__pc}, instruction={self.__instruction}, "
-            f'assembly="{self.__assembly}")'
+            f'assembly="{self.__assembly}", word={self.__word:#010x})'
         )
 
     def __eq__(self, other: Any) -> bool:
@@ -43,6 +70,7 @@ class TraceStep(Generic[InstrKind]):
                 and self.__pc == other.__pc
                 and self.__instruction == other.__instruction
                 and self.__assembly == other.__assembly
+                and self.__word == other.__word
             )
         return False
 
@@ -50,7 +78,7 @@ class TraceStep(Generic[InstrKind]):
         h1 = hash(self.__step)
         h2 = hash(self.__pc)
         h3 = hash(self.__instruction)
-        h4 = hash(self.__assembly)
+        h4 = hash((self.__assembly, self.__word))
         result = h1 * 31 + h2 * 37 + h3 * 41 + h4 * 43
         result ^= result >> 16
         result *= 0x45D9F3B
@@ -77,6 +105,11 @@ class TraceStep(Generic[InstrKind]):
     def assembly(self) -> str:
         return self.__assembly
 
+    @property
+    def word(self) -> int:
+        """Raw instruction word, `0` if the emitter provides none"""
+        return self.__word
+
     @classmethod
     def from_json(cls, data: str, instr_kind_enum: Type[InstrKind]) -> "TraceStep":
         trace_step_dict = json.loads(data)
@@ -86,7 +119,8 @@ class TraceStep(Generic[InstrKind]):
             trace_step_dict["instruction"].lower().replace("_", "").replace(".", "")
         )
         assembly = re.sub(r"\s+", " ", trace_step_dict["assembly"])
-        return TraceStep(step, pc, instruction, assembly)
+        word = int(trace_step_dict.get("word", 0))
+        return TraceStep(step, pc, instruction, assembly, word)
 
 
 # ---------------------------------------------------------------------------- #
@@ -167,13 +201,312 @@ class TraceFault(Generic[InjectionKind]):
         return TraceFault(step, pc, kind, info)
 
 
+# ---------------------------------------------------------------------------- #
+#                                 Trace Columns                                #
+# ---------------------------------------------------------------------------- #
+
+
+class TraceColumns(Generic[InstrKind]):
+    """Stores trace steps as parallel columns of step, pc, instruction code, instruction
+    word and assembly index. The instruction code indexes the members of the instruction
+    enum and the assembly index the interned assembly strings, so a step takes 26 bytes
+    instead of a `TraceStep` object. Steps of a binary trace carry no assembly string,
+    their assembly is disassembled from the word only when a step is accessed.
+
+    NOTE: The columns of a suffix trace start at `start_step`, the steps before it are
+          not recorded and the row of a step is `step - start_step`. The steps of `sparse`
+          columns, e.g. of a host only tracing some pc ranges, are ascending but may skip
+          steps, so the row of a step is searched instead.
+    """
+
+    __start_step: int
+    __sparse: bool
+    __step: array.array
+    __pc: array.array
+    __instruction: array.array
+    __word: array.array
+    __assembly: array.array
+    __assembly_table: list[str]
+    __assembly_lookup: dict[str, int]
+
+    __instr_kinds: list[InstrKind]
+    __instr_codes: dict[InstrKind, int]
+
+    def __init__(self, instr_kind_enum: Type[InstrKind], start_step: int = 0, sparse: bool = False):
+        self.__start_step = start_step
+        self.__sparse = sparse
+        self.__step = array.array("Q")
+        self.__pc = array.array("Q")
+        self.__instruction = array.array("H")
+        self.__word = array.array("I")
+        self.__assembly = array.array("I")
+        self.__assembly_table = []
+        self.__assembly_lookup = {}
+        self.__instr_kinds = list(instr_kind_enum)
+        self.__instr_codes = {kind: code for code, kind in enumerate(self.__instr_kinds)}
+
+    def __len__(self) -> int:
+        return len(self.__step)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TraceColumns):
+            return (
+                self.__start_step == other.__start_step
+                and self.__sparse == other.__sparse
+                and self.__step == other.__step
+                and self.__pc == other.__pc
+                and self.__instruction == other.__instruction
+                and self.__word == other.__word
+                and self.__instr_kinds == other.__instr_kinds
+                and self.assembly_strings() == other.assembly_strings()
+            )
+        return False
+
+    def intern(self, assembly: str) -> int:
+        """Returns the index of the assembly string in the assembly table"""
+        index = self.__assembly_lookup.get(assembly)
+        if index is None:
+            index = len(self.__assembly_table)
+            self.__assembly_lookup[assembly] = index
+            self.__assembly_table.append(assembly)
+        return index
+
+    def assembly_index(self, assembly: str | None) -> int:
+        return TRACE_WORD_ASSEMBLY if assembly is None else self.intern(assembly)
+
+    def append(
+        self, step: int, pc: int, instruction_code: int, assembly: str | None, word: int = 0
+    ):
+        """Appends a step, its assembly is disassembled from the word if it is `None`"""
+        if instruction_code >= len(self.__instr_kinds):
+            raise ValueError(f"unknown instruction id {instruction_code} at step {step}")
+        self.__step.append(step)
+        self.__pc.append(pc)
+        self.__instruction.append(instruction_code)
+        self.__word.append(word)
+        self.__assembly.append(self.assembly_index(assembly))
+
+    def append_step(self, step: TraceStep[InstrKind]):
+        code = self.__instr_codes[step.instruction]
+        self.append(step.step, step.pc, code, step.assembly, step.word)
+
+    def row_of(self, step: int) -> int | None:
+        """Returns the row of a recorded step or `None` if the step was not recorded"""
+        if not self.__sparse:
+            row = step - self.__start_step
+            return row if 0 <= row < len(self.__step) else None
+        row = bisect.bisect_left(self.__step, step)
+        return row if row < len(self.__step) and self.__step[row] == step else None
+
+    def rows_before(self, step: int) -> int:
+        """Returns the number of recorded steps preceding `step`"""
+        if not self.__sparse:
+            return min(max(step - self.__start_step, 0), len(self.__step))
+        return bisect.bisect_left(self.__step, step)
+
+    def add(self, step: int, pc: int, instruction_code: int, assembly: str | None, word: int = 0):
+        """Appends the next step of the trace. Emulators may repeat earlier steps, which
+        then have to be identical to the recorded step."""
+
+        expected_step = self.end_step
+        if step == expected_step or (self.__sparse and step > expected_step):
+            self.append(step, pc, instruction_code, assembly, word)
+
+        elif self.__start_step <= step < expected_step:  # compare any repeated steps
+            row = self.row_of(step)
+            if (
+                row is None
+                or self.__pc[row] != pc
+                or self.__instruction[row] != instruction_code
+                or self.__word[row] != word
+                or self.__assembly[row] != self.assembly_index(assembly)
+            ):
+                logger.info(f"step {step}: pc={pc}, code={instruction_code}, {assembly}")
+                logger.info(self.step_at(row))
+                raise ValueError(f"diverging trace at step {step}")
+
+        else:
+            logger.info(f"step {step}: pc={pc}, code={instruction_code}, {assembly}")
+            raise ValueError(f"Unexpected trace step! Expected: {expected_step}, but was {step}!")
+
+    def add_step(self, step: TraceStep[InstrKind]):
+        code = self.__instr_codes[step.instruction]
+        self.add(step.step, step.pc, code, step.assembly, step.word)
+
+    def add_records(self, data: bytes):
+        """Adds the fixed size records of a binary trace channel. A truncated last record,
+        e.g. of a killed host, is dropped. The record carries no assembly, it is
+        disassembled from the instruction word on access."""
+
+        truncated_size = len(data) % TRACE_RECORD_SIZE
+        if truncated_size > 0:
+            logger.warning(f"dropping truncated binary trace record of {truncated_size} bytes")
+            data = data[:-truncated_size]
+
+        if np is not None and len(self.__step) == 0:
+            records = np.frombuffer(data, dtype=TRACE_RECORD_DTYPE)
+            steps = records["step"]
+            if self.__sparse:
+                is_ascending = len(steps) == 0 or (
+                    int(steps[0]) >= self.__start_step
+                    and bool(np.all(np.diff(steps.astype(np.int64)) > 0))
+                )
+            else:
+                expected_steps = np.arange(self.__start_step, self.__start_step + len(records))
+                is_ascending = np.array_equal(steps, expected_steps)
+            if is_ascending:
+                self.set_records(records)
+                return  # NOTE: without repeated steps there is nothing to compare
+
+        for step, pc, instruction_code, word in struct.iter_unpack(TRACE_RECORD_FORMAT, data):
+            self.add(step, pc, instruction_code, None, word)
+
+    def set_records(self, records: Any):
+        """Replaces the columns by the structured numpy array of ascending records"""
+        if len(records) > 0 and int(records["instruction"].max()) >= len(self.__instr_kinds):
+            unknown = records[records["instruction"] >= len(self.__instr_kinds)][0]
+            raise ValueError(
+                f"unknown instruction id {unknown['instruction']} at step {unknown['step']}"
+            )
+        self.__step = array.array("Q", records["step"].astype(np.uint64).tobytes())
+        self.__pc = array.array("Q", records["pc"].astype(np.uint64).tobytes())
+        self.__instruction = array.array("H", records["instruction"].astype(np.uint16).tobytes())
+        self.__word = array.array("I", records["word"].astype(np.uint32).tobytes())
+        self.__assembly = array.array("I", [TRACE_WORD_ASSEMBLY]) * len(records)
+
+    def assembly_at(self, index: int) -> str:
+        assembly_index = self.__assembly[index]
+        if assembly_index == TRACE_WORD_ASSEMBLY:
+            return disassemble_rv32im(self.__word[index])
+        return self.__assembly_table[assembly_index]
+
+    def step_at(self, index: int) -> TraceStep[InstrKind]:
+        return TraceStep(
+            self.__step[index],
+            self.__pc[index],
+            self.__instr_kinds[self.__instruction[index]],
+            self.assembly_at(index),
+            self.__word[index],
+        )
+
+    def assembly_strings(self) -> list[str]:
+        return [self.assembly_at(index) for index in range(len(self.__assembly))]
+
+    @property
+    def start_step(self) -> int:
+        return self.__start_step
+
+    @property
+    def end_step(self) -> int:
+        """Step following the last recorded step, `start_step` if there is none"""
+        return self.__step[-1] + 1 if len(self.__step) > 0 else self.__start_step
+
+    @property
+    def sparse(self) -> bool:
+        return self.__sparse
+
+    @property
+    def step(self) -> array.array:
+        return self.__step
+
+    @property
+    def pc(self) -> array.array:
+        return self.__pc
+
+    @property
+    def instruction(self) -> array.array:
+        """Instruction codes, i.e. indices into `instr_kinds`"""
+        return self.__instruction
+
+    @property
+    def word(self) -> array.array:
+        return self.__word
+
+    @property
+    def assembly(self) -> array.array:
+        """Assembly indices, i.e. indices into `assembly_table` or `TRACE_WORD_ASSEMBLY`"""
+        return self.__assembly
+
+    @property
+    def assembly_table(self) -> list[str]:
+        return self.__assembly_table
+
+    @property
+    def instr_kinds(self) -> list[InstrKind]:
+        return self.__instr_kinds
+
+
+# ---------------------------------------------------------------------------- #
+
+
+class TraceSteps(Sequence[TraceStep[InstrKind]]):
+    """Lazy view of trace columns creating the `TraceStep` objects on access. The steps
+    before the `start_step` of suffix columns are read from the `prefix` columns."""
+
+    __columns: TraceColumns[InstrKind]
+    __prefix: TraceColumns[InstrKind] | None
+
+    def __init__(
+        self, columns: TraceColumns[InstrKind], prefix: TraceColumns[InstrKind] | None = None
+    ):
+        self.__columns = columns
+        self.__prefix = prefix
+
+    def __len__(self) -> int:
+        if self.__prefix is None:
+            return len(self.__columns)
+        return self.prefix_length + len(self.__columns)
+
+    @property
+    def prefix_length(self) -> int:
+        """Number of steps read from the prefix columns"""
+        if self.__prefix is None:
+            return 0
+        return self.__prefix.rows_before(self.__columns.start_step)
+
+    def step_at(self, index: int) -> TraceStep[InstrKind]:
+        if self.__prefix is None:
+            return self.__columns.step_at(index)
+        prefix_length = self.prefix_length
+        if index < 0:
+            index += prefix_length + len(self.__columns)
+        if 0 <= index < prefix_length:
+            return self.__prefix.step_at(index)
+        return self.__columns.step_at(index - prefix_length)
+
+    @overload
+    def __getitem__(self, index: int) -> TraceStep[InstrKind]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TraceStep[InstrKind]]: ...
+
+    def __getitem__(self, index: int | slice) -> TraceStep[InstrKind] | list[TraceStep[InstrKind]]:
+        if isinstance(index, slice):
+            return [self.step_at(i) for i in range(*index.indices(len(self)))]
+        return self.step_at(index)
+
+    def __iter__(self) -> Iterator[TraceStep[InstrKind]]:
+        for index in range(len(self)):
+            yield self.step_at(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TraceSteps) and self.__prefix is None and other.__prefix is None:
+            return self.__columns == other.__columns
+        if isinstance(other, TraceSteps):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return False
+
+
 # ---------------------------------------------------------------------------- #
 #                                     Trace                                    #
 # ---------------------------------------------------------------------------- #
 
 
 class Trace(Generic[InstrKind, InjectionKind]):
-    __steps: list[TraceStep[InstrKind]]
+    __columns: TraceColumns[InstrKind]
+    __prefix: TraceColumns[InstrKind] | None
     __faults: list[TraceFault[InjectionKind]]
 
     __instr_kind_enum: Type[InstrKind]
@@ -181,23 +514,29 @@ class Trace(Generic[InstrKind, InjectionKind]):
 
     def __init__(
         self,
-        steps: list[TraceStep[InstrKind]],
+        steps: TraceColumns[InstrKind] | list[TraceStep[InstrKind]],
         faults: list[TraceFault[InjectionKind]],
         instr_kind_enum: Type[InstrKind],
         injection_kind_enum: Type[InjectionKind],
     ):
-        self.__steps = steps
+        if not isinstance(steps, TraceColumns):
+            columns = TraceColumns(instr_kind_enum)
+            for step in steps:
+                columns.append_step(step)
+            steps = columns
+        self.__columns = steps
+        self.__prefix = None
         self.__faults = faults
         self.__instr_kind_enum = instr_kind_enum
         self.__injection_kind_enum = injection_kind_enum
 
     def __str__(self) -> str:
-        len_steps = len(self.__steps)
+        len_steps = len(self.steps)
         len_faults = len(self.__faults)
         return f"Trace(steps=TraceStep[{len_steps}], faults=TraceFault[{len_faults}])"
 
     def __repr__(self):
-        len_steps = len(self.__steps)
+        len_steps = len(self.steps)
         len_faults = len(self.__faults)
         return (
             f"Trace[{self.__instr_kind_enum.name},{self.__injection_kind_enum.name}]"
@@ -207,7 +546,7 @@ class Trace(Generic[InstrKind, InjectionKind]):
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Trace):
             return (
-                self.__steps == other.__steps
+                self.steps == other.steps
                 and self.__faults == other.__faults
                 and self.__instr_kind_enum == other.__instr_kind_enum
                 and self.__injection_kind_enum == other.__injection_kind_enum
@@ -215,8 +554,8 @@ class Trace(Generic[InstrKind, InjectionKind]):
         return False
 
     def __hash__(self) -> int:
-        h1 = hash(self.__steps)
-        h2 = hash(self.__faults)
+        h1 = hash(len(self.steps))
+        h2 = hash(tuple(self.__faults))
         h3 = hash(self.__instr_kind_enum)
         h4 = hash(self.__injection_kind_enum)
         result = h1 * 31 + h2 * 37 + h3 * 41 + h4 * 43
@@ -228,23 +567,107 @@ class Trace(Generic[InstrKind, InjectionKind]):
     def has_fault_injection(self) -> bool:
         return len(self.__faults) > 0
 
+    def with_prefix(
+        self, original: "Trace[InstrKind, InjectionKind]"
+    ) -> "Trace[InstrKind, InjectionKind]":
+        """Returns the full view of a suffix trace. The steps before its `start_step` are
+        shared with the columns of the `original` trace instead of being copied."""
+
+        start_step = self.__columns.start_step
+        if original.columns.start_step != 0 or (
+            not original.columns.sparse and len(original.columns) < start_step
+        ):
+            raise ValueError(f"original trace does not cover the steps before {start_step}")
+        trace = Trace(
+            self.__columns, self.__faults, self.__instr_kind_enum, self.__injection_kind_enum
+        )
+        trace.__prefix = original.columns
+        return trace
+
+    def __column_values(self, column: str, dtype: str) -> Any:
+        """Returns the values of a column for every step, as numpy array if available"""
+        values = getattr(self.__columns, column)
+        prefix_length = self.steps.prefix_length
+        if np is not None:
+            if prefix_length == 0:
+                return np.frombuffer(values, dtype=dtype)
+            prefix = np.frombuffer(getattr(self.__prefix, column), dtype=dtype, count=prefix_length)
+            return np.concatenate([prefix, np.frombuffer(values, dtype=dtype)])
+        if prefix_length == 0:
+            return values
+        prefix = itertools.islice(getattr(self.__prefix, column), prefix_length)
+        return array.array(values.typecode, itertools.chain(prefix, values))
+
+    def instruction_codes(self) -> Any:
+        """Returns the instruction code of every step, as numpy array if available"""
+        return self.__column_values("instruction", "uint16")
+
+    def pcs(self) -> Any:
+        """Returns the pc of every step, as numpy array if available"""
+        return self.__column_values("pc", "uint64")
+
     def as_instruction_to_count(self) -> dict[InstrKind, int]:
-        summary = {e: 0 for e in list(self.__instr_kind_enum)}
-        for step in self.__steps:
-            summary[step.instruction] += 1
-        return summary
+        instr_kinds = self.__columns.instr_kinds
+        codes = self.instruction_codes()
+        if np is not None:
+            counts = np.bincount(codes, minlength=len(instr_kinds)).tolist()
+            return dict(zip(instr_kinds, counts))
+        counter = Counter(codes)
+        return {kind: counter[code] for code, kind in enumerate(instr_kinds)}
+
+    def as_instruction_to_indices(
+        self, pc_ranges: list[tuple[int, int]] | None = None
+    ) -> dict[InstrKind, Sequence[int]]:
+        """Returns the ascending step indices of each recorded instruction. The instructions
+        are ordered by their first occurrence in the trace. If `pc_ranges` are provided, only
+        the steps with a pc in one of the [start, end) ranges are kept."""
+
+        instr_kinds = self.__columns.instr_kinds
+        codes = self.instruction_codes()
+        if np is not None:
+            indices = None
+            if pc_ranges:
+                pcs = self.pcs()
+                is_in_range = np.zeros(len(pcs), dtype=bool)
+                for start, end in pc_ranges:
+                    is_in_range |= (pcs >= start) & (pcs < end)
+                indices = np.flatnonzero(is_in_range)
+                codes = codes[indices]
+            order = np.argsort(codes, kind="stable")
+            if indices is not None:
+                order = indices[order]
+            counts = np.bincount(codes, minlength=len(instr_kinds))
+            groups = np.split(order, np.cumsum(counts)[:-1])
+            recorded = sorted(np.flatnonzero(counts).tolist(), key=lambda c: groups[c][0])
+            return {instr_kinds[code]: groups[code] for code in recorded}
+
+        mapping: dict[InstrKind, list[int]] = {}
+        pcs = self.pcs() if pc_ranges else itertools.repeat(0)
+        for index, (code, pc) in enumerate(zip(codes, pcs)):
+            if not pc_ranges or any(start <= pc < end for start, end in pc_ranges):
+                mapping.setdefault(instr_kinds[code], []).append(index)
+        return mapping
 
     def as_instruction_to_steps(self) -> dict[InstrKind, list[TraceStep[InstrKind]]]:
-        mapping = {}
-        for step in self.__steps:
-            if step.instruction not in mapping:
-                mapping[step.instruction] = []
-            mapping[step.instruction].append(step)
-        return mapping
+        steps = self.steps
+        return {
+            instr_kind: [steps.step_at(int(index)) for index in indices]
+            for instr_kind, indices in self.as_instruction_to_indices().items()
+        }
+
+    @property
+    def columns(self) -> TraceColumns[InstrKind]:
+        return self.__columns
 
     @property
-    def steps(self) -> list[TraceStep[InstrKind]]:
-        return self.__steps
+    def start_step(self) -> int:
+        """First step recorded by the trace itself, earlier steps are shared with the
+        original trace if any"""
+        return self.__columns.start_step
+
+    @property
+    def steps(self) -> TraceSteps[InstrKind]:
+        return TraceSteps(self.__columns, self.__prefix)
 
     @property
     def faults(self) -> list[TraceFault[InjectionKind]]:
@@ -252,76 +675,92 @@ class Trace(Generic[InstrKind, InjectionKind]):
 
 
 # ---------------------------------------------------------------------------- #
-#                                Emulator Parser                               #
+#                                 Trace Builder                                #
 # ---------------------------------------------------------------------------- #
 
 
-def trace_from_str(
-    data: str, instr_kind_enum: Type[InstrKind], injection_kind_enum: Type[InjectionKind]
-) -> Trace[InstrKind, InjectionKind]:
-
-    tag_patterns = re.compile(
-        r"(\<trace\>(?P<trace>.+?)\<\/trace\>)|(\<fault\>(?P<fault>.+?)\<\/fault\>)"
-    )
-
-    # ----------------------- retrieve information packages ---------------------- #
+class TraceBuilder(Generic[InstrKind, InjectionKind]):
+    """Collects the trace tags of the emulator output one at a time and enforces the
+    ordering invariants of steps and faults as they arrive. The steps of a suffix trace
+    start at `start_step`, the steps of a `sparse` trace may skip steps."""
 
-    raw_steps = []
-    raw_faults = []
-
-    tag_match = None
-    group_dic = None
-
-    try:
-        for tag_match in re.finditer(tag_patterns, data):
-            group_dic = tag_match.groupdict()
-            if group_dic["trace"] is not None:
-                raw_steps.append(TraceStep.from_json(group_dic["trace"], instr_kind_enum))
-            elif group_dic["fault"] is not None:
-                raw_faults.append(TraceFault.from_json(group_dic["fault"], injection_kind_enum))
+    __steps: TraceColumns[InstrKind]
+    __faults: list[TraceFault[InjectionKind]]
 
-    except Exception as e:
-        logger.critical("Unable to retrieve trace information for specific tag!")
-        logger.info(f"matched tag: {tag_match}")
-        logger.info(f"match group dictionary: {group_dic}")
-        raise e  # rethrow
+    __instr_kind_enum: Type[InstrKind]
+    __injection_kind_enum: Type[InjectionKind]
 
-    # ----------------------- invariant checks and bundling ---------------------- #
+    def __init__(
+        self,
+        instr_kind_enum: Type[InstrKind],
+        injection_kind_enum: Type[InjectionKind],
+        start_step: int = 0,
+        sparse: bool = False,
+    ):
+        self.__steps = TraceColumns(instr_kind_enum, start_step, sparse)
+        self.__faults = []
+        self.__instr_kind_enum = instr_kind_enum
+        self.__injection_kind_enum = injection_kind_enum
 
-    steps = []
+    def add_tag(self, tag: str, payload: str):
+        """Adds the payload of a `trace` or `fault` tag"""
+        try:
+            if tag == "trace":
+                self.__steps.add_step(TraceStep.from_json(payload, self.__instr_kind_enum))
+            elif tag == "fault":
+                self.add_fault(TraceFault.from_json(payload, self.__injection_kind_enum))
+        except Exception as e:
+            logger.critical("Unable to retrieve trace information for specific tag!")
+            logger.info(f"matched tag: <{tag}>{payload}</{tag}>")
+            raise e  # rethrow
+
+    def add_fault(self, fault: TraceFault[InjectionKind]):
+        """Adds the next fault. Emulators may repeat earlier faults, but a fault must
+        never precede the last recorded fault."""
+        last_fault_step = self.__faults[-1].step if len(self.__faults) > 0 else None
+        if last_fault_step is None or last_fault_step < fault.step:
+            self.__faults.append(fault)
+        elif fault not in self.__faults:
+            logger.info(fault)
+            raise ValueError("Unordered / multiple or new fault detected!")
 
-    expected_trace_step = 0
-    for trace in raw_steps:
-        if expected_trace_step == trace.step:  # first trace
-            expected_trace_step = trace.step + 1
-            steps.append(trace)
+    @property
+    def step_count(self) -> int:
+        return len(self.__steps)
+
+    def build(self, binary_data: bytes | None = None) -> Trace[InstrKind, InjectionKind]:
+        """Returns the collected trace. If the `binary_data` of a binary trace channel is
+        provided, its records precede the collected steps."""
+        steps = self.__steps
+        if binary_data is not None:
+            steps = TraceColumns(
+                self.__instr_kind_enum, self.__steps.start_step, self.__steps.sparse
+            )
+            steps.add_records(binary_data)
+            for index in range(len(self.__steps)):
+                steps.add_step(self.__steps.step_at(index))
+        return Trace(steps, self.__faults, self.__instr_kind_enum, self.__injection_kind_enum)
 
-        elif expected_trace_step > trace.step:  # compare any following steps
-            if steps[trace.step] != trace:
-                logger.info(trace)
-                logger.info(steps[trace.step])
-                print(trace)
-                print(steps[trace.step])
-                raise ValueError(f"diverging trace at step {trace.step}")
 
-        else:
-            logger.info(trace)
-            raise ValueError(
-                f"Unexpected trace step! Expected: {expected_trace_step}, but was {trace.step}!"
-            )
+# ---------------------------------------------------------------------------- #
+#                                Emulator Parser                               #
+# ---------------------------------------------------------------------------- #
 
-    faults = []
 
-    last_fault_step = None
-    for fault in raw_faults:
-        if last_fault_step is None or last_fault_step < fault.step:
-            last_fault_step = fault.step
-            faults.append(fault)
-        elif last_fault_step >= fault.step and fault not in faults:
-            logger.info(fault)
-            raise ValueError("Unordered / multiple or new fault detected!")
+def trace_from_str(
+    data: str,
+    instr_kind_enum: Type[InstrKind],
+    injection_kind_enum: Type[InjectionKind],
+    binary_data: bytes | None = None,
+) -> Trace[InstrKind, InjectionKind]:
+    """Parses the trace tags of the emulator output. If the `binary_data` of a binary trace
+    channel is provided, the steps are read from its records first."""
 
-    return Trace(steps, faults, instr_kind_enum, injection_kind_enum)
+    builder = TraceBuilder(instr_kind_enum, injection_kind_enum)
+    tokenizer = TagTokenizer(["trace", "fault"], builder.add_tag)
+    feed_in_chunks(data, tokenizer.feed)
+    tokenizer.finish()
+    return builder.build(binary_data)
 
 
 def trace_from_exec(
@@ -329,4 +768,6 @@ def trace_from_exec(
     instr_kind_enum: Type[InstrKind],
     injection_kind_enum: Type[InjectionKind],
 ) -> Trace[InstrKind, InjectionKind]:
-    return trace_from_str(exec_status.stdout, instr_kind_enum, injection_kind_enum)
+    return trace_from_str(
+        exec_status.stdout, instr_kind_enum, injection_kind_enum, exec_status.trace_raw
+    )
@@ -0,0 +1,236 @@
+import itertools
+from dataclasses import dataclass
+from typing import Any
+
+from zkvm_fuzzer_utils.trace import TRACE_WORD_ASSEMBLY, Trace, TraceColumns, TraceStep
+
+try:
+    import numpy as np
+except ImportError:  # NOTE: numpy is optional, the diff falls back to pure python
+    np = None
+
+# number of steps before and after the first divergence kept in a trace diff
+TRACE_DIFF_CONTEXT = 3
+
+# maximal number of differing step ranges kept in a trace diff
+TRACE_DIFF_MAX_RANGES = 8
+
+
+# ---------------------------------------------------------------------------- #
+#                                  Trace Diff                                  #
+# ---------------------------------------------------------------------------- #
+
+
+@dataclass(frozen=True)
+class TraceDiff:
+    """Differences between the steps of an original and an injection trace. A step
+    differs if its pc, instruction, word or assembly differs, or if a sparse trace only
+    recorded it in one of the traces. Only the steps in the range recorded by both traces
+    are compared, the trace sizes are not."""
+
+    first_divergence: int | None
+    count: int
+    ranges: list[tuple[int, int]]  # at most `TRACE_DIFF_MAX_RANGES` as [start, end)
+    range_count: int
+    original_context: list[TraceStep]
+    injection_context: list[TraceStep]
+
+    def has_divergence(self) -> bool:
+        return self.first_divergence is not None
+
+    def ranges_as_str(self) -> str:
+        return " ".join(f"{start}-{end - 1}" for start, end in self.ranges)
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def context_as_str(context: list[TraceStep]) -> str:
+    return "; ".join(f"{step.step}:{step.pc:#x}:{step.assembly}" for step in context)
+
+
+# ---------------------------------------------------------------------------- #
+
+
+def _assembly_remap(original: TraceColumns, injection: TraceColumns) -> list[int]:
+    """Maps the assembly indices of the injection onto the indices of the original, an
+    assembly unknown to the original is mapped past its table. The last entry maps
+    `TRACE_WORD_ASSEMBLY`, i.e. an assembly disassembled from the word, onto itself."""
+    lookup = {assembly: index for index, assembly in enumerate(original.assembly_table)}
+    unknown = len(original.assembly_table)
+    remap = [lookup.get(assembly, unknown) for assembly in injection.assembly_table]
+    return remap + [TRACE_WORD_ASSEMBLY]
+
+
+def _differing_steps(
+    original: TraceColumns, injection: TraceColumns, start: int, end: int
+) -> list[int] | Any:
+    """Returns the ascending differing steps in [start, end) of both columns"""
+
+    remap = _assembly_remap(original, injection)
+    if original.sparse or injection.sparse:
+        return _differing_sparse_steps(original, injection, start, end, remap)
+
+    original_start = start - original.start_step
+    original_end = end - original.start_step
+    injection_start = start - injection.start_step
+    injection_end = end - injection.start_step
+
+    if np is not None:
+        original_pc = np.frombuffer(original.pc, dtype=np.uint64)[original_start:original_end]
+        injection_pc = np.frombuffer(injection.pc, dtype=np.uint64)[injection_start:injection_end]
+        original_instruction = np.frombuffer(original.instruction, dtype=np.uint16)[
+            original_start:original_end
+        ]
+        injection_instruction = np.frombuffer(injection.instruction, dtype=np.uint16)[
+            injection_start:injection_end
+        ]
+        original_word = np.frombuffer(original.word, dtype=np.uint32)[original_start:original_end]
+        injection_word = np.frombuffer(injection.word, dtype=np.uint32)[
+            injection_start:injection_end
+        ]
+        original_assembly = np.frombuffer(original.assembly, dtype=np.uint32)
+        injection_assembly = np.frombuffer(injection.assembly, dtype=np.uint32)
+        remapped_assembly = np.array(remap, dtype=np.int64)[
+            np.minimum(injection_assembly[injection_start:injection_end], len(remap) - 1)
+        ]
+        is_different = (
+            (original_pc != injection_pc)
+            | (original_instruction != injection_instruction)
+            | (original_word != injection_word)
+            | (original_assembly[original_start:original_end] != remapped_assembly)
+        )
+        return np.flatnonzero(is_different) + start
+
+    steps = []
+    word_assembly = len(remap) - 1
+
+    def rows(columns: TraceColumns, begin: int, until: int):
+        values = zip(columns.pc, columns.instruction, columns.word, columns.assembly)
+        return itertools.islice(values, begin, until)
+
+    pairs = zip(
+        rows(original, original_start, original_end),
+        rows(injection, injection_start, injection_end),
+    )
+    for step, (original_step, injection_step) in enumerate(pairs, start):
+        pc, instruction, word, assembly = original_step
+        injection_pc, injection_instruction, injection_word, injection_assembly = injection_step
+        if (
+            pc != injection_pc
+            or instruction != injection_instruction
+            or word != injection_word
+            or assembly != remap[min(injection_assembly, word_assembly)]
+        ):
+            steps.append(step)
+    return steps
+
+
+def _differing_sparse_steps(
+    original: TraceColumns, injection: TraceColumns, start: int, end: int, remap: list[int]
+) -> list[int] | Any:
+    """Returns the ascending differing steps in [start, end) of columns skipping steps,
+    which are matched by their step instead of their row"""
+
+    original_start = original.rows_before(start)
+    original_end = original.rows_before(end)
+    injection_start = injection.rows_before(start)
+    injection_end = injection.rows_before(end)
+
+    if np is not None:
+
+        def values(columns: TraceColumns, column: str, dtype: Any, begin: int, until: int):
+            return np.frombuffer(getattr(columns, column), dtype=dtype)[begin:until]
+
+        original_steps = values(original, "step", np.uint64, original_start, original_end)
+        injection_steps = values(injection, "step", np.uint64, injection_start, injection_end)
+        common_steps, original_rows, injection_rows = np.intersect1d(
+            original_steps, injection_steps, assume_unique=True, return_indices=True
+        )
+        is_different = np.zeros(len(common_steps), dtype=bool)
+        for column, dtype in (("pc", np.uint64), ("instruction", np.uint16), ("word", np.uint32)):
+            original_values = values(original, column, dtype, original_start, original_end)
+            injection_values = values(injection, column, dtype, injection_start, injection_end)
+            is_different |= original_values[original_rows] != injection_values[injection_rows]
+        original_assembly = values(original, "assembly", np.uint32, original_start, original_end)
+        injection_assembly = values(
+            injection, "assembly", np.uint32, injection_start, injection_end
+        )
+        remapped_assembly = np.array(remap, dtype=np.int64)[
+            np.minimum(injection_assembly[injection_rows], len(remap) - 1)
+        ]
+        is_different |= original_assembly[original_rows] != remapped_assembly
+        recorded_once = np.setxor1d(original_steps, injection_steps, assume_unique=True)
+        return np.union1d(common_steps[is_different], recorded_once).astype(np.int64)
+
+    word_assembly = len(remap) - 1
+    original_values = {
+        original.step[row]: (
+            original.pc[row],
+            original.instruction[row],
+            original.word[row],
+            original.assembly[row],
+        )
+        for row in range(original_start, original_end)
+    }
+    injection_values = {
+        injection.step[row]: (
+            injection.pc[row],
+            injection.instruction[row],
+            injection.word[row],
+            remap[min(injection.assembly[row], word_assembly)],
+        )
+        for row in range(injection_start, injection_end)
+    }
+    steps = original_values.keys() | injection_values.keys()
+    return sorted(s for s in steps if original_values.get(s) != injection_values.get(s))
+
+
+def _differing_ranges(steps: list[int] | Any) -> list[tuple[int, int]]:
+    """Groups ascending steps into [start, end) ranges of consecutive steps"""
+    if np is not None and not isinstance(steps, list):
+        breaks = np.flatnonzero(np.diff(steps) > 1)
+        starts = steps[np.concatenate(([0], breaks + 1))]
+        ends = steps[np.concatenate((breaks, [len(steps) - 1]))] + 1
+        return list(zip(starts.tolist(), ends.tolist()))
+    ranges = []
+    for step in steps:
+        if ranges and ranges[-1][1] == step:
+            ranges[-1] = (ranges[-1][0], step + 1)
+        else:
+            ranges.append((step, step + 1))
+    return ranges
+
+
+def diff_traces(
+    original_trace: Trace, injection_trace: Trace, context: int = TRACE_DIFF_CONTEXT
+) -> TraceDiff:
+    """Compares the steps recorded by both traces. The prefix an injection trace shares
+    with the original trace is identical by construction and skipped."""
+
+    original = original_trace.columns
+    injection = injection_trace.columns
+    start = max(original.start_step, injection.start_step)
+    end = min(original.end_step, injection.end_step)
+
+    steps = _differing_steps(original, injection, start, end) if start < end else []
+    if len(steps) == 0:
+        return TraceDiff(None, 0, [], 0, [], [])
+
+    ranges = _differing_ranges(steps)
+    first_divergence = int(steps[0])
+
+    def context_steps(columns: TraceColumns) -> list[TraceStep]:
+        row = columns.rows_before(first_divergence)
+        context_start = max(columns.rows_before(start), row - context)
+        context_end = min(columns.rows_before(end), row + context + 1)
+        return [columns.step_at(index) for index in range(context_start, context_end)]
+
+    return TraceDiff(
+        first_divergence,
+        len(steps),
+        ranges[:TRACE_DIFF_MAX_RANGES],
+        len(ranges),
+        context_steps(original),
+        context_steps(injection),
+    )
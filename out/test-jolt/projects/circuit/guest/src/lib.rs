@@ -0,0 +1,1650 @@
+#![cfg_attr(feature = "guest", no_std)]
+#![allow(unconditional_panic)]
+#![allow(arithmetic_overflow)]
+#![allow(asm_sub_register)]
+
+/*
+
+@field(4294967296)
+circuit c0 (in0:field, in1:field, in2:field, in3:bool, in4:field, in5:bool, in6:bool, in7:bool, in8:bool, in9:bool) -> (out0:field, out1:bool, out2:bool, out3:bool, out4:field, out5:bool, out6:field, out7:bool, out8:field, out9:field, out10:bool):
+    out0 = 3317195991
+    var0 = (F && in9)
+    var1 = (! F)
+    var2 = (in3 && var1)
+    var3 = (var0 || var2)
+    var4 = (T ? T : in7)
+    var5 = (in2 >= out0)
+    var6 = (F ? in6 : F)
+    var7 = (var4 ? var5 : var6)
+    var8 = (T ^^ var7)
+    var9 = (in9 ? var3 : var8)
+    out1 = (! var9)
+    var10 = (in7 ? out1 : T)
+    var11 = (in8 ? in1 : in1)
+    var12 = (~ in4)
+    var13 = (var10 ? var11 : var12)
+    var14 = (~ 4294967295)
+    var15 = (var13 > var14)
+    var16 = (out1 && var15)
+    out2 = (! var16)
+    var17 = (T ? in2 : in1)
+    var18 = (~ var17)
+    var19 = (in8 ? 1301266498 : in2)
+    var20 = (in0 - 3028596947)
+    var21 = sll(var19, var20)
+    var22 = (var18 - var21)
+    var23 = (in2 ^ in1)
+    var24 = (in0 <= var23)
+    var25 = (0 | in4)
+    var26 = sub(4294967295, 295627028)
+    var27 = (var25 * var26)
+    var28 = (var24 ? 1 : var27)
+    var29 = (var22 % var28)
+    out3 = (2022900523 <= var29)
+    out4 = or(0, 540594478)
+    out5 = T
+    var30 = (out0 % 3670637243)
+    out6 = (in4 | var30)
+    out7 = T
+    out8 = in1
+    out9 = (out6 ** out6)
+    out10 = (! T)
+
+*/
+
+#[allow(non_snake_case, unused_comparisons, unused_parens, unused_variables)]
+pub fn c0(in0: u32, in1: u32, in2: u32, in3: bool, in4: u32, in5: bool, in6: bool, in7: bool, in8: bool, in9: bool) -> (u32, bool, bool, bool, u32, bool, u32, bool, u32, u32, bool) {
+    
+    macro_rules! sll {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sll {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! sub {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sub {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! or {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "or {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    let out0 = 3317195991_u32;
+    let var0 = (false && in9);
+    let var1 = (! false);
+    let var2 = (in3 && var1);
+    let var3 = (var0 || var2);
+    let var4 = (if true { true } else { in7 });
+    let var5 = (in2 >= out0);
+    let var6 = (if false { in6 } else { false });
+    let var7 = (if var4 { var5 } else { var6 });
+    let var8 = (true ^ var7);
+    let var9 = (if in9 { var3 } else { var8 });
+    let out1 = (! var9);
+    let var10 = (if in7 { out1 } else { true });
+    let var11 = (if in8 { in1 } else { in1 });
+    let var12 = (! in4);
+    let var13 = (if var10 { var11 } else { var12 });
+    let var14 = (! 4294967295_u32);
+    let var15 = (var13 > var14);
+    let var16 = (out1 && var15);
+    let out2 = (! var16);
+    let var17 = (if true { in2 } else { in1 });
+    let var18 = (! var17);
+    let var19 = (if in8 { 1301266498_u32 } else { in2 });
+    let var20 = (in0 - 3028596947_u32);
+    let var21 = sll!(var19, var20);
+    let var22 = (var18 - var21);
+    let var23 = (in2 ^ in1);
+    let var24 = (in0 <= var23);
+    let var25 = (0_u32 | in4);
+    let var26 = sub!(4294967295_u32, 295627028_u32);
+    let var27 = (var25 * var26);
+    let var28 = (if var24 { 1_u32 } else { var27 });
+    let var29 = (var22 % var28);
+    let out3 = (2022900523_u32 <= var29);
+    let out4 = or!(0_u32, 540594478_u32);
+    let out5 = true;
+    let var30 = (out0 % 3670637243_u32);
+    let out6 = (in4 | var30);
+    let out7 = true;
+    let out8 = in1;
+    let out9 = out6.pow(out6);
+    let out10 = (! true);
+    return (out0, out1, out2, out3, out4, out5, out6, out7, out8, out9, out10);
+}
+
+/*
+
+@field(4294967296)
+circuit c1 (in0:field, in1:field, in2:field, in3:bool, in4:field, in5:bool, in6:bool, in7:bool, in8:bool, in9:bool) -> (out0:field, out1:bool, out2:bool, out3:bool, out4:field, out5:bool, out6:field, out7:bool, out8:field, out9:field, out10:bool):
+    out0 = 3317195991
+    var0 = (F && in9)
+    var1 = (! F)
+    var2 = (in3 && var1)
+    var3 = (var0 || var2)
+    var4 = (T ? T : in7)
+    var5 = (in2 >= out0)
+    var6 = (F ? in6 : F)
+    var7 = (var4 ? var5 : var6)
+    var8 = (T ^^ var7)
+    var9 = (in9 ? var3 : var8)
+    out1 = (! var9)
+    var10 = (in7 ? out1 : T)
+    var11 = (in8 ? in1 : in1)
+    var12 = (~ in4)
+    var13 = (var10 ? var11 : var12)
+    var14 = (~ 4294967295)
+    var15 = (var13 > var14)
+    var16 = (out1 && var15)
+    out2 = (! var16)
+    var17 = (T ? in2 : in1)
+    var18 = (var17 / 1)
+    var19 = (~ var18)
+    var20 = (var19 | 0)
+    var21 = (in8 ? 1301266498 : in2)
+    var22 = (in0 - 3028596947)
+    var23 = sll(var21, var22)
+    var24 = (var20 - var23)
+    var25 = (in2 ^ in1)
+    var26 = (in0 <= var25)
+    var27 = (0 | in4)
+    var28 = sub(4294967295, 295627028)
+    var29 = (var27 * var28)
+    var30 = (var26 ? 1 : var29)
+    var31 = (var24 % var30)
+    out3 = (2022900523 <= var31)
+    out4 = or(0, 540594478)
+    out5 = T
+    var32 = (out0 % 3670637243)
+    out6 = (in4 | var32)
+    out7 = T
+    out8 = in1
+    out9 = (out6 ** out6)
+    out10 = (! T)
+
+*/
+
+#[allow(non_snake_case, unused_comparisons, unused_parens, unused_variables)]
+pub fn c1(in0: u32, in1: u32, in2: u32, in3: bool, in4: u32, in5: bool, in6: bool, in7: bool, in8: bool, in9: bool) -> (u32, bool, bool, bool, u32, bool, u32, bool, u32, u32, bool) {
+    
+    macro_rules! sll {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sll {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! sub {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sub {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! or {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "or {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    let out0 = 3317195991_u32;
+    let var0 = (false && in9);
+    let var1 = (! false);
+    let var2 = (in3 && var1);
+    let var3 = (var0 || var2);
+    let var4 = (if true { true } else { in7 });
+    let var5 = (in2 >= out0);
+    let var6 = (if false { in6 } else { false });
+    let var7 = (if var4 { var5 } else { var6 });
+    let var8 = (true ^ var7);
+    let var9 = (if in9 { var3 } else { var8 });
+    let out1 = (! var9);
+    let var10 = (if in7 { out1 } else { true });
+    let var11 = (if in8 { in1 } else { in1 });
+    let var12 = (! in4);
+    let var13 = (if var10 { var11 } else { var12 });
+    let var14 = (! 4294967295_u32);
+    let var15 = (var13 > var14);
+    let var16 = (out1 && var15);
+    let out2 = (! var16);
+    let var17 = (if true { in2 } else { in1 });
+    let var18 = (var17 / 1_u32);
+    let var19 = (! var18);
+    let var20 = (var19 | 0_u32);
+    let var21 = (if in8 { 1301266498_u32 } else { in2 });
+    let var22 = (in0 - 3028596947_u32);
+    let var23 = sll!(var21, var22);
+    let var24 = (var20 - var23);
+    let var25 = (in2 ^ in1);
+    let var26 = (in0 <= var25);
+    let var27 = (0_u32 | in4);
+    let var28 = sub!(4294967295_u32, 295627028_u32);
+    let var29 = (var27 * var28);
+    let var30 = (if var26 { 1_u32 } else { var29 });
+    let var31 = (var24 % var30);
+    let out3 = (2022900523_u32 <= var31);
+    let out4 = or!(0_u32, 540594478_u32);
+    let out5 = true;
+    let var32 = (out0 % 3670637243_u32);
+    let out6 = (in4 | var32);
+    let out7 = true;
+    let out8 = in1;
+    let out9 = out6.pow(out6);
+    let out10 = (! true);
+    return (out0, out1, out2, out3, out4, out5, out6, out7, out8, out9, out10);
+}
+
+/*
+
+@field(4294967296)
+circuit c2 (in0:field, in1:field, in2:field, in3:bool, in4:field, in5:bool, in6:bool, in7:bool, in8:bool, in9:bool) -> (out0:field, out1:bool, out2:bool, out3:bool, out4:field, out5:bool, out6:field, out7:bool, out8:field, out9:field, out10:bool):
+    out0 = 3317195991
+    var0 = (F && in9)
+    var1 = (! F)
+    var2 = (in3 && var1)
+    var3 = (var0 || var2)
+    var4 = (T ? T : in7)
+    var5 = (in2 >= out0)
+    var6 = (F ? in6 : F)
+    var7 = (var4 ? var5 : var6)
+    var8 = (T ^^ var7)
+    var9 = (in9 ? var3 : var8)
+    out1 = (! var9)
+    var10 = (in7 ? out1 : T)
+    var11 = (in8 ? in1 : in1)
+    var12 = (~ in4)
+    var13 = (var10 ? var11 : var12)
+    var14 = (~ 4294967295)
+    var15 = (var13 > var14)
+    var16 = (out1 && var15)
+    out2 = (! var16)
+    var17 = (T ? in2 : in1)
+    var18 = (var17 / 1)
+    var19 = (~ var18)
+    var20 = (3940711467 % 1)
+    var21 = (var19 | var20)
+    var22 = (in8 ? 1301266498 : in2)
+    var23 = (in0 - 3028596947)
+    var24 = sll(var22, var23)
+    var25 = (var21 - var24)
+    var26 = (in2 ^ in1)
+    var27 = (in0 <= var26)
+    var28 = (0 | in4)
+    var29 = sub(4294967295, 295627028)
+    var30 = (var28 * var29)
+    var31 = (var27 ? 1 : var30)
+    var32 = (var25 % var31)
+    var33 = (2022900523 < var32)
+    var34 = (T ? in2 : in1)
+    var35 = (var34 / 1)
+    var36 = (~ var35)
+    var37 = (var36 | 0)
+    var38 = (in8 ? 1301266498 : in2)
+    var39 = (in0 - 3028596947)
+    var40 = sll(var38, var39)
+    var41 = (var37 - var40)
+    var42 = (in2 ^ in1)
+    var43 = (in0 <= var42)
+    var44 = (0 | in4)
+    var45 = sub(4294967295, 295627028)
+    var46 = (var44 * var45)
+    var47 = (var43 ? 1 : var46)
+    var48 = (var41 % var47)
+    var49 = (2022900523 == var48)
+    out3 = (var33 || var49)
+    out4 = or(0, 540594478)
+    out5 = T
+    var50 = (out0 % 3670637243)
+    out6 = (in4 | var50)
+    out7 = T
+    out8 = in1
+    out9 = (out6 ** out6)
+    out10 = (! T)
+
+*/
+
+#[allow(non_snake_case, unused_comparisons, unused_parens, unused_variables)]
+pub fn c2(in0: u32, in1: u32, in2: u32, in3: bool, in4: u32, in5: bool, in6: bool, in7: bool, in8: bool, in9: bool) -> (u32, bool, bool, bool, u32, bool, u32, bool, u32, u32, bool) {
+    
+    macro_rules! sll {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sll {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! sub {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sub {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! or {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "or {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    let out0 = 3317195991_u32;
+    let var0 = (false && in9);
+    let var1 = (! false);
+    let var2 = (in3 && var1);
+    let var3 = (var0 || var2);
+    let var4 = (if true { true } else { in7 });
+    let var5 = (in2 >= out0);
+    let var6 = (if false { in6 } else { false });
+    let var7 = (if var4 { var5 } else { var6 });
+    let var8 = (true ^ var7);
+    let var9 = (if in9 { var3 } else { var8 });
+    let out1 = (! var9);
+    let var10 = (if in7 { out1 } else { true });
+    let var11 = (if in8 { in1 } else { in1 });
+    let var12 = (! in4);
+    let var13 = (if var10 { var11 } else { var12 });
+    let var14 = (! 4294967295_u32);
+    let var15 = (var13 > var14);
+    let var16 = (out1 && var15);
+    let out2 = (! var16);
+    let var17 = (if true { in2 } else { in1 });
+    let var18 = (var17 / 1_u32);
+    let var19 = (! var18);
+    let var20 = (3940711467_u32 % 1_u32);
+    let var21 = (var19 | var20);
+    let var22 = (if in8 { 1301266498_u32 } else { in2 });
+    let var23 = (in0 - 3028596947_u32);
+    let var24 = sll!(var22, var23);
+    let var25 = (var21 - var24);
+    let var26 = (in2 ^ in1);
+    let var27 = (in0 <= var26);
+    let var28 = (0_u32 | in4);
+    let var29 = sub!(4294967295_u32, 295627028_u32);
+    let var30 = (var28 * var29);
+    let var31 = (if var27 { 1_u32 } else { var30 });
+    let var32 = (var25 % var31);
+    let var33 = (2022900523_u32 < var32);
+    let var34 = (if true { in2 } else { in1 });
+    let var35 = (var34 / 1_u32);
+    let var36 = (! var35);
+    let var37 = (var36 | 0_u32);
+    let var38 = (if in8 { 1301266498_u32 } else { in2 });
+    let var39 = (in0 - 3028596947_u32);
+    let var40 = sll!(var38, var39);
+    let var41 = (var37 - var40);
+    let var42 = (in2 ^ in1);
+    let var43 = (in0 <= var42);
+    let var44 = (0_u32 | in4);
+    let var45 = sub!(4294967295_u32, 295627028_u32);
+    let var46 = (var44 * var45);
+    let var47 = (if var43 { 1_u32 } else { var46 });
+    let var48 = (var41 % var47);
+    let var49 = (2022900523_u32 == var48);
+    let out3 = (var33 || var49);
+    let out4 = or!(0_u32, 540594478_u32);
+    let out5 = true;
+    let var50 = (out0 % 3670637243_u32);
+    let out6 = (in4 | var50);
+    let out7 = true;
+    let out8 = in1;
+    let out9 = out6.pow(out6);
+    let out10 = (! true);
+    return (out0, out1, out2, out3, out4, out5, out6, out7, out8, out9, out10);
+}
+
+/*
+
+@field(4294967296)
+circuit c3 (in0:field, in1:field, in2:field, in3:bool, in4:field, in5:bool, in6:bool, in7:bool, in8:bool, in9:bool) -> (out0:field, out1:bool, out2:bool, out3:bool, out4:field, out5:bool, out6:field, out7:bool, out8:field, out9:field, out10:bool):
+    out0 = 3317195991
+    var0 = (F && in9)
+    var1 = (! F)
+    var2 = (in3 && var1)
+    var3 = (var0 || var2)
+    var4 = (T ? T : in7)
+    var5 = (in2 >= out0)
+    var6 = (F ? in6 : F)
+    var7 = (var4 ? var5 : var6)
+    var8 = (T ^^ var7)
+    var9 = (in9 ? var3 : var8)
+    out1 = (! var9)
+    var10 = (in7 ? out1 : T)
+    var11 = (in8 ? in1 : in1)
+    var12 = (~ in4)
+    var13 = (var10 ? var11 : var12)
+    var14 = (~ 4294967295)
+    var15 = (var13 > var14)
+    var16 = (out1 && var15)
+    out2 = (! var16)
+    var17 = (T ? in2 : in1)
+    var18 = (var17 / 1)
+    var19 = (~ var18)
+    var20 = (3940711467 % 1)
+    var21 = (var19 | var20)
+    var22 = (in8 ? 1301266498 : in2)
+    var23 = (in0 - 3028596947)
+    var24 = sll(var22, var23)
+    var25 = (var21 - var24)
+    var26 = (in2 ^ in1)
+    var27 = (in0 <= var26)
+    var28 = (in4 | 0)
+    var29 = sub(4294967295, 295627028)
+    var30 = (var28 * var29)
+    var31 = (var27 ? 1 : var30)
+    var32 = (var25 % var31)
+    var33 = (2022900523 < var32)
+    var34 = (T ? in2 : in1)
+    var35 = (var34 / 1)
+    var36 = (~ var35)
+    var37 = (var36 | 0)
+    var38 = (in8 ? 1301266498 : in2)
+    var39 = (in0 - 3028596947)
+    var40 = sll(var38, var39)
+    var41 = (var37 - var40)
+    var42 = (in2 ^ in1)
+    var43 = (in0 <= var42)
+    var44 = (0 | in4)
+    var45 = sub(4294967295, 295627028)
+    var46 = (var44 * var45)
+    var47 = (var43 ? 1 : var46)
+    var48 = (var41 % var47)
+    var49 = (var48 == 2022900523)
+    out3 = (var33 || var49)
+    out4 = or(0, 540594478)
+    out5 = T
+    var50 = (out0 % 3670637243)
+    out6 = (in4 | var50)
+    out7 = T
+    out8 = in1
+    out9 = (out6 ** out6)
+    out10 = (! T)
+
+*/
+
+#[allow(non_snake_case, unused_comparisons, unused_parens, unused_variables)]
+pub fn c3(in0: u32, in1: u32, in2: u32, in3: bool, in4: u32, in5: bool, in6: bool, in7: bool, in8: bool, in9: bool) -> (u32, bool, bool, bool, u32, bool, u32, bool, u32, u32, bool) {
+    
+    macro_rules! sll {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sll {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! sub {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sub {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! or {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "or {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    let out0 = 3317195991_u32;
+    let var0 = (false && in9);
+    let var1 = (! false);
+    let var2 = (in3 && var1);
+    let var3 = (var0 || var2);
+    let var4 = (if true { true } else { in7 });
+    let var5 = (in2 >= out0);
+    let var6 = (if false { in6 } else { false });
+    let var7 = (if var4 { var5 } else { var6 });
+    let var8 = (true ^ var7);
+    let var9 = (if in9 { var3 } else { var8 });
+    let out1 = (! var9);
+    let var10 = (if in7 { out1 } else { true });
+    let var11 = (if in8 { in1 } else { in1 });
+    let var12 = (! in4);
+    let var13 = (if var10 { var11 } else { var12 });
+    let var14 = (! 4294967295_u32);
+    let var15 = (var13 > var14);
+    let var16 = (out1 && var15);
+    let out2 = (! var16);
+    let var17 = (if true { in2 } else { in1 });
+    let var18 = (var17 / 1_u32);
+    let var19 = (! var18);
+    let var20 = (3940711467_u32 % 1_u32);
+    let var21 = (var19 | var20);
+    let var22 = (if in8 { 1301266498_u32 } else { in2 });
+    let var23 = (in0 - 3028596947_u32);
+    let var24 = sll!(var22, var23);
+    let var25 = (var21 - var24);
+    let var26 = (in2 ^ in1);
+    let var27 = (in0 <= var26);
+    let var28 = (in4 | 0_u32);
+    let var29 = sub!(4294967295_u32, 295627028_u32);
+    let var30 = (var28 * var29);
+    let var31 = (if var27 { 1_u32 } else { var30 });
+    let var32 = (var25 % var31);
+    let var33 = (2022900523_u32 < var32);
+    let var34 = (if true { in2 } else { in1 });
+    let var35 = (var34 / 1_u32);
+    let var36 = (! var35);
+    let var37 = (var36 | 0_u32);
+    let var38 = (if in8 { 1301266498_u32 } else { in2 });
+    let var39 = (in0 - 3028596947_u32);
+    let var40 = sll!(var38, var39);
+    let var41 = (var37 - var40);
+    let var42 = (in2 ^ in1);
+    let var43 = (in0 <= var42);
+    let var44 = (0_u32 | in4);
+    let var45 = sub!(4294967295_u32, 295627028_u32);
+    let var46 = (var44 * var45);
+    let var47 = (if var43 { 1_u32 } else { var46 });
+    let var48 = (var41 % var47);
+    let var49 = (var48 == 2022900523_u32);
+    let out3 = (var33 || var49);
+    let out4 = or!(0_u32, 540594478_u32);
+    let out5 = true;
+    let var50 = (out0 % 3670637243_u32);
+    let out6 = (in4 | var50);
+    let out7 = true;
+    let out8 = in1;
+    let out9 = out6.pow(out6);
+    let out10 = (! true);
+    return (out0, out1, out2, out3, out4, out5, out6, out7, out8, out9, out10);
+}
+
+/*
+
+@field(4294967296)
+circuit c4 (in0:field, in1:field, in2:field, in3:bool, in4:field, in5:bool, in6:bool, in7:bool, in8:bool, in9:bool) -> (out0:field, out1:bool, out2:bool, out3:bool, out4:field, out5:bool, out6:field, out7:bool, out8:field, out9:field, out10:bool):
+    out0 = 3317195991
+    var0 = (F && in9)
+    var1 = (! F)
+    var2 = (in3 && var1)
+    var3 = (var0 || var2)
+    var4 = (T ? T : in7)
+    var5 = (in2 >= out0)
+    var6 = (F ? in6 : F)
+    var7 = (var4 ? var5 : var6)
+    var8 = (var7 ^^ T)
+    var9 = (in9 ? var3 : var8)
+    out1 = (! var9)
+    var10 = (in7 ? out1 : T)
+    var11 = (in8 ? in1 : in1)
+    var12 = (~ in4)
+    var13 = (var10 ? var11 : var12)
+    var14 = (~ 4294967295)
+    var15 = (var13 > var14)
+    var16 = (out1 && var15)
+    out2 = (! var16)
+    var17 = (T ? in2 : in1)
+    var18 = (var17 / 1)
+    var19 = (~ var18)
+    var20 = (3940711467 % 1)
+    var21 = (var19 | var20)
+    var22 = (in8 ? 1301266498 : in2)
+    var23 = (in0 - 3028596947)
+    var24 = sll(var22, var23)
+    var25 = (var21 - var24)
+    var26 = (in2 ^ in1)
+    var27 = (in0 <= var26)
+    var28 = (in4 | 0)
+    var29 = sub(4294967295, 295627028)
+    var30 = (var28 * var29)
+    var31 = (var27 ? 1 : var30)
+    var32 = (var25 % var31)
+    var33 = (2022900523 < var32)
+    var34 = (T ? in2 : in1)
+    var35 = (var34 / 1)
+    var36 = (~ var35)
+    var37 = (var36 | 0)
+    var38 = (in8 ? 1301266498 : in2)
+    var39 = (in0 - 3028596947)
+    var40 = sll(var38, var39)
+    var41 = (var37 - var40)
+    var42 = (in2 ^ in1)
+    var43 = (in0 <= var42)
+    var44 = (0 | in4)
+    var45 = sub(4294967295, 295627028)
+    var46 = (var44 * var45)
+    var47 = (var43 ? 1 : var46)
+    var48 = (var41 % var47)
+    var49 = (var48 == 2022900523)
+    out3 = (var33 || var49)
+    out4 = or(0, 540594478)
+    out5 = T
+    var50 = (out0 % 3670637243)
+    out6 = (in4 | var50)
+    out7 = T
+    out8 = in1
+    var51 = (out6 ** out6)
+    out9 = (var51 / 1)
+    out10 = (! T)
+
+*/
+
+#[allow(non_snake_case, unused_comparisons, unused_parens, unused_variables)]
+pub fn c4(in0: u32, in1: u32, in2: u32, in3: bool, in4: u32, in5: bool, in6: bool, in7: bool, in8: bool, in9: bool) -> (u32, bool, bool, bool, u32, bool, u32, bool, u32, u32, bool) {
+    
+    macro_rules! sll {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sll {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! sub {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sub {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! or {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "or {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    let out0 = 3317195991_u32;
+    let var0 = (false && in9);
+    let var1 = (! false);
+    let var2 = (in3 && var1);
+    let var3 = (var0 || var2);
+    let var4 = (if true { true } else { in7 });
+    let var5 = (in2 >= out0);
+    let var6 = (if false { in6 } else { false });
+    let var7 = (if var4 { var5 } else { var6 });
+    let var8 = (var7 ^ true);
+    let var9 = (if in9 { var3 } else { var8 });
+    let out1 = (! var9);
+    let var10 = (if in7 { out1 } else { true });
+    let var11 = (if in8 { in1 } else { in1 });
+    let var12 = (! in4);
+    let var13 = (if var10 { var11 } else { var12 });
+    let var14 = (! 4294967295_u32);
+    let var15 = (var13 > var14);
+    let var16 = (out1 && var15);
+    let out2 = (! var16);
+    let var17 = (if true { in2 } else { in1 });
+    let var18 = (var17 / 1_u32);
+    let var19 = (! var18);
+    let var20 = (3940711467_u32 % 1_u32);
+    let var21 = (var19 | var20);
+    let var22 = (if in8 { 1301266498_u32 } else { in2 });
+    let var23 = (in0 - 3028596947_u32);
+    let var24 = sll!(var22, var23);
+    let var25 = (var21 - var24);
+    let var26 = (in2 ^ in1);
+    let var27 = (in0 <= var26);
+    let var28 = (in4 | 0_u32);
+    let var29 = sub!(4294967295_u32, 295627028_u32);
+    let var30 = (var28 * var29);
+    let var31 = (if var27 { 1_u32 } else { var30 });
+    let var32 = (var25 % var31);
+    let var33 = (2022900523_u32 < var32);
+    let var34 = (if true { in2 } else { in1 });
+    let var35 = (var34 / 1_u32);
+    let var36 = (! var35);
+    let var37 = (var36 | 0_u32);
+    let var38 = (if in8 { 1301266498_u32 } else { in2 });
+    let var39 = (in0 - 3028596947_u32);
+    let var40 = sll!(var38, var39);
+    let var41 = (var37 - var40);
+    let var42 = (in2 ^ in1);
+    let var43 = (in0 <= var42);
+    let var44 = (0_u32 | in4);
+    let var45 = sub!(4294967295_u32, 295627028_u32);
+    let var46 = (var44 * var45);
+    let var47 = (if var43 { 1_u32 } else { var46 });
+    let var48 = (var41 % var47);
+    let var49 = (var48 == 2022900523_u32);
+    let out3 = (var33 || var49);
+    let out4 = or!(0_u32, 540594478_u32);
+    let out5 = true;
+    let var50 = (out0 % 3670637243_u32);
+    let out6 = (in4 | var50);
+    let out7 = true;
+    let out8 = in1;
+    let var51 = out6.pow(out6);
+    let out9 = (var51 / 1_u32);
+    let out10 = (! true);
+    return (out0, out1, out2, out3, out4, out5, out6, out7, out8, out9, out10);
+}
+
+/*
+
+@field(4294967296)
+circuit c5 (in0:field, in1:field, in2:field, in3:bool, in4:field, in5:bool, in6:bool, in7:bool, in8:bool, in9:bool) -> (out0:field, out1:bool, out2:bool, out3:bool, out4:field, out5:bool, out6:field, out7:bool, out8:field, out9:field, out10:bool):
+    out0 = 3317195991
+    var0 = (F && in9)
+    var1 = (! F)
+    var2 = (in3 && var1)
+    var3 = (var0 || var2)
+    var4 = (T ? T : in7)
+    var5 = (in2 >= out0)
+    var6 = (F ? in6 : F)
+    var7 = (var4 ? var5 : var6)
+    var8 = (var7 ^^ T)
+    var9 = (in9 ? var3 : var8)
+    out1 = (! var9)
+    var10 = (in7 ? out1 : T)
+    var11 = (in8 ? in1 : in1)
+    var12 = (~ in4)
+    var13 = (var10 ? var11 : var12)
+    var14 = (~ 4294967295)
+    var15 = (var13 > var14)
+    var16 = (out1 && var15)
+    out2 = (! var16)
+    var17 = (T ? in2 : in1)
+    var18 = (var17 / 1)
+    var19 = (~ var18)
+    var20 = (3940711467 % 1)
+    var21 = (var19 | var20)
+    var22 = (in8 ? 1301266498 : in2)
+    var23 = (in0 - 3028596947)
+    var24 = sll(var22, var23)
+    var25 = (var21 - var24)
+    var26 = (in2 ^ in1)
+    var27 = (in0 < var26)
+    var28 = (in2 ^ in1)
+    var29 = (in0 == var28)
+    var30 = (var27 || var29)
+    var31 = (in4 | 0)
+    var32 = sub(4294967295, 295627028)
+    var33 = (var31 * var32)
+    var34 = (var30 ? 1 : var33)
+    var35 = (var25 % var34)
+    var36 = (2022900523 < var35)
+    var37 = (T ? in2 : in1)
+    var38 = (var37 / 1)
+    var39 = (~ var38)
+    var40 = (var39 | 0)
+    var41 = (in8 ? 1301266498 : in2)
+    var42 = (in0 - 3028596947)
+    var43 = sll(var41, var42)
+    var44 = (var40 - var43)
+    var45 = (in2 ^ in1)
+    var46 = (in0 <= var45)
+    var47 = (in4 | 0)
+    var48 = sub(4294967295, 295627028)
+    var49 = (var47 * var48)
+    var50 = (var46 ? 1 : var49)
+    var51 = (var44 % var50)
+    var52 = (var51 == 2022900523)
+    out3 = (var36 || var52)
+    out4 = or(0, 540594478)
+    out5 = T
+    var53 = (out0 % 3670637243)
+    out6 = (in4 | var53)
+    out7 = T
+    out8 = in1
+    var54 = (out6 ** out6)
+    out9 = (var54 / 1)
+    out10 = (! T)
+
+*/
+
+#[allow(non_snake_case, unused_comparisons, unused_parens, unused_variables)]
+pub fn c5(in0: u32, in1: u32, in2: u32, in3: bool, in4: u32, in5: bool, in6: bool, in7: bool, in8: bool, in9: bool) -> (u32, bool, bool, bool, u32, bool, u32, bool, u32, u32, bool) {
+    
+    macro_rules! sll {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sll {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! sub {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "sub {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    
+    macro_rules! or {
+        ($a:expr, $b:expr) => {{
+            let result: u32;
+            unsafe {
+                core::arch::asm!(
+                    "or {result}, {a}, {b}",
+                    result = out(reg) result,
+                    a = in(reg) $a,
+                    b = in(reg) $b,
+                );
+            }
+            result
+        }}
+    }
+    
+    let out0 = 3317195991_u32;
+    let var0 = (false && in9);
+    let var1 = (! false);
+    let var2 = (in3 && var1);
+    let var3 = (var0 || var2);
+    let var4 = (if true { true } else { in7 });
+    let var5 = (in2 >= out0);
+    let var6 = (if false { in6 } else { false });
+    let var7 = (if var4 { var5 } else { var6 });
+    let var8 = (var7 ^ true);
+    let var9 = (if in9 { var3 } else { var8 });
+    let out1 = (! var9);
+    let var10 = (if in7 { out1 } else { true });
+    let var11 = (if in8 { in1 } else { in1 });
+    let var12 = (! in4);
+    let var13 = (if var10 { var11 } else { var12 });
+    let var14 = (! 4294967295_u32);
+    let var15 = (var13 > var14);
+    let var16 = (out1 && var15);
+    let out2 = (! var16);
+    let var17 = (if true { in2 } else { in1 });
+    let var18 = (var17 / 1_u32);
+    let var19 = (! var18);
+    let var20 = (3940711467_u32 % 1_u32);
+    let var21 = (var19 | var20);
+    let var22 = (if in8 { 1301266498_u32 } else { in2 });
+    let var23 = (in0 - 3028596947_u32);
+    let var24 = sll!(var22, var23);
+    let var25 = (var21 - var24);
+    let var26 = (in2 ^ in1);
+    let var27 = (in0 < var26);
+    let var28 = (in2 ^ in1);
+    let var29 = (in0 == var28);
+    let var30 = (var27 || var29);
+    let var31 = (in4 | 0_u32);
+    let var32 = sub!(4294967295_u32, 295627028_u32);
+    let var33 = (var31 * var32);
+    let var34 = (if var30 { 1_u32 } else { var33 });
+    let var35 = (var25 % var34);
+    let var36 = (2022900523_u32 < var35);
+    let var37 = (if true { in2 } else { in1 });
+    let var38 = (var37 / 1_u32);
+    let var39 = (! var38);
+    let var40 = (var39 | 0_u32);
+    let var41 = (if in8 { 1301266498_u32 } else { in2 });
+    let var42 = (in0 - 3028596947_u32);
+    let var43 = sll!(var41, var42);
+    let var44 = (var40 - var43);
+    let var45 = (in2 ^ in1);
+    let var46 = (in0 <= var45);
+    let var47 = (in4 | 0_u32);
+    let var48 = sub!(4294967295_u32, 295627028_u32);
+    let var49 = (var47 * var48);
+    let var50 = (if var46 { 1_u32 } else { var49 });
+    let var51 = (var44 % var50);
+    let var52 = (var51 == 2022900523_u32);
+    let out3 = (var36 || var52);
+    let out4 = or!(0_u32, 540594478_u32);
+    let out5 = true;
+    let var53 = (out0 % 3670637243_u32);
+    let out6 = (in4 | var53);
+    let out7 = true;
+    let out8 = in1;
+    let var54 = out6.pow(out6);
+    let out9 = (var54 / 1_u32);
+    let out10 = (! true);
+    return (out0, out1, out2, out3, out4, out5, out6, out7, out8, out9, out10);
+}
+
+
+#[jolt::provable(guest_only)]
+fn circuits(
+    c0_args: [u32; 10],
+    c1_args: [u32; 10],
+    c2_args: [u32; 10],
+    c3_args: [u32; 10],
+    c4_args: [u32; 10],
+    c5_args: [u32; 10],
+) -> u32 {
+
+    //
+    // Parse Inputs and call Circuits
+    //
+
+    // -- c0 --
+    let c0_in0: u32 = c0_args[0];
+    let c0_in1: u32 = c0_args[1];
+    let c0_in2: u32 = c0_args[2];
+    let c0_in3: bool = c0_args[3] == 0_u32;
+    let c0_in4: u32 = c0_args[4];
+    let c0_in5: bool = c0_args[5] == 0_u32;
+    let c0_in6: bool = c0_args[6] == 0_u32;
+    let c0_in7: bool = c0_args[7] == 0_u32;
+    let c0_in8: bool = c0_args[8] == 0_u32;
+    let c0_in9: bool = c0_args[9] == 0_u32;
+
+    // -- c1 --
+    let c1_in0: u32 = c1_args[0];
+    let c1_in1: u32 = c1_args[1];
+    let c1_in2: u32 = c1_args[2];
+    let c1_in3: bool = c1_args[3] == 0_u32;
+    let c1_in4: u32 = c1_args[4];
+    let c1_in5: bool = c1_args[5] == 0_u32;
+    let c1_in6: bool = c1_args[6] == 0_u32;
+    let c1_in7: bool = c1_args[7] == 0_u32;
+    let c1_in8: bool = c1_args[8] == 0_u32;
+    let c1_in9: bool = c1_args[9] == 0_u32;
+
+    // -- c2 --
+    let c2_in0: u32 = c2_args[0];
+    let c2_in1: u32 = c2_args[1];
+    let c2_in2: u32 = c2_args[2];
+    let c2_in3: bool = c2_args[3] == 0_u32;
+    let c2_in4: u32 = c2_args[4];
+    let c2_in5: bool = c2_args[5] == 0_u32;
+    let c2_in6: bool = c2_args[6] == 0_u32;
+    let c2_in7: bool = c2_args[7] == 0_u32;
+    let c2_in8: bool = c2_args[8] == 0_u32;
+    let c2_in9: bool = c2_args[9] == 0_u32;
+
+    // -- c3 --
+    let c3_in0: u32 = c3_args[0];
+    let c3_in1: u32 = c3_args[1];
+    let c3_in2: u32 = c3_args[2];
+    let c3_in3: bool = c3_args[3] == 0_u32;
+    let c3_in4: u32 = c3_args[4];
+    let c3_in5: bool = c3_args[5] == 0_u32;
+    let c3_in6: bool = c3_args[6] == 0_u32;
+    let c3_in7: bool = c3_args[7] == 0_u32;
+    let c3_in8: bool = c3_args[8] == 0_u32;
+    let c3_in9: bool = c3_args[9] == 0_u32;
+
+    // -- c4 --
+    let c4_in0: u32 = c4_args[0];
+    let c4_in1: u32 = c4_args[1];
+    let c4_in2: u32 = c4_args[2];
+    let c4_in3: bool = c4_args[3] == 0_u32;
+    let c4_in4: u32 = c4_args[4];
+    let c4_in5: bool = c4_args[5] == 0_u32;
+    let c4_in6: bool = c4_args[6] == 0_u32;
+    let c4_in7: bool = c4_args[7] == 0_u32;
+    let c4_in8: bool = c4_args[8] == 0_u32;
+    let c4_in9: bool = c4_args[9] == 0_u32;
+
+    // -- c5 --
+    let c5_in0: u32 = c5_args[0];
+    let c5_in1: u32 = c5_args[1];
+    let c5_in2: u32 = c5_args[2];
+    let c5_in3: bool = c5_args[3] == 0_u32;
+    let c5_in4: u32 = c5_args[4];
+    let c5_in5: bool = c5_args[5] == 0_u32;
+    let c5_in6: bool = c5_args[6] == 0_u32;
+    let c5_in7: bool = c5_args[7] == 0_u32;
+    let c5_in8: bool = c5_args[8] == 0_u32;
+    let c5_in9: bool = c5_args[9] == 0_u32;
+
+
+    //
+    // Compute Circuit Outputs
+    //
+
+    // -- c0 --
+    let (
+        c0_out0,
+        c0_out1,
+        c0_out2,
+        c0_out3,
+        c0_out4,
+        c0_out5,
+        c0_out6,
+        c0_out7,
+        c0_out8,
+        c0_out9,
+        c0_out10,
+    ) : (
+        u32,
+        bool,
+        bool,
+        bool,
+        u32,
+        bool,
+        u32,
+        bool,
+        u32,
+        u32,
+        bool,
+    ) = c0(
+        c0_in0,
+        c0_in1,
+        c0_in2,
+        c0_in3,
+        c0_in4,
+        c0_in5,
+        c0_in6,
+        c0_in7,
+        c0_in8,
+        c0_in9,
+    );
+
+    // -- c1 --
+    let (
+        c1_out0,
+        c1_out1,
+        c1_out2,
+        c1_out3,
+        c1_out4,
+        c1_out5,
+        c1_out6,
+        c1_out7,
+        c1_out8,
+        c1_out9,
+        c1_out10,
+    ) : (
+        u32,
+        bool,
+        bool,
+        bool,
+        u32,
+        bool,
+        u32,
+        bool,
+        u32,
+        u32,
+        bool,
+    ) = c1(
+        c1_in0,
+        c1_in1,
+        c1_in2,
+        c1_in3,
+        c1_in4,
+        c1_in5,
+        c1_in6,
+        c1_in7,
+        c1_in8,
+        c1_in9,
+    );
+
+    // -- c2 --
+    let (
+        c2_out0,
+        c2_out1,
+        c2_out2,
+        c2_out3,
+        c2_out4,
+        c2_out5,
+        c2_out6,
+        c2_out7,
+        c2_out8,
+        c2_out9,
+        c2_out10,
+    ) : (
+        u32,
+        bool,
+        bool,
+        bool,
+        u32,
+        bool,
+        u32,
+        bool,
+        u32,
+        u32,
+        bool,
+    ) = c2(
+        c2_in0,
+        c2_in1,
+        c2_in2,
+        c2_in3,
+        c2_in4,
+        c2_in5,
+        c2_in6,
+        c2_in7,
+        c2_in8,
+        c2_in9,
+    );
+
+    // -- c3 --
+    let (
+        c3_out0,
+        c3_out1,
+        c3_out2,
+        c3_out3,
+        c3_out4,
+        c3_out5,
+        c3_out6,
+        c3_out7,
+        c3_out8,
+        c3_out9,
+        c3_out10,
+    ) : (
+        u32,
+        bool,
+        bool,
+        bool,
+        u32,
+        bool,
+        u32,
+        bool,
+        u32,
+        u32,
+        bool,
+    ) = c3(
+        c3_in0,
+        c3_in1,
+        c3_in2,
+        c3_in3,
+        c3_in4,
+        c3_in5,
+        c3_in6,
+        c3_in7,
+        c3_in8,
+        c3_in9,
+    );
+
+    // -- c4 --
+    let (
+        c4_out0,
+        c4_out1,
+        c4_out2,
+        c4_out3,
+        c4_out4,
+        c4_out5,
+        c4_out6,
+        c4_out7,
+        c4_out8,
+        c4_out9,
+        c4_out10,
+    ) : (
+        u32,
+        bool,
+        bool,
+        bool,
+        u32,
+        bool,
+        u32,
+        bool,
+        u32,
+        u32,
+        bool,
+    ) = c4(
+        c4_in0,
+        c4_in1,
+        c4_in2,
+        c4_in3,
+        c4_in4,
+        c4_in5,
+        c4_in6,
+        c4_in7,
+        c4_in8,
+        c4_in9,
+    );
+
+    // -- c5 --
+    let (
+        c5_out0,
+        c5_out1,
+        c5_out2,
+        c5_out3,
+        c5_out4,
+        c5_out5,
+        c5_out6,
+        c5_out7,
+        c5_out8,
+        c5_out9,
+        c5_out10,
+    ) : (
+        u32,
+        bool,
+        bool,
+        bool,
+        u32,
+        bool,
+        u32,
+        bool,
+        u32,
+        u32,
+        bool,
+    ) = c5(
+        c5_in0,
+        c5_in1,
+        c5_in2,
+        c5_in3,
+        c5_in4,
+        c5_in5,
+        c5_in6,
+        c5_in7,
+        c5_in8,
+        c5_in9,
+    );
+
+    //
+    // Compare Outputs
+    //
+
+    // -- c0 x c1 --
+    let diff_0_0 = c0_out0 ^ c1_out0;
+    if diff_0_0 != 0 {
+        return 0_u32;
+    }
+
+    let diff_0_1 = c0_out1 ^ c1_out1;
+    if diff_0_1 {
+        return 1_u32;
+    }
+
+    let diff_0_2 = c0_out2 ^ c1_out2;
+    if diff_0_2 {
+        return 2_u32;
+    }
+
+    let diff_0_3 = c0_out3 ^ c1_out3;
+    if diff_0_3 {
+        return 3_u32;
+    }
+
+    let diff_0_4 = c0_out4 ^ c1_out4;
+    if diff_0_4 != 0 {
+        return 4_u32;
+    }
+
+    let diff_0_5 = c0_out5 ^ c1_out5;
+    if diff_0_5 {
+        return 5_u32;
+    }
+
+    let diff_0_6 = c0_out6 ^ c1_out6;
+    if diff_0_6 != 0 {
+        return 6_u32;
+    }
+
+    let diff_0_7 = c0_out7 ^ c1_out7;
+    if diff_0_7 {
+        return 7_u32;
+    }
+
+    let diff_0_8 = c0_out8 ^ c1_out8;
+    if diff_0_8 != 0 {
+        return 8_u32;
+    }
+
+    let diff_0_9 = c0_out9 ^ c1_out9;
+    if diff_0_9 != 0 {
+        return 9_u32;
+    }
+
+    let diff_0_10 = c0_out10 ^ c1_out10;
+    if diff_0_10 {
+        return 10_u32;
+    }
+
+    // -- c1 x c2 --
+    let diff_1_0 = c1_out0 ^ c2_out0;
+    if diff_1_0 != 0 {
+        return 1000_u32;
+    }
+
+    let diff_1_1 = c1_out1 ^ c2_out1;
+    if diff_1_1 {
+        return 1001_u32;
+    }
+
+    let diff_1_2 = c1_out2 ^ c2_out2;
+    if diff_1_2 {
+        return 1002_u32;
+    }
+
+    let diff_1_3 = c1_out3 ^ c2_out3;
+    if diff_1_3 {
+        return 1003_u32;
+    }
+
+    let diff_1_4 = c1_out4 ^ c2_out4;
+    if diff_1_4 != 0 {
+        return 1004_u32;
+    }
+
+    let diff_1_5 = c1_out5 ^ c2_out5;
+    if diff_1_5 {
+        return 1005_u32;
+    }
+
+    let diff_1_6 = c1_out6 ^ c2_out6;
+    if diff_1_6 != 0 {
+        return 1006_u32;
+    }
+
+    let diff_1_7 = c1_out7 ^ c2_out7;
+    if diff_1_7 {
+        return 1007_u32;
+    }
+
+    let diff_1_8 = c1_out8 ^ c2_out8;
+    if diff_1_8 != 0 {
+        return 1008_u32;
+    }
+
+    let diff_1_9 = c1_out9 ^ c2_out9;
+    if diff_1_9 != 0 {
+        return 1009_u32;
+    }
+
+    let diff_1_10 = c1_out10 ^ c2_out10;
+    if diff_1_10 {
+        return 1010_u32;
+    }
+
+    // -- c2 x c3 --
+    let diff_2_0 = c2_out0 ^ c3_out0;
+    if diff_2_0 != 0 {
+        return 2000_u32;
+    }
+
+    let diff_2_1 = c2_out1 ^ c3_out1;
+    if diff_2_1 {
+        return 2001_u32;
+    }
+
+    let diff_2_2 = c2_out2 ^ c3_out2;
+    if diff_2_2 {
+        return 2002_u32;
+    }
+
+    let diff_2_3 = c2_out3 ^ c3_out3;
+    if diff_2_3 {
+        return 2003_u32;
+    }
+
+    let diff_2_4 = c2_out4 ^ c3_out4;
+    if diff_2_4 != 0 {
+        return 2004_u32;
+    }
+
+    let diff_2_5 = c2_out5 ^ c3_out5;
+    if diff_2_5 {
+        return 2005_u32;
+    }
+
+    let diff_2_6 = c2_out6 ^ c3_out6;
+    if diff_2_6 != 0 {
+        return 2006_u32;
+    }
+
+    let diff_2_7 = c2_out7 ^ c3_out7;
+    if diff_2_7 {
+        return 2007_u32;
+    }
+
+    let diff_2_8 = c2_out8 ^ c3_out8;
+    if diff_2_8 != 0 {
+        return 2008_u32;
+    }
+
+    let diff_2_9 = c2_out9 ^ c3_out9;
+    if diff_2_9 != 0 {
+        return 2009_u32;
+    }
+
+    let diff_2_10 = c2_out10 ^ c3_out10;
+    if diff_2_10 {
+        return 2010_u32;
+    }
+
+    // -- c3 x c4 --
+    let diff_3_0 = c3_out0 ^ c4_out0;
+    if diff_3_0 != 0 {
+        return 3000_u32;
+    }
+
+    let diff_3_1 = c3_out1 ^ c4_out1;
+    if diff_3_1 {
+        return 3001_u32;
+    }
+
+    let diff_3_2 = c3_out2 ^ c4_out2;
+    if diff_3_2 {
+        return 3002_u32;
+    }
+
+    let diff_3_3 = c3_out3 ^ c4_out3;
+    if diff_3_3 {
+        return 3003_u32;
+    }
+
+    let diff_3_4 = c3_out4 ^ c4_out4;
+    if diff_3_4 != 0 {
+        return 3004_u32;
+    }
+
+    let diff_3_5 = c3_out5 ^ c4_out5;
+    if diff_3_5 {
+        return 3005_u32;
+    }
+
+    let diff_3_6 = c3_out6 ^ c4_out6;
+    if diff_3_6 != 0 {
+        return 3006_u32;
+    }
+
+    let diff_3_7 = c3_out7 ^ c4_out7;
+    if diff_3_7 {
+        return 3007_u32;
+    }
+
+    let diff_3_8 = c3_out8 ^ c4_out8;
+    if diff_3_8 != 0 {
+        return 3008_u32;
+    }
+
+    let diff_3_9 = c3_out9 ^ c4_out9;
+    if diff_3_9 != 0 {
+        return 3009_u32;
+    }
+
+    let diff_3_10 = c3_out10 ^ c4_out10;
+    if diff_3_10 {
+        return 3010_u32;
+    }
+
+    // -- c4 x c5 --
+    let diff_4_0 = c4_out0 ^ c5_out0;
+    if diff_4_0 != 0 {
+        return 4000_u32;
+    }
+
+    let diff_4_1 = c4_out1 ^ c5_out1;
+    if diff_4_1 {
+        return 4001_u32;
+    }
+
+    let diff_4_2 = c4_out2 ^ c5_out2;
+    if diff_4_2 {
+        return 4002_u32;
+    }
+
+    let diff_4_3 = c4_out3 ^ c5_out3;
+    if diff_4_3 {
+        return 4003_u32;
+    }
+
+    let diff_4_4 = c4_out4 ^ c5_out4;
+    if diff_4_4 != 0 {
+        return 4004_u32;
+    }
+
+    let diff_4_5 = c4_out5 ^ c5_out5;
+    if diff_4_5 {
+        return 4005_u32;
+    }
+
+    let diff_4_6 = c4_out6 ^ c5_out6;
+    if diff_4_6 != 0 {
+        return 4006_u32;
+    }
+
+    let diff_4_7 = c4_out7 ^ c5_out7;
+    if diff_4_7 {
+        return 4007_u32;
+    }
+
+    let diff_4_8 = c4_out8 ^ c5_out8;
+    if diff_4_8 != 0 {
+        return 4008_u32;
+    }
+
+    let diff_4_9 = c4_out9 ^ c5_out9;
+    if diff_4_9 != 0 {
+        return 4009_u32;
+    }
+
+    let diff_4_10 = c4_out10 ^ c5_out10;
+    if diff_4_10 {
+        return 4010_u32;
+    }
+
+    3735928559_u32
+
+}
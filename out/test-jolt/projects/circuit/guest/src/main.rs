@@ -0,0 +1,6 @@
+#![cfg_attr(feature = "guest", no_std)]
+#![no_main]
+
+#[allow(unused_imports)]
+use jolt_guest::*;
+
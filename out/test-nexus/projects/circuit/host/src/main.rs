@@ -0,0 +1,351 @@
+use fuzzer_utils;
+use nexus_sdk::{
+    compile::{cargo::CargoPackager, Compile, Compiler},
+    stwo::seq::Stwo,
+    ByGuestCompilation, Local, Prover, Verifiable, Viewable,
+};
+use clap::Parser;
+use std::time::Instant;
+
+#[derive(Clone, Copy, Debug)]
+enum Input {
+    U32(u32),
+    Bool(bool),
+}
+
+impl Input {
+    fn as_u32(&self) -> u32 {
+        match *self {
+            Input::U32(value) => value,
+            Input::Bool(value) => value as u32,
+        }
+    }
+}
+
+#[derive(Clone, Debug, Default)]
+struct Inputs(Vec<Input>);
+
+#[allow(dead_code)]
+impl Inputs {
+    fn as_u32_array<const N: usize>(&self) -> [u32; N] {
+        let values: Vec<u32> = self.0.iter().map(Input::as_u32).collect();
+        values.try_into().unwrap_or_else(|values: Vec<u32>| {
+            panic!("expected {} inputs, but got {}", N, values.len())
+        })
+    }
+}
+
+impl std::str::FromStr for Inputs {
+    type Err = String;
+
+    fn from_str(value: &str) -> Result<Self, Self::Err> {
+        let mut inputs = Vec::new();
+        for entry in value.split(',').filter(|entry| !entry.is_empty()) {
+            let input = match entry.split_once(':') {
+                Some(("u32", raw)) => {
+                    Input::U32(raw.parse().map_err(|e| format!("'{entry}': {e}"))?)
+                }
+                Some(("bool", "0")) => Input::Bool(false),
+                Some(("bool", "1")) => Input::Bool(true),
+                _ => return Err(format!("invalid typed input '{entry}'")),
+            };
+            inputs.push(input);
+        }
+        Ok(Inputs(inputs))
+    }
+}
+
+#[derive(Parser, Debug)]
+#[clap(author, version, about, long_about = None)]
+struct Args {
+    #[clap(long = "circuits", default_value_t = 1)]
+    circuits: usize,
+
+    #[clap(long = "inputs", default_value = "")]
+    inputs: Inputs,
+
+    #[clap(long = "step-bound", default_value_t = 1000000)]
+    step_bound: u64,
+
+    #[clap(long = "step-overflow", default_value = "panic")]
+    step_overflow: String,
+
+    #[clap(long = "trace")]
+    trace: bool,
+
+    #[clap(long = "trace-output")]
+    trace_output: Option<String>,
+
+    #[clap(long = "trace-from", default_value_t = 0)]
+    trace_from: u64,
+
+    #[clap(long = "trace-pc-ranges", default_value = "")]
+    trace_pc_ranges: String,
+
+    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]
+    #[clap(long)]
+    inject: bool,
+
+    #[clap(long)]
+    seed: Option<u64>,
+
+    #[clap(long)]
+    inject_step: Option<u64>,
+
+    #[clap(long)]
+    inject_kind: Option<String>,
+
+}
+
+const PACKAGE: &str = "nexus-guest";
+
+fn main() {
+
+    let argv: Vec<String> = std::env::args().collect();
+    if argv.len() == 3 && argv[1] == "--batch" {
+        run_batch(&argv[0], &argv[2]);
+    } else if argv.len() == 2 && argv[1] == "--serve" {
+        run_server(&argv[0]);
+    } else if argv.len() == 2 && argv[1] == "--fork-serve" {
+        run_fork_server(&argv[0]);
+    } else {
+        run(Args::parse());
+        fuzzer_utils::close_trace_channel();
+    }
+}
+
+fn set_batch_panic_hook() {
+    // NOTE: The default hook prints the backtrace note only for the first panic of a
+    //       process, which is required to parse the panic information per execution.
+    std::panic::set_hook(Box::new(|info| {
+        let thread = std::thread::current();
+        let location = info.location().map(|l| l.to_string()).unwrap_or_default();
+        let message = match info.payload().downcast_ref::<&str>() {
+            Some(message) => message.to_string(),
+            None => info.payload().downcast_ref::<String>().cloned().unwrap_or_default(),
+        };
+        eprintln!(
+            "thread '{}' panicked at {}:\n{}\n\
+            note: run with `RUST_BACKTRACE=1` environment variable to display a backtrace",
+            thread.name().unwrap_or("<unnamed>"),
+            location,
+            message
+        );
+    }));
+}
+
+fn run_batch(program: &str, batch: &str) {
+    set_batch_panic_hook();
+    let content = if batch == "-" {
+        std::io::read_to_string(std::io::stdin()).expect("unable to read batch from stdin")
+    } else {
+        std::fs::read_to_string(batch).expect("unable to read batch file")
+    };
+    for (index, line) in content.lines().enumerate() {
+        run_batch_entry(program, index, line);
+    }
+}
+
+fn run_server(program: &str) {
+    use std::io::BufRead;
+    set_batch_panic_hook();
+    for (index, line) in std::io::stdin().lock().lines().enumerate() {
+        run_batch_entry(program, index, &line.expect("unable to read request"));
+    }
+}
+
+fn run_fork_server(program: &str) {
+    use std::io::{BufRead, Write};
+    extern "C" {
+        fn fork() -> i32;
+        fn waitpid(pid: i32, status: *mut i32, options: i32) -> i32;
+        fn prctl(option: i32, ...) -> i32;
+    }
+    set_batch_panic_hook();
+    for (index, line) in std::io::stdin().lock().lines().enumerate() {
+        let line = line.expect("unable to read request");
+        std::io::stdout().flush().expect("unable to flush stdout");
+        let timer = std::time::Instant::now();
+        let pid = unsafe { fork() };
+        if pid == 0 {
+            // PR_SET_PDEATHSIG with SIGKILL, the child must not outlive the server
+            unsafe { prctl(1, 9u64) };
+            let code = match run_batch_entry(program, index, &line) {
+                "ok" => 0,
+                "invalid" => 2,
+                _ => 101,
+            };
+            std::process::exit(code);
+        }
+        assert!(pid > 0, "unable to fork execution");
+        let mut status = 0;
+        unsafe { waitpid(pid, &mut status, 0) };
+        let is_exited = status & 0x7f == 0;
+        let code = (status >> 8) & 0xff;
+        if !is_exited || ![0, 2, 101].contains(&code) {
+            // the child was killed or exited before writing its end markers
+            eprintln!("fork server child {} terminated with wait status {}", pid, status);
+            print_batch_end(index, "panic", timer.elapsed().as_secs_f64());
+        }
+    }
+}
+
+fn run_batch_entry(program: &str, index: usize, line: &str) -> &'static str {
+    fuzzer_utils::reset_state();
+    println!("<batch>{{\"index\":{}, \"status\":\"start\"}}</batch>", index);
+    eprintln!("<batch>{{\"index\":{}, \"status\":\"start\"}}</batch>", index);
+    let timer = std::time::Instant::now();
+    let arguments = std::iter::once(program.to_string())
+        .chain(line.split_whitespace().map(String::from));
+    let status = match Args::try_parse_from(arguments) {
+        Ok(args) => match std::panic::catch_unwind(move || run(args)) {
+            Ok(_) => "ok",
+            Err(_) => "panic",
+        },
+        Err(error) => {
+            eprintln!("{}", error);
+            "invalid"
+        }
+    };
+    fuzzer_utils::close_trace_channel();
+    print_batch_end(index, status, timer.elapsed().as_secs_f64());
+    status
+}
+
+fn print_batch_end(index: usize, status: &str, time: f64) {
+    println!(
+        "<batch>{{\"index\":{}, \"status\":\"{}\", \"time\":{}}}</batch>",
+        index, status, time
+    );
+    eprintln!(
+        "<batch>{{\"index\":{}, \"status\":\"{}\", \"time\":{}}}</batch>",
+        index, status, time
+    );
+}
+
+fn run(args: Args) {
+    fuzzer_utils::set_step_bound(args.step_bound);
+    fuzzer_utils::set_step_overflow(&args.step_overflow);
+    fuzzer_utils::set_trace_logging(args.trace);
+    fuzzer_utils::set_trace_from_step(args.trace_from);
+    fuzzer_utils::set_trace_pc_ranges(&args.trace_pc_ranges);
+    if let Some(trace_output) = &args.trace_output {
+        fuzzer_utils::open_trace_channel(trace_output);
+    }
+    fuzzer_utils::set_injection(args.inject);
+    if args.inject {
+        fuzzer_utils::set_seed(args.seed.unwrap());
+        fuzzer_utils::set_injection_step(args.inject_step.unwrap());
+        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());
+        fuzzer_utils::disable_assertions();
+    } else {
+        fuzzer_utils::enable_assertions();
+    }
+
+    let circuit_inputs: [u32; 10] = args.inputs.as_u32_array();
+
+    println!(
+        "<record>{{\
+            \"context\":\"Compiler\", \
+            \"status\":\"start\"\
+        }}</record>"
+    );
+    let timer = Instant::now();
+
+    let mut prover_compiler = Compiler::<CargoPackager>::new(PACKAGE);
+    let prover : Stwo<Local> = Stwo::compile(&mut prover_compiler).expect("compile");
+
+    let elf = prover.elf.clone(); // save elf for use with test verification
+
+    println!(
+        "<record>{{\
+            \"context\":\"Compiler\", \
+            \"status\":\"success\", \
+            \"time\":\"{:.2?}\"\
+        }}</record>",
+        timer.elapsed()
+    );
+
+    println!(
+        "<record>{{\
+            \"context\":\"Prover\", \
+            \"status\":\"start\"\
+        }}</record>"
+    );
+    let timer = Instant::now();
+
+    let (view, proof) = prover.prove_with_input::<([u32; 10], [u32; 10], [u32; 10], [u32; 10], [u32; 10], [u32; 10]), [u32; 10]>(
+        &(circuit_inputs, circuit_inputs, circuit_inputs, circuit_inputs, circuit_inputs, circuit_inputs), &circuit_inputs
+    ).expect("prover failed");
+    if args.inject { fuzzer_utils::enable_assertions(); }
+
+    println!(
+        ">>>>> Logging
+{}
+<<<<<",
+        view.logs().expect("failed to retrieve debug logs").join("")
+    );
+
+    let output = view
+        .public_output::<u32>()
+        .expect("output retrieval failed");
+
+    println!(
+        "<record>{{\
+            \"context\":\"Prover\", \
+            \"status\":\"success\", \
+            \"output\":\"{output}\", \
+            \"time\":\"{:.2?}\"\
+        }}</record>",
+        timer.elapsed()
+    );
+
+    println!(
+        "<record>{{\
+            \"context\":\"Exit Code Check\", \
+            \"status\":\"start\"\
+        }}</record>"
+    );
+    let timer = Instant::now();
+
+    let exit_code = view.exit_code().expect("failed to retrieve exit code");
+    println!("exit_code = {:?}", exit_code);
+    assert!(exit_code == nexus_sdk::KnownExitCodes::ExitSuccess as u32, "unexpected exit code");
+
+    println!(
+        "<record>{{\
+            \"context\":\"Exit Code Check\", \
+            \"status\":\"success\", \
+            \"time\":\"{:.2?}\"\
+        }}</record>",
+        timer.elapsed()
+    );
+
+    println!(
+        "<record>{{\
+            \"context\":\"Verifier\", \
+            \"status\":\"start\"\
+        }}</record>"
+    );
+    let timer = Instant::now();
+
+    proof.verify_expected::<
+        [u32; 10],
+        u32,
+    >(
+        &circuit_inputs,
+        nexus_sdk::KnownExitCodes::ExitSuccess as u32,
+        &output,
+        &elf,
+        &[],  // no associated data
+    ).expect("verifier failed");
+
+    println!(
+        "<record>{{\
+            \"context\":\"Verifier\", \
+            \"status\":\"success\", \
+            \"time\":\"{:.2?}\"\
+        }}</record>",
+        timer.elapsed()
+    );
+}
\ No newline at end of file
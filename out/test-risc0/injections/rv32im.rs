@@ -0,0 +1,1135 @@
+// Copyright 2025 RISC Zero, Inc.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use anyhow::Result;
+use derive_more::Debug;
+use risc0_binfmt::{ByteAddr, WordAddr};
+
+use super::platform::{REG_MAX, REG_ZERO, WORD_SIZE};
+
+
+// <----------------------- START OF FAULT INJECTION ----------------------->
+
+use rand::rngs::StdRng;
+use rand::{Rng, SeedableRng};
+use fuzzer_utils;
+
+struct RV32IMFaultInjectionContext {
+    trace_info_enabled: bool,
+    injection_enabled: bool,
+    injection_step: u64,
+    injection_type: String,
+    current_step: u64,
+    rng: StdRng,
+}
+
+impl RV32IMFaultInjectionContext {
+    pub fn new(
+        trace_info_enabled: bool,
+        injection_enabled: bool,
+        injection_step: u64,
+        injection_type: String,
+        injection_seed: u64,
+    ) -> Self {
+        Self {
+            trace_info_enabled,
+            injection_enabled,
+            injection_step,
+            injection_type,
+            current_step: 0,
+            rng: StdRng::seed_from_u64(injection_seed),
+        }
+    }
+
+    pub fn insn_kind_from_decoded(&self, decoded: &DecodedInstruction) -> InsnKind {
+        match (decoded.opcode, decoded.func3, decoded.func7) {
+            // R-format arithmetic ops
+            (0b0110011, 0b000, 0b0000000) => InsnKind::Add,
+            (0b0110011, 0b000, 0b0100000) => InsnKind::Sub,
+            (0b0110011, 0b001, 0b0000000) => InsnKind::Sll,
+            (0b0110011, 0b010, 0b0000000) => InsnKind::Slt,
+            (0b0110011, 0b011, 0b0000000) => InsnKind::SltU,
+            (0b0110011, 0b101, 0b0000000) => InsnKind::Srl,
+            (0b0110011, 0b100, 0b0000000) => InsnKind::Xor,
+            (0b0110011, 0b101, 0b0100000) => InsnKind::Sra,
+            (0b0110011, 0b110, 0b0000000) => InsnKind::Or,
+            (0b0110011, 0b111, 0b0000000) => InsnKind::And,
+            (0b0110011, 0b000, 0b0000001) => InsnKind::Mul,
+            (0b0110011, 0b001, 0b0000001) => InsnKind::MulH,
+            (0b0110011, 0b010, 0b0000001) => InsnKind::MulHSU,
+            (0b0110011, 0b011, 0b0000001) => InsnKind::MulHU,
+            (0b0110011, 0b100, 0b0000001) => InsnKind::Div,
+            (0b0110011, 0b101, 0b0000001) => InsnKind::DivU,
+            (0b0110011, 0b110, 0b0000001) => InsnKind::Rem,
+            (0b0110011, 0b111, 0b0000001) => InsnKind::RemU,
+            // I-format arithmetic ops
+            (0b0010011, 0b000, _) => InsnKind::AddI,
+            (0b0010011, 0b001, 0b0000000) => InsnKind::SllI,
+            (0b0010011, 0b010, _) => InsnKind::SltI,
+            (0b0010011, 0b011, _) => InsnKind::SltIU,
+            (0b0010011, 0b100, _) => InsnKind::XorI,
+            (0b0010011, 0b101, 0b0000000) => InsnKind::SrlI,
+            (0b0010011, 0b101, 0b0100000) => InsnKind::SraI,
+            (0b0010011, 0b110, _) => InsnKind::OrI,
+            (0b0010011, 0b111, _) => InsnKind::AndI,
+            // I-format memory loads
+            (0b0000011, 0b000, _) => InsnKind::Lb,
+            (0b0000011, 0b001, _) => InsnKind::Lh,
+            (0b0000011, 0b010, _) => InsnKind::Lw,
+            (0b0000011, 0b100, _) => InsnKind::LbU,
+            (0b0000011, 0b101, _) => InsnKind::LhU,
+            // S-format memory stores
+            (0b0100011, 0b000, _) => InsnKind::Sb,
+            (0b0100011, 0b001, _) => InsnKind::Sh,
+            (0b0100011, 0b010, _) => InsnKind::Sw,
+            // U-format lui
+            (0b0110111, _, _) => InsnKind::Lui,
+            // U-format auipc
+            (0b0010111, _, _) => InsnKind::Auipc,
+            // B-format branch
+            (0b1100011, 0b000, _) => InsnKind::Beq,
+            (0b1100011, 0b001, _) => InsnKind::Bne,
+            (0b1100011, 0b100, _) => InsnKind::Blt,
+            (0b1100011, 0b101, _) => InsnKind::Bge,
+            (0b1100011, 0b110, _) => InsnKind::BltU,
+            (0b1100011, 0b111, _) => InsnKind::BgeU,
+            // J-format jal
+            (0b1101111, _, _) => InsnKind::Jal,
+            // I-format jalr
+            (0b1100111, _, _) => InsnKind::JalR,
+            // System instruction
+            (0b1110011, 0b000, 0b0011000) => InsnKind::Mret,
+            (0b1110011, 0b000, 0b0000000) => InsnKind::Eany,
+            _ => InsnKind::Invalid,
+        }
+    }
+
+    pub fn insn_kind_from_word(&self, word: u32) -> InsnKind {
+        self.insn_kind_from_decoded(&DecodedInstruction::new(word))
+    }
+
+    pub fn print_injection_info(&self, pc: ByteAddr, kind: &String, info: &String) {
+        if self.trace_info_enabled {
+            println!(
+                "<fault>{{\"step\":{}, \"pc\":{}, \"kind\":\"{}\", \"info\":\"{}\"}}</fault>",
+                self.current_step,
+                pc.0,
+                kind,
+                info
+            );
+        }
+    }
+
+    pub fn print_trace_info(&self, pc: ByteAddr, word: u32) {
+        let decoded = DecodedInstruction::new(word);
+        let kind = self.insn_kind_from_decoded(&decoded);
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(pc.0)
+            && !fuzzer_utils::write_trace_record(
+                self.current_step,
+                pc.0,
+                &format!("{:?}", kind),
+                word,
+            )
+        {
+            println!(
+                "<trace>{{\"step\":{}, \"pc\":{}, \"instruction\":\"{:?}\", \"assembly\":\"{}\"}}</trace>",
+                self.current_step,
+                pc.0,
+                kind,
+                disasm(kind, &decoded)
+            );
+        }
+    }
+
+    pub fn is_injection_enabled(&self) -> bool {
+        self.injection_enabled
+    }
+
+    pub fn is_injection(&self, injection_type: String) -> bool {
+        self.injection_enabled
+            && self.current_step == self.injection_step
+            && self.injection_type == injection_type
+    }
+
+    pub fn step(&mut self) {
+        self.current_step += 1;
+        fuzzer_utils::check_step_bound(self.current_step);
+    }
+
+    pub fn random_pc(&mut self, pc: ByteAddr) -> ByteAddr {
+        let selector = self.rng.random_range(0..=2);
+        let steps: u32 = match selector {
+            0 => { WORD_SIZE.try_into().unwrap() },
+            1 => {
+                (self.rng.random_range(2..=10) * WORD_SIZE)
+                    .try_into()
+                    .unwrap()
+            },
+            2 => {
+                (self.rng.random_range(11..=1000) * WORD_SIZE)
+                    .try_into()
+                    .unwrap()
+            },
+            _ => unreachable!(),
+        };
+        if self.rng.random::<bool>() {
+            pc + steps
+        } else {
+            ByteAddr(pc.0.saturating_sub(steps))
+        }
+    }
+
+    pub fn random_word(&mut self, word: u32) -> u32 {
+        // TODO: instruction aware manipulations
+        // NOTE: we do not temper with the last 2 bits (0, 1)
+        //       because it seems to do nothing and it is checked during fetch.
+        let mut new_word = word;
+        let mut kind = InsnKind::Invalid;
+        while new_word == word || kind == InsnKind::Invalid {
+            let selector: u32 = self.rng.random_range(0..=2);
+            new_word = match selector {
+                0 => {
+                    let bit_to_flip = self.rng.random_range(2..=31);
+                    word ^ (1 << bit_to_flip)
+                },
+                1 => {
+                    let n = self.rng.random_range(1..=29);
+                    let bits_to_flip = rand::seq::index::sample(&mut self.rng, 29, n).into_vec();
+                    let mut flipped_word = word;
+                    for bit_with_offset in bits_to_flip {
+                        let bit_to_flip = bit_with_offset + 2;
+                        flipped_word ^= 1 << bit_to_flip;
+                    }
+                    flipped_word
+                },
+                2 => {
+                    // random word (with last 2 bits set)
+                    self.rng.random::<u32>() | 0x03
+                },
+                _ => unreachable!(),
+            };
+            kind = self.insn_kind_from_word(new_word);
+        }
+        new_word
+    }
+
+    pub fn random_mod_of_u32(&mut self, out: u32) -> u32 {
+        let mut new_out = out;
+        while new_out == out {
+            let selector: u32 = self.rng.random_range(0..=7);
+            new_out = match selector {
+                0 => { 0 },
+                1 => { 1 },
+                2 => { 0xffffffff },
+                3 => { 0xfffffffe },
+                4 => {
+                    let n = self.rng.random_range(1..=31);
+                    let bits_to_flip = rand::seq::index::sample(&mut self.rng, 31, n).into_vec();
+                    let mut flipped_out = out;
+                    for bit_to_flip in bits_to_flip {
+                        flipped_out ^= 1 << bit_to_flip;
+                    }
+                    flipped_out
+                },
+                5 => { out.saturating_add(1) },
+                6 => { out.saturating_sub(1) },
+                7 => { self.rng.random::<u32>() },
+                _ => unreachable!(),
+            };
+        }
+        new_out
+    }
+
+    pub fn random_memory_addr<C: EmuContext>(&mut self, ctx: &mut C) -> WordAddr {
+        if self.rng.random::<bool>() {
+            ByteAddr(self.rng.random::<u32>()).waddr()
+        } else {
+            let mem_reg = self.rng.random_range(2..=3); // sp, gp
+            ByteAddr(
+                ctx.load_register(mem_reg).expect("load register for 'random_memory_addr'")
+            ).waddr()
+        }
+    }
+
+    pub fn random_memory_u32<C: EmuContext>(&mut self, ctx: &mut C, addr: WordAddr) -> u32 {
+        if self.rng.random::<bool>() {
+            self.rng.random::<u32>()
+        } else {
+            let old_value = ctx
+                .load_memory(addr)
+                .expect("load memory for 'random_memory_u32'");
+           self.random_mod_of_u32(old_value)
+        }
+    }
+
+    pub fn random_register_addr(&mut self) -> usize {
+        self.rng.random_range(1..=31) as usize
+    }
+
+    pub fn random_register_u32<C: EmuContext>(&mut self, ctx: &mut C, addr: usize) -> u32 {
+        if self.rng.random::<bool>() {
+            self.rng.random::<u32>()
+        } else {
+            let old_value = ctx
+                .load_register(addr)
+                .expect("load register for 'random_register_u32'");
+            self.random_mod_of_u32(old_value)
+        }
+    }
+}
+
+impl Default for RV32IMFaultInjectionContext {
+    fn default() -> Self {
+        RV32IMFaultInjectionContext::new(
+            fuzzer_utils::is_trace_logging(),
+            fuzzer_utils::is_injection(),
+            fuzzer_utils::get_injection_step(),
+            fuzzer_utils::get_injection_kind(),
+            fuzzer_utils::get_seed(),
+        )
+    }
+}
+
+// <------------------------ END OF FAULT INJECTION ------------------------>
+
+
+pub trait EmuContext {
+    // Handle environment call
+    fn ecall(&mut self) -> Result<bool>;
+
+    // Handle a machine return
+    fn mret(&mut self) -> Result<bool>;
+
+    // Handle a trap
+    fn trap(&mut self, cause: Exception) -> Result<bool>;
+
+    // Callback when instructions are decoded
+    fn on_insn_decoded(&mut self, kind: InsnKind, decoded: &DecodedInstruction) -> Result<()>;
+
+    // Callback when instructions end normally
+    fn on_normal_end(&mut self, kind: InsnKind) -> Result<()>;
+
+    // Get the program counter
+    fn get_pc(&self) -> ByteAddr;
+
+    // Set the program counter
+    fn set_pc(&mut self, addr: ByteAddr);
+
+    // Load from a register
+    fn load_register(&mut self, idx: usize) -> Result<u32>;
+
+    // Store to a register
+    fn store_register(&mut self, idx: usize, word: u32) -> Result<()>;
+
+    // Load from memory
+    fn load_memory(&mut self, addr: WordAddr) -> Result<u32>;
+
+    // Store to memory
+    fn store_memory(&mut self, addr: WordAddr, word: u32) -> Result<()>;
+
+    // Check access for instruction load
+    fn check_insn_load(&self, addr: ByteAddr) -> bool;
+
+    // Check access for data load
+    fn check_data_load(&self, addr: ByteAddr) -> bool;
+
+    // Check access for data store
+    fn check_data_store(&self, addr: ByteAddr) -> bool;
+}
+
+#[derive(Default)]
+pub struct Emulator {
+    // <----------------------- START OF FAULT INJECTION ----------------------->
+
+    fault_inj_ctx: RV32IMFaultInjectionContext,
+
+    // <------------------------ END OF FAULT INJECTION ------------------------>
+}
+
+
+#[derive(Debug)]
+#[repr(u32)]
+pub enum Exception {
+    InstructionMisaligned = 0,
+    InstructionFault,
+    #[allow(dead_code)]
+    #[debug("IllegalInstruction({_0:#010x}, {_1})")]
+    IllegalInstruction(u32, u32),
+    Breakpoint,
+    LoadAddressMisaligned,
+    #[allow(dead_code)]
+    LoadAccessFault(ByteAddr),
+    #[allow(dead_code)]
+    StoreAddressMisaligned(ByteAddr),
+    StoreAccessFault,
+    #[allow(dead_code)]
+    InvalidEcallDispatch(u32),
+    #[allow(dead_code)]
+    UserEnvCall(ByteAddr),
+}
+
+impl Exception {
+    pub fn as_u32(&self) -> u32 {
+        unsafe { *(self as *const Self as *const u32) }
+    }
+}
+
+#[derive(Clone, Debug, Default)]
+pub struct DecodedInstruction {
+    pub insn: u32,
+    top_bit: u32,
+    func7: u32,
+    rs2: u32,
+    rs1: u32,
+    func3: u32,
+    rd: u32,
+    opcode: u32,
+}
+
+#[derive(Clone, Copy, Debug, PartialEq)]
+pub enum InsnKind {
+    Add = 0,  // major: 0, minor: 0
+    Sub = 1,  // major: 0, minor: 1
+    Xor = 2,  // major: 0, minor: 2
+    Or = 3,   // major: 0, minor: 3
+    And = 4,  // major: 0, minor: 4
+    Slt = 5,  // major: 0, minor: 5
+    SltU = 6, // major: 0, minor: 6
+    AddI = 7, // major: 0, minor: 7
+
+    XorI = 8,   // major: 1, minor: 0
+    OrI = 9,    // major: 1, minor: 1
+    AndI = 10,  // major: 1, minor: 2
+    SltI = 11,  // major: 1, minor: 3
+    SltIU = 12, // major: 1, minor: 4
+    Beq = 13,   // major: 1, minor: 5
+    Bne = 14,   // major: 1, minor: 6
+    Blt = 15,   // major: 1, minor: 7
+
+    Bge = 16,   // major: 2, minor: 0
+    BltU = 17,  // major: 2, minor: 1
+    BgeU = 18,  // major: 2, minor: 2
+    Jal = 19,   // major: 2, minor: 3
+    JalR = 20,  // major: 2, minor: 4
+    Lui = 21,   // major: 2, minor: 5
+    Auipc = 22, // major: 2, minor: 6
+
+    Sll = 24,    // major: 3, minor: 0
+    SllI = 25,   // major: 3, minor: 1
+    Mul = 26,    // major: 3, minor: 2
+    MulH = 27,   // major: 3, minor: 3
+    MulHSU = 28, // major: 3, minor: 4
+    MulHU = 29,  // major: 3, minor: 5
+
+    Srl = 32,  // major: 4, minor: 0
+    Sra = 33,  // major: 4, minor: 1
+    SrlI = 34, // major: 4, minor: 2
+    SraI = 35, // major: 4, minor: 3
+    Div = 36,  // major: 4, minor: 4
+    DivU = 37, // major: 4, minor: 5
+    Rem = 38,  // major: 4, minor: 6
+    RemU = 39, // major: 4, minor: 7
+
+    Lb = 40,  // major: 5, minor: 0
+    Lh = 41,  // major: 5, minor: 1
+    Lw = 42,  // major: 5, minor: 2
+    LbU = 43, // major: 5, minor: 3
+    LhU = 44, // major: 5, minor: 4
+
+    Sb = 48, // major: 6, minor: 0
+    Sh = 49, // major: 6, minor: 1
+    Sw = 50, // major: 6, minor: 2
+
+    Eany = 56, // major: 7, minor: 0
+    Mret = 57, // major: 7, minor: 1
+
+    Invalid = 255,
+}
+
+impl DecodedInstruction {
+    fn new(insn: u32) -> Self {
+        Self {
+            insn,
+            top_bit: (insn & 0x80000000) >> 31,
+            func7: (insn & 0xfe000000) >> 25,
+            rs2: (insn & 0x01f00000) >> 20,
+            rs1: (insn & 0x000f8000) >> 15,
+            func3: (insn & 0x00007000) >> 12,
+            rd: (insn & 0x00000f80) >> 7,
+            opcode: insn & 0x0000007f,
+        }
+    }
+
+    fn imm_b(&self) -> u32 {
+        (self.top_bit * 0xfffff000)
+            | ((self.rd & 1) << 11)
+            | ((self.func7 & 0x3f) << 5)
+            | (self.rd & 0x1e)
+    }
+
+    fn imm_i(&self) -> u32 {
+        (self.top_bit * 0xfffff000) | (self.func7 << 5) | self.rs2
+    }
+
+    fn imm_s(&self) -> u32 {
+        (self.top_bit * 0xfffff000) | (self.func7 << 5) | self.rd
+    }
+
+    fn imm_j(&self) -> u32 {
+        (self.top_bit * 0xfff00000)
+            | (self.rs1 << 15)
+            | (self.func3 << 12)
+            | ((self.rs2 & 1) << 11)
+            | ((self.func7 & 0x3f) << 5)
+            | (self.rs2 & 0x1e)
+    }
+
+    fn imm_u(&self) -> u32 {
+        self.insn & 0xfffff000
+    }
+}
+
+impl Emulator {
+    pub fn new() -> Self {
+        Self {
+            // <----------------------- START OF FAULT INJECTION ----------------------->
+
+            fault_inj_ctx: RV32IMFaultInjectionContext::default(),
+
+            // <------------------------ END OF FAULT INJECTION ------------------------>
+        }
+    }
+
+    fn trace_instruction<C: EmuContext>(
+        &mut self,
+        ctx: &mut C,
+        kind: InsnKind,
+        decoded: &DecodedInstruction,
+    ) -> Result<()> {
+        ctx.on_insn_decoded(kind, decoded)
+    }
+
+    #[inline(always)]
+    fn exec_rv32im<C: EmuContext>(&mut self, ctx: &mut C, word: u32) -> Result<Option<InsnKind>> {
+        let decoded = DecodedInstruction::new(word);
+
+        match (decoded.opcode, decoded.func3, decoded.func7) {
+            // R-format arithmetic ops
+            (0b0110011, 0b000, 0b0000000) => self.step_compute(ctx, InsnKind::Add, decoded),
+            (0b0110011, 0b000, 0b0100000) => self.step_compute(ctx, InsnKind::Sub, decoded),
+            (0b0110011, 0b001, 0b0000000) => self.step_compute(ctx, InsnKind::Sll, decoded),
+            (0b0110011, 0b010, 0b0000000) => self.step_compute(ctx, InsnKind::Slt, decoded),
+            (0b0110011, 0b011, 0b0000000) => self.step_compute(ctx, InsnKind::SltU, decoded),
+            (0b0110011, 0b101, 0b0000000) => self.step_compute(ctx, InsnKind::Srl, decoded),
+            (0b0110011, 0b100, 0b0000000) => self.step_compute(ctx, InsnKind::Xor, decoded),
+            (0b0110011, 0b101, 0b0100000) => self.step_compute(ctx, InsnKind::Sra, decoded),
+            (0b0110011, 0b110, 0b0000000) => self.step_compute(ctx, InsnKind::Or, decoded),
+            (0b0110011, 0b111, 0b0000000) => self.step_compute(ctx, InsnKind::And, decoded),
+            (0b0110011, 0b000, 0b0000001) => self.step_compute(ctx, InsnKind::Mul, decoded),
+            (0b0110011, 0b001, 0b0000001) => self.step_compute(ctx, InsnKind::MulH, decoded),
+            (0b0110011, 0b010, 0b0000001) => self.step_compute(ctx, InsnKind::MulHSU, decoded),
+            (0b0110011, 0b011, 0b0000001) => self.step_compute(ctx, InsnKind::MulHU, decoded),
+            (0b0110011, 0b100, 0b0000001) => self.step_compute(ctx, InsnKind::Div, decoded),
+            (0b0110011, 0b101, 0b0000001) => self.step_compute(ctx, InsnKind::DivU, decoded),
+            (0b0110011, 0b110, 0b0000001) => self.step_compute(ctx, InsnKind::Rem, decoded),
+            (0b0110011, 0b111, 0b0000001) => self.step_compute(ctx, InsnKind::RemU, decoded),
+            // I-format arithmetic ops
+            (0b0010011, 0b000, _) => self.step_compute(ctx, InsnKind::AddI, decoded),
+            (0b0010011, 0b001, 0b0000000) => self.step_compute(ctx, InsnKind::SllI, decoded),
+            (0b0010011, 0b010, _) => self.step_compute(ctx, InsnKind::SltI, decoded),
+            (0b0010011, 0b011, _) => self.step_compute(ctx, InsnKind::SltIU, decoded),
+            (0b0010011, 0b100, _) => self.step_compute(ctx, InsnKind::XorI, decoded),
+            (0b0010011, 0b101, 0b0000000) => self.step_compute(ctx, InsnKind::SrlI, decoded),
+            (0b0010011, 0b101, 0b0100000) => self.step_compute(ctx, InsnKind::SraI, decoded),
+            (0b0010011, 0b110, _) => self.step_compute(ctx, InsnKind::OrI, decoded),
+            (0b0010011, 0b111, _) => self.step_compute(ctx, InsnKind::AndI, decoded),
+            // I-format memory loads
+            (0b0000011, 0b000, _) => self.step_load(ctx, InsnKind::Lb, decoded),
+            (0b0000011, 0b001, _) => self.step_load(ctx, InsnKind::Lh, decoded),
+            (0b0000011, 0b010, _) => self.step_load(ctx, InsnKind::Lw, decoded),
+            (0b0000011, 0b100, _) => self.step_load(ctx, InsnKind::LbU, decoded),
+            (0b0000011, 0b101, _) => self.step_load(ctx, InsnKind::LhU, decoded),
+            // S-format memory stores
+            (0b0100011, 0b000, _) => self.step_store(ctx, InsnKind::Sb, decoded),
+            (0b0100011, 0b001, _) => self.step_store(ctx, InsnKind::Sh, decoded),
+            (0b0100011, 0b010, _) => self.step_store(ctx, InsnKind::Sw, decoded),
+            // U-format lui
+            (0b0110111, _, _) => self.step_compute(ctx, InsnKind::Lui, decoded),
+            // U-format auipc
+            (0b0010111, _, _) => self.step_compute(ctx, InsnKind::Auipc, decoded),
+            // B-format branch
+            (0b1100011, 0b000, _) => self.step_compute(ctx, InsnKind::Beq, decoded),
+            (0b1100011, 0b001, _) => self.step_compute(ctx, InsnKind::Bne, decoded),
+            (0b1100011, 0b100, _) => self.step_compute(ctx, InsnKind::Blt, decoded),
+            (0b1100011, 0b101, _) => self.step_compute(ctx, InsnKind::Bge, decoded),
+            (0b1100011, 0b110, _) => self.step_compute(ctx, InsnKind::BltU, decoded),
+            (0b1100011, 0b111, _) => self.step_compute(ctx, InsnKind::BgeU, decoded),
+            // J-format jal
+            (0b1101111, _, _) => self.step_compute(ctx, InsnKind::Jal, decoded),
+            // I-format jalr
+            (0b1100111, _, _) => self.step_compute(ctx, InsnKind::JalR, decoded),
+            // System instruction
+            (0b1110011, 0b000, 0b0011000) => self.step_system(ctx, InsnKind::Mret, decoded),
+            (0b1110011, 0b000, 0b0000000) => self.step_system(ctx, InsnKind::Eany, decoded),
+            _ => Ok(ctx
+                .trap(Exception::IllegalInstruction(decoded.insn, line!()))?
+                .then_some(InsnKind::Invalid)),
+        }
+    }
+
+    #[inline(always)]
+    pub fn step<C: EmuContext>(&mut self, ctx: &mut C) -> Result<()> {
+        let mut pc /* <-- FAULT INJECTION */ = ctx.get_pc();
+
+        if !ctx.check_insn_load(pc) && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+            ctx.trap(Exception::InstructionFault)?;
+            return Ok(());
+        }
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self
+            .fault_inj_ctx
+            .is_injection("PRE_EXEC_PC_MOD".to_string())
+        {
+            let new_pc = self.fault_inj_ctx.random_pc(pc);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"PRE_EXEC_PC_MOD".to_string(),
+                &format!("pc:{} => pc:{}", pc.0, new_pc.0)
+            );
+            pc = new_pc;
+            ctx.set_pc(pc);
+        }
+        if self
+            .fault_inj_ctx
+            .is_injection("PRE_EXEC_MEM_MOD".to_string())
+        {
+            let mem_addr = self.fault_inj_ctx.random_memory_addr(ctx);
+            let mem_data = self.fault_inj_ctx.random_memory_u32(ctx, mem_addr);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"PRE_EXEC_MEM_MOD".to_string(),
+                &format!("MEM[{:?}] = {}", mem_addr, mem_data)
+            );
+            ctx.store_memory(mem_addr, mem_data)?;
+        }
+        if self
+            .fault_inj_ctx
+            .is_injection("PRE_EXEC_REG_MOD".to_string())
+        {
+            let reg_addr = self.fault_inj_ctx.random_register_addr();
+            let reg_data = self.fault_inj_ctx.random_register_u32(ctx, reg_addr);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"PRE_EXEC_REG_MOD".to_string(),
+                &format!("{} = {}", REG_ALIASES[reg_addr], reg_data)
+            );
+            ctx.store_register(reg_addr, reg_data)?;
+        }
+
+        // <----------------------- END OF FAULT INJECTION ----------------------->
+
+
+        let mut /* <-- FAULT INJECTION */ word = ctx.load_memory(pc.waddr())?;
+        if word & 0x03 != 0x03 && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+            ctx.trap(Exception::IllegalInstruction(word, 0))?;
+            return Ok(());
+        }
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self
+            .fault_inj_ctx
+            .is_injection("INSTR_WORD_MOD".to_string())
+        {
+            let new_word = self.fault_inj_ctx.random_word(word);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"INSTR_WORD_MOD".to_string(),
+                &format!("word:{} => word:{}", word, new_word)
+            );
+            word = new_word;
+        }
+
+        self.fault_inj_ctx.print_trace_info(pc, word);
+
+        // <----------------------- END OF FAULT INJECTION  ----------------------->
+
+
+        if let Some(kind) = self.exec_rv32im(ctx, word)? {
+            ctx.on_normal_end(kind)?
+        }
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self
+            .fault_inj_ctx
+            .is_injection("POST_EXEC_PC_MOD".to_string())
+        {
+            let new_pc = self.fault_inj_ctx.random_pc(pc);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"POST_EXEC_PC_MOD".to_string(),
+                &format!("pc:{} => pc:{}", pc.0, new_pc.0)
+            );
+            pc = new_pc;
+            ctx.set_pc(pc);
+        }
+        if self
+            .fault_inj_ctx
+            .is_injection("POST_EXEC_MEM_MOD".to_string())
+        {
+            let mem_addr = self.fault_inj_ctx.random_memory_addr(ctx);
+            let mem_data = self.fault_inj_ctx.random_memory_u32(ctx, mem_addr);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"POST_EXEC_MEM_MOD".to_string(),
+                &format!("MEM[{:?}] = {}", mem_addr, mem_data)
+            );
+            ctx.store_memory(mem_addr, mem_data)?;
+        }
+        if self
+            .fault_inj_ctx
+            .is_injection("POST_EXEC_REG_MOD".to_string())
+        {
+            let reg_addr = self.fault_inj_ctx.random_register_addr();
+            let reg_data = self.fault_inj_ctx.random_register_u32(ctx, reg_addr);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"POST_EXEC_REG_MOD".to_string(),
+                &format!("{} = {}", REG_ALIASES[reg_addr], reg_data)
+            );
+            ctx.store_register(reg_addr, reg_data)?;
+        }
+        self.fault_inj_ctx.step();
+
+        // <----------------------- END OF FAULT INJECTION ----------------------->
+
+
+        Ok(())
+    }
+
+    fn load_rs2<M: EmuContext>(
+        &self,
+        ctx: &mut M,
+        decoded: &DecodedInstruction,
+        rs1: u32,
+    ) -> Result<u32> {
+        if decoded.rs1 == decoded.rs2 {
+            Ok(rs1)
+        } else {
+            ctx.load_register(decoded.rs2 as usize)
+        }
+    }
+
+    #[inline(always)]
+    fn step_compute<M: EmuContext>(
+        &mut self,
+        ctx: &mut M,
+        kind: InsnKind,
+        decoded: DecodedInstruction,
+    ) -> Result<Option<InsnKind>> {
+        self.trace_instruction(ctx, kind, &decoded)?;
+
+        let pc = ctx.get_pc();
+        let mut new_pc = pc + WORD_SIZE;
+        let mut rd = decoded.rd;
+        let rs1 = ctx.load_register(decoded.rs1 as usize)?;
+        let rs2 = self.load_rs2(ctx, &decoded, rs1)?;
+        let imm_i = decoded.imm_i();
+        let mut br_cond = |cond: bool| -> u32 {
+            rd = 0;
+
+            // <----------------------- START OF FAULT INJECTION ----------------------->
+            let mut cond = cond;
+            if self.fault_inj_ctx.is_injection("BR_NEG_COND".to_string()) {
+                let new_cond = !cond;
+                self.fault_inj_ctx.print_injection_info(
+                    pc,
+                    &"BR_NEG_COND".to_string(),
+                    &format!("cond:{} => cond:{}", cond, new_cond)
+                );
+                cond = new_cond;
+            }
+            // <----------------------- END OF FAULT INJECTION  ----------------------->
+
+            if cond {
+                new_pc = pc.wrapping_add(decoded.imm_b());
+            }
+            0
+        };
+        let mut /* <-- FAULT INJECTION */ out = match kind {
+            InsnKind::Add => rs1.wrapping_add(rs2),
+            InsnKind::Sub => rs1.wrapping_sub(rs2),
+            InsnKind::Xor => rs1 ^ rs2,
+            InsnKind::Or => rs1 | rs2,
+            InsnKind::And => rs1 & rs2,
+            InsnKind::Sll => rs1 << (rs2 & 0x1f),
+            InsnKind::Srl => rs1 >> (rs2 & 0x1f),
+            InsnKind::Sra => ((rs1 as i32) >> (rs2 & 0x1f)) as u32,
+            InsnKind::Slt => {
+                if (rs1 as i32) < (rs2 as i32) {
+                    1
+                } else {
+                    0
+                }
+            }
+            InsnKind::SltU => {
+                if rs1 < rs2 {
+                    1
+                } else {
+                    0
+                }
+            }
+            InsnKind::AddI => rs1.wrapping_add(imm_i),
+            InsnKind::XorI => rs1 ^ imm_i,
+            InsnKind::OrI => rs1 | imm_i,
+            InsnKind::AndI => rs1 & imm_i,
+            InsnKind::SllI => rs1 << (imm_i & 0x1f),
+            InsnKind::SrlI => rs1 >> (imm_i & 0x1f),
+            InsnKind::SraI => ((rs1 as i32) >> (imm_i & 0x1f)) as u32,
+            InsnKind::SltI => {
+                if (rs1 as i32) < (imm_i as i32) {
+                    1
+                } else {
+                    0
+                }
+            }
+            InsnKind::SltIU => {
+                if rs1 < imm_i {
+                    1
+                } else {
+                    0
+                }
+            }
+            InsnKind::Beq => br_cond(rs1 == rs2),
+            InsnKind::Bne => br_cond(rs1 != rs2),
+            InsnKind::Blt => br_cond((rs1 as i32) < (rs2 as i32)),
+            InsnKind::Bge => br_cond((rs1 as i32) >= (rs2 as i32)),
+            InsnKind::BltU => br_cond(rs1 < rs2),
+            InsnKind::BgeU => br_cond(rs1 >= rs2),
+            InsnKind::Jal => {
+                new_pc = pc.wrapping_add(decoded.imm_j());
+                (pc + WORD_SIZE).0
+            }
+            InsnKind::JalR => {
+                new_pc = ByteAddr(rs1.wrapping_add(imm_i) & 0xfffffffe);
+                (pc + WORD_SIZE).0
+            }
+            InsnKind::Lui => decoded.imm_u(),
+            InsnKind::Auipc => (pc.wrapping_add(decoded.imm_u())).0,
+            InsnKind::Mul => rs1.wrapping_mul(rs2),
+            InsnKind::MulH => {
+                (sign_extend_u32(rs1).wrapping_mul(sign_extend_u32(rs2)) >> 32) as u32
+            }
+            InsnKind::MulHSU => (sign_extend_u32(rs1).wrapping_mul(rs2 as i64) >> 32) as u32,
+            InsnKind::MulHU => (((rs1 as u64).wrapping_mul(rs2 as u64)) >> 32) as u32,
+            InsnKind::Div => {
+                if rs2 == 0 {
+                    u32::MAX
+                } else {
+                    ((rs1 as i32).wrapping_div(rs2 as i32)) as u32
+                }
+            }
+            InsnKind::DivU => {
+                if rs2 == 0 {
+                    u32::MAX
+                } else {
+                    rs1 / rs2
+                }
+            }
+            InsnKind::Rem => {
+                if rs2 == 0 {
+                    rs1
+                } else {
+                    ((rs1 as i32).wrapping_rem(rs2 as i32)) as u32
+                }
+            }
+            InsnKind::RemU => {
+                if rs2 == 0 {
+                    rs1
+                } else {
+                    rs1 % rs2
+                }
+            }
+            _ => unreachable!(),
+        };
+        if !new_pc.is_aligned() && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+            return Ok(ctx.trap(Exception::InstructionMisaligned)?.then_some(kind));
+        }
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_inj_ctx.is_injection("COMP_OUT_MOD".to_string()) {
+            let new_out = self.fault_inj_ctx.random_mod_of_u32(out);
+            self.fault_inj_ctx.print_injection_info(
+                pc,
+                &"COMP_OUT_MOD".to_string(),
+                &format!("out:{} => out:{}", out, new_out)
+            );
+            out = new_out;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        ctx.store_register(rd as usize, out)?;
+        ctx.set_pc(new_pc);
+        Ok(Some(kind))
+    }
+
+    #[inline(always)]
+    fn step_load<M: EmuContext>(
+        &mut self,
+        ctx: &mut M,
+        kind: InsnKind,
+        decoded: DecodedInstruction,
+    ) -> Result<Option<InsnKind>> {
+        self.trace_instruction(ctx, kind, &decoded)?;
+
+        let rs1 = ctx.load_register(decoded.rs1 as usize)?;
+        let addr = ByteAddr(rs1.wrapping_add(decoded.imm_i()));
+        if !ctx.check_data_load(addr) && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+            return Ok(ctx.trap(Exception::LoadAccessFault(addr))?.then_some(kind));
+        }
+        let data = ctx.load_memory(addr.waddr())?;
+        let shift = 8 * (addr.0 & 3);
+        let mut /* FAULT INJECTION */ out = match kind {
+            InsnKind::Lb => {
+                let mut out = (data >> shift) & 0xff;
+                if out & 0x80 != 0 {
+                    out |= 0xffffff00;
+                }
+                out
+            }
+            InsnKind::Lh => {
+                if addr.0 & 0x01 != 0 && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+                    return Ok(ctx.trap(Exception::LoadAddressMisaligned)?.then_some(kind));
+                }
+                let mut out = (data >> shift) & 0xffff;
+                if out & 0x8000 != 0 {
+                    out |= 0xffff0000;
+                }
+                out
+            }
+            InsnKind::Lw => {
+                if addr.0 & 0x03 != 0 && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+                    return Ok(ctx.trap(Exception::LoadAddressMisaligned)?.then_some(kind));
+                }
+                data
+            }
+            InsnKind::LbU => (data >> shift) & 0xff,
+            InsnKind::LhU => {
+                if addr.0 & 0x01 != 0 && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+                    return Ok(ctx.trap(Exception::LoadAddressMisaligned)?.then_some(kind));
+                }
+                (data >> shift) & 0xffff
+            }
+            _ => unreachable!(),
+        };
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_inj_ctx.is_injection("LOAD_VAL_MOD".to_string()) {
+            let new_out = self.fault_inj_ctx.random_mod_of_u32(out);
+            self.fault_inj_ctx.print_injection_info(
+                ctx.get_pc(),
+                &"LOAD_VAL_MOD".to_string(),
+                &format!("out:{} => out:{}", out, new_out)
+            );
+            out = new_out;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        ctx.store_register(decoded.rd as usize, out)?;
+        ctx.set_pc(ctx.get_pc() + WORD_SIZE);
+        Ok(Some(kind))
+    }
+
+    #[inline(always)]
+    fn step_store<M: EmuContext>(
+        &mut self,
+        ctx: &mut M,
+        kind: InsnKind,
+        decoded: DecodedInstruction,
+    ) -> Result<Option<InsnKind>> {
+        self.trace_instruction(ctx, kind, &decoded)?;
+
+        let rs1 = ctx.load_register(decoded.rs1 as usize)?;
+        let rs2 = self.load_rs2(ctx, &decoded, rs1)?;
+        let addr = ByteAddr(rs1.wrapping_add(decoded.imm_s()));
+        let shift = 8 * (addr.0 & 3);
+        if !ctx.check_data_store(addr) && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+            return Ok(ctx.trap(Exception::StoreAccessFault)?.then_some(kind));
+        }
+        let mut data = ctx.load_memory(addr.waddr())?;
+        match kind {
+            InsnKind::Sb => {
+                data ^= data & (0xff << shift);
+                data |= (rs2 & 0xff) << shift;
+            }
+            InsnKind::Sh => {
+                if addr.0 & 0x01 != 0 && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+                    tracing::debug!("Misaligned SH");
+                    return Ok(ctx
+                        .trap(Exception::StoreAddressMisaligned(addr))?
+                        .then_some(kind));
+                }
+                data ^= data & (0xffff << shift);
+                data |= (rs2 & 0xffff) << shift;
+            }
+            InsnKind::Sw => {
+                if addr.0 & 0x03 != 0 && !self.fault_inj_ctx.is_injection_enabled() /*<-- FAULT INJECTION */ {
+                    tracing::debug!("Misaligned SW");
+                    return Ok(ctx
+                        .trap(Exception::StoreAddressMisaligned(addr))?
+                        .then_some(kind));
+                }
+                data = rs2;
+            }
+            _ => unreachable!(),
+        }
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_inj_ctx.is_injection("STORE_OUT_MOD".to_string()) {
+            let new_data = self.fault_inj_ctx.random_mod_of_u32(data);
+            self.fault_inj_ctx.print_injection_info(
+                ctx.get_pc(),
+                &"STORE_OUT_MOD".to_string(),
+                &format!("data:{} => data:{}", data, new_data)
+            );
+            data = new_data;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        ctx.store_memory(addr.waddr(), data)?;
+        ctx.set_pc(ctx.get_pc() + WORD_SIZE);
+        Ok(Some(kind))
+    }
+
+    #[inline(always)]
+    fn step_system<M: EmuContext>(
+        &mut self,
+        ctx: &mut M,
+        kind: InsnKind,
+        decoded: DecodedInstruction,
+    ) -> Result<Option<InsnKind>> {
+        self.trace_instruction(ctx, kind, &decoded)?;
+
+        Ok(match kind {
+            InsnKind::Eany => match decoded.rs2 {
+                0 => ctx.ecall(),
+                1 => ctx.trap(Exception::Breakpoint),
+                _ => ctx.trap(Exception::IllegalInstruction(decoded.insn, 2)),
+            },
+            InsnKind::Mret => ctx.mret(),
+            _ => unreachable!(),
+        }?
+        .then_some(kind))
+    }
+}
+
+fn sign_extend_u32(x: u32) -> i64 {
+    (x as i32) as i64
+}
+
+struct Register(u32);
+
+const REG_ALIASES: [&str; REG_MAX] = [
+    "zero", "ra", "sp", "gp", "tp", "t0", "t1", "t2", "s0", "s1", "a0", "a1", "a2", "a3", "a4",
+    "a5", "a6", "a7", "s2", "s3", "s4", "s5", "s6", "s7", "s8", "s9", "s10", "s11", "t3", "t4",
+    "t5", "t6",
+];
+
+impl std::fmt::Display for Register {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        write!(f, "{}", REG_ALIASES[self.0 as usize])
+    }
+}
+
+pub fn disasm(kind: InsnKind, decoded: &DecodedInstruction) -> String {
+    let (rd, rs1, rs2) = (
+        Register(decoded.rd),
+        Register(decoded.rs1),
+        Register(decoded.rs2),
+    );
+    match kind {
+        InsnKind::Invalid => "illegal".to_string(),
+        InsnKind::Add => format!("add {rd}, {rs1}, {rs2}"),
+        InsnKind::Sub => format!("sub {rd}, {rs1}, {rs2}"),
+        InsnKind::Xor => format!("xor {rd}, {rs1}, {rs2}"),
+        InsnKind::Or => format!("or {rd}, {rs1}, {rs2}"),
+        InsnKind::And => format!("and {rd}, {rs1}, {rs2}"),
+        InsnKind::Sll => format!("sll {rd}, {rs1}, {rs2}"),
+        InsnKind::Srl => format!("srl {rd}, {rs1}, {rs2}"),
+        InsnKind::Sra => format!("sra {rd}, {rs1}, {rs2}"),
+        InsnKind::Slt => format!("slt {rd}, {rs1}, {rs2}"),
+        InsnKind::SltU => format!("sltu {rd}, {rs1}, {rs2}"),
+        InsnKind::AddI => {
+            if rs1.0 == REG_ZERO as u32 {
+                format!("li {rd}, {}", decoded.imm_i() as i32)
+            } else {
+                format!("addi {rd}, {rs1}, {}", decoded.imm_i() as i32)
+            }
+        }
+        InsnKind::XorI => format!("xori {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::OrI => format!("ori {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::AndI => format!("andi {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::SllI => format!("slli {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::SrlI => format!("srli {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::SraI => format!("srai {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::SltI => format!("slti {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::SltIU => format!("sltiu {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::Beq => format!("beq {rs1}, {rs2}, {}", decoded.imm_b() as i32),
+        InsnKind::Bne => format!("bne {rs1}, {rs2}, {}", decoded.imm_b() as i32),
+        InsnKind::Blt => format!("blt {rs1}, {rs2}, {}", decoded.imm_b() as i32),
+        InsnKind::Bge => format!("bge {rs1}, {rs2}, {}", decoded.imm_b() as i32),
+        InsnKind::BltU => format!("bltu {rs1}, {rs2}, {}", decoded.imm_b() as i32),
+        InsnKind::BgeU => format!("bgeu {rs1}, {rs2}, {}", decoded.imm_b() as i32),
+        InsnKind::Jal => format!("jal {rd}, {}", decoded.imm_j() as i32),
+        InsnKind::JalR => format!("jalr {rd}, {rs1}, {}", decoded.imm_i() as i32),
+        InsnKind::Lui => format!("lui {rd}, {:#010x}", decoded.imm_u() >> 12),
+        InsnKind::Auipc => format!("auipc {rd}, {:#010x}", decoded.imm_u() >> 12),
+        InsnKind::Mul => format!("mul {rd}, {rs1}, {rs2}"),
+        InsnKind::MulH => format!("mulh {rd}, {rs1}, {rs2}"),
+        InsnKind::MulHSU => format!("mulhsu {rd}, {rs1}, {rs2}"),
+        InsnKind::MulHU => format!("mulhu {rd}, {rs1}, {rs2}"),
+        InsnKind::Div => format!("div {rd}, {rs1}, {rs2}"),
+        InsnKind::DivU => format!("divu {rd}, {rs1}, {rs2}"),
+        InsnKind::Rem => format!("rem {rd}, {rs1}, {rs2}"),
+        InsnKind::RemU => format!("remu {rd}, {rs1}, {rs2}"),
+        InsnKind::Lb => format!("lb {rd}, {}({rs1})", decoded.imm_i() as i32),
+        InsnKind::Lh => format!("lh {rd}, {}({rs1})", decoded.imm_i() as i32),
+        InsnKind::Lw => format!("lw {rd}, {}({rs1})", decoded.imm_i() as i32),
+        InsnKind::LbU => format!("lbu {rd}, {}({rs1})", decoded.imm_i() as i32),
+        InsnKind::LhU => format!("lhu {rd}, {}({rs1})", decoded.imm_i() as i32),
+        InsnKind::Sb => format!("sb {rs2}, {}({rs1})", decoded.imm_s() as i32),
+        InsnKind::Sh => format!("sh {rs2}, {}({rs1})", decoded.imm_s() as i32),
+        InsnKind::Sw => format!("sw {rs2}, {}({rs1})", decoded.imm_s() as i32),
+        InsnKind::Eany => match decoded.rs2 {
+            0 => "ecall".to_string(),
+            1 => "ebreak".to_string(),
+            _ => "illegal eany".to_string(),
+        },
+        InsnKind::Mret => "mret".to_string(),
+    }
+}
@@ -0,0 +1 @@
+include!(concat!(env!("OUT_DIR"), "/methods.rs"));
@@ -0,0 +1,3822 @@
+#[cfg(feature = "profiling")]
+use std::{fs::File, io::BufWriter};
+use std::{str::FromStr, sync::Arc};
+
+use crate::estimator::RecordEstimator;
+#[cfg(feature = "profiling")]
+use crate::profiler::Profiler;
+
+use clap::ValueEnum;
+use enum_map::EnumMap;
+use hashbrown::HashMap;
+use serde::{Deserialize, Serialize};
+use sp1_primitives::consts::BABYBEAR_PRIME;
+use sp1_stark::{air::PublicValues, SP1CoreOpts};
+use strum::IntoEnumIterator;
+use thiserror::Error;
+
+use crate::{
+    context::{IoOptions, SP1Context},
+    dependencies::{
+        emit_auipc_dependency, emit_branch_dependencies, emit_divrem_dependencies,
+        emit_jump_dependencies, emit_memory_dependencies,
+    },
+    estimate_riscv_lde_size,
+    events::{
+        AUIPCEvent, AluEvent, BranchEvent, CpuEvent, JumpEvent, MemInstrEvent,
+        MemoryAccessPosition, MemoryInitializeFinalizeEvent, MemoryLocalEvent, MemoryReadRecord,
+        MemoryRecord, MemoryRecordEnum, MemoryWriteRecord, SyscallEvent,
+        NUM_LOCAL_MEMORY_ENTRIES_PER_ROW_EXEC,
+    },
+    hook::{HookEnv, HookRegistry},
+    memory::{Entry, Memory},
+    pad_rv32im_event_counts,
+    record::{ExecutionRecord, MemoryAccessRecord},
+    report::ExecutionReport,
+    state::{ExecutionState, ForkState},
+    subproof::SubproofVerifier,
+    syscalls::{default_syscall_map, Syscall, SyscallCode, SyscallContext},
+    CoreAirId, Instruction, MaximalShapes, Opcode, Program, Register, RiscvAirId,
+};
+
+
+// <----------------------- START OF FAULT INJECTION ----------------------->
+
+use rand::rngs::StdRng;
+use rand::{Rng, SeedableRng};
+use fuzzer_utils;
+
+/// Context used to manage fault injections
+#[derive(Debug)]
+pub struct RV32IMFaultInjectionContext {
+    trace_info_enabled: bool,
+    injection_enabled: bool,
+    instruction_override: bool,
+    injection_step: u64,
+    injection_type: String,
+    current_step: u64,
+    rng: StdRng,
+    injection_history: HashMap<u32, Instruction>,
+    pc_hint: u32,
+    instruction_hint: Option<Instruction>,
+}
+
+impl RV32IMFaultInjectionContext {
+
+    /// construct the RV32IM fault injection context
+    pub fn new(
+        trace_info_enabled: bool,
+        injection_enabled: bool,
+        instruction_override: bool,
+        injection_step: u64,
+        injection_type: String,
+        injection_seed: u64,
+    ) -> Self {
+        Self {
+            trace_info_enabled,
+            injection_enabled,
+            instruction_override,
+            injection_step,
+            injection_type,
+            current_step: 0,
+            rng: StdRng::seed_from_u64(injection_seed),
+            injection_history: HashMap::new(),
+            pc_hint: 0,
+            instruction_hint: None,
+        }
+    }
+
+    /// advances the context one step
+    pub fn step(&mut self, next_pc: u32) {
+        self.current_step += 1;
+        self.pc_hint = next_pc;
+        fuzzer_utils::check_step_bound(self.current_step);
+    }
+
+    /// get a guess what the current pc might be
+    pub fn get_pc_hint(&self) -> u32 {
+        self.pc_hint
+    }
+
+    /// set the current instruction
+    pub fn set_instruction_hint(&mut self, instruction: &Instruction) {
+        self.instruction_hint = Some(*instruction);
+    }
+
+    /// get a guess what the current instruction might be
+    pub fn get_instruction_hint(&self) -> Instruction {
+        self.instruction_hint.unwrap()
+    }
+
+    /// prints the injection info in parsable format
+    pub fn print_injection_info(
+        &self,
+        pc: &u32,
+        instruction: &Instruction,
+        injection_type: &str,
+        info: &String,
+    ) {
+        if self.trace_info_enabled {
+            println!(
+                "<fault>{{\
+                    \"step\":{}, \
+                    \"pc\":{}, \
+                    \"instruction\":\"{}\", \
+                    \"assembly\":\"{:?}\", \
+                    \"kind\":\"{}\",\
+                    \"info\":\"{}\"\
+                }}</fault>",
+                self.current_step,
+                pc,
+                instruction.opcode.mnemonic(),
+                instruction,
+                injection_type,
+                info,
+            );
+        }
+    }
+
+    /// checks if injections are enabled
+    pub fn is_injection_enabled(&self) -> bool {
+        self.injection_enabled
+    }
+
+    /// predicate to indicate if an injection should take place now
+    pub fn is_injection(
+        &self,
+        injection_type: &str,
+        pc: &u32,
+        _executor_mode: ExecutorMode
+    ) -> bool {
+        self.injection_enabled &&
+        self.injection_type == injection_type && (
+            (
+                self.instruction_override
+                && self.injection_history.contains_key(pc)
+            ) || (
+                self.current_step == self.injection_step
+            )
+        )
+    }
+
+    /// prints trace information on the current step
+    pub fn print_trace_info(
+        &self,
+        pc: &u32,
+        instruction: &Instruction,
+        executor_mode: ExecutorMode,
+        clk: u32,
+    ) {
+        // NOTE: decoded sp1 instructions have no instruction word
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(*pc)
+            && !fuzzer_utils::write_trace_record(
+                self.current_step,
+                *pc,
+                instruction.opcode.mnemonic(),
+                0,
+            )
+        {
+            println!(
+                "<trace>{{\
+                    \"step\":{}, \
+                    \"pc\":{}, \
+                    \"instruction\":\"{}\", \
+                    \"assembly\":\"{:?}\", \
+                    \"executor_mode\":\"{:?}\", \
+                    \"clk\": \"{}\"\
+                }}</trace>",
+                self.current_step,
+                pc,
+                instruction.opcode.mnemonic(),
+                instruction,
+                executor_mode,
+                clk,
+            );
+        }
+    }
+
+    /// randomly modify a given instruction
+    pub fn random_modify_instruction(&mut self, instruction: &Instruction) -> Instruction {
+        // TODO: modify with more control
+        // NOTE: an old version of rng is used so we might switch from gen -> random soon.
+
+        loop {
+            let new_op = if self.rng.gen::<bool>() {
+                match self.rng.gen_range(0..=35) {
+                    0 => Opcode::ADD,
+                    1 => Opcode::SUB,
+                    2 => Opcode::XOR,
+                    3 => Opcode::OR,
+                    4 => Opcode::AND,
+                    5 => Opcode::SLL,
+                    6 => Opcode::SRL,
+                    7 => Opcode::SRA,
+                    8 => Opcode::SLT,
+                    9 => Opcode::SLTU,
+                    10 => Opcode::MUL,
+                    11 => Opcode::MULH,
+                    12 => Opcode::MULHU,
+                    13 => Opcode::MULHSU,
+                    14 => Opcode::DIV,
+                    15 => Opcode::DIVU,
+                    16 => Opcode::REM,
+                    17 => Opcode::REMU,
+                    18 => Opcode::LB,
+                    19 => Opcode::LH,
+                    20 => Opcode::LW,
+                    21 => Opcode::LBU,
+                    22 => Opcode::LHU,
+                    23 => Opcode::SB,
+                    24 => Opcode::SH,
+                    25 => Opcode::SW,
+                    26 => Opcode::BEQ,
+                    27 => Opcode::BNE,
+                    28 => Opcode::BLT,
+                    29 => Opcode::BGE,
+                    30 => Opcode::BLTU,
+                    31 => Opcode::BGEU,
+                    32 => Opcode::JAL,
+                    33 => Opcode::JALR,
+                    34 => Opcode::AUIPC,
+                    35 => Opcode::ECALL,
+                    // 36 => Opcode::EBREAK,
+                    _  => unreachable!(),
+                }
+            } else {
+                instruction.opcode.clone()
+            };
+
+            let op_change_mask = self.rng.gen_range(0..=7) as u32;
+            let new_op_a = if op_change_mask & 1 == 1 {
+                self.rng.gen_range(0..=31)
+            } else {
+                instruction.op_a
+            };
+
+            let random_instruction = match self.rng.gen_range(0..=2) {
+                // reg, reg, reg
+                0 => {
+                    let new_op_b = if op_change_mask & 2 == 2 || instruction.imm_b {
+                        self.rng.gen_range(0..=31) as u32
+                    } else {
+                        instruction.op_b
+                    };
+                    let new_op_c = if op_change_mask & 4 == 4 || instruction.imm_c {
+                        self.rng.gen_range(0..=31) as u32
+                    } else {
+                        instruction.op_c
+                    };
+                    Instruction::new(
+                        new_op,
+                        new_op_a,
+                        new_op_b,
+                        new_op_c,
+                        false, /* imm b */
+                        false, /* imm c */
+                    )
+                },
+                // reg, reg, imm
+                1 => {
+                    let new_op_b = if op_change_mask & 2 == 2 || instruction.imm_b {
+                        self.rng.gen_range(0..=31) as u32
+                    } else {
+                        instruction.op_b
+                    };
+                    let new_op_c = if op_change_mask & 4 == 4 {
+                        self.rng.gen::<u32>()
+                    } else {
+                        instruction.op_c
+                    };
+                    Instruction::new(
+                        new_op,
+                        new_op_a,
+                        new_op_b,
+                        new_op_c,
+                        false, /* imm b */
+                        true, /* imm c */
+                    )
+                },
+                // reg, imm, imm
+                2 => {
+                    let new_op_b = if op_change_mask & 2 == 2 {
+                        self.rng.gen::<u32>()
+                    } else {
+                        instruction.op_b
+                    };
+                    let new_op_c = if op_change_mask & 4 == 4 {
+                        self.rng.gen::<u32>()
+                    } else {
+                        instruction.op_c
+                    };
+                    Instruction::new(
+                        new_op,
+                        new_op_a,
+                        new_op_b,
+                        new_op_c,
+                        true, /* imm b */
+                        true, /* imm c */
+                    )
+                },
+                _ => unreachable!(),
+            };
+
+            // NOTE: Instruction does not derive "PartialEq" so we use the fmt implementation
+            if format!("{:?}", instruction) != format!("{:?}", random_instruction) {
+                return random_instruction;
+            }
+        }
+    }
+
+    /// returns a cached or a new instruction based on the setting and the provided parameters
+    pub fn get_or_create_instruction(&mut self, instruction: &Instruction, pc: u32) -> Instruction {
+        if self.instruction_override {
+            if let Some(prev_instruction) = self.injection_history.get(&pc) {
+                return prev_instruction.clone();
+            }
+        }
+        let new_instruction = self.random_modify_instruction(instruction);
+        self.injection_history.insert(pc, new_instruction);
+        new_instruction
+    }
+
+    /// given a pc, this function returns a new pc within a
+    /// distance of 1 up to 1000 steps chosen at random.
+    pub fn random_pc(&mut self, pc: u32) -> u32 {
+        // determine amount of steps
+        let steps: u32 = match self.rng.gen_range(0..=2) {
+            0 => { 1 },
+            1 => { self.rng.gen_range(2..=10) },
+            2 => { self.rng.gen_range(11..=1000) },
+            _ => unreachable!(),
+        };
+
+        // determine direction
+        if self.rng.gen::<bool>() {
+            pc + (steps * 4_u32)
+        } else {
+            pc.saturating_sub(steps * 4_u32)
+        }
+    }
+
+    /// randomly modifies a given u32 pair
+    pub fn random_mod_of_u32_pair(&mut self, a: u32, b: u32) -> (u32, u32) {
+        let selector: u32 = self.rng.gen_range(0..=5);
+        match selector {
+            0 => (self.random_mod_of_u32(a), b),
+            1 => (a, self.random_mod_of_u32(b)),
+            2 => (self.random_mod_of_u32(a), self.random_mod_of_u32(b)),
+            3 => (b, a),
+            4 => (a, a),
+            5 => (b, b),
+            _ => unreachable!(),
+        }
+    }
+
+    /// returns a random number between 0 and 31 (riscv registers)
+    pub fn random_register(&mut self) -> Register {
+        Register::from_u8(self.rng.gen_range(0..=31) as u8)
+    }
+
+    /// randomly modifies a given value
+    pub fn random_mod_of_u32(&mut self, value: u32) -> u32 {
+        let mut new_value = value;
+        while new_value == value {
+            let selector: u32 = self.rng.gen_range(0..=7);
+            new_value = match selector {
+                0 => { 0 },
+                1 => { 1 },
+                2 => { 0xffffffff },
+                3 => { 0xfffffffe },
+                4 => {
+                    let n = self.rng.gen_range(1..=31);
+                    let bits_to_flip = rand::seq::index::sample(&mut self.rng, 31, n).into_vec();
+                    let mut flipped_value = value;
+                    for bit_to_flip in bits_to_flip {
+                        flipped_value ^= 1 << bit_to_flip;
+                    }
+                    flipped_value
+                },
+                5 => { value.saturating_add(1) },
+                6 => { value.saturating_sub(1) },
+                7 => { self.rng.gen::<u32>() },
+                _ => unreachable!(),
+            };
+        }
+        new_value
+    }
+
+    /// given a register pair this functions returns a random modification of it
+    pub fn random_register_pair_modification(
+        &mut self,
+        rs1: Register,
+        rs2: Register,
+    ) -> (Register, Register) {
+
+        let mut mod_rs1 = rs1;
+        let mut mod_rs2 = rs2;
+
+        while mod_rs1 == rs1 && mod_rs2 == rs2 {
+            let selector: u32 = self.rng.gen_range(0..=5);
+            (mod_rs1, mod_rs2) = match selector {
+                0 => { (rs2, rs1) },
+                1 => { (rs1, rs1) },
+                2 => { (rs2, rs2) },
+                3 => { (self.random_register(), self.random_register()) },
+                4 => { (self.random_register(), rs2) },
+                5 => { (rs1, self.random_register()) },
+                _ => unreachable!(),
+            }
+        }
+        (mod_rs1, mod_rs2)
+    }
+
+    /// given a register this functions returns a random modification of it
+    pub fn random_register_modification(&mut self, rs1: Register) -> Register {
+        let mut mod_rs1 = self.random_register();
+        while mod_rs1 == rs1 {
+            mod_rs1 = self.random_register();
+        }
+        mod_rs1
+    }
+
+    /// returns a random boolean
+    pub fn random_bool(&mut self) -> bool {
+        self.rng.gen::<bool>()
+    }
+
+    /// returns a random ecall
+    pub fn random_ecall(&mut self) -> u32 {
+        let selector: u32 = self.rng.gen_range(0..=38);
+        match selector {
+            0 => { 0x00_00_00_00 }, // HALT
+            1 => { 0x00_00_00_02 }, // WRITE
+            2 => { 0x00_00_00_03 }, // ENTER_UNCONSTRAINED
+            3 => { 0x00_00_00_04 }, // EXIT_UNCONSTRAINED
+            4 => { 0x00_30_01_05 }, // SHA_EXTEND
+            5 => { 0x00_01_01_06 }, // SHA_COMPRESS
+            6 => { 0x00_01_01_07 }, // ED_ADD
+            7 => { 0x00_00_01_08 }, // ED_DECOMPRESS
+            8 => { 0x00_01_01_09 }, // KECCAK_PERMUTE
+            9 => { 0x00_01_01_0A }, // SECP256K1_ADD
+            10 => { 0x00_00_01_0B }, // SECP256K1_DOUBLE
+            11 => { 0x00_00_01_0C }, // SECP256K1_DECOMPRESS
+            12 => { 0x00_01_01_2C }, // SECP256R1_ADD
+            13 => { 0x00_00_01_2D }, // SECP256R1_DOUBLE
+            14 => { 0x00_00_01_2E }, // SECP256R1_DECOMPRESS
+            15 => { 0x00_01_01_2F }, // U256XU2048_MUL
+            16 => { 0x00_01_01_0E }, // BN254_ADD
+            17 => { 0x00_00_01_0F }, // BN254_DOUBLE
+            18 => { 0x00_00_00_10 }, // COMMIT
+            19 => { 0x00_00_00_1A }, // COMMIT_DEFERRED_PROOFS
+            20 => { 0x00_00_00_1B }, // VERIFY_SP1_PROOF
+            21 => { 0x00_00_00_F0 }, // HINT_LEN
+            22 => { 0x00_00_00_F1 }, // HINT_READ
+            23 => { 0x00_00_01_1C }, // BLS12381_DECOMPRESS
+            24 => { 0x00_01_01_1D }, // UINT256_MUL
+            25 => { 0x00_01_01_1E }, // BLS12381_ADD
+            26 => { 0x00_00_01_1F }, // BLS12381_DOUBLE
+            27 => { 0x00_01_01_20 }, // BLS12381_FP_ADD
+            28 => { 0x00_01_01_21 }, // BLS12381_FP_SUB
+            29 => { 0x00_01_01_22 }, // BLS12381_FP_MUL
+            30 => { 0x00_01_01_23 }, // BLS12381_FP2_ADD
+            31 => { 0x00_01_01_24 }, // BLS12381_FP2_SUB
+            32 => { 0x00_01_01_25 }, // BLS12381_FP2_MUL
+            33 => { 0x00_01_01_26 }, // BN254_FP_ADD
+            34 => { 0x00_01_01_27 }, // BN254_FP_SUB
+            35 => { 0x00_01_01_28 }, // BN254_FP_MUL
+            36 => { 0x00_01_01_29 }, // BN254_FP2_ADD
+            37 => { 0x00_01_01_2A }, // BN254_FP2_SUB
+            38 => { 0x00_01_01_2B }, // BN254_FP2_MUL
+            _ => unreachable!(),
+        }
+    }
+
+    /// returns a random ecall
+    pub fn random_mod_ecall(&mut self, old_ecall: u32) -> u32 {
+        let mut new_ecall: u32 = old_ecall;
+        while new_ecall == old_ecall {
+            new_ecall = self.random_ecall();
+        }
+        new_ecall
+    }
+}
+
+/// Default implementation for `RV32IMFaultInjectionContext`
+impl Default for RV32IMFaultInjectionContext {
+    fn default() -> Self {
+        Self::new(
+            fuzzer_utils::is_trace_logging(),
+            fuzzer_utils::is_injection(),
+            fuzzer_utils::is_instruction_override(),
+            fuzzer_utils::get_injection_step(),
+            fuzzer_utils::get_injection_kind(),
+            fuzzer_utils::get_seed(),
+        )
+    }
+}
+
+// <-----------------------  END OF FAULT INJECTION  ----------------------->
+
+
+/// The default increment for the program counter.  Is used for all instructions except
+/// for branches and jumps.
+pub const DEFAULT_PC_INC: u32 = 4;
+/// This is used in the `InstrEvent` to indicate that the instruction is not from the CPU.
+/// A valid pc should be divisible by 4, so we use 1 to indicate that the pc is not used.
+pub const UNUSED_PC: u32 = 1;
+
+/// The maximum number of instructions in a program.
+pub const MAX_PROGRAM_SIZE: usize = 1 << 22;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+/// Whether to verify deferred proofs during execution.
+pub enum DeferredProofVerification {
+    /// Verify deferred proofs during execution.
+    Enabled,
+    /// Skip verification of deferred proofs
+    Disabled,
+}
+
+impl From<bool> for DeferredProofVerification {
+    fn from(value: bool) -> Self {
+        if value {
+            DeferredProofVerification::Enabled
+        } else {
+            DeferredProofVerification::Disabled
+        }
+    }
+}
+
+/// An executor for the SP1 RISC-V zkVM.
+///
+/// The exeuctor is responsible for executing a user program and tracing important events which
+/// occur during execution (i.e., memory reads, alu operations, etc).
+pub struct Executor<'a> {
+    /// The program.
+    pub program: Arc<Program>,
+
+    /// The state of the execution.
+    pub state: ExecutionState,
+
+    /// Memory addresses that were touched in this batch of shards. Used to minimize the size of
+    /// checkpoints.
+    pub memory_checkpoint: Memory<Option<MemoryRecord>>,
+
+    /// Memory addresses that were initialized in this batch of shards. Used to minimize the size
+    /// of checkpoints. The value stored is whether or not it had a value at the beginning of
+    /// the batch.
+    pub uninitialized_memory_checkpoint: Memory<bool>,
+
+    /// Report of the program execution.
+    pub report: ExecutionReport,
+
+    /// The mode the executor is running in.
+    pub executor_mode: ExecutorMode,
+
+    /// The memory accesses for the current cycle.
+    pub memory_accesses: MemoryAccessRecord,
+
+    /// Whether the runtime is in constrained mode or not.
+    ///
+    /// In unconstrained mode, any events, clock, register, or memory changes are reset after
+    /// leaving the unconstrained block. The only thing preserved is writes to the input
+    /// stream.
+    pub unconstrained: bool,
+
+    /// Whether we should write to the report.
+    pub print_report: bool,
+
+    /// Data used to estimate total trace area.
+    pub record_estimator: Option<Box<RecordEstimator>>,
+
+    /// Whether we should emit global memory init and finalize events. This can be enabled in
+    /// Checkpoint mode and disabled in Trace mode.
+    pub emit_global_memory_events: bool,
+
+    /// The maximum size of each shard.
+    pub shard_size: u32,
+
+    /// The maximum number of shards to execute at once.
+    pub shard_batch_size: u32,
+
+    /// The maximum number of cycles for a syscall.
+    pub max_syscall_cycles: u32,
+
+    /// The mapping between syscall codes and their implementations.
+    pub syscall_map: HashMap<SyscallCode, Arc<dyn Syscall>>,
+
+    /// The options for the runtime.
+    pub opts: SP1CoreOpts,
+
+    /// The maximum number of cpu cycles to use for execution.
+    pub max_cycles: Option<u64>,
+
+    /// The current trace of the execution that is being collected.
+    pub record: Box<ExecutionRecord>,
+
+    /// The collected records, split by cpu cycles.
+    pub records: Vec<Box<ExecutionRecord>>,
+
+    /// Local memory access events.
+    pub local_memory_access: HashMap<u32, MemoryLocalEvent>,
+
+    /// A counter for the number of cycles that have been executed in certain functions.
+    pub cycle_tracker: HashMap<String, (u64, u32)>,
+
+    /// A buffer for stdout and stderr IO.
+    pub io_buf: HashMap<u32, String>,
+
+    /// The ZKVM program profiler.
+    ///
+    /// Keeps track of the number of cycles spent in each function.
+    #[cfg(feature = "profiling")]
+    pub profiler: Option<(Profiler, BufWriter<File>)>,
+
+    /// The state of the runtime when in unconstrained mode.
+    pub unconstrained_state: Box<ForkState>,
+
+    /// Statistics for event counts.
+    pub local_counts: LocalCounts,
+
+    /// Verifier used to sanity check `verify_sp1_proof` during runtime.
+    pub subproof_verifier: Option<&'a dyn SubproofVerifier>,
+
+    /// Registry of hooks, to be invoked by writing to certain file descriptors.
+    pub hook_registry: HookRegistry<'a>,
+
+    /// The maximal shapes for the program.
+    pub maximal_shapes: Option<MaximalShapes>,
+
+    /// The costs of the program.
+    pub costs: HashMap<RiscvAirId, u64>,
+
+    /// Skip deferred proof verification. This check is informational only, not related to circuit
+    /// correctness.
+    pub deferred_proof_verification: DeferredProofVerification,
+
+    /// The frequency to check the stopping condition.
+    pub shape_check_frequency: u64,
+
+    /// Early exit if the estimate LDE size is too big.
+    pub lde_size_check: bool,
+
+    /// The maximum LDE size to allow.
+    pub lde_size_threshold: u64,
+
+    /// The options for the IO.
+    pub io_options: IoOptions<'a>,
+
+    /// Temporary event counts for the current shard. This is a field to reuse memory.
+    event_counts: EnumMap<RiscvAirId, u64>,
+
+
+    // <----------------------- START OF FAULT INJECTION ----------------------->
+
+    /// context for fault injection
+    pub fault_injection_context: RV32IMFaultInjectionContext,
+
+    // <------------------------ END OF FAULT INJECTION ------------------------>
+}
+
+/// The different modes the executor can run in.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize, ValueEnum)]
+pub enum ExecutorMode {
+    /// Run the execution with no tracing or checkpointing.
+    Simple,
+    /// Run the execution with checkpoints for memory.
+    Checkpoint,
+    /// Run the execution with full tracing of events.
+    Trace,
+    /// Run the execution with full tracing of events and size bounds for shape collection.
+    ShapeCollection,
+}
+
+/// Information about event counts which are relevant for shape fixing.
+#[derive(Debug, Default, Clone, PartialEq, Eq)]
+pub struct LocalCounts {
+    /// The event counts.
+    pub event_counts: Box<EnumMap<Opcode, u64>>,
+    /// The number of syscalls sent globally in the current shard.
+    pub syscalls_sent: usize,
+    /// The number of addresses touched in this shard.
+    pub local_mem: usize,
+}
+
+/// Errors that the [``Executor``] can throw.
+#[derive(Error, Debug, Serialize, Deserialize, PartialEq, Eq)]
+pub enum ExecutionError {
+    /// The execution failed with a non-zero exit code.
+    #[error("execution failed with exit code {0}")]
+    HaltWithNonZeroExitCode(u32),
+
+    /// The execution failed with an invalid memory access.
+    #[error("invalid memory access for opcode {0} and address {1}")]
+    InvalidMemoryAccess(Opcode, u32),
+
+    /// The execution failed with an unimplemented syscall.
+    #[error("unimplemented syscall {0}")]
+    UnsupportedSyscall(u32),
+
+    /// The execution failed with a breakpoint.
+    #[error("breakpoint encountered")]
+    Breakpoint(),
+
+    /// The execution failed with an exceeded cycle limit.
+    #[error("exceeded cycle limit of {0}")]
+    ExceededCycleLimit(u64),
+
+    /// The execution failed because the syscall was called in unconstrained mode.
+    #[error("syscall called in unconstrained mode")]
+    InvalidSyscallUsage(u64),
+
+    /// The execution failed with an unimplemented feature.
+    #[error("got unimplemented as opcode")]
+    Unimplemented(),
+
+    /// The program ended in unconstrained mode.
+    #[error("program ended in unconstrained mode")]
+    EndInUnconstrained(),
+
+    /// The unconstrained cycle limit was exceeded.
+    #[error("unconstrained cycle limit exceeded")]
+    UnconstrainedCycleLimitExceeded(u64),
+}
+
+impl<'a> Executor<'a> {
+    /// Create a new [``Executor``] from a program and options.
+    #[must_use]
+    pub fn new(program: Program, opts: SP1CoreOpts) -> Self {
+        Self::with_context(program, opts, SP1Context::default())
+    }
+
+    /// WARNING: This function's API is subject to change without a major version bump.
+    ///
+    /// If the feature `"profiling"` is enabled, this sets up the profiler. Otherwise, it does
+    /// nothing. The argument `elf_bytes` must describe the same program as `self.program`.
+    ///
+    /// The profiler is configured by the following environment variables:
+    ///
+    /// - `TRACE_FILE`: writes Gecko traces to this path. If unspecified, the profiler is disabled.
+    /// - `TRACE_SAMPLE_RATE`: The period between clock cycles where samples are taken. Defaults to
+    ///   1.
+    #[inline]
+    #[allow(unused_variables)]
+    pub fn maybe_setup_profiler(&mut self, elf_bytes: &[u8]) {
+        #[cfg(feature = "profiling")]
+        {
+            let trace_buf = std::env::var("TRACE_FILE").ok().map(|file| {
+                let file = File::create(file).unwrap();
+                BufWriter::new(file)
+            });
+
+            if let Some(trace_buf) = trace_buf {
+                eprintln!("Profiling enabled");
+
+                let sample_rate = std::env::var("TRACE_SAMPLE_RATE")
+                    .ok()
+                    .and_then(|rate| {
+                        eprintln!("Profiling sample rate: {rate}");
+                        rate.parse::<u32>().ok()
+                    })
+                    .unwrap_or(1);
+
+                self.profiler = Some((
+                    Profiler::new(elf_bytes, sample_rate as u64)
+                        .expect("Failed to create profiler"),
+                    trace_buf,
+                ));
+            }
+        }
+    }
+
+    /// Create a new runtime from a program, options, and a context.
+    #[must_use]
+    pub fn with_context(program: Program, opts: SP1CoreOpts, context: SP1Context<'a>) -> Self {
+        // Create a shared reference to the program.
+        let program = Arc::new(program);
+
+        // Create a default record with the program.
+        let record = ExecutionRecord::new(program.clone());
+
+        // Determine the maximum number of cycles for any syscall.
+        let syscall_map = default_syscall_map();
+        let max_syscall_cycles =
+            syscall_map.values().map(|syscall| syscall.num_extra_cycles()).max().unwrap_or(0);
+
+        let hook_registry = context.hook_registry.unwrap_or_default();
+
+        let costs: HashMap<String, usize> =
+            serde_json::from_str(include_str!("./artifacts/rv32im_costs.json")).unwrap();
+        let costs: HashMap<RiscvAirId, usize> =
+            costs.into_iter().map(|(k, v)| (RiscvAirId::from_str(&k).unwrap(), v)).collect();
+
+        Self {
+            record: Box::new(record),
+            records: vec![],
+            state: ExecutionState::new(program.pc_start),
+            program,
+            memory_accesses: MemoryAccessRecord::default(),
+            shard_size: (opts.shard_size as u32) * 4,
+            shard_batch_size: opts.shard_batch_size as u32,
+            cycle_tracker: HashMap::new(),
+            io_buf: HashMap::new(),
+            #[cfg(feature = "profiling")]
+            profiler: None,
+            unconstrained: false,
+            unconstrained_state: Box::new(ForkState::default()),
+            syscall_map,
+            executor_mode: ExecutorMode::Trace,
+            emit_global_memory_events: true,
+            max_syscall_cycles,
+            report: ExecutionReport::default(),
+            local_counts: LocalCounts::default(),
+            print_report: false,
+            record_estimator: None,
+            subproof_verifier: context.subproof_verifier,
+            hook_registry,
+            opts,
+            max_cycles: context.max_cycles,
+            deferred_proof_verification: context.deferred_proof_verification.into(),
+            memory_checkpoint: Memory::default(),
+            uninitialized_memory_checkpoint: Memory::default(),
+            local_memory_access: HashMap::new(),
+            maximal_shapes: None,
+            costs: costs.into_iter().map(|(k, v)| (k, v as u64)).collect(),
+            shape_check_frequency: 16,
+            lde_size_check: false,
+            lde_size_threshold: 0,
+            event_counts: EnumMap::default(),
+            io_options: context.io_options,
+
+            // <----------------------- START OF FAULT INJECTION ----------------------->
+
+            fault_injection_context: RV32IMFaultInjectionContext::default(),
+
+            // <------------------------ END OF FAULT INJECTION ------------------------>
+        }
+    }
+
+    /// Invokes a hook with the given file descriptor `fd` with the data `buf`.
+    ///
+    /// # Errors
+    ///
+    /// If the file descriptor is not found in the [``HookRegistry``], this function will return an
+    /// error.
+    pub fn hook(&self, fd: u32, buf: &[u8]) -> eyre::Result<Vec<Vec<u8>>> {
+        Ok(self
+            .hook_registry
+            .get(fd)
+            .ok_or(eyre::eyre!("no hook found for file descriptor {}", fd))?
+            .invoke_hook(self.hook_env(), buf))
+    }
+
+    /// Prepare a `HookEnv` for use by hooks.
+    #[must_use]
+    pub fn hook_env<'b>(&'b self) -> HookEnv<'b, 'a> {
+        HookEnv { runtime: self }
+    }
+
+    /// Recover runtime state from a program and existing execution state.
+    #[must_use]
+    pub fn recover(program: Program, state: ExecutionState, opts: SP1CoreOpts) -> Self {
+        let mut runtime = Self::new(program, opts);
+        runtime.state = state;
+        // Disable deferred proof verification since we're recovering from a checkpoint, and the
+        // checkpoint creator already had a chance to check the proofs.
+        runtime.deferred_proof_verification = DeferredProofVerification::Disabled;
+        runtime
+    }
+
+    /// Get the current values of the registers.
+    #[allow(clippy::single_match_else)]
+    #[must_use]
+    pub fn registers(&mut self) -> [u32; 32] {
+        let mut registers = [0; 32];
+        for i in 0..32 {
+            let record = self.state.memory.registers.get(i);
+
+            // Only add the previous memory state to checkpoint map if we're in checkpoint mode,
+            // or if we're in unconstrained mode. In unconstrained mode, the mode is always
+            // Simple.
+            if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+                match record {
+                    Some(record) => {
+                        self.memory_checkpoint.registers.entry(i).or_insert_with(|| Some(*record));
+                    }
+                    None => {
+                        self.memory_checkpoint.registers.entry(i).or_insert(None);
+                    }
+                }
+            }
+
+            registers[i as usize] = match record {
+                Some(record) => record.value,
+                None => 0,
+            };
+        }
+        registers
+    }
+
+    /// Get the current value of a register.
+    #[must_use]
+    pub fn register(&mut self, register: Register) -> u32 {
+        let addr = register as u32;
+        let record = self.state.memory.registers.get(addr);
+
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match record {
+                Some(record) => {
+                    self.memory_checkpoint.registers.entry(addr).or_insert_with(|| Some(*record));
+                }
+                None => {
+                    self.memory_checkpoint.registers.entry(addr).or_insert(None);
+                }
+            }
+        }
+        match record {
+            Some(record) => record.value,
+            None => 0,
+        }
+    }
+
+    /// Get the current value of a word.
+    ///
+    /// Assumes `addr` is a valid memory address, not a register.
+    #[must_use]
+    pub fn word(&mut self, addr: u32) -> u32 {
+        #[allow(clippy::single_match_else)]
+        let record = self.state.memory.page_table.get(addr);
+
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match record {
+                Some(record) => {
+                    self.memory_checkpoint.page_table.entry(addr).or_insert_with(|| Some(*record));
+                }
+                None => {
+                    self.memory_checkpoint.page_table.entry(addr).or_insert(None);
+                }
+            }
+        }
+
+        match record {
+            Some(record) => record.value,
+            None => 0,
+        }
+    }
+
+    /// Get the current value of a byte.
+    ///
+    /// Assumes `addr` is a valid memory address, not a register.
+    #[must_use]
+    pub fn byte(&mut self, addr: u32) -> u8 {
+        let word = self.word(addr - addr % 4);
+        (word >> ((addr % 4) * 8)) as u8
+    }
+
+    /// Get the current timestamp for a given memory access position.
+    #[must_use]
+    pub const fn timestamp(&self, position: &MemoryAccessPosition) -> u32 {
+        self.state.clk + *position as u32
+    }
+
+    /// Get the current shard.
+    #[must_use]
+    #[inline]
+    pub fn shard(&self) -> u32 {
+        self.state.current_shard
+    }
+
+    /// Read a word from memory and create an access record.
+    pub fn mr(
+        &mut self,
+        addr: u32,
+        shard: u32,
+        timestamp: u32,
+        local_memory_access: Option<&mut HashMap<u32, MemoryLocalEvent>>,
+    ) -> MemoryReadRecord {
+        // Check that the memory address is within the babybear field and not within the registers'
+        // address space.  Also check that the address is aligned.
+
+        if
+            (addr % 4 != 0 || addr <= Register::X31 as u32 || addr >= BABYBEAR_PRIME) &&
+            !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */
+        {
+            panic!("Invalid memory access: addr={addr}");
+        }
+
+        // Get the memory record entry.
+        let entry = self.state.memory.page_table.entry(addr);
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match entry {
+                Entry::Occupied(ref entry) => {
+                    let record = entry.get();
+                    self.memory_checkpoint.page_table.entry(addr).or_insert_with(|| Some(*record));
+                }
+                Entry::Vacant(_) => {
+                    self.memory_checkpoint.page_table.entry(addr).or_insert(None);
+                }
+            }
+        }
+
+        // If we're in unconstrained mode, we don't want to modify state, so we'll save the
+        // original state if it's the first time modifying it.
+        if self.unconstrained {
+            let record = match entry {
+                Entry::Occupied(ref entry) => Some(entry.get()),
+                Entry::Vacant(_) => None,
+            };
+            self.unconstrained_state.memory_diff.entry(addr).or_insert(record.copied());
+        }
+
+        // If it's the first time accessing this address, initialize previous values.
+        let record: &mut MemoryRecord = match entry {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                // If addr has a specific value to be initialized with, use that, otherwise 0.
+                let value = self.state.uninitialized_memory.page_table.get(addr).unwrap_or(&0);
+                self.uninitialized_memory_checkpoint
+                    .page_table
+                    .entry(addr)
+                    .or_insert_with(|| *value != 0);
+                entry.insert(MemoryRecord { value: *value, shard: 0, timestamp: 0 })
+            }
+        };
+
+        // We update the local memory counter in two cases:
+        //  1. This is the first time the address is touched, this corresponds to the condition
+        //     record.shard != shard.
+        //  2. The address is being accessed in a syscall. In this case, we need to send it. We use
+        //     local_memory_access to detect this. *WARNING*: This means that we are counting on the
+        //     .is_some() condition to be true only in the SyscallContext.
+        if !self.unconstrained && (record.shard != shard || local_memory_access.is_some()) {
+            self.local_counts.local_mem += 1;
+        }
+
+        if !self.unconstrained {
+            if let Some(estimator) = &mut self.record_estimator {
+                if record.shard != shard {
+                    estimator.current_local_mem += 1;
+                }
+                let current_touched_compressed_addresses = if local_memory_access.is_some() {
+                    &mut estimator.current_precompile_touched_compressed_addresses
+                } else {
+                    &mut estimator.current_touched_compressed_addresses
+                };
+                current_touched_compressed_addresses.insert(addr >> 2);
+            }
+        }
+
+        let prev_record = *record;
+        record.shard = shard;
+        record.timestamp = timestamp;
+
+        if !self.unconstrained && self.executor_mode == ExecutorMode::Trace {
+            let local_memory_access = if let Some(local_memory_access) = local_memory_access {
+                local_memory_access
+            } else {
+                &mut self.local_memory_access
+            };
+
+            local_memory_access
+                .entry(addr)
+                .and_modify(|e| {
+                    e.final_mem_access = *record;
+                })
+                .or_insert(MemoryLocalEvent {
+                    addr,
+                    initial_mem_access: prev_record,
+                    final_mem_access: *record,
+                });
+        }
+
+        // Construct the memory read record.
+        MemoryReadRecord::new(
+            record.value,
+            record.shard,
+            record.timestamp,
+            prev_record.shard,
+            prev_record.timestamp,
+        )
+    }
+
+    /// Read a register and return its value.
+    ///
+    /// Assumes that the executor mode IS NOT [`ExecutorMode::Trace`]
+    pub fn rr(&mut self, register: Register, shard: u32, timestamp: u32) -> u32 {
+        // Get the memory record entry.
+        let addr = register as u32;
+        let entry = self.state.memory.registers.entry(addr);
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match entry {
+                Entry::Occupied(ref entry) => {
+                    let record = entry.get();
+                    self.memory_checkpoint.registers.entry(addr).or_insert_with(|| Some(*record));
+                }
+                Entry::Vacant(_) => {
+                    self.memory_checkpoint.registers.entry(addr).or_insert(None);
+                }
+            }
+        }
+
+        // If we're in unconstrained mode, we don't want to modify state, so we'll save the
+        // original state if it's the first time modifying it.
+        if self.unconstrained {
+            let record = match entry {
+                Entry::Occupied(ref entry) => Some(entry.get()),
+                Entry::Vacant(_) => None,
+            };
+            self.unconstrained_state.memory_diff.entry(addr).or_insert(record.copied());
+        }
+
+        // If it's the first time accessing this address, initialize previous values.
+        let record: &mut MemoryRecord = match entry {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                // If addr has a specific value to be initialized with, use that, otherwise 0.
+                let value = self.state.uninitialized_memory.registers.get(addr).unwrap_or(&0);
+                self.uninitialized_memory_checkpoint
+                    .registers
+                    .entry(addr)
+                    .or_insert_with(|| *value != 0);
+                entry.insert(MemoryRecord { value: *value, shard: 0, timestamp: 0 })
+            }
+        };
+
+        record.shard = shard;
+        record.timestamp = timestamp;
+        record.value
+    }
+
+    /// Read a register and create an access record.
+    ///
+    /// Assumes that self.mode IS [`ExecutorMode::Trace`].
+    pub fn rr_traced(
+        &mut self,
+        register: Register,
+        shard: u32,
+        timestamp: u32,
+        local_memory_access: Option<&mut HashMap<u32, MemoryLocalEvent>>,
+    ) -> MemoryReadRecord {
+        // Get the memory record entry.
+        let addr = register as u32;
+        let entry = self.state.memory.registers.entry(addr);
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match entry {
+                Entry::Occupied(ref entry) => {
+                    let record = entry.get();
+                    self.memory_checkpoint.registers.entry(addr).or_insert_with(|| Some(*record));
+                }
+                Entry::Vacant(_) => {
+                    self.memory_checkpoint.registers.entry(addr).or_insert(None);
+                }
+            }
+        }
+        // If we're in unconstrained mode, we don't want to modify state, so we'll save the
+        // original state if it's the first time modifying it.
+        if self.unconstrained {
+            let record = match entry {
+                Entry::Occupied(ref entry) => Some(entry.get()),
+                Entry::Vacant(_) => None,
+            };
+            self.unconstrained_state.memory_diff.entry(addr).or_insert(record.copied());
+        }
+        // If it's the first time accessing this address, initialize previous values.
+        let record: &mut MemoryRecord = match entry {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                // If addr has a specific value to be initialized with, use that, otherwise 0.
+                let value = self.state.uninitialized_memory.registers.get(addr).unwrap_or(&0);
+                self.uninitialized_memory_checkpoint
+                    .registers
+                    .entry(addr)
+                    .or_insert_with(|| *value != 0);
+                entry.insert(MemoryRecord { value: *value, shard: 0, timestamp: 0 })
+            }
+        };
+        let prev_record = *record;
+        record.shard = shard;
+        record.timestamp = timestamp;
+        if !self.unconstrained && self.executor_mode == ExecutorMode::Trace {
+            let local_memory_access = if let Some(local_memory_access) = local_memory_access {
+                local_memory_access
+            } else {
+                &mut self.local_memory_access
+            };
+            local_memory_access
+                .entry(addr)
+                .and_modify(|e| {
+                    e.final_mem_access = *record;
+                })
+                .or_insert(MemoryLocalEvent {
+                    addr,
+                    initial_mem_access: prev_record,
+                    final_mem_access: *record,
+                });
+        }
+        // Construct the memory read record.
+        MemoryReadRecord::new(
+            record.value,
+            record.shard,
+            record.timestamp,
+            prev_record.shard,
+            prev_record.timestamp,
+        )
+    }
+    /// Write a word to memory and create an access record.
+    pub fn mw(
+        &mut self,
+        addr: u32,
+        value: u32,
+        shard: u32,
+        timestamp: u32,
+        local_memory_access: Option<&mut HashMap<u32, MemoryLocalEvent>>,
+    ) -> MemoryWriteRecord {
+        // Check that the memory address is within the babybear field and not within the registers'
+        // address space.  Also check that the address is aligned.
+
+        if
+            (addr % 4 != 0 || addr <= Register::X31 as u32 || addr >= BABYBEAR_PRIME) &&
+            !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */
+        {
+            panic!("Invalid memory access: addr={addr}");
+        }
+
+        // Get the memory record entry.
+        let entry = self.state.memory.page_table.entry(addr);
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match entry {
+                Entry::Occupied(ref entry) => {
+                    let record = entry.get();
+                    self.memory_checkpoint.page_table.entry(addr).or_insert_with(|| Some(*record));
+                }
+                Entry::Vacant(_) => {
+                    self.memory_checkpoint.page_table.entry(addr).or_insert(None);
+                }
+            }
+        }
+        // If we're in unconstrained mode, we don't want to modify state, so we'll save the
+        // original state if it's the first time modifying it.
+        if self.unconstrained {
+            let record = match entry {
+                Entry::Occupied(ref entry) => Some(entry.get()),
+                Entry::Vacant(_) => None,
+            };
+            self.unconstrained_state.memory_diff.entry(addr).or_insert(record.copied());
+        }
+        // If it's the first time accessing this address, initialize previous values.
+        let record: &mut MemoryRecord = match entry {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                // If addr has a specific value to be initialized with, use that, otherwise 0.
+                let value = self.state.uninitialized_memory.page_table.get(addr).unwrap_or(&0);
+                self.uninitialized_memory_checkpoint
+                    .page_table
+                    .entry(addr)
+                    .or_insert_with(|| *value != 0);
+
+                entry.insert(MemoryRecord { value: *value, shard: 0, timestamp: 0 })
+            }
+        };
+
+        // We update the local memory counter in two cases:
+        //  1. This is the first time the address is touched, this corresponds to the condition
+        //     record.shard != shard.
+        //  2. The address is being accessed in a syscall. In this case, we need to send it. We use
+        //     local_memory_access to detect this. *WARNING*: This means that we are counting on the
+        //     .is_some() condition to be true only in the SyscallContext.
+        if !self.unconstrained && (record.shard != shard || local_memory_access.is_some()) {
+            self.local_counts.local_mem += 1;
+        }
+
+        if !self.unconstrained {
+            if let Some(estimator) = &mut self.record_estimator {
+                if record.shard != shard {
+                    estimator.current_local_mem += 1;
+                }
+                let current_touched_compressed_addresses = if local_memory_access.is_some() {
+                    &mut estimator.current_precompile_touched_compressed_addresses
+                } else {
+                    &mut estimator.current_touched_compressed_addresses
+                };
+                current_touched_compressed_addresses.insert(addr >> 2);
+            }
+        }
+
+        let prev_record = *record;
+        record.value = value;
+        record.shard = shard;
+        record.timestamp = timestamp;
+        if !self.unconstrained && self.executor_mode == ExecutorMode::Trace {
+            let local_memory_access = if let Some(local_memory_access) = local_memory_access {
+                local_memory_access
+            } else {
+                &mut self.local_memory_access
+            };
+
+            local_memory_access
+                .entry(addr)
+                .and_modify(|e| {
+                    e.final_mem_access = *record;
+                })
+                .or_insert(MemoryLocalEvent {
+                    addr,
+                    initial_mem_access: prev_record,
+                    final_mem_access: *record,
+                });
+        }
+
+        // Construct the memory write record.
+        MemoryWriteRecord::new(
+            record.value,
+            record.shard,
+            record.timestamp,
+            prev_record.value,
+            prev_record.shard,
+            prev_record.timestamp,
+        )
+    }
+
+    /// Write a word to a register and create an access record.
+    ///
+    /// Assumes that self.mode IS [`ExecutorMode::Trace`].
+    pub fn rw_traced(
+        &mut self,
+        register: Register,
+        value: u32,
+        shard: u32,
+        timestamp: u32,
+        local_memory_access: Option<&mut HashMap<u32, MemoryLocalEvent>>,
+    ) -> MemoryWriteRecord {
+        let addr = register as u32;
+
+        // Get the memory record entry.
+        let entry = self.state.memory.registers.entry(addr);
+        if self.unconstrained {
+            match entry {
+                Entry::Occupied(ref entry) => {
+                    let record = entry.get();
+                    self.memory_checkpoint.registers.entry(addr).or_insert_with(|| Some(*record));
+                }
+                Entry::Vacant(_) => {
+                    self.memory_checkpoint.registers.entry(addr).or_insert(None);
+                }
+            }
+        }
+
+        // If we're in unconstrained mode, we don't want to modify state, so we'll save the
+        // original state if it's the first time modifying it.
+        if self.unconstrained {
+            let record = match entry {
+                Entry::Occupied(ref entry) => Some(entry.get()),
+                Entry::Vacant(_) => None,
+            };
+            self.unconstrained_state.memory_diff.entry(addr).or_insert(record.copied());
+        }
+
+        // If it's the first time accessing this register, initialize previous values.
+        let record: &mut MemoryRecord = match entry {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                // If addr has a specific value to be initialized with, use that, otherwise 0.
+                let value = self.state.uninitialized_memory.registers.get(addr).unwrap_or(&0);
+                self.uninitialized_memory_checkpoint
+                    .registers
+                    .entry(addr)
+                    .or_insert_with(|| *value != 0);
+
+                entry.insert(MemoryRecord { value: *value, shard: 0, timestamp: 0 })
+            }
+        };
+
+        let prev_record = *record;
+        record.value = value;
+        record.shard = shard;
+        record.timestamp = timestamp;
+
+        if !self.unconstrained {
+            let local_memory_access = if let Some(local_memory_access) = local_memory_access {
+                local_memory_access
+            } else {
+                &mut self.local_memory_access
+            };
+
+            local_memory_access
+                .entry(addr)
+                .and_modify(|e| {
+                    e.final_mem_access = *record;
+                })
+                .or_insert(MemoryLocalEvent {
+                    addr,
+                    initial_mem_access: prev_record,
+                    final_mem_access: *record,
+                });
+        }
+
+        // Construct the memory write record.
+        MemoryWriteRecord::new(
+            record.value,
+            record.shard,
+            record.timestamp,
+            prev_record.value,
+            prev_record.shard,
+            prev_record.timestamp,
+        )
+    }
+
+    /// Write a word to a register and create an access record.
+    ///
+    /// Assumes that the executor mode IS NOT [`ExecutorMode::Trace`].
+    #[inline]
+    pub fn rw(&mut self, register: Register, value: u32, shard: u32, timestamp: u32) {
+        let addr = register as u32;
+        // Get the memory record entry.
+        let entry = self.state.memory.registers.entry(addr);
+        if self.executor_mode == ExecutorMode::Checkpoint || self.unconstrained {
+            match entry {
+                Entry::Occupied(ref entry) => {
+                    let record = entry.get();
+                    self.memory_checkpoint.registers.entry(addr).or_insert_with(|| Some(*record));
+                }
+                Entry::Vacant(_) => {
+                    self.memory_checkpoint.registers.entry(addr).or_insert(None);
+                }
+            }
+        }
+
+        // If we're in unconstrained mode, we don't want to modify state, so we'll save the
+        // original state if it's the first time modifying it.
+        if self.unconstrained {
+            let record = match entry {
+                Entry::Occupied(ref entry) => Some(entry.get()),
+                Entry::Vacant(_) => None,
+            };
+            self.unconstrained_state.memory_diff.entry(addr).or_insert(record.copied());
+        }
+
+        // If it's the first time accessing this register, initialize previous values.
+        let record: &mut MemoryRecord = match entry {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                // If addr has a specific value to be initialized with, use that, otherwise 0.
+                let value = self.state.uninitialized_memory.registers.get(addr).unwrap_or(&0);
+                self.uninitialized_memory_checkpoint
+                    .registers
+                    .entry(addr)
+                    .or_insert_with(|| *value != 0);
+
+                entry.insert(MemoryRecord { value: *value, shard: 0, timestamp: 0 })
+            }
+        };
+
+        record.value = value;
+        record.shard = shard;
+        record.timestamp = timestamp;
+    }
+
+    /// Read from memory, assuming that all addresses are aligned.
+    #[inline]
+    pub fn mr_cpu(&mut self, addr: u32) -> u32 {
+        // Read the address from memory and create a memory read record.
+        let record =
+            self.mr(addr, self.shard(), self.timestamp(&MemoryAccessPosition::Memory), None);
+        // If we're not in unconstrained mode, record the access for the current cycle.
+        if self.executor_mode == ExecutorMode::Trace {
+            self.memory_accesses.memory = Some(record.into());
+        }
+        record.value
+    }
+
+    /// Read a register.
+    #[inline]
+    pub fn rr_cpu(&mut self, register: Register, position: MemoryAccessPosition) -> u32 {
+        // Read the address from memory and create a memory read record if in trace mode.
+        if self.executor_mode == ExecutorMode::Trace {
+            let record = self.rr_traced(register, self.shard(), self.timestamp(&position), None);
+            if !self.unconstrained {
+                match position {
+                    MemoryAccessPosition::A => self.memory_accesses.a = Some(record.into()),
+                    MemoryAccessPosition::B => self.memory_accesses.b = Some(record.into()),
+                    MemoryAccessPosition::C => self.memory_accesses.c = Some(record.into()),
+                    MemoryAccessPosition::Memory => {
+                        self.memory_accesses.memory = Some(record.into());
+                    }
+                }
+            }
+            record.value
+        } else {
+            self.rr(register, self.shard(), self.timestamp(&position))
+        }
+    }
+
+    /// Write to memory.
+    ///
+    /// # Panics
+    ///
+    /// This function will panic if the address is not aligned or if the memory accesses are already
+    /// initialized.
+    pub fn mw_cpu(&mut self, addr: u32, value: u32) {
+        // Read the address from memory and create a memory read record.
+        let record =
+            self.mw(addr, value, self.shard(), self.timestamp(&MemoryAccessPosition::Memory), None);
+        // If we're not in unconstrained mode, record the access for the current cycle.
+        if self.executor_mode == ExecutorMode::Trace {
+            debug_assert!(self.memory_accesses.memory.is_none());
+            self.memory_accesses.memory = Some(record.into());
+        }
+    }
+
+    /// Write to a register.
+    pub fn rw_cpu(&mut self, register: Register, value: u32) {
+        // The only time we are writing to a register is when it is in operand A.
+        let position = MemoryAccessPosition::A;
+
+        // Register %x0 should always be 0. See 2.6 Load and Store Instruction on
+        // P.18 of the RISC-V spec. We always write 0 to %x0.
+        let value = if register == Register::X0 { 0 } else { value };
+
+        // Read the address from memory and create a memory read record.
+        if self.executor_mode == ExecutorMode::Trace {
+            let record =
+                self.rw_traced(register, value, self.shard(), self.timestamp(&position), None);
+            if !self.unconstrained {
+                // The only time we are writing to a register is when it is in operand A.
+                debug_assert!(self.memory_accesses.a.is_none());
+                self.memory_accesses.a = Some(record.into());
+            }
+        } else {
+            self.rw(register, value, self.shard(), self.timestamp(&position));
+        }
+    }
+
+    /// Emit events for this cycle.
+    #[allow(clippy::too_many_arguments)]
+    fn emit_events(
+        &mut self,
+        clk: u32,
+        next_pc: u32,
+        instruction: &Instruction,
+        syscall_code: SyscallCode,
+        a: u32,
+        b: u32,
+        c: u32,
+        op_a_0: bool,
+        record: MemoryAccessRecord,
+        exit_code: u32,
+    ) {
+        self.emit_cpu(clk, next_pc, a, b, c, record, exit_code);
+
+        if instruction.is_alu_instruction() {
+            self.emit_alu_event(instruction.opcode, a, b, c, op_a_0);
+        } else if instruction.is_memory_load_instruction() ||
+            instruction.is_memory_store_instruction()
+        {
+            self.emit_mem_instr_event(instruction.opcode, a, b, c, op_a_0);
+        } else if instruction.is_branch_instruction() {
+            self.emit_branch_event(instruction.opcode, a, b, c, op_a_0, next_pc);
+        } else if instruction.is_jump_instruction() {
+            self.emit_jump_event(instruction.opcode, a, b, c, op_a_0, next_pc);
+        } else if instruction.is_auipc_instruction() {
+            self.emit_auipc_event(instruction.opcode, a, b, c, op_a_0);
+        } else if instruction.is_ecall_instruction() {
+            self.emit_syscall_event(clk, record.a, op_a_0, syscall_code, b, c, next_pc);
+        } else {
+            unreachable!()
+        }
+    }
+
+    /// Emit a CPU event.
+    #[allow(clippy::too_many_arguments)]
+    #[inline]
+    fn emit_cpu(
+        &mut self,
+        clk: u32,
+        next_pc: u32,
+        a: u32,
+        b: u32,
+        c: u32,
+        record: MemoryAccessRecord,
+        exit_code: u32,
+    ) {
+        self.record.cpu_events.push(CpuEvent {
+            clk,
+            pc: self.state.pc,
+            next_pc,
+            a,
+            a_record: record.a,
+            b,
+            b_record: record.b,
+            c,
+            c_record: record.c,
+            exit_code,
+        });
+    }
+
+    /// Emit an ALU event.
+    fn emit_alu_event(&mut self, opcode: Opcode, a: u32, b: u32, c: u32, op_a_0: bool) {
+        let event = AluEvent { pc: self.state.pc, opcode, a, b, c, op_a_0 };
+        match opcode {
+            Opcode::ADD => {
+                self.record.add_events.push(event);
+            }
+            Opcode::SUB => {
+                self.record.sub_events.push(event);
+            }
+            Opcode::XOR | Opcode::OR | Opcode::AND => {
+                self.record.bitwise_events.push(event);
+            }
+            Opcode::SLL => {
+                self.record.shift_left_events.push(event);
+            }
+            Opcode::SRL | Opcode::SRA => {
+                self.record.shift_right_events.push(event);
+            }
+            Opcode::SLT | Opcode::SLTU => {
+                self.record.lt_events.push(event);
+            }
+            Opcode::MUL | Opcode::MULHU | Opcode::MULHSU | Opcode::MULH => {
+                self.record.mul_events.push(event);
+            }
+            Opcode::DIVU | Opcode::REMU | Opcode::DIV | Opcode::REM => {
+                self.record.divrem_events.push(event);
+                emit_divrem_dependencies(self, event);
+            }
+            _ => unreachable!(),
+        }
+    }
+
+    /// Emit a memory instruction event.
+    #[inline]
+    fn emit_mem_instr_event(&mut self, opcode: Opcode, a: u32, b: u32, c: u32, op_a_0: bool) {
+        let event = MemInstrEvent {
+            shard: self.shard(),
+            clk: self.state.clk,
+            pc: self.state.pc,
+            opcode,
+            a,
+            b,
+            c,
+            op_a_0,
+            mem_access: self.memory_accesses.memory.expect("Must have memory access"),
+        };
+
+        self.record.memory_instr_events.push(event);
+        emit_memory_dependencies(
+            self,
+            event,
+            self.memory_accesses.memory.expect("Must have memory access").current_record(),
+        );
+    }
+
+    /// Emit a branch event.
+    #[inline]
+    fn emit_branch_event(
+        &mut self,
+        opcode: Opcode,
+        a: u32,
+        b: u32,
+        c: u32,
+        op_a_0: bool,
+        next_pc: u32,
+    ) {
+        let event = BranchEvent { pc: self.state.pc, next_pc, opcode, a, b, c, op_a_0 };
+        self.record.branch_events.push(event);
+        emit_branch_dependencies(self, event);
+    }
+
+    /// Emit a jump event.
+    #[inline]
+    fn emit_jump_event(
+        &mut self,
+        opcode: Opcode,
+        a: u32,
+        b: u32,
+        c: u32,
+        op_a_0: bool,
+        next_pc: u32,
+    ) {
+        let event = JumpEvent::new(self.state.pc, next_pc, opcode, a, b, c, op_a_0);
+        self.record.jump_events.push(event);
+        emit_jump_dependencies(self, event);
+    }
+
+    /// Emit an AUIPC event.
+    #[inline]
+    fn emit_auipc_event(&mut self, opcode: Opcode, a: u32, b: u32, c: u32, op_a_0: bool) {
+        let event = AUIPCEvent::new(self.state.pc, opcode, a, b, c, op_a_0);
+        self.record.auipc_events.push(event);
+        emit_auipc_dependency(self, event);
+    }
+
+    /// Create a syscall event.
+    #[allow(clippy::too_many_arguments)]
+    #[inline]
+    pub(crate) fn syscall_event(
+        &self,
+        clk: u32,
+        a_record: Option<MemoryRecordEnum>,
+        op_a_0: Option<bool>,
+        syscall_code: SyscallCode,
+        arg1: u32,
+        arg2: u32,
+        next_pc: u32,
+    ) -> SyscallEvent {
+        let (write, is_real) = match a_record {
+            Some(MemoryRecordEnum::Write(record)) => (record, true),
+            _ => (MemoryWriteRecord::default(), false),
+        };
+
+        // If op_a_0 is None, then we assume it is not register 0.  Note that this will happen
+        // for syscall events that are created within the precompiles' execute function.  Those
+        // events will be added to precompile tables, which wouldn't use the op_a_0 field.
+        // Note that we can't make the op_a_0 field an Option<bool> in SyscallEvent because
+        // of the cbindgen.
+        let op_a_0 = op_a_0.unwrap_or(false);
+
+        SyscallEvent {
+            shard: self.shard(),
+            clk,
+            pc: self.state.pc,
+            next_pc,
+            a_record: write,
+            a_record_is_real: is_real,
+            op_a_0,
+            syscall_code,
+            syscall_id: syscall_code.syscall_id(),
+            arg1,
+            arg2,
+        }
+    }
+
+    /// Emit a syscall event.
+    #[allow(clippy::too_many_arguments)]
+    fn emit_syscall_event(
+        &mut self,
+        clk: u32,
+        a_record: Option<MemoryRecordEnum>,
+        op_a_0: bool,
+        syscall_code: SyscallCode,
+        arg1: u32,
+        arg2: u32,
+        next_pc: u32,
+    ) {
+        let syscall_event =
+            self.syscall_event(clk, a_record, Some(op_a_0), syscall_code, arg1, arg2, next_pc);
+
+        self.record.syscall_events.push(syscall_event);
+    }
+
+    /// Fetch the destination register and input operand values for an ALU instruction.
+    fn alu_rr(&mut self, instruction: &Instruction) -> (Register, u32, u32) {
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_injection_context.is_injection(
+            "ALU_LOAD_OPERAND_MOD",
+            &self.fault_injection_context.get_pc_hint(),
+            self.executor_mode,
+        ) {
+            let mut rd: Register;
+            let mut rs1: Register;
+            let mut rs2: Register;
+            let mut b: u32;
+            let mut c: u32;
+            let mut imm: u32;
+
+            if !instruction.imm_c {
+                (rd, rs1, rs2) = instruction.r_type();
+                (rs1, rs2) = self
+                    .fault_injection_context
+                    .random_register_pair_modification(rs1, rs2);
+                c = self.rr_cpu(rs2, MemoryAccessPosition::C);
+                b = self.rr_cpu(rs1, MemoryAccessPosition::B);
+            } else if !instruction.imm_b && instruction.imm_c {
+                (rd, rs1, imm) = instruction.i_type();
+                rs1 = self
+                    .fault_injection_context
+                    .random_register_modification(rs1);
+                if self.fault_injection_context.random_bool() {
+                    imm = self.fault_injection_context.random_mod_of_u32(imm);
+                }
+                (rd, b, c) = (rd, self.rr_cpu(rs1, MemoryAccessPosition::B), imm);
+            } else {
+                debug_assert!(instruction.imm_b && instruction.imm_c);
+                (rd, b, c) =
+                    (Register::from_u8(instruction.op_a), instruction.op_b, instruction.op_c);
+                (b, c) = self.fault_injection_context.random_mod_of_u32_pair(b, c);
+            }
+
+            self.fault_injection_context.print_injection_info(
+                &self.fault_injection_context.get_pc_hint(),
+                instruction,
+                "ALU_LOAD_OPERAND_MOD",
+                &format!("{:?}", (rd, b, c)),
+            );
+
+            return (rd, b, c);
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        if !instruction.imm_c {
+            let (rd, rs1, rs2) = instruction.r_type();
+            let c = self.rr_cpu(rs2, MemoryAccessPosition::C);
+            let b = self.rr_cpu(rs1, MemoryAccessPosition::B);
+            (rd, b, c)
+        } else if !instruction.imm_b && instruction.imm_c {
+            let (rd, rs1, imm) = instruction.i_type();
+            let (rd, b, c) = (rd, self.rr_cpu(rs1, MemoryAccessPosition::B), imm);
+            (rd, b, c)
+        } else {
+            debug_assert!(instruction.imm_b && instruction.imm_c);
+            let (rd, b, c) =
+                (Register::from_u8(instruction.op_a), instruction.op_b, instruction.op_c);
+            (rd, b, c)
+        }
+    }
+
+    /// Set the destination register with the result.
+    #[inline]
+    fn alu_rw(&mut self, rd: Register, a: u32) {
+        self.rw_cpu(rd, a);
+    }
+
+    /// Fetch the input operand values for a load instruction.
+    fn load_rr(&mut self, instruction: &Instruction) -> (Register, u32, u32, u32, u32) {
+        let (rd, rs1, imm) = instruction.i_type();
+        let (b, c) = (self.rr_cpu(rs1, MemoryAccessPosition::B), imm);
+        let addr = b.wrapping_add(c);
+        let memory_value = self.mr_cpu(align(addr));
+        (rd, b, c, addr, memory_value)
+    }
+
+    /// Fetch the input operand values for a store instruction.
+    fn store_rr(&mut self, instruction: &Instruction) -> (u32, u32, u32, u32, u32) {
+        let (rs1, rs2, imm) = instruction.s_type();
+        let c = imm;
+        let b = self.rr_cpu(rs2, MemoryAccessPosition::B);
+        let a = self.rr_cpu(rs1, MemoryAccessPosition::A);
+        let addr = b.wrapping_add(c);
+        let memory_value = self.word(align(addr));
+        (a, b, c, addr, memory_value)
+    }
+
+    /// Fetch the input operand values for a branch instruction.
+    fn branch_rr(&mut self, instruction: &Instruction) -> (u32, u32, u32) {
+        let (rs1, rs2, imm) = instruction.b_type();
+        let c = imm;
+        let b = self.rr_cpu(rs2, MemoryAccessPosition::B);
+        let a = self.rr_cpu(rs1, MemoryAccessPosition::A);
+        (a, b, c)
+    }
+
+    /// Fetch the instruction at the current program counter.
+    #[inline]
+    fn fetch(&self) -> Instruction {
+        *self.program.fetch(self.state.pc)
+    }
+
+    /// Execute the given instruction over the current state of the runtime.
+    #[allow(clippy::too_many_lines)]
+    fn execute_instruction(&mut self, instruction: &Instruction) -> Result<(), ExecutionError> {
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        let mut instruction = instruction;
+        let mut _keepalive_instruction: Instruction;
+        let current_pc = self.state.pc;
+
+        if self.fault_injection_context.is_injection(
+            "INSTR_WORD_MOD",
+            &current_pc,
+            self.executor_mode,
+        ) {
+            _keepalive_instruction = self
+                .fault_injection_context
+                .get_or_create_instruction(instruction, current_pc)
+            ;
+            self.fault_injection_context.print_injection_info(
+                &current_pc,
+                instruction,
+                "INSTR_WORD_MOD",
+                &format!("{:?} => {:?}", instruction, _keepalive_instruction),
+            );
+            instruction = &_keepalive_instruction;
+        }
+
+        self.fault_injection_context.set_instruction_hint(instruction);
+
+        self.fault_injection_context.print_trace_info(
+            &current_pc,
+            instruction,
+            self.executor_mode,
+            self.state.clk,
+        );
+
+        if instruction.is_unimp_instruction() && self.fault_injection_context.is_injection_enabled() {
+            println!("WARNING: HOTFIX UNIMPLEMENTED INSTRUCTION -> NOP");
+            _keepalive_instruction = Instruction::new(Opcode::ADD, 0, 0, 0, false, false);
+            instruction = &_keepalive_instruction;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+
+        // The `clk` variable contains the cycle before the current instruction is executed.  The
+        // `state.clk` can be updated before the end of this function by precompiles' execution.
+        let mut clk = self.state.clk;
+        let mut exit_code = 0u32;
+        let mut next_pc = self.state.pc.wrapping_add(4);
+        // Will be set to a non-default value if the instruction is a syscall.
+
+        let (mut a, b, c): (u32, u32, u32);
+
+        if self.executor_mode == ExecutorMode::Trace {
+            self.memory_accesses = MemoryAccessRecord::default();
+        }
+
+        // The syscall id for precompiles.  This is only used/set when opcode == ECALL.
+        let mut syscall = SyscallCode::default();
+
+        if !self.unconstrained {
+            if self.print_report {
+                self.report.opcode_counts[instruction.opcode] += 1;
+            }
+            self.local_counts.event_counts[instruction.opcode] += 1;
+            if instruction.is_memory_load_instruction() {
+                self.local_counts.event_counts[Opcode::ADD] += 2;
+            } else if instruction.is_jump_instruction() {
+                self.local_counts.event_counts[Opcode::ADD] += 1;
+            } else if instruction.is_branch_instruction() {
+                self.local_counts.event_counts[Opcode::ADD] += 1;
+                self.local_counts.event_counts[Opcode::SLTU] += 2;
+            } else if instruction.is_divrem_instruction() {
+                self.local_counts.event_counts[Opcode::MUL] += 2;
+                self.local_counts.event_counts[Opcode::ADD] += 2;
+                self.local_counts.event_counts[Opcode::SLTU] += 1;
+            }
+        }
+
+        if instruction.is_alu_instruction() {
+            (a, b, c) = self.execute_alu(instruction);
+        } else if instruction.is_memory_load_instruction() {
+            (a, b, c) = self.execute_load(instruction)?;
+        } else if instruction.is_memory_store_instruction() {
+            (a, b, c) = self.execute_store(instruction)?;
+        } else if instruction.is_branch_instruction() {
+            (a, b, c, next_pc) = self.execute_branch(instruction, next_pc);
+        } else if instruction.is_jump_instruction() {
+            (a, b, c, next_pc) = self.execute_jump(instruction);
+        } else if instruction.is_auipc_instruction() {
+            let (rd, imm) = instruction.u_type();
+            (b, c) = (imm, imm);
+            a = self.state.pc.wrapping_add(b);
+            self.rw_cpu(rd, a);
+        } else if instruction.is_ecall_instruction() {
+            (a, b, c, clk, next_pc, syscall, exit_code) = self.execute_ecall()?;
+        } else if instruction.is_ebreak_instruction() {
+            return Err(ExecutionError::Breakpoint());
+        } else if instruction.is_unimp_instruction() {
+            // See https://github.com/riscv-non-isa/riscv-asm-manual/blob/master/riscv-asm.md#instruction-aliases
+            return Err(ExecutionError::Unimplemented());
+        } else {
+            eprintln!("unreachable: {:?}", instruction.opcode);
+            unreachable!()
+        }
+
+        // If the destination register is x0, then we need to make sure that a's value is 0.
+        let op_a_0 = instruction.op_a == Register::X0 as u8;
+        if op_a_0 {
+            a = 0;
+        }
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_injection_context.is_injection(
+            "POST_EXEC_PRE_COMMIT_PC_MOD",
+            &next_pc,
+            self.executor_mode,
+        ) {
+            let new_next_pc = self.fault_injection_context.random_pc(next_pc);
+            self.fault_injection_context.print_injection_info(
+                &next_pc,
+                instruction,
+                "POST_EXEC_PRE_COMMIT_PC_MOD",
+                &format!("{} => {}", next_pc, new_next_pc),
+            );
+            next_pc = new_next_pc;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+
+        // Emit the events for this cycle.
+        if self.executor_mode == ExecutorMode::Trace {
+            self.emit_events(
+                clk,
+                next_pc,
+                instruction,
+                syscall,
+                a,
+                b,
+                c,
+                op_a_0,
+                self.memory_accesses,
+                exit_code,
+            );
+        }
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_injection_context.is_injection(
+            "POST_EXEC_POST_COMMIT_PC_MOD",
+            &next_pc,
+            self.executor_mode,
+        ) {
+            let new_next_pc = self.fault_injection_context.random_pc(next_pc);
+            self.fault_injection_context.print_injection_info(
+                &next_pc,
+                instruction,
+                "POST_EXEC_POST_COMMIT_PC_MOD",
+                &format!("{} => {}", next_pc, new_next_pc),
+            );
+            next_pc = new_next_pc;
+        }
+
+        // needed for later injection
+        let old_pc = self.state.pc;
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+
+        // Update the program counter.
+        self.state.pc = next_pc;
+
+        // Update the clk to the next cycle.
+        self.state.clk += 4;
+
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_injection_context.is_injection(
+            "EXECUTE_INSTRUCTION_AGAIN",
+            &next_pc,
+            self.executor_mode,
+        ) {
+
+            let self_state_pc = self.state.pc;
+            let self_state_clk = self.state.clk;
+
+            if self.fault_injection_context.random_bool() {
+                self.state.pc = old_pc; // reset pc
+            }
+
+            if self.fault_injection_context.random_bool() {
+                self.state.clk -= 4; // reset clk
+            }
+
+            self.fault_injection_context.print_injection_info(
+                &next_pc,
+                instruction,
+                "EXECUTE_INSTRUCTION_AGAIN",
+                &format!(
+                    "pc: {} => {}, clk: {} => {}, instr: {:?}",
+                    self_state_pc,
+                    self.state.pc,
+                    self_state_clk,
+                    self.state.clk,
+                    instruction
+                ),
+            );
+
+            self.fault_injection_context.step(next_pc);
+
+            self.execute_instruction(instruction)?;
+
+        } else {
+
+            self.fault_injection_context.step(next_pc);
+
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+
+        Ok(())
+    }
+
+    /// Execute an ALU instruction.
+    fn execute_alu(&mut self, instruction: &Instruction) -> (u32, u32, u32) {
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        let (mut rd, mut b, mut c) = self.alu_rr(instruction);
+
+        if self.fault_injection_context.is_injection(
+            "ALU_PARSED_OPERAND_MOD",
+            &self.fault_injection_context.get_pc_hint(),
+            self.executor_mode,
+        ) {
+            let (new_b, new_c) = self.fault_injection_context.random_mod_of_u32_pair(b, c);
+
+            self.fault_injection_context.print_injection_info(
+                &self.fault_injection_context.get_pc_hint(),
+                instruction,
+                "ALU_PARSED_OPERAND_MOD",
+                &format!("{:?} => {:?}", (b,c), (new_b, new_c)),
+            );
+            b = new_b;
+            c = new_c;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        let mut /*INJECTION*/ a = match instruction.opcode {
+            Opcode::ADD => b.wrapping_add(c),
+            Opcode::SUB => b.wrapping_sub(c),
+            Opcode::XOR => b ^ c,
+            Opcode::OR => b | c,
+            Opcode::AND => b & c,
+            Opcode::SLL => b.wrapping_shl(c),
+            Opcode::SRL => b.wrapping_shr(c),
+            Opcode::SRA => (b as i32).wrapping_shr(c) as u32,
+            Opcode::SLT => {
+                if (b as i32) < (c as i32) {
+                    1
+                } else {
+                    0
+                }
+            }
+            Opcode::SLTU => {
+                if b < c {
+                    1
+                } else {
+                    0
+                }
+            }
+            Opcode::MUL => b.wrapping_mul(c),
+            Opcode::MULH => (((b as i32) as i64).wrapping_mul((c as i32) as i64) >> 32) as u32,
+            Opcode::MULHU => ((b as u64).wrapping_mul(c as u64) >> 32) as u32,
+            Opcode::MULHSU => (((b as i32) as i64).wrapping_mul(c as i64) >> 32) as u32,
+            Opcode::DIV => {
+                if c == 0 {
+                    u32::MAX
+                } else {
+                    (b as i32).wrapping_div(c as i32) as u32
+                }
+            }
+            Opcode::DIVU => {
+                if c == 0 {
+                    u32::MAX
+                } else {
+                    b.wrapping_div(c)
+                }
+            }
+            Opcode::REM => {
+                if c == 0 {
+                    b
+                } else {
+                    (b as i32).wrapping_rem(c as i32) as u32
+                }
+            }
+            Opcode::REMU => {
+                if c == 0 {
+                    b
+                } else {
+                    b.wrapping_rem(c)
+                }
+            }
+            _ => unreachable!(),
+        };
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_injection_context.is_injection(
+            "ALU_RESULT_MOD",
+            &self.fault_injection_context.get_pc_hint(),
+            self.executor_mode,
+        ) {
+            let new_a = self.fault_injection_context.random_mod_of_u32(a);
+            self.fault_injection_context.print_injection_info(
+                &self.fault_injection_context.get_pc_hint(),
+                instruction,
+                "ALU_RESULT_MOD",
+                &format!("{:?} => {:?}", a, new_a),
+            );
+            a = new_a;
+        }
+
+        if self.fault_injection_context.is_injection(
+            "ALU_RESULT_LOC_MOD",
+            &self.fault_injection_context.get_pc_hint(),
+            self.executor_mode,
+        ) {
+            let new_rd = self.fault_injection_context.random_register();
+            self.fault_injection_context.print_injection_info(
+                &self.fault_injection_context.get_pc_hint(),
+                instruction,
+                "ALU_RESULT_LOC_MOD",
+                &format!("{:?} => {:?}", rd, new_rd),
+            );
+            rd = new_rd;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        self.alu_rw(rd, a);
+        (a, b, c)
+    }
+
+    /// Execute a load instruction.
+    fn execute_load(
+        &mut self,
+        instruction: &Instruction,
+    ) -> Result<(u32, u32, u32), ExecutionError> {
+        let (rd, b, c, addr, memory_read_value) = self.load_rr(instruction);
+
+        let a = match instruction.opcode {
+            Opcode::LB => ((memory_read_value >> ((addr % 4) * 8)) & 0xFF) as i8 as i32 as u32,
+            Opcode::LH => {
+                if addr % 2 != 0 && !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */ {
+                    return Err(ExecutionError::InvalidMemoryAccess(Opcode::LH, addr));
+                }
+                ((memory_read_value >> (((addr / 2) % 2) * 16)) & 0xFFFF) as i16 as i32 as u32
+            }
+            Opcode::LW => {
+                if addr % 4 != 0 && !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */ {
+                    return Err(ExecutionError::InvalidMemoryAccess(Opcode::LW, addr));
+                }
+                memory_read_value
+            }
+            Opcode::LBU => (memory_read_value >> ((addr % 4) * 8)) & 0xFF,
+            Opcode::LHU => {
+                if addr % 2 != 0 && !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */ {
+                    return Err(ExecutionError::InvalidMemoryAccess(Opcode::LHU, addr));
+                }
+                (memory_read_value >> (((addr / 2) % 2) * 16)) & 0xFFFF
+            }
+            _ => unreachable!(),
+        };
+        self.rw_cpu(rd, a);
+        Ok((a, b, c))
+    }
+
+    /// Execute a store instruction.
+    fn execute_store(
+        &mut self,
+        instruction: &Instruction,
+    ) -> Result<(u32, u32, u32), ExecutionError> {
+        let (a, b, c, addr, memory_read_value) = self.store_rr(instruction);
+
+        let memory_store_value = match instruction.opcode {
+            Opcode::SB => {
+                let shift = (addr % 4) * 8;
+                ((a & 0xFF) << shift) | (memory_read_value & !(0xFF << shift))
+            }
+            Opcode::SH => {
+                if addr % 2 != 0 && !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */ {
+                    return Err(ExecutionError::InvalidMemoryAccess(Opcode::SH, addr));
+                }
+                let shift = ((addr / 2) % 2) * 16;
+                ((a & 0xFFFF) << shift) | (memory_read_value & !(0xFFFF << shift))
+            }
+            Opcode::SW => {
+                if addr % 4 != 0 && !self.fault_injection_context.is_injection_enabled() /* <-- INJECTION */ {
+                    return Err(ExecutionError::InvalidMemoryAccess(Opcode::SW, addr));
+                }
+                a
+            }
+            _ => unreachable!(),
+        };
+        self.mw_cpu(align(addr), memory_store_value);
+        Ok((a, b, c))
+    }
+
+    /// Execute a branch instruction.
+    fn execute_branch(
+        &mut self,
+        instruction: &Instruction,
+        mut next_pc: u32,
+    ) -> (u32, u32, u32, u32) {
+        let (a, b, c) = self.branch_rr(instruction);
+        let branch = match instruction.opcode {
+            Opcode::BEQ => a == b,
+            Opcode::BNE => a != b,
+            Opcode::BLT => (a as i32) < (b as i32),
+            Opcode::BGE => (a as i32) >= (b as i32),
+            Opcode::BLTU => a < b,
+            Opcode::BGEU => a >= b,
+            _ => {
+                unreachable!()
+            }
+        };
+        if branch {
+            next_pc = self.state.pc.wrapping_add(c);
+        }
+        (a, b, c, next_pc)
+    }
+
+    /// Execute an ecall instruction.
+    #[allow(clippy::type_complexity)]
+    fn execute_ecall(
+        &mut self,
+    ) -> Result<(u32, u32, u32, u32, u32, SyscallCode, u32), ExecutionError> {
+        // We peek at register x5 to get the syscall id. The reason we don't `self.rr` this
+        // register is that we write to it later.
+        let t0 = Register::X5;
+        let mut syscall_id = self.register(t0);
+
+        // <----------------------- START OF FAULT INJECTION ----------------------->
+
+        if self.fault_injection_context.is_injection(
+            "SYS_CALL_MOD_ECALL_ID",
+            &self.fault_injection_context.get_pc_hint(),
+            self.executor_mode,
+        ) {
+            let new_syscall_id = self.fault_injection_context.random_mod_ecall(syscall_id);
+            self.fault_injection_context.print_injection_info(
+                &self.fault_injection_context.get_pc_hint(),
+                &self.fault_injection_context.get_instruction_hint(),
+                "SYS_CALL_MOD_ECALL_ID",
+                &format!("{:?} => {:?}", syscall_id, new_syscall_id),
+            );
+            syscall_id = new_syscall_id;
+        }
+
+        // <------------------------ END OF FAULT INJECTION ------------------------>
+
+        let c = self.rr_cpu(Register::X11, MemoryAccessPosition::C);
+        let b = self.rr_cpu(Register::X10, MemoryAccessPosition::B);
+        let syscall = SyscallCode::from_u32(syscall_id);
+
+        if self.print_report && !self.unconstrained {
+            self.report.syscall_counts[syscall] += 1;
+        }
+
+        // `hint_slice` is allowed in unconstrained mode since it is used to write the hint.
+        // Other syscalls are not allowed because they can lead to non-deterministic
+        // behavior, especially since many syscalls modify memory in place,
+        // which is not permitted in unconstrained mode. This will result in
+        // non-zero memory interactions when generating a proof.
+
+        if self.unconstrained &&
+            (syscall != SyscallCode::EXIT_UNCONSTRAINED && syscall != SyscallCode::WRITE)
+        {
+            return Err(ExecutionError::InvalidSyscallUsage(syscall_id as u64));
+        }
+
+        // Update the syscall counts.
+        let syscall_for_count = syscall.count_map();
+        let syscall_count = self.state.syscall_counts.entry(syscall_for_count).or_insert(0);
+        *syscall_count += 1;
+
+        let syscall_impl = self.get_syscall(syscall).cloned();
+        let is_error_enabled = self.fault_injection_context.is_injection_enabled(); /* <-- INJECTION */
+        let mut precompile_rt = SyscallContext::new(self);
+        let (a, precompile_next_pc, precompile_cycles, returned_exit_code) =
+            if let Some(syscall_impl) = syscall_impl {
+                // Executing a syscall optionally returns a value to write to the t0
+                // register. If it returns None, we just keep the
+                // syscall_id in t0.
+                let res = syscall_impl.execute(&mut precompile_rt, syscall, b, c);
+                let a = if let Some(val) = res { val } else { syscall_id };
+
+                // If the syscall is `HALT` and the exit code is non-zero, return an error.
+                if
+                    syscall == SyscallCode::HALT &&
+                    precompile_rt.exit_code != 0 &&
+                    is_error_enabled /* <-- INJECTION */
+                {
+                    return Err(ExecutionError::HaltWithNonZeroExitCode(precompile_rt.exit_code));
+                }
+
+                (a, precompile_rt.next_pc, syscall_impl.num_extra_cycles(), precompile_rt.exit_code)
+            } else {
+
+                // <----------------------- START OF FAULT INJECTION ----------------------->
+
+                if self.fault_injection_context.is_injection_enabled() {
+                    println!("WARNING: HOTFIX ERR: UnsupportedSyscall -> HALT");
+                    (0, 0, 0_u32, 0_u32)
+                } else {
+                    return Err(ExecutionError::UnsupportedSyscall(syscall_id));
+                }
+
+                // <------------------------ END OF FAULT INJECTION ------------------------>
+
+            };
+
+        if let (Some(estimator), Some(syscall_id)) =
+            (&mut self.record_estimator, syscall.as_air_id())
+        {
+            let threshold = match syscall_id {
+                RiscvAirId::ShaExtend => self.opts.split_opts.sha_extend,
+                RiscvAirId::ShaCompress => self.opts.split_opts.sha_compress,
+                RiscvAirId::KeccakPermute => self.opts.split_opts.keccak,
+                _ => self.opts.split_opts.deferred,
+            } as u64;
+            let shards = &mut estimator.precompile_records[syscall_id];
+            let local_memory_ct =
+                estimator.current_precompile_touched_compressed_addresses.len() as u64;
+            match shards.last_mut().filter(|shard| shard.0 < threshold) {
+                Some((shard_precompile_event_ct, shard_local_memory_ct)) => {
+                    *shard_precompile_event_ct += 1;
+                    *shard_local_memory_ct += local_memory_ct;
+                }
+                None => shards.push((1, local_memory_ct)),
+            }
+            estimator.current_precompile_touched_compressed_addresses.clear();
+        }
+
+        // If the syscall is `EXIT_UNCONSTRAINED`, the memory was restored to pre-unconstrained code
+        // in the execute function, so we need to re-read from x10 and x11.  Just do a peek on the
+        // registers.
+        let (b, c) = if syscall == SyscallCode::EXIT_UNCONSTRAINED {
+            (self.register(Register::X10), self.register(Register::X11))
+        } else {
+            (b, c)
+        };
+
+        // Allow the syscall impl to modify state.clk/pc (exit unconstrained does this)
+        self.rw_cpu(t0, a);
+        let clk = self.state.clk;
+        self.state.clk += precompile_cycles;
+
+        Ok((a, b, c, clk, precompile_next_pc, syscall, returned_exit_code))
+    }
+
+    /// Execute a jump instruction.
+    fn execute_jump(&mut self, instruction: &Instruction) -> (u32, u32, u32, u32) {
+        let (a, b, c, next_pc) = match instruction.opcode {
+            Opcode::JAL => {
+                let (rd, imm) = instruction.j_type();
+                let (b, c) = (imm, 0);
+                let a = self.state.pc + 4;
+                self.rw_cpu(rd, a);
+                let next_pc = self.state.pc.wrapping_add(imm);
+                (a, b, c, next_pc)
+            }
+            Opcode::JALR => {
+                let (rd, rs1, imm) = instruction.i_type();
+                let (b, c) = (self.rr_cpu(rs1, MemoryAccessPosition::B), imm);
+                let a = self.state.pc + 4;
+                self.rw_cpu(rd, a);
+                let next_pc = b.wrapping_add(c);
+                (a, b, c, next_pc)
+            }
+            _ => unreachable!(),
+        };
+        (a, b, c, next_pc)
+    }
+
+    /// Executes one cycle of the program, returning whether the program has finished.
+    #[inline]
+    #[allow(clippy::too_many_lines)]
+    fn execute_cycle(&mut self) -> Result<bool, ExecutionError> {
+        // Fetch the instruction at the current program counter.
+        let instruction = self.fetch();
+
+        // Log the current state of the runtime.
+        self.log(&instruction);
+
+        // Execute the instruction.
+        self.execute_instruction(&instruction)?;
+
+        // Increment the clock.
+        self.state.global_clk += 1;
+
+        if self.unconstrained {
+            self.unconstrained_state.total_unconstrained_cycles += 1;
+        }
+
+        if !self.unconstrained {
+            // If there's not enough cycles left for another instruction, move to the next shard.
+            let cpu_exit = self.max_syscall_cycles + self.state.clk >= self.shard_size;
+
+            // Every N cycles, check if there exists at least one shape that fits.
+            //
+            // If we're close to not fitting, early stop the shard to ensure we don't OOM.
+            let mut shape_match_found = true;
+            if self.state.global_clk % self.shape_check_frequency == 0 {
+                // Estimate the number of events in the trace.
+                Self::estimate_riscv_event_counts(
+                    &mut self.event_counts,
+                    (self.state.clk >> 2) as u64,
+                    &self.local_counts,
+                );
+
+                // Check if the LDE size is too large.
+                if self.lde_size_check {
+                    let padded_event_counts =
+                        pad_rv32im_event_counts(self.event_counts, self.shape_check_frequency);
+                    let padded_lde_size = estimate_riscv_lde_size(padded_event_counts, &self.costs);
+                    if padded_lde_size > self.lde_size_threshold {
+                        #[allow(clippy::cast_precision_loss)]
+                        let size_gib = (padded_lde_size as f64) / (1 << 9) as f64;
+                        tracing::warn!(
+                            "Stopping shard early since the estimated LDE size is too large: {:.3} GiB",
+                            size_gib
+                        );
+                        shape_match_found = false;
+                    }
+                }
+                // Check if we're too "close" to a maximal shape.
+                else if let Some(maximal_shapes) = &self.maximal_shapes {
+                    let distance = |threshold: usize, count: usize| {
+                        if count != 0 {
+                            threshold - count
+                        } else {
+                            usize::MAX
+                        }
+                    };
+
+                    shape_match_found = false;
+
+                    for shape in maximal_shapes.iter() {
+                        let cpu_threshold = shape[CoreAirId::Cpu];
+                        if self.state.clk > ((1 << cpu_threshold) << 2) {
+                            continue;
+                        }
+
+                        let mut l_infinity = usize::MAX;
+                        let mut shape_too_small = false;
+                        for air in CoreAirId::iter() {
+                            if air == CoreAirId::Cpu {
+                                continue;
+                            }
+
+                            let threshold = 1 << shape[air];
+                            let count = self.event_counts[RiscvAirId::from(air)] as usize;
+                            if count > threshold {
+                                shape_too_small = true;
+                                break;
+                            }
+
+                            if distance(threshold, count) < l_infinity {
+                                l_infinity = distance(threshold, count);
+                            }
+                        }
+
+                        if shape_too_small {
+                            continue;
+                        }
+
+                        if l_infinity >= 32 * (self.shape_check_frequency as usize) {
+                            shape_match_found = true;
+                            break;
+                        }
+                    }
+
+                    if !shape_match_found {
+                        self.record.counts = Some(self.event_counts);
+                        tracing::debug!(
+                            "Stopping shard {} to stay within some maximal shape. clk = {} pc = 0x{:x?}",
+                            self.shard(),
+                            self.state.global_clk,
+                            self.state.pc,
+                        );
+                    }
+                }
+            }
+
+            if cpu_exit || !shape_match_found {
+                self.bump_record();
+                self.state.current_shard += 1;
+                self.state.clk = 0;
+            }
+
+            // If the cycle limit is exceeded, return an error.
+            if let Some(max_cycles) = self.max_cycles {
+                if self.state.global_clk > max_cycles {
+                    return Err(ExecutionError::ExceededCycleLimit(max_cycles));
+                }
+            }
+        }
+
+        let done = self.state.pc == 0 ||
+            self.state.pc.wrapping_sub(self.program.pc_base) >=
+                (self.program.instructions.len() * 4) as u32;
+        if done && self.unconstrained {
+            tracing::error!("program ended in unconstrained mode at clk {}", self.state.global_clk);
+            return Err(ExecutionError::EndInUnconstrained());
+        }
+        Ok(done)
+    }
+
+    /// Bump the record.
+    pub fn bump_record(&mut self) {
+        if let Some(estimator) = &mut self.record_estimator {
+            self.local_counts.local_mem = std::mem::take(&mut estimator.current_local_mem);
+            Self::estimate_riscv_event_counts(
+                &mut self.event_counts,
+                (self.state.clk >> 2) as u64,
+                &self.local_counts,
+            );
+            // The above method estimates event counts only for core shards.
+            estimator.core_records.push(self.event_counts);
+            estimator.current_touched_compressed_addresses.clear();
+        }
+        self.local_counts = LocalCounts::default();
+        // Copy all of the existing local memory accesses to the record's local_memory_access vec.
+        if self.executor_mode == ExecutorMode::Trace {
+            for (_, event) in self.local_memory_access.drain() {
+                self.record.cpu_local_memory_access.push(event);
+            }
+        }
+
+        let removed_record = std::mem::replace(
+            &mut self.record,
+            Box::new(ExecutionRecord::new(self.program.clone())),
+        );
+        let public_values = removed_record.public_values;
+        self.record.public_values = public_values;
+        self.records.push(removed_record);
+    }
+
+    /// Execute up to `self.shard_batch_size` cycles, returning the events emitted and whether the
+    /// program ended.
+    ///
+    /// # Errors
+    ///
+    /// This function will return an error if the program execution fails.
+    pub fn execute_record(
+        &mut self,
+        emit_global_memory_events: bool,
+    ) -> Result<(Vec<Box<ExecutionRecord>>, bool), ExecutionError> {
+        self.executor_mode = ExecutorMode::Trace;
+        self.emit_global_memory_events = emit_global_memory_events;
+        self.print_report = true;
+        let done = self.execute()?;
+        Ok((std::mem::take(&mut self.records), done))
+    }
+
+    /// Execute up to `self.shard_batch_size` cycles, returning the checkpoint from before execution
+    /// and whether the program ended.
+    ///
+    /// # Errors
+    ///
+    /// This function will return an error if the program execution fails.
+    pub fn execute_state(
+        &mut self,
+        emit_global_memory_events: bool,
+    ) -> Result<(ExecutionState, PublicValues<u32, u32>, bool), ExecutionError> {
+        self.memory_checkpoint.clear();
+        self.executor_mode = ExecutorMode::Checkpoint;
+        self.emit_global_memory_events = emit_global_memory_events;
+
+        // Clone self.state without memory, uninitialized_memory, proof_stream in it so it's faster.
+        let memory = std::mem::take(&mut self.state.memory);
+        let uninitialized_memory = std::mem::take(&mut self.state.uninitialized_memory);
+        let proof_stream = std::mem::take(&mut self.state.proof_stream);
+        let mut checkpoint = tracing::debug_span!("clone").in_scope(|| self.state.clone());
+        self.state.memory = memory;
+        self.state.uninitialized_memory = uninitialized_memory;
+        self.state.proof_stream = proof_stream;
+
+        let done = tracing::debug_span!("execute").in_scope(|| self.execute())?;
+        // Create a checkpoint using `memory_checkpoint`. Just include all memory if `done` since we
+        // need it all for MemoryFinalize.
+        let next_pc = self.state.pc;
+        tracing::debug_span!("create memory checkpoint").in_scope(|| {
+            let replacement_memory_checkpoint = Memory::<_>::new_preallocated();
+            let replacement_uninitialized_memory_checkpoint = Memory::<_>::new_preallocated();
+            let memory_checkpoint =
+                std::mem::replace(&mut self.memory_checkpoint, replacement_memory_checkpoint);
+            let uninitialized_memory_checkpoint = std::mem::replace(
+                &mut self.uninitialized_memory_checkpoint,
+                replacement_uninitialized_memory_checkpoint,
+            );
+            if done && !self.emit_global_memory_events {
+                // If it's the last shard, and we're not emitting memory events, we need to include
+                // all memory so that memory events can be emitted from the checkpoint. But we need
+                // to first reset any modified memory to as it was before the execution.
+                checkpoint.memory.clone_from(&self.state.memory);
+                memory_checkpoint.into_iter().for_each(|(addr, record)| {
+                    if let Some(record) = record {
+                        checkpoint.memory.insert(addr, record);
+                    } else {
+                        checkpoint.memory.remove(addr);
+                    }
+                });
+                checkpoint.uninitialized_memory = self.state.uninitialized_memory.clone();
+                // Remove memory that was written to in this batch.
+                for (addr, is_old) in uninitialized_memory_checkpoint {
+                    if !is_old {
+                        checkpoint.uninitialized_memory.remove(addr);
+                    }
+                }
+            } else {
+                checkpoint.memory = memory_checkpoint
+                    .into_iter()
+                    .filter_map(|(addr, record)| record.map(|record| (addr, record)))
+                    .collect();
+                checkpoint.uninitialized_memory = uninitialized_memory_checkpoint
+                    .into_iter()
+                    .filter(|&(_, has_value)| has_value)
+                    .map(|(addr, _)| (addr, *self.state.uninitialized_memory.get(addr).unwrap()))
+                    .collect();
+            }
+        });
+        let mut public_values = self.records.last().as_ref().unwrap().public_values;
+        public_values.start_pc = next_pc;
+        public_values.next_pc = next_pc;
+        if !done {
+            self.records.clear();
+        }
+        Ok((checkpoint, public_values, done))
+    }
+
+    fn initialize(&mut self) {
+        self.state.clk = 0;
+
+        tracing::debug!("loading memory image");
+        for (&addr, value) in &self.program.memory_image {
+            self.state.memory.insert(addr, MemoryRecord { value: *value, shard: 0, timestamp: 0 });
+        }
+        // Insert the memory record for 0.
+        self.state.memory.insert(0, MemoryRecord { value: 0, shard: 0, timestamp: 0 });
+    }
+
+    /// Executes the program without tracing and without emitting events.
+    ///
+    /// # Errors
+    ///
+    /// This function will return an error if the program execution fails.
+    pub fn run_fast(&mut self) -> Result<(), ExecutionError> {
+        self.executor_mode = ExecutorMode::Simple;
+        self.print_report = true;
+        while !self.execute()? {}
+
+        #[cfg(feature = "profiling")]
+        if let Some((profiler, writer)) = self.profiler.take() {
+            profiler.write(writer).expect("Failed to write profile to output file");
+        }
+
+        Ok(())
+    }
+
+    /// Executes the program in checkpoint mode, without emitting the checkpoints.
+    ///
+    /// # Errors
+    ///
+    /// This function will return an error if the program execution fails.
+    pub fn run_checkpoint(
+        &mut self,
+        emit_global_memory_events: bool,
+    ) -> Result<(), ExecutionError> {
+        self.executor_mode = ExecutorMode::Simple;
+        self.print_report = true;
+        while !self.execute_state(emit_global_memory_events)?.2 {}
+        Ok(())
+    }
+
+    /// Executes the program and prints the execution report.
+    ///
+    /// # Errors
+    ///
+    /// This function will return an error if the program execution fails.
+    pub fn run(&mut self) -> Result<(), ExecutionError> {
+        self.executor_mode = ExecutorMode::Trace;
+        self.print_report = true;
+        while !self.execute()? {}
+
+        #[cfg(feature = "profiling")]
+        if let Some((profiler, writer)) = self.profiler.take() {
+            profiler.write(writer).expect("Failed to write profile to output file");
+        }
+
+        Ok(())
+    }
+
+    /// Executes up to `self.shard_batch_size` cycles of the program, returning whether the program
+    /// has finished.
+    pub fn execute(&mut self) -> Result<bool, ExecutionError> {
+        // Get the program.
+        let program = self.program.clone();
+
+        // Get the current shard.
+        let start_shard = self.state.current_shard;
+
+        // If it's the first cycle, initialize the program.
+        if self.state.global_clk == 0 {
+            self.initialize();
+        }
+
+        let unconstrained_cycle_limit =
+            std::env::var("UNCONSTRAINED_CYCLE_LIMIT").map(|v| v.parse::<u64>().unwrap()).ok();
+
+        // Loop until we've executed `self.shard_batch_size` shards if `self.shard_batch_size` is
+        // set.
+        let mut done = false;
+        let mut current_shard = self.state.current_shard;
+        let mut num_shards_executed = 0;
+        loop {
+            if self.execute_cycle()? {
+                done = true;
+                break;
+            }
+
+            // Check if the unconstrained cycle limit was exceeded.
+            if let Some(unconstrained_cycle_limit) = unconstrained_cycle_limit {
+                if self.unconstrained_state.total_unconstrained_cycles > unconstrained_cycle_limit {
+                    return Err(ExecutionError::UnconstrainedCycleLimitExceeded(
+                        unconstrained_cycle_limit,
+                    ));
+                }
+            }
+
+            if self.shard_batch_size > 0 && current_shard != self.state.current_shard {
+                num_shards_executed += 1;
+                current_shard = self.state.current_shard;
+                if num_shards_executed == self.shard_batch_size {
+                    break;
+                }
+            }
+        }
+
+        // Get the final public values.
+        let public_values = self.record.public_values;
+
+        if done {
+            self.postprocess();
+
+            // Push the remaining execution record with memory initialize & finalize events.
+            self.bump_record();
+
+            // Flush stdout and stderr.
+            if let Some(ref mut w) = self.io_options.stdout {
+                if let Err(e) = w.flush() {
+                    tracing::error!("failed to flush stdout override: {e}");
+                }
+            }
+
+            if let Some(ref mut w) = self.io_options.stderr {
+                if let Err(e) = w.flush() {
+                    tracing::error!("failed to flush stderr override: {e}");
+                }
+            }
+        }
+
+        // Push the remaining execution record, if there are any CPU events.
+        if !self.record.cpu_events.is_empty() {
+            self.bump_record();
+        }
+
+        // Set the global public values for all shards.
+        let mut last_next_pc = 0;
+        let mut last_exit_code = 0;
+        for (i, record) in self.records.iter_mut().enumerate() {
+            record.program = program.clone();
+            record.public_values = public_values;
+            record.public_values.committed_value_digest = public_values.committed_value_digest;
+            record.public_values.deferred_proofs_digest = public_values.deferred_proofs_digest;
+            record.public_values.execution_shard = start_shard + i as u32;
+            if record.cpu_events.is_empty() {
+                record.public_values.start_pc = last_next_pc;
+                record.public_values.next_pc = last_next_pc;
+                record.public_values.exit_code = last_exit_code;
+            } else {
+                record.public_values.start_pc = record.cpu_events[0].pc;
+                record.public_values.next_pc = record.cpu_events.last().unwrap().next_pc;
+                record.public_values.exit_code = record.cpu_events.last().unwrap().exit_code;
+                last_next_pc = record.public_values.next_pc;
+                last_exit_code = record.public_values.exit_code;
+            }
+        }
+
+        Ok(done)
+    }
+
+    fn postprocess(&mut self) {
+        // Flush remaining stdout/stderr
+        for (fd, buf) in &self.io_buf {
+            if !buf.is_empty() {
+                match fd {
+                    1 => {
+                        eprintln!("stdout: {buf}");
+                    }
+                    2 => {
+                        eprintln!("stderr: {buf}");
+                    }
+                    _ => {}
+                }
+            }
+        }
+
+        // Ensure that all proofs and input bytes were read, otherwise warn the user.
+        if self.state.proof_stream_ptr != self.state.proof_stream.len() {
+            tracing::warn!(
+                "Not all proofs were read. Proving will fail during recursion. Did you pass too
+        many proofs in or forget to call verify_sp1_proof?"
+            );
+        }
+
+        if !self.state.input_stream.is_empty() {
+            tracing::warn!("Not all input bytes were read.");
+        }
+
+        if let Some(estimator) = &mut self.record_estimator {
+            // Mirror the logic below.
+            // Register 0 is always init and finalized, so we add 1
+            // registers 1..32
+            let touched_reg_ct =
+                1 + (1..32).filter(|&r| self.state.memory.registers.get(r).is_some()).count();
+            let total_mem = touched_reg_ct + self.state.memory.page_table.exact_len();
+            // The memory_image is already initialized in the MemoryProgram chip
+            // so we subtract it off. It is initialized in the executor in the `initialize`
+            // function.
+            estimator.memory_global_init_events = total_mem
+                .checked_sub(self.record.program.memory_image.len())
+                .expect("program memory image should be accounted for in memory exact len")
+                as u64;
+            estimator.memory_global_finalize_events = total_mem as u64;
+        }
+
+        if self.emit_global_memory_events &&
+            (self.executor_mode == ExecutorMode::Trace ||
+                self.executor_mode == ExecutorMode::Checkpoint)
+        {
+            // SECTION: Set up all MemoryInitializeFinalizeEvents needed for memory argument.
+            let memory_finalize_events = &mut self.record.global_memory_finalize_events;
+            memory_finalize_events.reserve_exact(self.state.memory.page_table.estimate_len() + 32);
+
+            // We handle the addr = 0 case separately, as we constrain it to be 0 in the first row
+            // of the memory finalize table so it must be first in the array of events.
+            let addr_0_record = self.state.memory.get(0);
+
+            let addr_0_final_record = match addr_0_record {
+                Some(record) => record,
+                None => &MemoryRecord { value: 0, shard: 0, timestamp: 0 },
+            };
+            memory_finalize_events
+                .push(MemoryInitializeFinalizeEvent::finalize_from_record(0, addr_0_final_record));
+
+            let memory_initialize_events = &mut self.record.global_memory_initialize_events;
+            memory_initialize_events
+                .reserve_exact(self.state.memory.page_table.estimate_len() + 32);
+            let addr_0_initialize_event = MemoryInitializeFinalizeEvent::initialize(0, 0);
+            memory_initialize_events.push(addr_0_initialize_event);
+
+            // Count the number of touched memory addresses manually, since `PagedMemory` doesn't
+            // already know its length.
+            if self.print_report {
+                self.report.touched_memory_addresses = 0;
+            }
+            for addr in 1..32 {
+                let record = self.state.memory.registers.get(addr);
+                if record.is_some() {
+                    if self.print_report {
+                        self.report.touched_memory_addresses += 1;
+                    }
+                    // Program memory is initialized in the MemoryProgram chip and doesn't require
+                    // any events, so we only send init events for other memory
+                    // addresses.
+                    if !self.record.program.memory_image.contains_key(&addr) {
+                        let initial_value =
+                            self.state.uninitialized_memory.registers.get(addr).unwrap_or(&0);
+                        memory_initialize_events
+                            .push(MemoryInitializeFinalizeEvent::initialize(addr, *initial_value));
+                    }
+
+                    let record = *record.unwrap();
+                    memory_finalize_events
+                        .push(MemoryInitializeFinalizeEvent::finalize_from_record(addr, &record));
+                }
+            }
+            for addr in self.state.memory.page_table.keys() {
+                if self.print_report {
+                    self.report.touched_memory_addresses += 1;
+                }
+
+                // Program memory is initialized in the MemoryProgram chip and doesn't require any
+                // events, so we only send init events for other memory addresses.
+                if !self.record.program.memory_image.contains_key(&addr) {
+                    let initial_value = self.state.uninitialized_memory.get(addr).unwrap_or(&0);
+                    memory_initialize_events
+                        .push(MemoryInitializeFinalizeEvent::initialize(addr, *initial_value));
+                }
+
+                let record = *self.state.memory.get(addr).unwrap();
+                memory_finalize_events
+                    .push(MemoryInitializeFinalizeEvent::finalize_from_record(addr, &record));
+            }
+        }
+    }
+
+    fn get_syscall(&mut self, code: SyscallCode) -> Option<&Arc<dyn Syscall>> {
+        self.syscall_map.get(&code)
+    }
+
+    /// Maps the opcode counts to the number of events in each air.
+    fn estimate_riscv_event_counts(
+        event_counts: &mut EnumMap<RiscvAirId, u64>,
+        cpu_cycles: u64,
+        local_counts: &LocalCounts,
+    ) {
+        let touched_addresses: u64 = local_counts.local_mem as u64;
+        let syscalls_sent: u64 = local_counts.syscalls_sent as u64;
+        let opcode_counts: &EnumMap<Opcode, u64> = &local_counts.event_counts;
+
+        // Compute the number of events in the cpu chip.
+        event_counts[RiscvAirId::Cpu] = cpu_cycles;
+
+        // Compute the number of events in the add sub chip.
+        event_counts[RiscvAirId::AddSub] = opcode_counts[Opcode::ADD] + opcode_counts[Opcode::SUB];
+
+        // Compute the number of events in the mul chip.
+        event_counts[RiscvAirId::Mul] = opcode_counts[Opcode::MUL] +
+            opcode_counts[Opcode::MULH] +
+            opcode_counts[Opcode::MULHU] +
+            opcode_counts[Opcode::MULHSU];
+
+        // Compute the number of events in the bitwise chip.
+        event_counts[RiscvAirId::Bitwise] =
+            opcode_counts[Opcode::XOR] + opcode_counts[Opcode::OR] + opcode_counts[Opcode::AND];
+
+        // Compute the number of events in the shift left chip.
+        event_counts[RiscvAirId::ShiftLeft] = opcode_counts[Opcode::SLL];
+
+        // Compute the number of events in the shift right chip.
+        event_counts[RiscvAirId::ShiftRight] =
+            opcode_counts[Opcode::SRL] + opcode_counts[Opcode::SRA];
+
+        // Compute the number of events in the divrem chip.
+        event_counts[RiscvAirId::DivRem] = opcode_counts[Opcode::DIV] +
+            opcode_counts[Opcode::DIVU] +
+            opcode_counts[Opcode::REM] +
+            opcode_counts[Opcode::REMU];
+
+        // Compute the number of events in the lt chip.
+        event_counts[RiscvAirId::Lt] = opcode_counts[Opcode::SLT] + opcode_counts[Opcode::SLTU];
+
+        // Compute the number of events in the memory local chip.
+        event_counts[RiscvAirId::MemoryLocal] =
+            touched_addresses.div_ceil(NUM_LOCAL_MEMORY_ENTRIES_PER_ROW_EXEC as u64);
+
+        // Compute the number of events in the branch chip.
+        event_counts[RiscvAirId::Branch] = opcode_counts[Opcode::BEQ] +
+            opcode_counts[Opcode::BNE] +
+            opcode_counts[Opcode::BLT] +
+            opcode_counts[Opcode::BGE] +
+            opcode_counts[Opcode::BLTU] +
+            opcode_counts[Opcode::BGEU];
+
+        // Compute the number of events in the jump chip.
+        event_counts[RiscvAirId::Jump] = opcode_counts[Opcode::JAL] + opcode_counts[Opcode::JALR];
+
+        // Compute the number of events in the auipc chip.
+        event_counts[RiscvAirId::Auipc] = opcode_counts[Opcode::AUIPC] +
+            opcode_counts[Opcode::UNIMP] +
+            opcode_counts[Opcode::EBREAK];
+
+        // Compute the number of events in the memory instruction chip.
+        event_counts[RiscvAirId::MemoryInstrs] = opcode_counts[Opcode::LB] +
+            opcode_counts[Opcode::LH] +
+            opcode_counts[Opcode::LW] +
+            opcode_counts[Opcode::LBU] +
+            opcode_counts[Opcode::LHU] +
+            opcode_counts[Opcode::SB] +
+            opcode_counts[Opcode::SH] +
+            opcode_counts[Opcode::SW];
+
+        // Compute the number of events in the syscall instruction chip.b
+        event_counts[RiscvAirId::SyscallInstrs] = opcode_counts[Opcode::ECALL];
+
+        // Compute the number of events in the syscall core chip.
+        event_counts[RiscvAirId::SyscallCore] = syscalls_sent;
+
+        // Compute the number of events in the global chip.
+        event_counts[RiscvAirId::Global] =
+            2 * touched_addresses + event_counts[RiscvAirId::SyscallInstrs];
+
+        // Adjust for divrem dependencies.
+        event_counts[RiscvAirId::Mul] += event_counts[RiscvAirId::DivRem];
+        event_counts[RiscvAirId::Lt] += event_counts[RiscvAirId::DivRem];
+
+        // Note: we ignore the additional dependencies for addsub, since they are accounted for in
+        // the maximal shapes.
+    }
+
+    #[inline]
+    fn log(&mut self, _: &Instruction) {
+        #[cfg(feature = "profiling")]
+        if let Some((ref mut profiler, _)) = self.profiler {
+            if !self.unconstrained {
+                profiler.record(self.state.global_clk, self.state.pc as u64);
+            }
+        }
+
+        if !self.unconstrained && self.state.global_clk % 10_000_000 == 0 {
+            tracing::info!("clk = {} pc = 0x{:x?}", self.state.global_clk, self.state.pc);
+        }
+    }
+}
+
+impl Default for ExecutorMode {
+    fn default() -> Self {
+        Self::Simple
+    }
+}
+
+/// Aligns an address to the nearest word below or equal to it.
+#[must_use]
+pub const fn align(addr: u32) -> u32 {
+    addr - addr % 4
+}
+
+#[cfg(test)]
+mod tests {
+
+    use sp1_stark::SP1CoreOpts;
+    use sp1_zkvm::syscalls::SHA_COMPRESS;
+
+    use crate::programs::tests::{
+        fibonacci_program, panic_program, secp256r1_add_program, secp256r1_double_program,
+        simple_memory_program, simple_program, ssz_withdrawals_program, u256xu2048_mul_program,
+    };
+
+    use crate::{Register, SP1Context};
+
+    use super::{Executor, Instruction, Opcode, Program};
+
+    fn _assert_send<T: Send>() {}
+
+    /// Runtime needs to be Send so we can use it across async calls.
+    fn _assert_runtime_is_send() {
+        #[allow(clippy::used_underscore_items)]
+        _assert_send::<Executor>();
+    }
+
+    #[test]
+    fn test_simple_program_run() {
+        let program = simple_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 42);
+    }
+
+    #[test]
+    fn test_fibonacci_program_run() {
+        let program = fibonacci_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    fn test_fibonacci_program_run_with_max_cycles() {
+        let program = fibonacci_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+
+        let max_cycles = runtime.state.global_clk;
+
+        let program = fibonacci_program();
+        let context = SP1Context::builder().max_cycles(max_cycles).build();
+        let mut runtime = Executor::with_context(program, SP1CoreOpts::default(), context);
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    fn test_secp256r1_add_program_run() {
+        let program = secp256r1_add_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    fn test_secp256r1_double_program_run() {
+        let program = secp256r1_double_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    fn test_u256xu2048_mul() {
+        let program = u256xu2048_mul_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    fn test_ssz_withdrawals_program_run() {
+        let program = ssz_withdrawals_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    #[should_panic]
+    fn test_panic() {
+        let program = panic_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    fn test_add() {
+        // main:
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     add x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::ADD, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 42);
+    }
+
+    #[test]
+    fn test_sub() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     sub x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::SUB, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 32);
+    }
+
+    #[test]
+    fn test_xor() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     xor x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::XOR, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 32);
+    }
+
+    #[test]
+    fn test_or() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     or x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::OR, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 37);
+    }
+
+    #[test]
+    fn test_and() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     and x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::AND, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 5);
+    }
+
+    #[test]
+    fn test_sll() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     sll x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::SLL, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 1184);
+    }
+
+    #[test]
+    fn test_srl() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     srl x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::SRL, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 1);
+    }
+
+    #[test]
+    fn test_sra() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     sra x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::SRA, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 1);
+    }
+
+    #[test]
+    fn test_slt() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     slt x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::SLT, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 0);
+    }
+
+    #[test]
+    fn test_sltu() {
+        //     addi x29, x0, 5
+        //     addi x30, x0, 37
+        //     sltu x31, x30, x29
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 0, 37, false, true),
+            Instruction::new(Opcode::SLTU, 31, 30, 29, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 0);
+    }
+
+    #[test]
+    fn test_addi() {
+        //     addi x29, x0, 5
+        //     addi x30, x29, 37
+        //     addi x31, x30, 42
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 29, 37, false, true),
+            Instruction::new(Opcode::ADD, 31, 30, 42, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 84);
+    }
+
+    #[test]
+    fn test_addi_negative() {
+        //     addi x29, x0, 5
+        //     addi x30, x29, -1
+        //     addi x31, x30, 4
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::ADD, 30, 29, 0xFFFF_FFFF, false, true),
+            Instruction::new(Opcode::ADD, 31, 30, 4, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 5 - 1 + 4);
+    }
+
+    #[test]
+    fn test_xori() {
+        //     addi x29, x0, 5
+        //     xori x30, x29, 37
+        //     xori x31, x30, 42
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::XOR, 30, 29, 37, false, true),
+            Instruction::new(Opcode::XOR, 31, 30, 42, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 10);
+    }
+
+    #[test]
+    fn test_ori() {
+        //     addi x29, x0, 5
+        //     ori x30, x29, 37
+        //     ori x31, x30, 42
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::OR, 30, 29, 37, false, true),
+            Instruction::new(Opcode::OR, 31, 30, 42, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 47);
+    }
+
+    #[test]
+    fn test_andi() {
+        //     addi x29, x0, 5
+        //     andi x30, x29, 37
+        //     andi x31, x30, 42
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::AND, 30, 29, 37, false, true),
+            Instruction::new(Opcode::AND, 31, 30, 42, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 0);
+    }
+
+    #[test]
+    fn test_slli() {
+        //     addi x29, x0, 5
+        //     slli x31, x29, 37
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 5, false, true),
+            Instruction::new(Opcode::SLL, 31, 29, 4, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 80);
+    }
+
+    #[test]
+    fn test_srli() {
+        //    addi x29, x0, 5
+        //    srli x31, x29, 37
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 42, false, true),
+            Instruction::new(Opcode::SRL, 31, 29, 4, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 2);
+    }
+
+    #[test]
+    fn test_srai() {
+        //   addi x29, x0, 5
+        //   srai x31, x29, 37
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 42, false, true),
+            Instruction::new(Opcode::SRA, 31, 29, 4, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 2);
+    }
+
+    #[test]
+    fn test_slti() {
+        //   addi x29, x0, 5
+        //   slti x31, x29, 37
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 42, false, true),
+            Instruction::new(Opcode::SLT, 31, 29, 37, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 0);
+    }
+
+    #[test]
+    fn test_sltiu() {
+        //   addi x29, x0, 5
+        //   sltiu x31, x29, 37
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 42, false, true),
+            Instruction::new(Opcode::SLTU, 31, 29, 37, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.register(Register::X31), 0);
+    }
+
+    #[test]
+    fn test_jalr() {
+        //   addi x11, x11, 100
+        //   jalr x5, x11, 8
+        //
+        // `JALR rd offset(rs)` reads the value at rs, adds offset to it and uses it as the
+        // destination address. It then stores the address of the next instruction in rd in case
+        // we'd want to come back here.
+
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 11, 11, 100, false, true),
+            Instruction::new(Opcode::JALR, 5, 11, 8, false, true),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.registers()[Register::X5 as usize], 8);
+        assert_eq!(runtime.registers()[Register::X11 as usize], 100);
+        assert_eq!(runtime.state.pc, 108);
+    }
+
+    fn simple_op_code_test(opcode: Opcode, expected: u32, a: u32, b: u32) {
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 10, 0, a, false, true),
+            Instruction::new(Opcode::ADD, 11, 0, b, false, true),
+            Instruction::new(opcode, 12, 10, 11, false, false),
+        ];
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+        assert_eq!(runtime.registers()[Register::X12 as usize], expected);
+    }
+
+    #[test]
+    #[allow(clippy::unreadable_literal)]
+    fn multiplication_tests() {
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0x00000000, 0x00000000);
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0x00000001, 0x00000001);
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0x00000003, 0x00000007);
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0x00000000, 0xffff8000);
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0x80000000, 0x00000000);
+        simple_op_code_test(Opcode::MULHU, 0x7fffc000, 0x80000000, 0xffff8000);
+        simple_op_code_test(Opcode::MULHU, 0x0001fefe, 0xaaaaaaab, 0x0002fe7d);
+        simple_op_code_test(Opcode::MULHU, 0x0001fefe, 0x0002fe7d, 0xaaaaaaab);
+        simple_op_code_test(Opcode::MULHU, 0xfe010000, 0xff000000, 0xff000000);
+        simple_op_code_test(Opcode::MULHU, 0xfffffffe, 0xffffffff, 0xffffffff);
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0xffffffff, 0x00000001);
+        simple_op_code_test(Opcode::MULHU, 0x00000000, 0x00000001, 0xffffffff);
+
+        simple_op_code_test(Opcode::MULHSU, 0x00000000, 0x00000000, 0x00000000);
+        simple_op_code_test(Opcode::MULHSU, 0x00000000, 0x00000001, 0x00000001);
+        simple_op_code_test(Opcode::MULHSU, 0x00000000, 0x00000003, 0x00000007);
+        simple_op_code_test(Opcode::MULHSU, 0x00000000, 0x00000000, 0xffff8000);
+        simple_op_code_test(Opcode::MULHSU, 0x00000000, 0x80000000, 0x00000000);
+        simple_op_code_test(Opcode::MULHSU, 0x80004000, 0x80000000, 0xffff8000);
+        simple_op_code_test(Opcode::MULHSU, 0xffff0081, 0xaaaaaaab, 0x0002fe7d);
+        simple_op_code_test(Opcode::MULHSU, 0x0001fefe, 0x0002fe7d, 0xaaaaaaab);
+        simple_op_code_test(Opcode::MULHSU, 0xff010000, 0xff000000, 0xff000000);
+        simple_op_code_test(Opcode::MULHSU, 0xffffffff, 0xffffffff, 0xffffffff);
+        simple_op_code_test(Opcode::MULHSU, 0xffffffff, 0xffffffff, 0x00000001);
+        simple_op_code_test(Opcode::MULHSU, 0x00000000, 0x00000001, 0xffffffff);
+
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0x00000000, 0x00000000);
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0x00000001, 0x00000001);
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0x00000003, 0x00000007);
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0x00000000, 0xffff8000);
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0x80000000, 0x00000000);
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0x80000000, 0x00000000);
+        simple_op_code_test(Opcode::MULH, 0xffff0081, 0xaaaaaaab, 0x0002fe7d);
+        simple_op_code_test(Opcode::MULH, 0xffff0081, 0x0002fe7d, 0xaaaaaaab);
+        simple_op_code_test(Opcode::MULH, 0x00010000, 0xff000000, 0xff000000);
+        simple_op_code_test(Opcode::MULH, 0x00000000, 0xffffffff, 0xffffffff);
+        simple_op_code_test(Opcode::MULH, 0xffffffff, 0xffffffff, 0x00000001);
+        simple_op_code_test(Opcode::MULH, 0xffffffff, 0x00000001, 0xffffffff);
+
+        simple_op_code_test(Opcode::MUL, 0x00001200, 0x00007e00, 0xb6db6db7);
+        simple_op_code_test(Opcode::MUL, 0x00001240, 0x00007fc0, 0xb6db6db7);
+        simple_op_code_test(Opcode::MUL, 0x00000000, 0x00000000, 0x00000000);
+        simple_op_code_test(Opcode::MUL, 0x00000001, 0x00000001, 0x00000001);
+        simple_op_code_test(Opcode::MUL, 0x00000015, 0x00000003, 0x00000007);
+        simple_op_code_test(Opcode::MUL, 0x00000000, 0x00000000, 0xffff8000);
+        simple_op_code_test(Opcode::MUL, 0x00000000, 0x80000000, 0x00000000);
+        simple_op_code_test(Opcode::MUL, 0x00000000, 0x80000000, 0xffff8000);
+        simple_op_code_test(Opcode::MUL, 0x0000ff7f, 0xaaaaaaab, 0x0002fe7d);
+        simple_op_code_test(Opcode::MUL, 0x0000ff7f, 0x0002fe7d, 0xaaaaaaab);
+        simple_op_code_test(Opcode::MUL, 0x00000000, 0xff000000, 0xff000000);
+        simple_op_code_test(Opcode::MUL, 0x00000001, 0xffffffff, 0xffffffff);
+        simple_op_code_test(Opcode::MUL, 0xffffffff, 0xffffffff, 0x00000001);
+        simple_op_code_test(Opcode::MUL, 0xffffffff, 0x00000001, 0xffffffff);
+    }
+
+    fn neg(a: u32) -> u32 {
+        u32::MAX - a + 1
+    }
+
+    #[test]
+    fn division_tests() {
+        simple_op_code_test(Opcode::DIVU, 3, 20, 6);
+        simple_op_code_test(Opcode::DIVU, 715_827_879, u32::MAX - 20 + 1, 6);
+        simple_op_code_test(Opcode::DIVU, 0, 20, u32::MAX - 6 + 1);
+        simple_op_code_test(Opcode::DIVU, 0, u32::MAX - 20 + 1, u32::MAX - 6 + 1);
+
+        simple_op_code_test(Opcode::DIVU, 1 << 31, 1 << 31, 1);
+        simple_op_code_test(Opcode::DIVU, 0, 1 << 31, u32::MAX - 1 + 1);
+
+        simple_op_code_test(Opcode::DIVU, u32::MAX, 1 << 31, 0);
+        simple_op_code_test(Opcode::DIVU, u32::MAX, 1, 0);
+        simple_op_code_test(Opcode::DIVU, u32::MAX, 0, 0);
+
+        simple_op_code_test(Opcode::DIV, 3, 18, 6);
+        simple_op_code_test(Opcode::DIV, neg(6), neg(24), 4);
+        simple_op_code_test(Opcode::DIV, neg(2), 16, neg(8));
+        simple_op_code_test(Opcode::DIV, neg(1), 0, 0);
+
+        // Overflow cases
+        simple_op_code_test(Opcode::DIV, 1 << 31, 1 << 31, neg(1));
+        simple_op_code_test(Opcode::REM, 0, 1 << 31, neg(1));
+    }
+
+    #[test]
+    fn remainder_tests() {
+        simple_op_code_test(Opcode::REM, 7, 16, 9);
+        simple_op_code_test(Opcode::REM, neg(4), neg(22), 6);
+        simple_op_code_test(Opcode::REM, 1, 25, neg(3));
+        simple_op_code_test(Opcode::REM, neg(2), neg(22), neg(4));
+        simple_op_code_test(Opcode::REM, 0, 873, 1);
+        simple_op_code_test(Opcode::REM, 0, 873, neg(1));
+        simple_op_code_test(Opcode::REM, 5, 5, 0);
+        simple_op_code_test(Opcode::REM, neg(5), neg(5), 0);
+        simple_op_code_test(Opcode::REM, 0, 0, 0);
+
+        simple_op_code_test(Opcode::REMU, 4, 18, 7);
+        simple_op_code_test(Opcode::REMU, 6, neg(20), 11);
+        simple_op_code_test(Opcode::REMU, 23, 23, neg(6));
+        simple_op_code_test(Opcode::REMU, neg(21), neg(21), neg(11));
+        simple_op_code_test(Opcode::REMU, 5, 5, 0);
+        simple_op_code_test(Opcode::REMU, neg(1), neg(1), 0);
+        simple_op_code_test(Opcode::REMU, 0, 0, 0);
+    }
+
+    #[test]
+    #[allow(clippy::unreadable_literal)]
+    fn shift_tests() {
+        simple_op_code_test(Opcode::SLL, 0x00000001, 0x00000001, 0);
+        simple_op_code_test(Opcode::SLL, 0x00000002, 0x00000001, 1);
+        simple_op_code_test(Opcode::SLL, 0x00000080, 0x00000001, 7);
+        simple_op_code_test(Opcode::SLL, 0x00004000, 0x00000001, 14);
+        simple_op_code_test(Opcode::SLL, 0x80000000, 0x00000001, 31);
+        simple_op_code_test(Opcode::SLL, 0xffffffff, 0xffffffff, 0);
+        simple_op_code_test(Opcode::SLL, 0xfffffffe, 0xffffffff, 1);
+        simple_op_code_test(Opcode::SLL, 0xffffff80, 0xffffffff, 7);
+        simple_op_code_test(Opcode::SLL, 0xffffc000, 0xffffffff, 14);
+        simple_op_code_test(Opcode::SLL, 0x80000000, 0xffffffff, 31);
+        simple_op_code_test(Opcode::SLL, 0x21212121, 0x21212121, 0);
+        simple_op_code_test(Opcode::SLL, 0x42424242, 0x21212121, 1);
+        simple_op_code_test(Opcode::SLL, 0x90909080, 0x21212121, 7);
+        simple_op_code_test(Opcode::SLL, 0x48484000, 0x21212121, 14);
+        simple_op_code_test(Opcode::SLL, 0x80000000, 0x21212121, 31);
+        simple_op_code_test(Opcode::SLL, 0x21212121, 0x21212121, 0xffffffe0);
+        simple_op_code_test(Opcode::SLL, 0x42424242, 0x21212121, 0xffffffe1);
+        simple_op_code_test(Opcode::SLL, 0x90909080, 0x21212121, 0xffffffe7);
+        simple_op_code_test(Opcode::SLL, 0x48484000, 0x21212121, 0xffffffee);
+        simple_op_code_test(Opcode::SLL, 0x00000000, 0x21212120, 0xffffffff);
+
+        simple_op_code_test(Opcode::SRL, 0xffff8000, 0xffff8000, 0);
+        simple_op_code_test(Opcode::SRL, 0x7fffc000, 0xffff8000, 1);
+        simple_op_code_test(Opcode::SRL, 0x01ffff00, 0xffff8000, 7);
+        simple_op_code_test(Opcode::SRL, 0x0003fffe, 0xffff8000, 14);
+        simple_op_code_test(Opcode::SRL, 0x0001ffff, 0xffff8001, 15);
+        simple_op_code_test(Opcode::SRL, 0xffffffff, 0xffffffff, 0);
+        simple_op_code_test(Opcode::SRL, 0x7fffffff, 0xffffffff, 1);
+        simple_op_code_test(Opcode::SRL, 0x01ffffff, 0xffffffff, 7);
+        simple_op_code_test(Opcode::SRL, 0x0003ffff, 0xffffffff, 14);
+        simple_op_code_test(Opcode::SRL, 0x00000001, 0xffffffff, 31);
+        simple_op_code_test(Opcode::SRL, 0x21212121, 0x21212121, 0);
+        simple_op_code_test(Opcode::SRL, 0x10909090, 0x21212121, 1);
+        simple_op_code_test(Opcode::SRL, 0x00424242, 0x21212121, 7);
+        simple_op_code_test(Opcode::SRL, 0x00008484, 0x21212121, 14);
+        simple_op_code_test(Opcode::SRL, 0x00000000, 0x21212121, 31);
+        simple_op_code_test(Opcode::SRL, 0x21212121, 0x21212121, 0xffffffe0);
+        simple_op_code_test(Opcode::SRL, 0x10909090, 0x21212121, 0xffffffe1);
+        simple_op_code_test(Opcode::SRL, 0x00424242, 0x21212121, 0xffffffe7);
+        simple_op_code_test(Opcode::SRL, 0x00008484, 0x21212121, 0xffffffee);
+        simple_op_code_test(Opcode::SRL, 0x00000000, 0x21212121, 0xffffffff);
+
+        simple_op_code_test(Opcode::SRA, 0x00000000, 0x00000000, 0);
+        simple_op_code_test(Opcode::SRA, 0xc0000000, 0x80000000, 1);
+        simple_op_code_test(Opcode::SRA, 0xff000000, 0x80000000, 7);
+        simple_op_code_test(Opcode::SRA, 0xfffe0000, 0x80000000, 14);
+        simple_op_code_test(Opcode::SRA, 0xffffffff, 0x80000001, 31);
+        simple_op_code_test(Opcode::SRA, 0x7fffffff, 0x7fffffff, 0);
+        simple_op_code_test(Opcode::SRA, 0x3fffffff, 0x7fffffff, 1);
+        simple_op_code_test(Opcode::SRA, 0x00ffffff, 0x7fffffff, 7);
+        simple_op_code_test(Opcode::SRA, 0x0001ffff, 0x7fffffff, 14);
+        simple_op_code_test(Opcode::SRA, 0x00000000, 0x7fffffff, 31);
+        simple_op_code_test(Opcode::SRA, 0x81818181, 0x81818181, 0);
+        simple_op_code_test(Opcode::SRA, 0xc0c0c0c0, 0x81818181, 1);
+        simple_op_code_test(Opcode::SRA, 0xff030303, 0x81818181, 7);
+        simple_op_code_test(Opcode::SRA, 0xfffe0606, 0x81818181, 14);
+        simple_op_code_test(Opcode::SRA, 0xffffffff, 0x81818181, 31);
+    }
+
+    #[test]
+    #[allow(clippy::unreadable_literal)]
+    fn test_simple_memory_program_run() {
+        let program = simple_memory_program();
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+
+        // Assert SW & LW case
+        assert_eq!(runtime.register(Register::X28), 0x12348765);
+
+        // Assert LBU cases
+        assert_eq!(runtime.register(Register::X27), 0x65);
+        assert_eq!(runtime.register(Register::X26), 0x87);
+        assert_eq!(runtime.register(Register::X25), 0x34);
+        assert_eq!(runtime.register(Register::X24), 0x12);
+
+        // Assert LB cases
+        assert_eq!(runtime.register(Register::X23), 0x65);
+        assert_eq!(runtime.register(Register::X22), 0xffffff87);
+
+        // Assert LHU cases
+        assert_eq!(runtime.register(Register::X21), 0x8765);
+        assert_eq!(runtime.register(Register::X20), 0x1234);
+
+        // Assert LH cases
+        assert_eq!(runtime.register(Register::X19), 0xffff8765);
+        assert_eq!(runtime.register(Register::X18), 0x1234);
+
+        // Assert SB cases
+        assert_eq!(runtime.register(Register::X16), 0x12348725);
+        assert_eq!(runtime.register(Register::X15), 0x12342525);
+        assert_eq!(runtime.register(Register::X14), 0x12252525);
+        assert_eq!(runtime.register(Register::X13), 0x25252525);
+
+        // Assert SH cases
+        assert_eq!(runtime.register(Register::X12), 0x12346525);
+        assert_eq!(runtime.register(Register::X11), 0x65256525);
+    }
+
+    #[test]
+    #[should_panic]
+    fn test_invalid_address_access_sw() {
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 20, false, true),
+            Instruction::new(Opcode::SW, 0, 29, 0, false, true),
+        ];
+
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    #[should_panic]
+    fn test_invalid_address_access_lw() {
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 29, 0, 20, false, true),
+            Instruction::new(Opcode::LW, 29, 29, 0, false, true),
+        ];
+
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+
+    #[test]
+    #[should_panic]
+    fn test_invalid_address_syscall() {
+        let instructions = vec![
+            Instruction::new(Opcode::ADD, 5, 0, SHA_COMPRESS, false, true),
+            Instruction::new(Opcode::ADD, 10, 0, 10, false, true),
+            Instruction::new(Opcode::ADD, 11, 10, 20, false, true),
+            Instruction::new(Opcode::ECALL, 5, 10, 11, false, false),
+        ];
+
+        let program = Program::new(instructions, 0, 0);
+        let mut runtime = Executor::new(program, SP1CoreOpts::default());
+        runtime.run().unwrap();
+    }
+}
@@ -0,0 +1 @@
+fn main() { 0; }
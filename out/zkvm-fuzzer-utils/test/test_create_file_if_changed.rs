@@ -0,0 +1 @@
+fn main() { println!(); }
@@ -0,0 +1,52 @@
+
+std::array<Val, 5> extern_getMemoryTxn(ExecContext& ctx, Val addrElem) {
+  uint32_t addr = addrElem.asUInt32();
+  size_t txnIdx = ctx.preflight.cycles[ctx.cycle].txnIdx++;
+  const MemoryTransaction& txn = ctx.preflight.txns[txnIdx];
+  if (txn.cycle / 2 != ctx.cycle) {
+    printf("txn.cycle: %u, ctx.cycle: %zu\n", txn.cycle, ctx.cycle);
+
+    // <----------------------- START OF FAULT INJECTION ----------------------->
+    if (const char* env_flag_ptr = std::getenv("ENABLE_INJECTION")) {
+        auto env_flag_string = std::string(env_flag_ptr);
+        if (env_flag_string == "1") {
+            printf("SKIP THROW: %s @ %s:%d\n", "Warning: fuzzer_assert! failed: txn cycle mismatch", __FILE__, __LINE__);
+        } else { throw std::runtime_error("txn cycle mismatch"); }
+    } else { throw std::runtime_error("txn cycle mismatch"); }
+    // <------------------------ END OF FAULT INJECTION ------------------------>
+
+  }
+
+  if (txn.addr != addr) {
+    printf("[%lu]: txn.addr: 0x%08x, addr: 0x%08x\n", ctx.cycle, txn.addr, addr);
+
+    // <----------------------- START OF FAULT INJECTION ----------------------->
+    if (const char* env_flag_ptr = std::getenv("ENABLE_INJECTION")) {
+        auto env_flag_string = std::string(env_flag_ptr);
+        if (env_flag_string == "1") {
+            printf("SKIP THROW: %s @ %s:%d\n", "Warning: fuzzer_assert! failed: memory peek not in preflight", __FILE__, __LINE__);
+        } else { throw std::runtime_error("memory peek not in preflight"); }
+    } else { throw std::runtime_error("memory peek not in preflight"); }
+    // <------------------------ END OF FAULT INJECTION ------------------------>
+
+  }
+
+
+  // <----------------------- START OF FAULT INJECTION ----------------------->
+  if (const char* env_flag_ptr = std::getenv("ENABLE_INJECTION")) {
+      auto env_flag_string = std::string(env_flag_ptr);
+      if (env_flag_string == "1") {
+          printf("SKIP ASSERT: %s @ %s:%d\n", "Warning: fuzzer_assert! failed: txn.addr != addr", __FILE__, __LINE__);
+      } else { assert(txn.addr != addr); }
+  } else { assert(txn.addr != addr); }
+  // <------------------------ END OF FAULT INJECTION ------------------------>
+
+
+  return {
+      txn.prevCycle,
+      txn.prevWord & 0xffff,
+      txn.prevWord >> 16,
+      txn.word & 0xffff,
+      txn.word >> 16,
+  };
+}
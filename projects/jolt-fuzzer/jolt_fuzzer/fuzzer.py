@@ -133,15 +133,17 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
         )
         self.commit_or_branch = commit_or_branch
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.is_fault_injection,
             self.is_trace_collection,
             self.commit_or_branch,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
     def is_skip_fault_injection_inspection(
         self, trace: Trace, arguments: InjectionArguments[InjectionKind]
@@ -151,6 +153,10 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
     def is_ignored_execution_error(self, exec_status: ExecStatus) -> bool:
         return False
 
+    def is_binary_trace_supported(self) -> bool:
+        # NOTE: every commit injects an emulator that writes trace records
+        return True
+
 
 # ---------------------------------------------------------------------------- #
 #                                    Checker                                   #
@@ -177,15 +183,17 @@ class CircuitChecker(CircuitCheckerBase[InstrKind, InjectionKind]):
         )
         self.commit_or_branch = commit_or_branch
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.active_finding.is_injection,
             "--trace" in self.active_finding.input_flags,
             self.commit_or_branch,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
 
 # ---------------------------------------------------------------------------- #
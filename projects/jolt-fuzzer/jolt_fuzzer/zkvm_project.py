@@ -1,6 +1,5 @@
 import io
 import logging
-import shutil
 from pathlib import Path
 
 from circil.ir.node import Circuit
@@ -10,11 +9,19 @@ from jolt_fuzzer.settings import (
     RUST_GUEST_RETURN_TYPE,
     get_rust_toolchain_version,
 )
-from zkvm_fuzzer_utils.file import create_file
 from zkvm_fuzzer_utils.project import AbstractCircuitProjectGenerator
 from zkvm_fuzzer_utils.rust.common import (
     ir_type_to_str,
+    stream_batch_main_routine,
     stream_circuit_output_and_compare_routine,
+    stream_session_end,
+    stream_session_run_routine,
+    stream_step_bound_fields,
+    stream_step_bound_setup,
+    stream_trace_fields,
+    stream_trace_setup,
+    stream_typed_inputs_definitions,
+    stream_typed_inputs_fields,
 )
 from zkvm_fuzzer_utils.rust.ir2rust import CircIL2UnsafeRustEmitter
 
@@ -69,7 +76,7 @@ class CircuitProjectGenerator(AbstractCircuitProjectGenerator):
             "20ac6eb526af383e7b597273990b5e4b783cc2a6",
             "70c77337426615b67191b301e9175e2bb093830d",
         ]:
-            shutil.copy2(self.zkvm_path / "Cargo.lock", self.root / "Cargo.lock")
+            self.create_file(self.root / "Cargo.lock", (self.zkvm_path / "Cargo.lock").read_text())
 
         self.create_root_cargo_toml()
         self.create_root_rust_toolchain()
@@ -96,6 +103,7 @@ lto = "fat"
 
 [dependencies]
 clap = { version = "4.0", features = ["derive", "env"] }
+rayon = "1"
 """
         )
 
@@ -134,10 +142,10 @@ icicle = ["jolt-sdk/icicle"]
         buffer.write("\n")
         buffer.write(f"{self.patch_crates_io_section}")
 
-        create_file(self.root / "Cargo.toml", buffer.getvalue())
+        self.create_file(self.root / "Cargo.toml", buffer.getvalue())
 
     def create_root_rust_toolchain(self):
-        create_file(
+        self.create_file(
             self.root / "rust-toolchain.toml",
             f"""[toolchain]
 channel = "{get_rust_toolchain_version(self.commit_or_branch)}"
@@ -157,16 +165,22 @@ components = ["cargo", "rustc", "clippy", "rustfmt"]
             """use clap::Parser;
 use std::time::Instant;
 
-#[derive(Parser, Debug)]
+"""
+        )
+        stream_typed_inputs_definitions(buffer)
+        buffer.write(
+            """#[derive(Parser, Debug)]
 #[clap(author, version, about, long_about = None)]
 struct Args {
-        """
+"""
         )
+        stream_typed_inputs_fields(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_fields(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    #[clap(long)]\n")
-            buffer.write("    trace: bool,\n")
-            buffer.write("\n")
+            stream_trace_fields(buffer)
 
         if self.is_fault_injection:
             buffer.write('    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]\n')
@@ -182,42 +196,15 @@ struct Args {
             buffer.write("    #[clap(long)]\n")
             buffer.write("    inject_kind: Option<String>,\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write("\n")
-            buffer.write("    #[clap(long)]\n")
-            buffer.write(f"    {e.name}: {ir_type_to_str(e.ty_hint)},\n")
-
         buffer.write(
             """}
 
-pub fn main() {
-
-    let args = Args::parse();
 """
         )
-
-        if self.is_trace_collection:
-            buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
-
-        if self.is_fault_injection:
-            buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
-            buffer.write("    if args.inject {\n")
-            buffer.write("        fuzzer_utils::set_seed(args.seed.unwrap());\n")
-            buffer.write("        fuzzer_utils::set_injection_step(args.inject_step.unwrap());\n")
-            buffer.write("        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());\n")
-            buffer.write("        fuzzer_utils::disable_assertions();\n")
-            buffer.write("    } else {\n")
-            buffer.write("        fuzzer_utils::enable_assertions();\n")
-            buffer.write("    }\n\n")
-
-        buffer.write(f"    let circuit_inputs: [u32; {len(self.circuit_candidate.inputs)}] = [\n")
-        for e in self.circuit_candidate.inputs:
-            buffer.write(f"        args.{e.name} as u32,\n")
-        buffer.write("    ];\n")
+        stream_batch_main_routine(buffer, [], self.requires_fuzzer_utils)
 
         buffer.write(
-            """
-    println!(
+            """    println!(
         "<record>{{\\
             \\"context\\":\\"Compiler\\", \\
             \\"status\\":\\"start\\"\\
@@ -280,7 +267,35 @@ pub fn main() {
         }}</record>",
         timer.elapsed()
     );
+"""
+        )
+        stream_session_run_routine(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_setup(buffer)
 
+        if self.is_trace_collection:
+            stream_trace_setup(buffer)
+
+        if self.is_fault_injection:
+            buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
+            buffer.write("    if args.inject {\n")
+            buffer.write("        fuzzer_utils::set_seed(args.seed.unwrap());\n")
+            buffer.write("        fuzzer_utils::set_injection_step(args.inject_step.unwrap());\n")
+            buffer.write("        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());\n")
+            buffer.write("        fuzzer_utils::disable_assertions();\n")
+            buffer.write("    } else {\n")
+            buffer.write("        fuzzer_utils::enable_assertions();\n")
+            buffer.write("    }\n\n")
+
+        # NOTE: the provable guest function fixes the arity, so its sizes remain bundle specific
+        buffer.write(
+            f"    let circuit_inputs: [u32; {len(self.circuit_candidate.inputs)}]"
+            " = args.inputs.as_u32_array();\n"
+        )
+
+        buffer.write(
+            """
     println!(
         "<record>{{\\
             \\"context\\":\\"Prover\\", \\
@@ -371,14 +386,14 @@ pub fn main() {
         }}</record>",
         timer.elapsed()
     );
-}
 """
         )
+        stream_session_end(buffer)
 
-        create_file(self.root / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "src" / "main.rs", buffer.getvalue())
 
     def create_guest_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "guest" / "Cargo.toml",
             f"""[package]
 name = "jolt-guest"
@@ -394,7 +409,7 @@ jolt = {{ package = "jolt-sdk", path = "{self.zkvm_path}/jolt-sdk" }}
         )
 
     def create_guest_main_rs(self):
-        create_file(
+        self.create_file(
             self.root / "guest" / "src" / "main.rs",
             """#![cfg_attr(feature = "guest", no_std)]
 #![no_main]
@@ -462,7 +477,7 @@ use jolt_guest::*;
 
         buffer.write("}\n")
 
-        create_file(self.root / "guest" / "src" / "lib.rs", buffer.getvalue())
+        self.create_file(self.root / "guest" / "src" / "lib.rs", buffer.getvalue())
 
 
 # ---------------------------------------------------------------------------- #
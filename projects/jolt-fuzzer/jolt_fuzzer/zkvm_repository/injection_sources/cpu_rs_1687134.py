@@ -133,7 +133,16 @@ impl RV32IMFaultInjectionContext {
 
     pub fn print_trace_info(&self, instr: &RV32IMInstruction, word: u32, pc: u64) {
         let name: &'static str = instr.into();
-        if self.trace_info_enabled {
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(pc as u32)
+            && !fuzzer_utils::write_trace_record(
+                self.current_step,
+                pc as u32,
+                fuzzer_utils::trace_static_instruction_id(name),
+                word,
+            )
+        {
             println!(
                 "<trace>{{\\
                     \\"step\\":{}, \\
@@ -158,11 +167,7 @@ impl RV32IMFaultInjectionContext {
 
     pub fn step(&mut self) {
         self.current_step += 1;
-
-        // TODO: in the future this should be either dynamic or a setting
-        if self.current_step > 1000000 {
-            panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-        }
+        fuzzer_utils::check_step_bound(self.current_step);
     }
 
     pub fn random_word(&mut self, word: u32) -> u32 {
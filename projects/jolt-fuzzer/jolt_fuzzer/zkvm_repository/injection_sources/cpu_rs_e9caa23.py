@@ -125,8 +125,17 @@ impl RV32IMFaultInjectionContext {
         }
     }
 
-    pub fn print_trace_info(&self, inst: &Instruction, pc: u64, asm: &String) {
-        if self.trace_info_enabled {
+    pub fn print_trace_info(&self, inst: &Instruction, word: u32, pc: u64, asm: &String) {
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(pc as u32)
+            && !fuzzer_utils::write_trace_record(
+                self.current_step,
+                pc as u32,
+                fuzzer_utils::trace_static_instruction_id(inst.name),
+                word,
+            )
+        {
             println!(
                 "<trace>{{\\
                     \\"step\\":{}, \\
@@ -150,11 +159,7 @@ impl RV32IMFaultInjectionContext {
 
     pub fn step(&mut self) {
         self.current_step += 1;
-
-        // TODO: in the future this should be either dynamic or a setting
-        if self.current_step > 1000000 {
-            panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-        }
+        fuzzer_utils::check_step_bound(self.current_step);
     }
 
     pub fn random_word(&mut self, word: u32) -> u32 {
@@ -492,7 +497,7 @@ impl Cpu {
                     );
 
                     let inst_asm = (new_inst.disassemble)(self, new_word, self.pc, true);
-                    self.fault_injection_context.print_trace_info(&new_inst, self.pc, &inst_asm);
+                    self.fault_injection_context.print_trace_info(&new_inst, new_word, self.pc, &inst_asm);
 
                     // < ------- >
 
@@ -519,7 +524,7 @@ impl Cpu {
                     // <----------------------- START OF FAULT INJECTION ----------------------->
 
                     let inst_asm = (inst.disassemble)(self, word, self.pc, true);
-                    self.fault_injection_context.print_trace_info(&inst, self.pc, &inst_asm);
+                    self.fault_injection_context.print_trace_info(&inst, word, self.pc, &inst_asm);
 
                     // <------------------------ END OF FAULT INJECTION ------------------------>
 
@@ -16,6 +16,24 @@
 : "${ONLY_MOD_WORD:=true}"
 : "${NO_INLINE_ASSEMBLY:=false}"
 : "${NO_SCHEDULAR:=false}"
+: "${BATCH_EXECUTION:=false}"
+: "${SERVER_EXECUTION:=false}"
+: "${FORK_SERVER_EXECUTION:=false}"
+: "${PARALLEL_EXECUTIONS:=1}"
+: "${MEMORY_BUDGET:=0}"
+: "${BUILD_AHEAD:=false}"
+: "${BINARY_TRACE:=false}"
+: "${TRACE_SUFFIX:=}"
+: "${TRACE_CIRCUITS_ONLY:=false}"
+: "${INJECTION_SAMPLING:=all}"
+: "${INJECTIONS_PER_TRACE:=1}"
+: "${STEP_BOUND:=1000000}"
+: "${STEP_OVERFLOW:=panic}"
+: "${CGROUP_ROOT:=}"
+: "${CGROUP_CPUS:=}"
+: "${BUILD_CACHE:=}"
+: "${BUILD_CACHE_QUOTA:=10240}"
+: "${SHARED_TARGET_DIR:=}"
 
 # ---------------------------------------------------------------------------- #
 #                                    Commits                                   #
@@ -34,7 +34,9 @@ from zkvm_fuzzer_utils.fuzzer import (
     FuzzerConfig,
 )
 from zkvm_fuzzer_utils.injection import InjectionArguments
+from zkvm_fuzzer_utils.output import OutputParser
 from zkvm_fuzzer_utils.risc32_im import RISCV_I_EXTENSION
+from zkvm_fuzzer_utils.stream import AbortPredicate, OutputPattern
 from zkvm_fuzzer_utils.trace import Trace
 
 logger = logging.getLogger("fuzzer")
@@ -121,18 +123,33 @@ def create_checker_config() -> CheckerConfig:
 # ---------------------------------------------------------------------------- #
 
 
+GUEST_DIVISION_OR_MODULO_BY_ZERO_PATTERN = (
+    r"Emulated program panic in file 'guest/src/main.rs' "  # force default guest file
+    r"at line [0-9]+: (attempt to divide by zero|"  # match on arbitrary line and id
+    r"attempt to calculate the remainder with a divisor of zero)"  # match a division by zero
+)
+
+
 def guest_division_or_modulo_by_zero(status: ExecStatus) -> bool:
-    pattern = re.compile(
-        r"Emulated program panic in file 'guest/src/main.rs' "  # force default guest file
-        r"at line [0-9]+: (attempt to divide by zero|"  # match on arbitrary line and id
-        r"attempt to calculate the remainder with a divisor of zero)"  # match a division by zero
-    )
+    pattern = re.compile(GUEST_DIVISION_OR_MODULO_BY_ZERO_PATTERN)
     opt_match = pattern.search(status.stdout)
     if opt_match:
         return True
     return False
 
 
+# ---------------------------------------------------------------------------- #
+
+
+def guest_division_or_modulo_by_zero_predicates() -> list[AbortPredicate]:
+    """Abort predicates for the ignored errors of `guest_division_or_modulo_by_zero`"""
+    return [
+        OutputPattern(
+            "guest division or modulo by zero", [GUEST_DIVISION_OR_MODULO_BY_ZERO_PATTERN]
+        )
+    ]
+
+
 # ---------------------------------------------------------------------------- #
 #                                    Fuzzer                                    #
 # ---------------------------------------------------------------------------- #
@@ -159,15 +176,17 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
         )
         self.commit_or_branch = commit_or_branch
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.is_fault_injection,
             self.is_trace_collection,
             self.commit_or_branch,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
     def is_skip_fault_injection_inspection(
         self, trace: Trace, arguments: InjectionArguments[InjectionKind]
@@ -180,9 +199,16 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
             return True
         return False
 
+    def create_abort_predicates(self, output_parser: OutputParser) -> list[AbortPredicate]:
+        return guest_division_or_modulo_by_zero_predicates()
+
     def is_ignored_execution_error(self, exec_status: ExecStatus) -> bool:
         return guest_division_or_modulo_by_zero(exec_status)
 
+    def is_binary_trace_supported(self) -> bool:
+        # NOTE: every commit injects an emulator that writes trace records
+        return True
+
 
 # ---------------------------------------------------------------------------- #
 #                                    Checker                                   #
@@ -209,15 +235,17 @@ class CircuitChecker(CircuitCheckerBase[InstrKind, InjectionKind]):
         )
         self.commit_or_branch = commit_or_branch
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.active_finding.is_injection,
             "--trace" in self.active_finding.input_flags,
             self.commit_or_branch,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
 
 # ---------------------------------------------------------------------------- #
@@ -9,11 +9,19 @@ from nexus_fuzzer.settings import (
     get_riscv_target,
     get_rust_toolchain_version,
 )
-from zkvm_fuzzer_utils.file import create_file
 from zkvm_fuzzer_utils.project import AbstractCircuitProjectGenerator
 from zkvm_fuzzer_utils.rust.common import (
     ir_type_to_str,
+    stream_batch_main_routine,
     stream_circuit_output_and_compare_routine,
+    stream_session_end,
+    stream_session_run_routine,
+    stream_step_bound_fields,
+    stream_step_bound_setup,
+    stream_trace_fields,
+    stream_trace_setup,
+    stream_typed_inputs_definitions,
+    stream_typed_inputs_fields,
 )
 from zkvm_fuzzer_utils.rust.ir2rust import CircIL2UnsafeRustEmitter
 
@@ -43,7 +51,7 @@ class CircuitProjectGenerator(AbstractCircuitProjectGenerator):
         self.create_guest_main_rs()
 
     def create_root_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "Cargo.toml",
             """[workspace]
 members = [
@@ -57,7 +65,7 @@ resolver = "2"
         )
 
     def create_root_rust_toolchain(self):
-        create_file(
+        self.create_file(
             self.root / "rust-toolchain.toml",
             f"""[toolchain]
 channel = "{get_rust_toolchain_version(self.commit_or_branch)}"
@@ -67,7 +75,7 @@ profile = "minimal"
         )
 
     def create_guest_cargo_config_toml(self):
-        create_file(
+        self.create_file(
             self.root / "guest" / ".cargo" / "config.toml",
             f"""[build]
 target = "{get_riscv_target(self.commit_or_branch)}"
@@ -91,13 +99,14 @@ default-run = "nexus-host"
 [dependencies]
 nexus-sdk = {{ path = "{self.zkvm_path}/sdk" }}
 clap = {{ version = "4.0", features = ["derive", "env"] }}
+rayon = "1"
 """
         )
 
         if self.requires_fuzzer_utils:
             buffer.write(f'fuzzer_utils = {{ path = "{self.zkvm_path}/fuzzer_utils" }}\n')
 
-        create_file(
+        self.create_file(
             self.root / "host" / "Cargo.toml",
             buffer.getvalue(),
         )
@@ -117,16 +126,22 @@ clap = {{ version = "4.0", features = ["derive", "env"] }}
 use clap::Parser;
 use std::time::Instant;
 
-#[derive(Parser, Debug)]
+"""
+        )
+        stream_typed_inputs_definitions(buffer)
+        buffer.write(
+            """#[derive(Parser, Debug)]
 #[clap(author, version, about, long_about = None)]
 struct Args {
 """
         )
+        stream_typed_inputs_fields(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_fields(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    #[clap(long)]\n")
-            buffer.write("    trace: bool,\n")
-            buffer.write("\n")
+            stream_trace_fields(buffer)
 
         if self.is_fault_injection:
             buffer.write('    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]\n')
@@ -142,39 +157,14 @@ struct Args {
             buffer.write("    #[clap(long)]\n")
             buffer.write("    inject_kind: Option<String>,\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write("\n")
-            buffer.write("    #[clap(long)]\n")
-            buffer.write(f"    {e.name}: {ir_type_to_str(e.ty_hint)},\n")
-
         buffer.write(
             """}
 
 const PACKAGE: &str = "nexus-guest";
 
-fn main() {
-    let args = Args::parse();
 """
         )
-
-        if self.is_trace_collection:
-            buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
-
-        if self.is_fault_injection:
-            buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
-            buffer.write("    if args.inject {\n")
-            buffer.write("        fuzzer_utils::set_seed(args.seed.unwrap());\n")
-            buffer.write("        fuzzer_utils::set_injection_step(args.inject_step.unwrap());\n")
-            buffer.write("        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());\n")
-            buffer.write("        fuzzer_utils::disable_assertions();\n")
-            buffer.write("    } else {\n")
-            buffer.write("        fuzzer_utils::enable_assertions();\n")
-            buffer.write("    }\n\n")
-
-        buffer.write(f"    let circuit_inputs: [u32; {len(self.circuit_candidate.inputs)}] = [\n")
-        for e in self.circuit_candidate.inputs:
-            buffer.write(f"        args.{e.name} as u32,\n")
-        buffer.write("    ];\n")
+        stream_batch_main_routine(buffer, [], self.requires_fuzzer_utils)
 
         public_input = "&circuit_inputs"
         private_input = "&(" + ", ".join(["circuit_inputs" for _ in self.circuits]) + ")"
@@ -182,8 +172,7 @@ fn main() {
         private_input_type = "(" + ", ".join([public_input_type for _ in self.circuits]) + ")"
 
         buffer.write(
-            """
-    println!(
+            """    println!(
         "<record>{{\\
             \\"context\\":\\"Compiler\\", \\
             \\"status\\":\\"start\\"\\
@@ -194,7 +183,8 @@ fn main() {
     let mut prover_compiler = Compiler::<CargoPackager>::new(PACKAGE);
     let prover : Stwo<Local> = Stwo::compile(&mut prover_compiler).expect("compile");
 
-    let elf = prover.elf.clone(); // save elf for use with test verification
+    // NOTE: proving consumes the prover, so the session keeps the compiled elf
+    let elf = prover.elf.clone();
 
     println!(
         "<record>{{\\
@@ -204,7 +194,35 @@ fn main() {
         }}</record>",
         timer.elapsed()
     );
+"""
+        )
+        stream_session_run_routine(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_setup(buffer)
+
+        if self.is_trace_collection:
+            stream_trace_setup(buffer)
+
+        if self.is_fault_injection:
+            buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
+            buffer.write("    if args.inject {\n")
+            buffer.write("        fuzzer_utils::set_seed(args.seed.unwrap());\n")
+            buffer.write("        fuzzer_utils::set_injection_step(args.inject_step.unwrap());\n")
+            buffer.write("        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());\n")
+            buffer.write("        fuzzer_utils::disable_assertions();\n")
+            buffer.write("    } else {\n")
+            buffer.write("        fuzzer_utils::enable_assertions();\n")
+            buffer.write("    }\n\n")
 
+        # NOTE: the guest reads typed tuples of arrays, so only their sizes remain bundle specific
+        buffer.write(
+            f"    let circuit_inputs: [u32; {len(self.circuit_candidate.inputs)}]"
+            " = args.inputs.as_u32_array();\n"
+        )
+
+        buffer.write(
+            """
     println!(
         "<record>{{\\
             \\"context\\":\\"Prover\\", \\
@@ -217,6 +235,7 @@ fn main() {
 
         buffer.write(
             f"""
+    let prover: Stwo<Local> = Stwo::new(&elf).expect("prover setup failed");
     let (view, proof) = prover.prove_with_input::<{private_input_type}, {public_input_type}>(
         {private_input}, {public_input}
     ).expect("prover failed");
@@ -308,13 +327,14 @@ fn main() {
         }}</record>",
         timer.elapsed()
     );
-}"""
+"""
         )
+        stream_session_end(buffer)
 
-        create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
 
     def create_guest_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "guest" / "Cargo.toml",
             f"""[package]
 name = "nexus-guest"
@@ -390,4 +410,4 @@ fn main(
 
         buffer.write("}")
 
-        create_file(self.root / "guest" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "guest" / "src" / "main.rs", buffer.getvalue())
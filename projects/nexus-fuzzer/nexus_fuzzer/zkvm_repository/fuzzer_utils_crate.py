@@ -1,6 +1,11 @@
 from pathlib import Path
 
+from nexus_fuzzer.kinds import InstrKind
 from zkvm_fuzzer_utils.file import create_file
+from zkvm_fuzzer_utils.rust.common import (
+    step_bound_definitions,
+    trace_channel_definitions,
+)
 
 # ---------------------------------------------------------------------------- #
 #                           Fuzzer Util Crate Creator                          #
@@ -24,7 +29,6 @@ version = "1.0.0"
 edition = "2021"
 
 [dependencies]
-once_cell = "1.18.0"
 """,
     )
 
@@ -35,15 +39,17 @@ once_cell = "1.18.0"
 def create_lib_rs(install_path: Path):
     create_file(
         install_path / "fuzzer_utils" / "src" / "lib.rs",
-        """use std::sync::atomic::{AtomicBool, Ordering};
-use once_cell::sync::Lazy;
-use std::sync::Mutex;
+        """use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::RwLock;
+
+// NOTE: the flags, the seed and the injection step are atomics, so reading them never
+//       blocks the emulator. Only the injection kind is behind a lock.
 
 ////////////////
 // ASSERTIONS
 /////////
 
-pub static GLOBAL_FUZZING_ASSERTION_FLAG: Lazy<AtomicBool> = Lazy::new(|| AtomicBool::new(true));
+pub static GLOBAL_FUZZING_ASSERTION_FLAG: AtomicBool = AtomicBool::new(true);
 
 pub fn assertions_enabled() -> bool {
     GLOBAL_FUZZING_ASSERTION_FLAG.load(Ordering::Relaxed)
@@ -116,23 +122,21 @@ macro_rules! fuzzer_assert_eq {
 // SEED
 /////////
 
-static GLOBAL_SEED: Lazy<Mutex<u64>> = Lazy::new(|| Mutex::new(0));
+static GLOBAL_SEED: AtomicU64 = AtomicU64::new(0);
 
 pub fn set_seed(value: u64) {
-    let mut state = GLOBAL_SEED.lock().unwrap();
-    *state = value;
+    GLOBAL_SEED.store(value, Ordering::Relaxed);
 }
 
 pub fn get_seed() -> u64 {
-    let state = GLOBAL_SEED.lock().unwrap();
-    *state
+    GLOBAL_SEED.load(Ordering::Relaxed)
 }
 
 ////////////////
 // FAULT INJECTION
 /////////
 
-pub static GLOBAL_INJECTION_FLAG: Lazy<AtomicBool> = Lazy::new(|| AtomicBool::new(false));
+pub static GLOBAL_INJECTION_FLAG: AtomicBool = AtomicBool::new(false);
 
 pub fn injection_enabled() -> bool {
     GLOBAL_INJECTION_FLAG.load(Ordering::Relaxed)
@@ -150,35 +154,31 @@ pub fn disable_injection() {
     GLOBAL_INJECTION_FLAG.store(false, Ordering::Relaxed);
 }
 
-static GLOBAL_INJECTION_KIND: Lazy<Mutex<String>> = Lazy::new(|| Mutex::new(String::new()));
+static GLOBAL_INJECTION_KIND: RwLock<String> = RwLock::new(String::new());
 
 pub fn set_injection_kind(value: String) {
-    let mut state = GLOBAL_INJECTION_KIND.lock().unwrap();
-    *state = value.clone();
+    *GLOBAL_INJECTION_KIND.write().unwrap() = value;
 }
 
 pub fn get_injection_kind() -> String {
-    let state = GLOBAL_INJECTION_KIND.lock().unwrap();
-    (*state).clone()
+    GLOBAL_INJECTION_KIND.read().unwrap().clone()
 }
 
-static GLOBAL_INJECTION_STEP: Lazy<Mutex<u64>> = Lazy::new(|| Mutex::new(0));
+static GLOBAL_INJECTION_STEP: AtomicU64 = AtomicU64::new(0);
 
 pub fn set_injection_step(value: u64) {
-    let mut state = GLOBAL_INJECTION_STEP.lock().unwrap();
-    *state = value;
+    GLOBAL_INJECTION_STEP.store(value, Ordering::Relaxed);
 }
 
 pub fn get_injection_step() -> u64 {
-    let state = GLOBAL_INJECTION_STEP.lock().unwrap();
-    *state
+    GLOBAL_INJECTION_STEP.load(Ordering::Relaxed)
 }
 
 ////////////////
 // TRACE LOGGING
 /////////
 
-pub static GLOBAL_TRACE_LOG_FLAG: Lazy<AtomicBool> = Lazy::new(|| AtomicBool::new(false));
+pub static GLOBAL_TRACE_LOG_FLAG: AtomicBool = AtomicBool::new(false);
 
 pub fn trace_log_enabled() -> bool {
     GLOBAL_TRACE_LOG_FLAG.load(Ordering::Relaxed)
@@ -195,7 +195,24 @@ pub fn enable_trace_logging() {
 pub fn disable_trace_logging() {
     GLOBAL_TRACE_LOG_FLAG.store(false, Ordering::Relaxed);
 }
-""",
+
+////////////////
+// RESET
+/////////
+
+/// Restores the initial state, used between executions of a batched host.
+pub fn reset_state() {
+    enable_assertions();
+    set_seed(0);
+    disable_injection();
+    set_injection_kind(String::new());
+    set_injection_step(0);
+    disable_trace_logging();
+    reset_step_bound();
+}
+"""
+        + trace_channel_definitions(InstrKind)
+        + step_bound_definitions(),
     )
 
 
@@ -203,11 +203,7 @@ impl RV32IMFaultInjectionContext {
 
     pub fn step(&mut self) {
         self.current_step += 1;
-
-        // TODO: in the future this should be either dynamic or a setting
-        if self.current_step > 1000000 {
-            panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-        }
+        fuzzer_utils::check_step_bound(self.current_step);
     }
 
     pub fn print_injection_info(
@@ -246,8 +242,22 @@ impl RV32IMFaultInjectionContext {
             && self.injection_type == injection_type
     }
 
+    fn write_trace_record(&self, pc: u32, instruction: &Instruction) -> bool {
+        if !fuzzer_utils::is_trace_channel_open() {
+            return false;
+        }
+        let word = encode_instruction(instruction);
+        let instruction_id =
+            fuzzer_utils::trace_encoded_instruction_id(word, &instruction.opcode.name());
+        fuzzer_utils::write_trace_record(self.current_step, pc, instruction_id, word)
+    }
+
     pub fn print_trace_info(&self, pc: u32, instruction: &Instruction, emulator_id: &str) {
-        if self.trace_info_enabled {
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(pc)
+            && !self.write_trace_record(pc, instruction)
+        {
             println!(
                 "<trace>{{\\
                     \\"step\\":{}, \\
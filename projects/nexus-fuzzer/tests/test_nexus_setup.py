@@ -58,11 +58,18 @@ def test_injection_source():
             [clippy_driver_bin, source_file], text=True, capture_output=True
         )
         lines = completed_process.stderr.split("\n")
+        error_count = 0
         for line in lines:
             is_error = False
 
+            # NOTE: the summary has to count exactly the expected errors seen before, so no
+            #       error is hidden from the checks below
+            if line.startswith("error: aborting due to"):
+                is_error = not line.startswith(f"error: aborting due to {error_count} previous")
+
             # check for unknown errors
-            if line.startswith("error"):
+            elif line.startswith("error"):
+                error_count += 1
                 is_error = True
                 if (
                     line.startswith("error[E0412]: cannot find type")
@@ -70,7 +77,6 @@ def test_injection_source():
                     or line.startswith("error[E0432]: unresolved import")
                     or line.startswith("error[E0433]: failed to resolve")
                     or line.startswith("error[E0601]: `main` function not found")
-                    or line.startswith("error: aborting due to 61 previous errors")
                 ):
                     is_error = False
 
@@ -25,6 +25,21 @@ class OpenVMFuzzerClient(FuzzerClient):
         logger.info(f" * trace: {self.is_trace_collection}")
         logger.info(f" * injection: {self.is_fault_injection}")
         logger.info(f" * schedular: {self.is_no_schedular}")
+        logger.info(f" * batch: {self.is_batch_execution}")
+        logger.info(f" * server: {self.is_server_execution}")
+        logger.info(f" * fork server: {self.is_fork_server_execution}")
+        logger.info(f" * parallel: {self.parallel_executions}")
+        logger.info(f" * memory budget: {self.memory_budget}")
+        logger.info(f" * build ahead: {self.is_build_ahead}")
+        logger.info(f" * binary trace: {self.is_binary_trace}")
+        logger.info(f" * trace suffix: {self.trace_suffix}")
+        logger.info(f" * trace circuits only: {self.is_trace_circuits_only}")
+        logger.info(f" * injection sampling: {self.injection_sampling}")
+        logger.info(f" * injections per trace: {self.injections_per_trace}")
+        logger.info(f" * step bound: {self.step_bound} ({self.step_overflow})")
+        logger.info(f" * cgroup root: {self.cgroup_root} ({self.cgroup_cpus} cpus)")
+        logger.info(f" * build cache: {self.build_cache_dir}")
+        logger.info(f" * shared target dir: {self.shared_target_dir}")
         logger.info(f" * commit: {self.commit_or_branch}")
         logger.info("===")
 
@@ -49,6 +64,33 @@ class OpenVMFuzzerClient(FuzzerClient):
         if self.is_no_schedular:
             fuzzer.disable_injection_schedular()
 
+        if self.is_batch_execution:
+            fuzzer.enable_batch_execution()
+        if self.is_server_execution:
+            fuzzer.enable_server_execution()
+        if self.is_fork_server_execution:
+            fuzzer.enable_fork_server_execution()
+
+        fuzzer.set_parallel_executions(self.parallel_executions)
+        fuzzer.set_memory_budget(self.memory_budget)
+
+        if self.is_build_ahead:
+            fuzzer.enable_build_ahead()
+        if self.is_binary_trace:
+            fuzzer.enable_binary_trace()
+        fuzzer.set_trace_suffix(self.trace_suffix)
+        if self.is_trace_circuits_only:
+            fuzzer.enable_trace_circuits_only()
+        fuzzer.set_injection_sampling(self.injection_sampling)
+        fuzzer.set_injections_per_trace(self.injections_per_trace)
+        fuzzer.set_step_bound(self.step_bound)
+        fuzzer.set_step_overflow(self.step_overflow)
+        fuzzer.set_cgroup_root(self.cgroup_root)
+        fuzzer.set_cgroup_cpus(self.cgroup_cpus)
+
+        fuzzer.set_build_cache(self.create_build_cache())
+        fuzzer.set_shared_target_dir(self.shared_target_dir)
+
         fuzzer.loop()
 
         logger.info(f"=== End {self.logger_prefix} Fuzzing Campaign ===")
@@ -1,4 +1,5 @@
 import logging
+import re
 from pathlib import Path
 from random import Random
 
@@ -31,6 +32,8 @@ from zkvm_fuzzer_utils.fuzzer import (
     FuzzerConfig,
 )
 from zkvm_fuzzer_utils.injection import InjectionArguments
+from zkvm_fuzzer_utils.output import OutputParser
+from zkvm_fuzzer_utils.stream import AbortPredicate, OutputPattern
 from zkvm_fuzzer_utils.trace import Trace
 
 logger = logging.getLogger("fuzzer")
@@ -98,9 +101,13 @@ def create_fuzzer_config(only_modify_word: bool) -> FuzzerConfig:
 # ---------------------------------------------------------------------------- #
 
 
+GUEST_DIVISION_BY_ZERO_MESSAGE = "attempt to divide by zero"
+GUEST_MODULO_BY_ZERO_MESSAGE = "attempt to calculate the remainder with a divisor of zero"
+
+
 def guest_division_by_zero(status: ExecStatus) -> bool:
     # NOTE: panics of the guests are actually inside of stdout
-    if "attempt to divide by zero" in status.stdout:
+    if GUEST_DIVISION_BY_ZERO_MESSAGE in status.stdout:
         return True
     return False
 
@@ -110,11 +117,23 @@ def guest_division_by_zero(status: ExecStatus) -> bool:
 
 def guest_modulo_by_zero(status: ExecStatus) -> bool:
     # NOTE: panics of the guests are actually inside of stdout
-    if "attempt to calculate the remainder with a divisor of zero" in status.stdout:
+    if GUEST_MODULO_BY_ZERO_MESSAGE in status.stdout:
         return True
     return False
 
 
+# ---------------------------------------------------------------------------- #
+
+
+def guest_division_or_modulo_by_zero_predicates() -> list[AbortPredicate]:
+    """Abort predicates for the ignored errors of `guest_division_by_zero` and
+    `guest_modulo_by_zero`"""
+    return [
+        OutputPattern("guest division by zero", [re.escape(GUEST_DIVISION_BY_ZERO_MESSAGE)]),
+        OutputPattern("guest modulo by zero", [re.escape(GUEST_MODULO_BY_ZERO_MESSAGE)]),
+    ]
+
+
 # ---------------------------------------------------------------------------- #
 #                                    Fuzzer                                    #
 # ---------------------------------------------------------------------------- #
@@ -141,21 +160,26 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
         )
         self.commit_or_branch = commit_or_branch
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.is_fault_injection,
             self.is_trace_collection,
             self.commit_or_branch,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
     def is_skip_fault_injection_inspection(
         self, trace: Trace, arguments: InjectionArguments[InjectionKind]
     ) -> bool:
         return False
 
+    def create_abort_predicates(self, output_parser: OutputParser) -> list[AbortPredicate]:
+        return guest_division_or_modulo_by_zero_predicates()
+
     def is_ignored_execution_error(self, exec_status: ExecStatus) -> bool:
         return guest_division_by_zero(exec_status) or guest_modulo_by_zero(exec_status)
 
@@ -5,11 +5,20 @@ from circil.ir.node import Circuit
 from openvm_fuzzer.settings import (
     RUST_GUEST_CORRECT_VALUE,
 )
-from zkvm_fuzzer_utils.file import create_file
 from zkvm_fuzzer_utils.project import AbstractCircuitProjectGenerator
 from zkvm_fuzzer_utils.rust.common import (
     ir_type_to_str,
+    stream_batch_main_routine,
     stream_circuit_output_and_compare_routine,
+    stream_session_end,
+    stream_session_run_routine,
+    stream_step_bound_fields,
+    stream_step_bound_setup,
+    stream_trace_fields,
+    stream_trace_setup,
+    stream_typed_inputs_definitions,
+    stream_typed_inputs_fields,
+    stream_typed_inputs_writes,
 )
 from zkvm_fuzzer_utils.rust.ir2rust import CircIL2UnsafeRustEmitter
 
@@ -79,7 +88,7 @@ class CircuitProjectGenerator(AbstractCircuitProjectGenerator):
         self.create_guest_main_rs()
 
     def create_root_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "Cargo.toml",
             """[workspace]
 members = [
@@ -102,6 +111,7 @@ edition = "2021"
 
 [dependencies]
 clap = { version = "4.0", features = ["derive", "env"] }
+rayon = "1"
 """
         )
 
@@ -119,7 +129,7 @@ openvm-transpiler = {{ path = "{self.zkvm_path}/crates/toolchain/transpiler" }}
 """
         )
 
-        create_file(
+        self.create_file(
             self.root / "host" / "Cargo.toml",
             buffer.getvalue(),
         )
@@ -143,16 +153,22 @@ use openvm_stark_sdk::config::FriParameters;
 use clap::Parser;
 use std::time::Instant;
 
-#[derive(Parser, Debug)]
+"""
+        )
+        stream_typed_inputs_definitions(buffer)
+        buffer.write(
+            """#[derive(Parser, Debug)]
 #[clap(author, version, about, long_about = None)]
 struct Args {
-        """
+"""
         )
+        stream_typed_inputs_fields(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_fields(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    #[clap(long)]\n")
-            buffer.write("    trace: bool,\n")
-            buffer.write("\n")
+            stream_trace_fields(buffer)
 
         if self.is_fault_injection:
             buffer.write('    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]\n')
@@ -168,36 +184,15 @@ struct Args {
             buffer.write("    #[clap(long)]\n")
             buffer.write("    inject_kind: Option<String>,\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write("\n")
-            buffer.write("    #[clap(long)]\n")
-            buffer.write(f"    {e.name}: {ir_type_to_str(e.ty_hint)},\n")
-
         buffer.write(
             """}
 
-fn main() {
-    let args = Args::parse();
 """
         )
-
-        if self.is_trace_collection:
-            buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
-
-        if self.is_fault_injection:
-            buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
-            buffer.write("    if args.inject {\n")
-            buffer.write("        fuzzer_utils::set_seed(args.seed.unwrap());\n")
-            buffer.write("        fuzzer_utils::set_injection_step(args.inject_step.unwrap());\n")
-            buffer.write("        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());\n")
-            buffer.write("        fuzzer_utils::disable_assertions();\n")
-            buffer.write("    } else {\n")
-            buffer.write("        fuzzer_utils::enable_assertions();\n")
-            buffer.write("    }\n")
+        stream_batch_main_routine(buffer, [], self.requires_fuzzer_utils)
 
         buffer.write(
-            """
-    println!(
+            """    println!(
         "<record>{{\\
             \\"context\\":\\"Setup\\", \\
             \\"status\\":\\"start\\"\\
@@ -215,9 +210,6 @@ fn main() {
 """
         )
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write(f"    let {e.name} = args.{e.name};\n")
-
         if self.commit_or_branch == "4285a4f974db90ce11bd21c0642d059cbb8975d0":
             buffer.write(
                 """
@@ -230,8 +222,6 @@ fn main() {
         .expect("guest build");
 
     let exe = sdk.transpile(elf, vm_config.transpiler()).expect("guest transpile");
-
-    let mut stdin = StdIn::default();
 """
             )
         else:
@@ -250,17 +240,9 @@ fn main() {
     ).expect("guest build");
 
     let exe = sdk.transpile(elf, vm_config.transpiler()).expect("guest transpile");
-
-    let mut stdin = StdIn::default();
 """
             )
 
-        for circuit in self.circuits:
-            buffer.write(f"    // -- {circuit.name} --\n")
-            for e in self.circuit_candidate.inputs:
-                buffer.write(f"    stdin.write(&{e.name});\n")
-            buffer.write("\n")
-
         buffer.write(
             """
     let app_log_blowup = 2;
@@ -270,6 +252,7 @@ fn main() {
     let app_committed_exe = sdk.commit_app_exe(app_fri_params, exe).expect("commit app exe");
 
     let app_pk = Arc::new(sdk.app_keygen(app_config).expect("app keygen"));
+    let app_vk = app_pk.get_app_vk();
 
     println!(
         "<record>{{\\
@@ -279,7 +262,32 @@ fn main() {
         }}</record>",
         timer.elapsed()
     );
+"""
+        )
+        stream_session_run_routine(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_setup(buffer)
 
+        if self.is_trace_collection:
+            stream_trace_setup(buffer)
+
+        if self.is_fault_injection:
+            buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
+            buffer.write("    if args.inject {\n")
+            buffer.write("        fuzzer_utils::set_seed(args.seed.unwrap());\n")
+            buffer.write("        fuzzer_utils::set_injection_step(args.inject_step.unwrap());\n")
+            buffer.write("        fuzzer_utils::set_injection_kind(args.inject_kind.unwrap());\n")
+            buffer.write("        fuzzer_utils::disable_assertions();\n")
+            buffer.write("    } else {\n")
+            buffer.write("        fuzzer_utils::enable_assertions();\n")
+            buffer.write("    }\n\n")
+
+        buffer.write("    let mut stdin = StdIn::default();\n")
+        stream_typed_inputs_writes(buffer, "stdin.write(&value);")
+
+        buffer.write(
+            """
     println!(
         "<record>{{\\
             \\"context\\":\\"Prover\\", \\
@@ -322,7 +330,6 @@ fn main() {
     );
     let timer = Instant::now();
 
-    let app_vk = app_pk.get_app_vk();
     sdk.verify_app_proof(&app_vk, &proof).expect("verify");
 
     println!(
@@ -333,13 +340,14 @@ fn main() {
         }}</record>",
         timer.elapsed()
     );
-}"""
+"""
         )
+        stream_session_end(buffer)
 
-        create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
 
     def create_guest_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "guest" / "Cargo.toml",
             f"""[package]
 name = "openvm-guest"
@@ -400,4 +408,4 @@ fn main() {
 
         buffer.write("}\n")
 
-        create_file(self.root / "guest" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "guest" / "src" / "main.rs", buffer.getvalue())
@@ -1,6 +1,11 @@
 from pathlib import Path
 
+from openvm_fuzzer.kinds import InstrKind
 from zkvm_fuzzer_utils.file import create_file
+from zkvm_fuzzer_utils.rust.common import (
+    step_bound_definitions,
+    trace_channel_definitions,
+)
 
 
 def create_cargo_toml(root: Path):
@@ -26,7 +31,9 @@ openvm-stark-backend.workspace = true
 def create_lib_rs(root: Path):
     create_file(
         root / "crates" / "fuzzer_utils" / "src" / "lib.rs",
-        """use std::sync::Mutex;
+        """use std::cell::RefCell;
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Mutex, RwLock};
 use lazy_static::lazy_static;
 use openvm_stark_backend::p3_field::{Field, PrimeField32};
 
@@ -65,50 +72,54 @@ use openvm_instructions::{
 // GLOBAL STATE
 /////////
 
-#[derive(Debug, Clone)]
-pub struct GlobalState {
-    pub trace_logging: bool,
-    pub injection: bool,
-    pub assertions: bool,
-    pub seed: u64,
-    pub step: u64,
-    pub injection_kind: String,
-    pub injection_step: u64,
-    pub rng: StdRng,
-    pub hint_instruction: String,  // the default is an empty string
-    pub hint_assembly: String,  // the default is an empty string
-    pub hint_pc: u32,  // the default is an empty string
-}
-
-impl GlobalState {
-    fn new() -> Self {
-        Self {
-            trace_logging: false,
-            injection: false,
-            assertions: true,
-            seed: 0,
-            injection_kind: String::new(),
-            step: 0,
-            injection_step: 0,
-            rng: StdRng::seed_from_u64(0),
-            hint_instruction: String::new(),
-            hint_assembly: String::new(),
-            hint_pc: 0,
-        }
-    }
-}
+// NOTE: the step hooks run for every executed instruction, so the configuration and the
+//       step counter are atomics and the hints of the current step are kept in a thread
+//       local buffer. Only the injection kind and the rng are behind locks.
+
+static TRACE_LOGGING: AtomicBool = AtomicBool::new(false);
+static INJECTION: AtomicBool = AtomicBool::new(false);
+static ASSERTIONS: AtomicBool = AtomicBool::new(true);
+static SEED: AtomicU64 = AtomicU64::new(0);
+static STEP: AtomicU64 = AtomicU64::new(0);
+static INJECTION_STEP: AtomicU64 = AtomicU64::new(0);
+static INJECTION_KIND: RwLock<String> = RwLock::new(String::new());
 
 lazy_static! {
-    static ref GLOBAL_STATE: Mutex<GlobalState> = Mutex::new(GlobalState::new());
+    static ref RNG: Mutex<StdRng> = Mutex::new(StdRng::seed_from_u64(0));
+}
+
+/// Hints of the current step, the strings are overwritten in place to reuse their buffers.
+struct StepHints {
+    pc: u32,
+    instruction: String,  // the default is an empty string
+    assembly: String,  // the default is an empty string
+}
+
+thread_local! {
+    static HINTS: RefCell<StepHints> = const {
+        RefCell::new(StepHints { pc: 0, instruction: String::new(), assembly: String::new() })
+    };
+}
+
+/// Restores the initial state, used between executions of a batched host.
+pub fn reset_state() {
+    set_trace_logging(false);
+    set_injection(false);
+    set_assertions(true);
+    set_seed(0);
+    STEP.store(0, Ordering::Relaxed);
+    set_injection_step(0);
+    set_injection_kind(String::new());
+    update_hints(0, "", "");
+    reset_step_bound();
 }
 
 pub fn is_trace_logging() -> bool {
-    GLOBAL_STATE.lock().unwrap().trace_logging
+    TRACE_LOGGING.load(Ordering::Relaxed)
 }
 
 pub fn set_trace_logging(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.trace_logging = value;
+    TRACE_LOGGING.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_trace_logging() {
@@ -120,12 +131,11 @@ pub fn disable_trace_logging() {
 }
 
 pub fn is_injection() -> bool {
-    GLOBAL_STATE.lock().unwrap().injection
+    INJECTION.load(Ordering::Relaxed)
 }
 
 pub fn set_injection(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection = value;
+    INJECTION.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_injection() {
@@ -137,12 +147,11 @@ pub fn disable_injection() {
 }
 
 pub fn is_assertions() -> bool {
-    GLOBAL_STATE.lock().unwrap().assertions
+    ASSERTIONS.load(Ordering::Relaxed)
 }
 
 pub fn set_assertions(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.assertions = value;
+    ASSERTIONS.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_assertions() {
@@ -154,93 +163,98 @@ pub fn disable_assertions() {
 }
 
 pub fn set_seed(value: u64) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.rng = StdRng::seed_from_u64(value);
-    state.seed = value;
+    *RNG.lock().unwrap() = StdRng::seed_from_u64(value);
+    SEED.store(value, Ordering::Relaxed);
 }
 
 pub fn get_seed() -> u64 {
-    GLOBAL_STATE.lock().unwrap().seed
+    SEED.load(Ordering::Relaxed)
 }
 
 pub fn is_injection_kind(value: &str) -> bool {
-    GLOBAL_STATE.lock().unwrap().injection_kind == value
+    *INJECTION_KIND.read().unwrap() == value
 }
 
 pub fn set_injection_kind(value: String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection_kind = value.clone();
+    *INJECTION_KIND.write().unwrap() = value;
 }
 
 pub fn get_injection_kind() -> String {
-    GLOBAL_STATE.lock().unwrap().injection_kind.clone()
+    INJECTION_KIND.read().unwrap().clone()
 }
 
 pub fn inc_step() {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.step += 1;
-
-    // TODO: in the future this should be either dynamic or a setting
-    if state.step > 1000000 {
-        panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-    }
+    let step = STEP.fetch_add(1, Ordering::Relaxed) + 1;
+    check_step_bound(step);
 }
 
 pub fn get_step() -> u64 {
-    GLOBAL_STATE.lock().unwrap().step
+    STEP.load(Ordering::Relaxed)
 }
 
 pub fn get_injection_step() -> u64 {
-    GLOBAL_STATE.lock().unwrap().injection_step
+    INJECTION_STEP.load(Ordering::Relaxed)
 }
 
 pub fn set_injection_step(value: u64) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection_step = value;
+    INJECTION_STEP.store(value, Ordering::Relaxed);
 }
 
 pub fn is_injection_at_step(kind: &str) -> bool {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.injection &&
-        state.step == state.injection_step &&
-        state.injection_kind == kind
+    // NOTE: the kind is only compared at the injection step
+    is_injection() && get_step() == get_injection_step() && is_injection_kind(kind)
 }
 
-pub fn set_hint_instruction(value: &String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_instruction = value.clone();
+pub fn set_hint_instruction(value: &str) {
+    HINTS.with(|hints| {
+        let instruction = &mut hints.borrow_mut().instruction;
+        instruction.clear();
+        instruction.push_str(value);
+    });
 }
 
 pub fn get_hint_instruction() -> String {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.hint_instruction.clone()
+    HINTS.with(|hints| hints.borrow().instruction.clone())
 }
 
-pub fn set_hint_assembly(value: &String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_assembly = value.clone();
+pub fn set_hint_assembly(value: &str) {
+    HINTS.with(|hints| {
+        let assembly = &mut hints.borrow_mut().assembly;
+        assembly.clear();
+        assembly.push_str(value);
+    });
 }
 
 pub fn get_hint_assembly() -> String {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.hint_assembly.clone()
+    HINTS.with(|hints| hints.borrow().assembly.clone())
 }
 
 pub fn set_hint_pc(value: u32) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_pc = value;
+    HINTS.with(|hints| hints.borrow_mut().pc = value);
 }
 
 pub fn get_hint_pc() -> u32 {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.hint_pc
+    HINTS.with(|hints| hints.borrow().pc)
 }
 
-pub fn update_hints(pc: u32, instruction: &String, assembly: &String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_pc = pc;
-    state.hint_instruction = instruction.clone();
-    state.hint_assembly = assembly.clone();
+pub fn update_hints(pc: u32, instruction: &str, assembly: &str) {
+    HINTS.with(|hints| {
+        let hints = &mut *hints.borrow_mut();
+        hints.pc = pc;
+        hints.instruction.clear();
+        hints.instruction.push_str(instruction);
+        hints.assembly.clear();
+        hints.assembly.push_str(assembly);
+    });
+}
+
+/// Returns `true` if the assembly hint of the current step is printed, i.e. by a trace
+/// or a fault record, so emitters only format the assembly hint if needed.
+pub fn is_assembly_hint_needed(pc: u32) -> bool {
+    let step = get_step();
+    is_trace_logging()
+        && ((is_injection() && step == get_injection_step())
+            || (is_trace_step(step) && is_trace_pc(pc)))
 }
 
 ////////////////
@@ -339,60 +353,69 @@ pub fn print_injection_info(
     inject_kind: &str,
     info: &String,
 ) {
-    let state = GLOBAL_STATE.lock().unwrap();
-    if state.trace_logging {
-        println!(
-            "<fault>{{\\
-                \\"step\\":{}, \\
-                \\"pc\\":{}, \\
-                \\"instruction\\":\\"{}\\", \\
-                \\"assembly\\":\\"{}\\", \\
-                \\"kind\\":\\"{}\\", \\
-                \\"info\\":\\"{}\\"\\
-            }}</fault>",
-            state.step,
-            state.hint_pc,
-            state.hint_instruction,
-            state.hint_assembly,
-            inject_kind,
-            info,
-        );
+    if is_trace_logging() {
+        HINTS.with(|hints| {
+            let hints = hints.borrow();
+            println!(
+                "<fault>{{\\
+                    \\"step\\":{}, \\
+                    \\"pc\\":{}, \\
+                    \\"instruction\\":\\"{}\\", \\
+                    \\"assembly\\":\\"{}\\", \\
+                    \\"kind\\":\\"{}\\", \\
+                    \\"info\\":\\"{}\\"\\
+                }}</fault>",
+                get_step(),
+                hints.pc,
+                hints.instruction,
+                hints.assembly,
+                inject_kind,
+                info,
+            );
+        });
     }
 }
 
 pub fn print_trace_info() {
-    let state = GLOBAL_STATE.lock().unwrap();
-    if state.trace_logging {
-        println!(
-            "<trace>{{\\
-                \\"step\\":{}, \\
-                \\"pc\\":{}, \\
-                \\"instruction\\":\\"{}\\", \\
-                \\"assembly\\":\\"{}\\"\\
-            }}</trace>",
-            state.step,
-            state.hint_pc,
-            state.hint_instruction,
-            state.hint_assembly,
-        );
+    let step = get_step();
+    if !is_trace_logging() || !is_trace_step(step) {
+        return;
     }
+    HINTS.with(|hints| {
+        let hints = hints.borrow();
+        // NOTE: the hints carry no instruction word to disassemble, so the step is always
+        //       printed with its assembly instead of being written to the trace channel
+        if is_trace_pc(hints.pc) {
+            println!(
+                "<trace>{{\\
+                    \\"step\\":{}, \\
+                    \\"pc\\":{}, \\
+                    \\"instruction\\":\\"{}\\", \\
+                    \\"assembly\\":\\"{}\\"\\
+                }}</trace>",
+                step,
+                hints.pc,
+                hints.instruction,
+                hints.assembly,
+            );
+        }
+    });
 }
 
-
 ////////////////
 // RANDOMNESS
 /////////
 
 pub fn random_bool() -> bool {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.rng.random::<bool>()
+    let mut rng = RNG.lock().unwrap();
+    rng.random::<bool>()
 }
 
 pub fn random_from_choices<T>(choices: Vec<T>) -> T
     where T : Clone
 {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    choices.choose(&mut state.rng).unwrap().clone()
+    let mut rng = RNG.lock().unwrap();
+    choices.choose(&mut *rng).unwrap().clone()
 }
 
 pub fn random_opcode(rng: &mut StdRng) ->  VmOpcode {
@@ -483,15 +506,15 @@ fn internal_random_mod_of_u32(element: u32, rng: &mut StdRng) -> u32 {
 }
 
 pub fn random_mod_of_u32_array<const LEN: usize>(elements: &[u32; LEN]) -> [u32; LEN] {
-    let mut state = GLOBAL_STATE.lock().unwrap();
+    let mut rng = RNG.lock().unwrap();
 
     let mut new_elements = *elements;
     let mut indices: Vec<usize> = (0..LEN).collect();
-    indices.shuffle(&mut state.rng);
-    let num_to_modify = state.rng.gen_range(1..=LEN);
+    indices.shuffle(&mut *rng);
+    let num_to_modify = rng.gen_range(1..=LEN);
 
     for &i in indices.iter().take(num_to_modify) {
-        new_elements[i] = internal_random_mod_of_u32(elements[i], &mut state.rng);
+        new_elements[i] = internal_random_mod_of_u32(elements[i], &mut *rng);
     }
 
     new_elements
@@ -502,17 +525,17 @@ pub fn random_mutate_field_element<F: Field + PrimeField32>(element: F, rng: &mu
 }
 
 pub fn random_mutate_instruction<F: Field + PrimeField32>(instruction: &Instruction<F>) ->  Instruction<F> {
-    let mut state = GLOBAL_STATE.lock().unwrap();
+    let mut rng = RNG.lock().unwrap();
 
     // create a mutable copy of the old instruction
     let mut new_instruction = instruction.clone();
 
     // pick the fields to updated and how many should be modified
-    let update_fields = state.rng.random_range(1..=8);
+    let update_fields = rng.random_range(1..=8);
     let mut update_options: Vec<u8> = vec![0, 1, 2, 3, 4, 5, 6, 7];
 
     // pick random selection from the available options
-    update_options.shuffle(&mut state.rng);
+    update_options.shuffle(&mut *rng);
     update_options.truncate(update_fields);
 
     // sort the options such that we first pick the new opcode if it is there
@@ -523,15 +546,15 @@ pub fn random_mutate_instruction<F: Field + PrimeField32>(instruction: &Instruct
         match option {
             0 => {
                 new_instruction = Instruction::default(); // full reset
-                new_instruction.opcode = random_new_opcode(instruction.opcode, &mut state.rng);
+                new_instruction.opcode = random_new_opcode(instruction.opcode, &mut *rng);
             },
-            1 => { new_instruction.a = random_mutate_field_element(new_instruction.a, &mut state.rng); },
-            2 => { new_instruction.b = random_mutate_field_element(new_instruction.b, &mut state.rng); },
-            3 => { new_instruction.c = random_mutate_field_element(new_instruction.c, &mut state.rng); },
-            4 => { new_instruction.d = random_mutate_field_element(new_instruction.d, &mut state.rng); },
-            5 => { new_instruction.e = random_mutate_field_element(new_instruction.e, &mut state.rng); },
-            6 => { new_instruction.f = random_mutate_field_element(new_instruction.f, &mut state.rng); },
-            7 => { new_instruction.g = random_mutate_field_element(new_instruction.g, &mut state.rng); },
+            1 => { new_instruction.a = random_mutate_field_element(new_instruction.a, &mut *rng); },
+            2 => { new_instruction.b = random_mutate_field_element(new_instruction.b, &mut *rng); },
+            3 => { new_instruction.c = random_mutate_field_element(new_instruction.c, &mut *rng); },
+            4 => { new_instruction.d = random_mutate_field_element(new_instruction.d, &mut *rng); },
+            5 => { new_instruction.e = random_mutate_field_element(new_instruction.e, &mut *rng); },
+            6 => { new_instruction.f = random_mutate_field_element(new_instruction.f, &mut *rng); },
+            7 => { new_instruction.g = random_mutate_field_element(new_instruction.g, &mut *rng); },
             _ => unreachable!(),
         };
     }
@@ -539,7 +562,9 @@ pub fn random_mutate_instruction<F: Field + PrimeField32>(instruction: &Instruct
     new_instruction
 }
 
-""",  # noqa: E501
+"""  # noqa: E501
+        + trace_channel_definitions(InstrKind)
+        + step_bound_definitions(),
     )
 
 
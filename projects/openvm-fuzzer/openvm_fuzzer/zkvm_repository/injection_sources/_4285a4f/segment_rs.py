@@ -248,7 +248,11 @@ impl<F: PrimeField32, VC: VmConfig<F>> ExecutionSegment<F, VC> {
 
                 // update global state
                 let instruction_debug = func_opcode_to_name(opcode);
-                let assembly_debug = format!("{:?}", instruction);
+                let assembly_debug = if fuzzer_utils::is_assembly_hint_needed(pc) {
+                    format!("{:?}", instruction)
+                } else {
+                    String::new()
+                };
                 fuzzer_utils::update_hints(pc, &instruction_debug, &assembly_debug);
 
                 if fuzzer_utils::is_injection_at_step("INSTR_WORD_MOD") {
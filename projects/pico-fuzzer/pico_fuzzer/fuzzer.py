@@ -115,41 +115,51 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
             create_circuit_config(no_inline_assembly),
         )
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.is_fault_injection,
             self.is_trace_collection,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
-    def build_project(self) -> list[ExecStatus]:
-        built_app = (
+    def create_build_cmds(self) -> list[CargoCmd]:
+        build_app = (
             CargoCmd.build()
             .with_sub_cli("pico")
             .with_cd(self.project_dir / "app")
             .with_timeout(self.fuzzer_config.build_timeout)
-            .execute()
         )
-        built_prover = (
+        build_prover = (
             CargoCmd.build()
             .with_cd(self.project_dir / "prover")
             .with_timeout(self.fuzzer_config.build_timeout)
             .in_release()
-            .execute()
+            .with_message_format_json()
         )
-        return [built_app, built_prover]
+        return [build_app, build_prover]
+
+    def get_build_artifacts(self) -> list[Path]:
+        # NOTE: the prover loads the guest ELF built by `cargo pico build` at runtime
+        return [self.get_guest_elf()]
+
+    def get_guest_elf(self) -> Path:
+        return Path("app") / "elf" / "riscv32im-pico-zkvm-elf"
+
+    def is_guest_elf_loaded_by_host(self) -> bool:
+        return True
 
-    def execute_project(self, arguments: list[str]):
+    def create_execution_cmd(self, arguments: list[str], timeout: float | None = None):
         return (
             CargoCmd.run()
             .with_cd(self.project_dir / "prover")
+            .with_executable(self.host_executable)
             .with_args(arguments)
-            .with_timeout(self.fuzzer_config.execution_timeout)
+            .with_timeout(timeout or self.fuzzer_config.execution_timeout)
             .in_release()
-            .with_explicit_clean_zombies()
-            .execute()
         )
 
     def is_skip_fault_injection_inspection(
@@ -5,11 +5,20 @@ from circil.ir.node import Circuit
 from pico_fuzzer.settings import (
     RUST_GUEST_CORRECT_VALUE,
 )
-from zkvm_fuzzer_utils.file import create_file
 from zkvm_fuzzer_utils.project import AbstractCircuitProjectGenerator
 from zkvm_fuzzer_utils.rust.common import (
     ir_type_to_str,
+    stream_batch_main_routine,
     stream_circuit_output_and_compare_routine,
+    stream_session_end,
+    stream_session_run_routine,
+    stream_step_bound_fields,
+    stream_step_bound_setup,
+    stream_trace_fields,
+    stream_trace_setup,
+    stream_typed_inputs_definitions,
+    stream_typed_inputs_fields,
+    stream_typed_inputs_writes,
 )
 from zkvm_fuzzer_utils.rust.ir2rust import CircIL2UnsafeRustEmitter
 
@@ -34,7 +43,7 @@ class CircuitProjectGenerator(AbstractCircuitProjectGenerator):
         self.create_lib_lib_rs()
 
     def create_lib_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "lib" / "Cargo.toml",
             """[package]
 name = "lib"
@@ -44,7 +53,7 @@ edition = "2024"
         )
 
     def create_lib_lib_rs(self):
-        create_file(
+        self.create_file(
             self.root / "lib" / "src" / "lib.rs",
             """use std::fs;
 pub fn load_elf(path: &str) -> Vec<u8> {
@@ -56,7 +65,7 @@ pub fn load_elf(path: &str) -> Vec<u8> {
         )
 
     def create_app_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "app" / "Cargo.toml",
             f"""[package]
 name = "pico-circuit"
@@ -114,7 +123,7 @@ pub fn main() {
 
         buffer.write("}")
 
-        create_file(
+        self.create_file(
             self.root / "app" / "src" / "main.rs",
             buffer.getvalue(),
         )
@@ -131,13 +140,14 @@ edition = "2024"
 pico-sdk = {{ path = "{self.zkvm_path}/sdk/sdk" }}
 lib = {{ path = "../lib" }}
 clap = {{ version = "4.0", features = ["derive", "env"] }}
+rayon = "1"
 """
         )
 
         if self.requires_fuzzer_utils:
             buffer.write(f'fuzzer_utils = {{ path = "{self.zkvm_path}/fuzzer_utils" }}\n')
 
-        create_file(
+        self.create_file(
             self.root / "prover" / "Cargo.toml",
             buffer.getvalue(),
         )
@@ -154,16 +164,25 @@ use pico_sdk::{client::DefaultProverClient, init_logger};
 use clap::Parser;
 use std::time::Instant;
 
-#[derive(Parser, Debug)]
+"""
+        )
+        stream_typed_inputs_definitions(buffer)
+        buffer.write(
+            """#[derive(Parser, Debug)]
 #[clap(author, version, about, long_about = None)]
 struct Args {
-        """
+    #[clap(long)]
+    elf: String,
+
+"""
         )
+        stream_typed_inputs_fields(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_fields(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    #[clap(long)]\n")
-            buffer.write("    trace: bool,\n")
-            buffer.write("\n")
+            stream_trace_fields(buffer)
 
         if self.is_fault_injection:
             buffer.write('    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]\n')
@@ -179,25 +198,31 @@ struct Args {
             buffer.write("    #[clap(long)]\n")
             buffer.write("    inject_kind: Option<String>,\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write("\n")
-            buffer.write("    #[clap(long)]\n")
-            buffer.write(f"    {e.name}: {ir_type_to_str(e.ty_hint)},\n")
-
         buffer.write(
             """
 }
 
-fn main() {
-    // Initialize logger
-    init_logger();
+"""
+        )
+        stream_batch_main_routine(
+            buffer, ["// Initialize logger", "init_logger();"], self.requires_fuzzer_utils
+        )
 
-    let args = Args::parse();
+        buffer.write(
+            """    // NOTE: The guest ELF is only known per execution, so its client is set up by
+    //       the first execution and reused until the ELF changes. The children of a fork
+    //       server do not share it and set it up on their own.
+    let clients: std::cell::RefCell<Option<(String, DefaultProverClient)>> =
+        std::cell::RefCell::new(None);
 """
         )
+        stream_session_run_routine(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_setup(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
+            stream_trace_setup(buffer)
 
         if self.is_fault_injection:
             buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
@@ -208,46 +233,42 @@ fn main() {
             buffer.write("        fuzzer_utils::disable_assertions();\n")
             buffer.write("    } else {\n")
             buffer.write("        fuzzer_utils::enable_assertions();\n")
-            buffer.write("    }\n")
+            buffer.write("    }\n\n")
 
         buffer.write(
-            """
-    println!(
-        "<record>{{\\
-            \\"context\\":\\"Setup\\", \\
-            \\"status\\":\\"start\\"\\
-        }}</record>"
-    );
-    let timer = Instant::now();
-
-    // Load the ELF file
-    let elf = load_elf("../app/elf/riscv32im-pico-zkvm-elf");
-
-    // Initialize the prover client
-    let client = DefaultProverClient::new(&elf);
-    let mut stdin_builder = client.new_stdin_builder();
+            """    if clients.borrow().as_ref().map_or(true, |(elf, _)| elf != &args.elf) {
+        println!(
+            "<record>{{\\
+                \\"context\\":\\"Setup\\", \\
+                \\"status\\":\\"start\\"\\
+            }}</record>"
+        );
+        let timer = Instant::now();
+
+        // Load the ELF file and initialize the prover client
+        let client = DefaultProverClient::new(&load_elf(&args.elf));
+        *clients.borrow_mut() = Some((args.elf.clone(), client));
+
+        println!(
+            "<record>{{\\
+                \\"context\\":\\"Setup\\", \\
+                \\"status\\":\\"success\\", \\
+                \\"time\\":\\"{:.2?}\\"\\
+            }}</record>",
+            timer.elapsed()
+        );
+    }
+    let clients = clients.borrow();
+    let (_, client) = clients.as_ref().expect("missing prover client");
 
     // Set up input and generate proof
+    let mut stdin_builder = client.new_stdin_builder();
 """
         )
-
-        for circuit in self.circuits:
-            buffer.write(f"    // -- {circuit.name} --\n")
-            for e in self.circuit_candidate.inputs:
-                buffer.write(f"    stdin_builder.write(&args.{e.name});\n")
-            buffer.write("\n")
+        stream_typed_inputs_writes(buffer, "stdin_builder.write(&value);")
 
         buffer.write(
             """
-    println!(
-        "<record>{{\\
-            \\"context\\":\\"Setup\\", \\
-            \\"status\\":\\"success\\", \\
-            \\"time\\":\\"{:.2?}\\"\\
-        }}</record>",
-        timer.elapsed()
-    );
-
     println!(
         "<record>{{\\
             \\"context\\":\\"Prover & Verifier\\", \\
@@ -278,11 +299,11 @@ fn main() {
 
     // Verification IF long prove is enabled
     // client.verify(&(riscv_proof, embed_proof)).expect("verify");
-}
 """
         )
+        stream_session_end(buffer)
 
-        create_file(
+        self.create_file(
             self.root / "prover" / "src" / "main.rs",
             buffer.getvalue(),
         )
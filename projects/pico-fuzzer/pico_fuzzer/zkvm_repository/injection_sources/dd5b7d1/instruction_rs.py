@@ -146,7 +146,11 @@ impl RiscvEmulator {
 
         // update global state
         let instruction_debug = format!("{:?}", instruction.opcode);
-        let assembly_debug = format!("{:?}", instruction);
+        let assembly_debug = if fuzzer_utils::is_assembly_hint_needed(self.state.pc) {
+            format!("{:?}", instruction)
+        } else {
+            String::new()
+        };
         fuzzer_utils::update_hints(self.state.pc, &instruction_debug, &assembly_debug);
 
         if fuzzer_utils::is_injection_at_step("INSTR_WORD_MOD") {
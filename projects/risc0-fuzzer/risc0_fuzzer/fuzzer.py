@@ -1,4 +1,5 @@
 import logging
+import re
 from pathlib import Path
 from random import Random
 
@@ -33,7 +34,9 @@ from zkvm_fuzzer_utils.fuzzer import (
     FuzzerConfig,
 )
 from zkvm_fuzzer_utils.injection import InjectionArguments
+from zkvm_fuzzer_utils.output import OutputParser
 from zkvm_fuzzer_utils.rust.cargo import CargoCmd
+from zkvm_fuzzer_utils.stream import STDERR, AbortPredicate, OutputPattern
 from zkvm_fuzzer_utils.trace import Trace
 
 logger = logging.getLogger("fuzzer")
@@ -114,8 +117,14 @@ def create_checker_config() -> CheckerConfig:
 # ---------------------------------------------------------------------------- #
 
 
+GUEST_DIVISION_BY_ZERO_MESSAGE = "Guest panicked: attempt to divide by zero"
+GUEST_MODULO_BY_ZERO_MESSAGE = (
+    "Guest panicked: attempt to calculate the remainder with a divisor of zero"
+)
+
+
 def guest_division_by_zero(status: ExecStatus) -> bool:
-    if "Guest panicked: attempt to divide by zero" in status.stderr:
+    if GUEST_DIVISION_BY_ZERO_MESSAGE in status.stderr:
         return True
     return False
 
@@ -124,11 +133,25 @@ def guest_division_by_zero(status: ExecStatus) -> bool:
 
 
 def guest_modulo_by_zero(status: ExecStatus) -> bool:
-    if "Guest panicked: attempt to calculate the remainder with a divisor of zero" in status.stderr:
+    if GUEST_MODULO_BY_ZERO_MESSAGE in status.stderr:
         return True
     return False
 
 
+# ---------------------------------------------------------------------------- #
+
+
+def guest_division_or_modulo_by_zero_predicates() -> list[AbortPredicate]:
+    """Abort predicates for the ignored errors of `guest_division_by_zero` and
+    `guest_modulo_by_zero`"""
+    return [
+        OutputPattern(
+            "guest division by zero", [re.escape(GUEST_DIVISION_BY_ZERO_MESSAGE)], STDERR
+        ),
+        OutputPattern("guest modulo by zero", [re.escape(GUEST_MODULO_BY_ZERO_MESSAGE)], STDERR),
+    ]
+
+
 # ---------------------------------------------------------------------------- #
 #                                    Fuzzer                                    #
 # ---------------------------------------------------------------------------- #
@@ -151,35 +174,47 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
             create_circuit_config(no_inline_assembly),
         )
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.is_fault_injection,
             self.is_trace_collection,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
-    def execute_project(self, arguments: list[str]):
+    def create_execution_cmd(self, arguments: list[str], timeout: float | None = None):
         return (
             CargoCmd.run()
             .with_cd(self.project_dir)
+            .with_executable(self.host_executable)
             .with_args(arguments)
             .with_env({"RISC0_PROVER": f"{RISC0_PROVER}"})
-            .with_timeout(self.fuzzer_config.execution_timeout)
+            .with_timeout(timeout or self.fuzzer_config.execution_timeout)
             .in_release()
-            .with_explicit_clean_zombies()
-            .execute()
         )
 
+    def get_target_guest_elf(self) -> str:
+        # NOTE: the build script of the methods compiles the guest with `risc0_build`
+        return "riscv-guest/**/riscv32im-risc0-zkvm-elf/release/risc0-guest"
+
     def is_skip_fault_injection_inspection(
         self, trace: Trace, arguments: InjectionArguments[InjectionKind]
     ) -> bool:
         return False
 
+    def create_abort_predicates(self, output_parser: OutputParser) -> list[AbortPredicate]:
+        return guest_division_or_modulo_by_zero_predicates()
+
     def is_ignored_execution_error(self, exec_status: ExecStatus) -> bool:
         return guest_division_by_zero(exec_status) or guest_modulo_by_zero(exec_status)
 
+    def is_binary_trace_supported(self) -> bool:
+        # NOTE: every commit injects an executor that writes trace records
+        return True
+
 
 # ---------------------------------------------------------------------------- #
 #                                    Checker                                   #
@@ -206,24 +241,26 @@ class CircuitChecker(CircuitCheckerBase[InstrKind, InjectionKind]):
         )
         self.commit_or_branch = commit_or_branch
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.active_finding.is_injection,
             "--trace" in self.active_finding.input_flags,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
 
     def execute_project(self, arguments: list[str]):
         return (
             CargoCmd.run()
             .with_cd(self.project_dir)
+            .with_executable(self.host_executable)
             .with_args(arguments)
             .with_env({"RISC0_PROVER": f"{RISC0_PROVER}"})
             .with_timeout(self.checker_config.execution_timeout)
             .in_release()
-            .with_explicit_clean_zombies()
             .execute()
         )
 
@@ -7,11 +7,20 @@ from risc0_fuzzer.settings import (
     RUST_GUEST_RETURN_TYPE,
     RUST_TOOLCHAIN_VERSION,
 )
-from zkvm_fuzzer_utils.file import create_file
 from zkvm_fuzzer_utils.project import AbstractCircuitProjectGenerator
 from zkvm_fuzzer_utils.rust.common import (
     ir_type_to_str,
+    stream_batch_main_routine,
     stream_circuit_output_and_compare_routine,
+    stream_session_end,
+    stream_session_run_routine,
+    stream_step_bound_fields,
+    stream_step_bound_setup,
+    stream_trace_fields,
+    stream_trace_setup,
+    stream_typed_inputs_definitions,
+    stream_typed_inputs_fields,
+    stream_typed_inputs_writes,
 )
 from zkvm_fuzzer_utils.rust.ir2rust import CircIL2UnsafeRustEmitter
 
@@ -39,7 +48,7 @@ class CircuitProjectGenerator(AbstractCircuitProjectGenerator):
         self.create_guest_main_rs()
 
     def create_root_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "Cargo.toml",
             """[workspace]
 members = [
@@ -54,7 +63,7 @@ resolver = "2"
         )
 
     def create_root_rust_toolchain(self):
-        create_file(
+        self.create_file(
             self.root / "rust-toolchain.toml",
             f"""[toolchain]
 channel = "{RUST_TOOLCHAIN_VERSION}"
@@ -77,6 +86,7 @@ risc0-methods = {{ path = "../methods" }}
 risc0-zkvm = {{ path = "{self.zkvm_path}/risc0/zkvm" }}
 tracing-subscriber = {{ version = "0.3", features = ["env-filter"] }}
 clap = {{ version = "4.0", features = ["derive", "env"] }}
+rayon = "1"
 """
         )
 
@@ -92,7 +102,7 @@ prove = ["risc0-zkvm/prove"]
 # heap-embedded-alloc = ["risc0-zkvm-platform/heap-embedded-alloc"]
 """
         )
-        create_file(self.root / "host" / "Cargo.toml", buffer.getvalue())
+        self.create_file(self.root / "host" / "Cargo.toml", buffer.getvalue())
 
     def create_host_main_rs(self):
         buffer = io.StringIO()
@@ -108,16 +118,22 @@ use risc0_zkvm::{default_prover, ExecutorEnv, ProverOpts};
 use std::time::Instant;
 use clap::Parser;
 
-#[derive(Parser, Debug)]
+"""
+        )
+        stream_typed_inputs_definitions(buffer)
+        buffer.write(
+            """#[derive(Parser, Debug)]
 #[clap(author, version, about, long_about = None)]
 struct Args {
-        """
+"""
         )
+        stream_typed_inputs_fields(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_fields(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    #[clap(long)]\n")
-            buffer.write("    trace: bool,\n")
-            buffer.write("\n")
+            stream_trace_fields(buffer)
 
         if self.is_fault_injection:
             buffer.write('    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]\n')
@@ -133,25 +149,31 @@ struct Args {
             buffer.write("    #[clap(long)]\n")
             buffer.write("    inject_kind: Option<String>,\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write("\n")
-            buffer.write("    #[clap(long)]\n")
-            buffer.write(f"    {e.name}: {ir_type_to_str(e.ty_hint)},\n")
-
         buffer.write(
             """}
 
-fn main() {
-    tracing_subscriber::fmt()
-        .with_env_filter(tracing_subscriber::filter::EnvFilter::from_default_env())
-        .init();
-
-    let args = Args::parse();
 """
         )
+        stream_batch_main_routine(
+            buffer,
+            [
+                "tracing_subscriber::fmt()",
+                "    .with_env_filter(tracing_subscriber::filter::EnvFilter::from_default_env())",
+                "    .init();",
+            ],
+            self.requires_fuzzer_utils,
+        )
+
+        # NOTE: the guest image is embedded in the host, leaving nothing to set up per session.
+        #       The default prover is not Send and is therefore created per execution.
+        buffer.write("    // == Session ==\n")
+        stream_session_run_routine(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_setup(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
+            stream_trace_setup(buffer)
 
         if self.is_fault_injection:
             buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
@@ -164,10 +186,6 @@ fn main() {
             buffer.write("        fuzzer_utils::enable_assertions();\n")
             buffer.write("    }\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            param_type = ir_type_to_str(e.ty_hint)
-            buffer.write(f"    let {e.name}: {param_type} = args.{e.name};\n")
-
         buffer.write(
             """
     // == Setup ==
@@ -179,16 +197,12 @@ fn main() {
         }}</record>"
     );
     let timer = Instant::now();
-    let executor_env = match ExecutorEnv::builder()
+    let mut executor_env_builder = ExecutorEnv::builder();
 """
         )
-        for circuit in self.circuits:
-            buffer.write(f"        // -- {circuit.name} --\n")
-            for e in self.circuit_candidate.inputs:
-                buffer.write(f"        .write(&{e.name}).unwrap()\n")
-            buffer.write("\n")
+        stream_typed_inputs_writes(buffer, "executor_env_builder.write(&value).unwrap();")
         buffer.write(
-            f"""        .build() {{
+            f"""    let executor_env = match executor_env_builder.build() {{
             Ok(executor_env) => {{
                 println!(
                     "<record>{{{{\\
@@ -326,14 +340,14 @@ fn main() {
             panic!("{}", error);
         }
     }
-}
 """
         )
+        stream_session_end(buffer)
 
-        create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
 
     def create_methods_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "methods" / "Cargo.toml",
             f"""[package]
 name = "risc0-methods"
@@ -349,7 +363,7 @@ methods = ["guest"]
         )
 
     def create_methods_build_rs(self):
-        create_file(
+        self.create_file(
             self.root / "methods" / "build.rs",
             """fn main() {
     risc0_build::embed_methods();
@@ -358,14 +372,14 @@ methods = ["guest"]
         )
 
     def create_methods_lib_rs(self):
-        create_file(
+        self.create_file(
             self.root / "methods" / "src" / "lib.rs",
             """include!(concat!(env!("OUT_DIR"), "/methods.rs"));
 """,
         )
 
     def create_guest_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "methods" / "guest" / "Cargo.toml",
             f"""[package]
 name = "risc0-guest"
@@ -416,4 +430,4 @@ fn main() {
 
         buffer.write("}\n")
 
-        create_file(self.root / "methods" / "guest" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "methods" / "guest" / "src" / "main.rs", buffer.getvalue())
@@ -1,7 +1,12 @@
 from pathlib import Path
 
+from risc0_fuzzer.kinds import InstrKind
 from risc0_fuzzer.settings import GLOBAL_FAULT_INJECTION_ENV_KEY
 from zkvm_fuzzer_utils.file import create_file
+from zkvm_fuzzer_utils.rust.common import (
+    step_bound_definitions,
+    trace_channel_definitions,
+)
 
 
 def create_fuzzer_utils_crate(root: Path):
@@ -18,7 +23,6 @@ version = "1.0.0"
 edition = "2021"
 
 [dependencies]
-lazy_static = "1.4"
 """,
     )
 
@@ -26,8 +30,9 @@ lazy_static = "1.4"
 def create_lib_rs(root: Path):
     create_file(
         root / "fuzzer_utils" / "src" / "lib.rs",
-        '''use std::sync::Mutex;
-use lazy_static::lazy_static;
+        '''use std::cell::RefCell;
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::RwLock;
 
 use std::env;
 
@@ -35,48 +40,50 @@ use std::env;
 // GLOBAL STATE
 /////////
 
-#[derive(Debug, Clone)]
-pub struct GlobalState {
-    pub trace_logging: bool,
-    pub injection: bool,
-    pub assertions: bool,
-    pub seed: u64,
-    pub step: u64,
-    pub injection_kind: String,
-    pub injection_step: u64,
-    pub hint_instruction: String,  // the default is an empty string
-    pub hint_assembly: String,  // the default is an empty string
-    pub hint_pc: u32,  // the default is an empty string
-}
-
-impl GlobalState {
-    fn new() -> Self {
-        Self {
-            trace_logging: false,
-            injection: false,
-            assertions: true,
-            seed: 0,
-            injection_kind: String::new(),
-            step: 0,
-            injection_step: 0,
-            hint_instruction: String::new(),
-            hint_assembly: String::new(),
-            hint_pc: 0,
-        }
-    }
+// NOTE: the step hooks run for every executed instruction, so the configuration and the
+//       step counter are atomics and the hints of the current step are kept in a thread
+//       local buffer. Only the injection kind is behind a lock.
+
+static TRACE_LOGGING: AtomicBool = AtomicBool::new(false);
+static INJECTION: AtomicBool = AtomicBool::new(false);
+static ASSERTIONS: AtomicBool = AtomicBool::new(true);
+static SEED: AtomicU64 = AtomicU64::new(0);
+static STEP: AtomicU64 = AtomicU64::new(0);
+static INJECTION_STEP: AtomicU64 = AtomicU64::new(0);
+static INJECTION_KIND: RwLock<String> = RwLock::new(String::new());
+
+/// Hints of the current step, the strings are overwritten in place to reuse their buffers.
+struct StepHints {
+    pc: u32,
+    instruction: String,  // the default is an empty string
+    assembly: String,  // the default is an empty string
+}
+
+thread_local! {
+    static HINTS: RefCell<StepHints> = const {
+        RefCell::new(StepHints { pc: 0, instruction: String::new(), assembly: String::new() })
+    };
 }
 
-lazy_static! {
-    static ref GLOBAL_STATE: Mutex<GlobalState> = Mutex::new(GlobalState::new());
+/// Restores the initial state, used between executions of a batched host.
+pub fn reset_state() {
+    set_trace_logging(false);
+    set_injection(false);
+    set_assertions(true);
+    set_seed(0);
+    STEP.store(0, Ordering::Relaxed);
+    set_injection_step(0);
+    set_injection_kind(String::new());
+    update_hints(0, "", "");
+    reset_step_bound();
 }
 
 pub fn is_trace_logging() -> bool {
-    GLOBAL_STATE.lock().unwrap().trace_logging
+    TRACE_LOGGING.load(Ordering::Relaxed)
 }
 
 pub fn set_trace_logging(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.trace_logging = value;
+    TRACE_LOGGING.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_trace_logging() {
@@ -88,12 +95,11 @@ pub fn disable_trace_logging() {
 }
 
 pub fn is_injection() -> bool {
-    GLOBAL_STATE.lock().unwrap().injection
+    INJECTION.load(Ordering::Relaxed)
 }
 
 pub fn set_injection(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection = value;
+    INJECTION.store(value, Ordering::Relaxed);
     if value {
         unsafe { env::set_var("'''
         + GLOBAL_FAULT_INJECTION_ENV_KEY
@@ -114,12 +120,11 @@ pub fn disable_injection() {
 }
 
 pub fn is_assertions() -> bool {
-    GLOBAL_STATE.lock().unwrap().assertions
+    ASSERTIONS.load(Ordering::Relaxed)
 }
 
 pub fn set_assertions(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.assertions = value;
+    ASSERTIONS.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_assertions() {
@@ -131,92 +136,88 @@ pub fn disable_assertions() {
 }
 
 pub fn set_seed(value: u64) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.seed = value;
+    SEED.store(value, Ordering::Relaxed);
 }
 
 pub fn get_seed() -> u64 {
-    GLOBAL_STATE.lock().unwrap().seed
+    SEED.load(Ordering::Relaxed)
 }
 
 pub fn is_injection_kind(value: &str) -> bool {
-    GLOBAL_STATE.lock().unwrap().injection_kind == value
+    *INJECTION_KIND.read().unwrap() == value
 }
 
 pub fn set_injection_kind(value: String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection_kind = value.clone();
+    *INJECTION_KIND.write().unwrap() = value;
 }
 
 pub fn get_injection_kind() -> String {
-    GLOBAL_STATE.lock().unwrap().injection_kind.clone()
+    INJECTION_KIND.read().unwrap().clone()
 }
 
 pub fn inc_step() {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.step += 1;
-
-    // TODO: in the future this should be either dynamic or a setting
-    if state.step > 1000000 {
-        panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-    }
+    let step = STEP.fetch_add(1, Ordering::Relaxed) + 1;
+    check_step_bound(step);
 }
 
 pub fn get_step() -> u64 {
-    GLOBAL_STATE.lock().unwrap().step
+    STEP.load(Ordering::Relaxed)
 }
 
 pub fn get_injection_step() -> u64 {
-    GLOBAL_STATE.lock().unwrap().injection_step
+    INJECTION_STEP.load(Ordering::Relaxed)
 }
 
 pub fn set_injection_step(value: u64) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection_step = value;
+    INJECTION_STEP.store(value, Ordering::Relaxed);
 }
 
 pub fn is_injection_at_step(kind: &str) -> bool {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.injection &&
-        state.step == state.injection_step &&
-        state.injection_kind == kind
+    // NOTE: the kind is only compared at the injection step
+    is_injection() && get_step() == get_injection_step() && is_injection_kind(kind)
 }
 
-pub fn set_hint_instruction(value: &String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_instruction = value.clone();
+pub fn set_hint_instruction(value: &str) {
+    HINTS.with(|hints| {
+        let instruction = &mut hints.borrow_mut().instruction;
+        instruction.clear();
+        instruction.push_str(value);
+    });
 }
 
 pub fn get_hint_instruction() -> String {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.hint_instruction.clone()
+    HINTS.with(|hints| hints.borrow().instruction.clone())
 }
 
-pub fn set_hint_assembly(value: &String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_assembly = value.clone();
+pub fn set_hint_assembly(value: &str) {
+    HINTS.with(|hints| {
+        let assembly = &mut hints.borrow_mut().assembly;
+        assembly.clear();
+        assembly.push_str(value);
+    });
 }
 
 pub fn get_hint_assembly() -> String {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.hint_assembly.clone()
+    HINTS.with(|hints| hints.borrow().assembly.clone())
 }
 
 pub fn set_hint_pc(value: u32) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_pc = value;
+    HINTS.with(|hints| hints.borrow_mut().pc = value);
 }
 
 pub fn get_hint_pc() -> u32 {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.hint_pc
+    HINTS.with(|hints| hints.borrow().pc)
 }
 
-pub fn update_hints(pc: u32, instruction: &String, assembly: &String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.hint_pc = pc;
-    state.hint_instruction = instruction.clone();
-    state.hint_assembly = assembly.clone();
+pub fn update_hints(pc: u32, instruction: &str, assembly: &str) {
+    HINTS.with(|hints| {
+        let hints = &mut *hints.borrow_mut();
+        hints.pc = pc;
+        hints.instruction.clear();
+        hints.instruction.push_str(instruction);
+        hints.assembly.clear();
+        hints.assembly.push_str(assembly);
+    });
 }
 
 ////////////////
@@ -315,30 +316,38 @@ pub fn print_injection_info(
     inject_kind: &str,
     info: &String,
 ) {
-    let state = GLOBAL_STATE.lock().unwrap();
-    if state.trace_logging {
-        println!(
-            "<fault>{{\\
-                \\"step\\":{}, \\
-                \\"pc\\":{}, \\
-                \\"instruction\\":\\"{}\\", \\
-                \\"assembly\\":\\"{}\\", \\
-                \\"kind\\":\\"{}\\", \\
-                \\"info\\":\\"{}\\"\\
-            }}</fault>",
-            state.step,
-            state.hint_pc,
-            state.hint_instruction,
-            state.hint_assembly,
-            inject_kind,
-            info,
-        );
+    if is_trace_logging() {
+        HINTS.with(|hints| {
+            let hints = hints.borrow();
+            println!(
+                "<fault>{{\\
+                    \\"step\\":{}, \\
+                    \\"pc\\":{}, \\
+                    \\"instruction\\":\\"{}\\", \\
+                    \\"assembly\\":\\"{}\\", \\
+                    \\"kind\\":\\"{}\\", \\
+                    \\"info\\":\\"{}\\"\\
+                }}</fault>",
+                get_step(),
+                hints.pc,
+                hints.instruction,
+                hints.assembly,
+                inject_kind,
+                info,
+            );
+        });
     }
 }
 
 pub fn print_trace_info() {
-    let state = GLOBAL_STATE.lock().unwrap();
-    if state.trace_logging {
+    let step = get_step();
+    if !is_trace_logging() {
+        return;
+    }
+    HINTS.with(|hints| {
+        let hints = hints.borrow();
+        // NOTE: the hints carry no instruction word to disassemble, so the step is always
+        //       printed with its assembly instead of being written to the trace channel
         println!(
             "<trace>{{\\
                 \\"step\\":{}, \\
@@ -346,12 +355,14 @@ pub fn print_trace_info() {
                 \\"instruction\\":\\"{}\\", \\
                 \\"assembly\\":\\"{}\\"\\
             }}</trace>",
-            state.step,
-            state.hint_pc,
-            state.hint_instruction,
-            state.hint_assembly,
+            step,
+            hints.pc,
+            hints.instruction,
+            hints.assembly,
         );
-    }
+    });
 }
-""",  # noqa: E501
+"""  # noqa: E501
+        + trace_channel_definitions(InstrKind)
+        + step_bound_definitions(),
     )
@@ -139,9 +139,71 @@ impl RV32IMFaultInjectionContext {
         }
     }
 
+    pub const fn insn_kind_trace_id(kind: &InsnKind) -> u16 {
+        match kind {
+            InsnKind::Add => fuzzer_utils::TRACE_INSTRUCTION_ADD,
+            InsnKind::Sub => fuzzer_utils::TRACE_INSTRUCTION_SUB,
+            InsnKind::Xor => fuzzer_utils::TRACE_INSTRUCTION_XOR,
+            InsnKind::Or => fuzzer_utils::TRACE_INSTRUCTION_OR,
+            InsnKind::And => fuzzer_utils::TRACE_INSTRUCTION_AND,
+            InsnKind::Slt => fuzzer_utils::TRACE_INSTRUCTION_SLT,
+            InsnKind::SltU => fuzzer_utils::TRACE_INSTRUCTION_SLTU,
+            InsnKind::AddI => fuzzer_utils::TRACE_INSTRUCTION_ADDI,
+            InsnKind::XorI => fuzzer_utils::TRACE_INSTRUCTION_XORI,
+            InsnKind::OrI => fuzzer_utils::TRACE_INSTRUCTION_ORI,
+            InsnKind::AndI => fuzzer_utils::TRACE_INSTRUCTION_ANDI,
+            InsnKind::SltI => fuzzer_utils::TRACE_INSTRUCTION_SLTI,
+            InsnKind::SltIU => fuzzer_utils::TRACE_INSTRUCTION_SLTIU,
+            InsnKind::Beq => fuzzer_utils::TRACE_INSTRUCTION_BEQ,
+            InsnKind::Bne => fuzzer_utils::TRACE_INSTRUCTION_BNE,
+            InsnKind::Blt => fuzzer_utils::TRACE_INSTRUCTION_BLT,
+            InsnKind::Bge => fuzzer_utils::TRACE_INSTRUCTION_BGE,
+            InsnKind::BltU => fuzzer_utils::TRACE_INSTRUCTION_BLTU,
+            InsnKind::BgeU => fuzzer_utils::TRACE_INSTRUCTION_BGEU,
+            InsnKind::Jal => fuzzer_utils::TRACE_INSTRUCTION_JAL,
+            InsnKind::JalR => fuzzer_utils::TRACE_INSTRUCTION_JALR,
+            InsnKind::Lui => fuzzer_utils::TRACE_INSTRUCTION_LUI,
+            InsnKind::Auipc => fuzzer_utils::TRACE_INSTRUCTION_AUIPC,
+            InsnKind::Sll => fuzzer_utils::TRACE_INSTRUCTION_SLL,
+            InsnKind::SllI => fuzzer_utils::TRACE_INSTRUCTION_SLLI,
+            InsnKind::Mul => fuzzer_utils::TRACE_INSTRUCTION_MUL,
+            InsnKind::MulH => fuzzer_utils::TRACE_INSTRUCTION_MULH,
+            InsnKind::MulHSU => fuzzer_utils::TRACE_INSTRUCTION_MULHSU,
+            InsnKind::MulHU => fuzzer_utils::TRACE_INSTRUCTION_MULHU,
+            InsnKind::Srl => fuzzer_utils::TRACE_INSTRUCTION_SRL,
+            InsnKind::Sra => fuzzer_utils::TRACE_INSTRUCTION_SRA,
+            InsnKind::SrlI => fuzzer_utils::TRACE_INSTRUCTION_SRLI,
+            InsnKind::SraI => fuzzer_utils::TRACE_INSTRUCTION_SRAI,
+            InsnKind::Div => fuzzer_utils::TRACE_INSTRUCTION_DIV,
+            InsnKind::DivU => fuzzer_utils::TRACE_INSTRUCTION_DIVU,
+            InsnKind::Rem => fuzzer_utils::TRACE_INSTRUCTION_REM,
+            InsnKind::RemU => fuzzer_utils::TRACE_INSTRUCTION_REMU,
+            InsnKind::Lb => fuzzer_utils::TRACE_INSTRUCTION_LB,
+            InsnKind::Lh => fuzzer_utils::TRACE_INSTRUCTION_LH,
+            InsnKind::Lw => fuzzer_utils::TRACE_INSTRUCTION_LW,
+            InsnKind::LbU => fuzzer_utils::TRACE_INSTRUCTION_LBU,
+            InsnKind::LhU => fuzzer_utils::TRACE_INSTRUCTION_LHU,
+            InsnKind::Sb => fuzzer_utils::TRACE_INSTRUCTION_SB,
+            InsnKind::Sh => fuzzer_utils::TRACE_INSTRUCTION_SH,
+            InsnKind::Sw => fuzzer_utils::TRACE_INSTRUCTION_SW,
+            InsnKind::Eany => fuzzer_utils::TRACE_INSTRUCTION_EANY,
+            InsnKind::Mret => fuzzer_utils::TRACE_INSTRUCTION_MRET,
+            InsnKind::Invalid => fuzzer_utils::TRACE_INSTRUCTION_INVALID,
+        }
+    }
+
     pub fn print_trace_info(&self, pc: ByteAddr, insn: &Instruction, decoded: &DecodedInstruction) {
         let kind = self.insn_kind_from_decoded(decoded);
-        if self.trace_info_enabled {
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(pc.0)
+            && !fuzzer_utils::write_trace_record(
+                self.current_step,
+                pc.0,
+                Self::insn_kind_trace_id(&kind),
+                decoded.insn,
+            )
+        {
             println!(
                 "<trace>{{\\"step\\":{}, \\"pc\\":{}, \\"instruction\\":\\"{:?}\\", \\"assembly\\":\\"{}\\"}}</trace>",
                 self.current_step,
@@ -164,11 +226,7 @@ impl RV32IMFaultInjectionContext {
 
     pub fn step(&mut self) {
         self.current_step += 1;
-
-        // TODO: in the future this should be either dynamic or a setting
-        if self.current_step > 1000000 {
-            panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-        }
+        fuzzer_utils::check_step_bound(self.current_step);
     }
 
     pub fn random_pc(&mut self, pc: ByteAddr) -> ByteAddr {
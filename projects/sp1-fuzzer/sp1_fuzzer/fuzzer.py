@@ -32,6 +32,8 @@ from zkvm_fuzzer_utils.fuzzer import (
     FuzzerConfig,
 )
 from zkvm_fuzzer_utils.injection import InjectionArguments
+from zkvm_fuzzer_utils.output import OutputParser
+from zkvm_fuzzer_utils.stream import STDERR, AbortPredicate, OutputPattern
 from zkvm_fuzzer_utils.trace import Trace
 
 logger = logging.getLogger("fuzzer")
@@ -98,27 +100,50 @@ def create_fuzzer_config(only_modify_word: bool) -> FuzzerConfig:
 # ---------------------------------------------------------------------------- #
 
 
+# this pattern checks for the inserted assertion (if present)
+GUEST_ASSERTION_PATTERN = r"stderr: division-by-zero \(id: [0-9]+\)"  # arbitrary assertion id
+# this pattern checks for the error in the guest
+GUEST_ERROR_PATTERN = (
+    r"(attempt to calculate the remainder with a divisor of zero|"
+    r"attempt to divide by zero)"  # match the guest error
+)
+GUEST_PANIC_MESSAGE = "panicked at guest/src/main.rs"
+
+
 def guest_division_or_modulo_by_zero(status: ExecStatus) -> bool:
-    # this pattern checks for the inserted assertion (if present)
-    pattern = re.compile(
-        r"stderr: division-by-zero \(id: [0-9]+\)"  # match on arbitrary assertion id
-    )
+    pattern = re.compile(GUEST_ASSERTION_PATTERN)
     opt_match = pattern.search(status.stderr)
-    if opt_match and "panicked at guest/src/main.rs" in status.stderr:
+    if opt_match and GUEST_PANIC_MESSAGE in status.stderr:
         return True
 
-    # this pattern checks for the error in the guest
-    pattern = re.compile(
-        r"(attempt to calculate the remainder with a divisor of zero|"
-        r"attempt to divide by zero)"  # match the guest error
-    )
+    pattern = re.compile(GUEST_ERROR_PATTERN)
     opt_match = pattern.search(status.stderr)
-    if opt_match and "panicked at guest/src/main.rs" in status.stderr:
+    if opt_match and GUEST_PANIC_MESSAGE in status.stderr:
         return True
 
     return False
 
 
+# ---------------------------------------------------------------------------- #
+
+
+def guest_division_or_modulo_by_zero_predicates() -> list[AbortPredicate]:
+    """Abort predicates for the ignored errors of `guest_division_or_modulo_by_zero`"""
+    guest_panic_pattern = re.escape(GUEST_PANIC_MESSAGE)
+    return [
+        OutputPattern(
+            "guest division or modulo by zero assertion",
+            [GUEST_ASSERTION_PATTERN, guest_panic_pattern],
+            STDERR,
+        ),
+        OutputPattern(
+            "guest division or modulo by zero",
+            [GUEST_ERROR_PATTERN, guest_panic_pattern],
+            STDERR,
+        ),
+    ]
+
+
 # ---------------------------------------------------------------------------- #
 #                                    Fuzzer                                    #
 # ---------------------------------------------------------------------------- #
@@ -141,20 +166,32 @@ class CircuitFuzzer(CircuitFuzzerBase[InstrKind, InjectionKind]):
             create_circuit_config(no_inline_assembly),
         )
 
-    def create_project(self):
-        CircuitProjectGenerator(
+    def create_project(self) -> list[Path]:
+        generator = CircuitProjectGenerator(
             self.project_dir,
             self.zkvm_dir,
             self.circuits,
             self.is_fault_injection,
             self.is_trace_collection,
-        ).create()
+        )
+        generator.create()
+        return generator.changed_files
+
+    def is_guest_elf_loaded_by_host(self) -> bool:
+        return True
+
+    def get_target_guest_elf(self) -> str:
+        # NOTE: the build script of the builder crate compiles the guest with `sp1_build`
+        return "elf-compilation/**/release/sp1-guest"
 
     def is_skip_fault_injection_inspection(
         self, trace: Trace, arguments: InjectionArguments[InjectionKind]
     ) -> bool:
         return False
 
+    def create_abort_predicates(self, output_parser: OutputParser) -> list[AbortPredicate]:
+        return guest_division_or_modulo_by_zero_predicates()
+
     def is_ignored_execution_error(self, exec_status: ExecStatus) -> bool:
         return guest_division_or_modulo_by_zero(exec_status)
 
@@ -7,13 +7,20 @@ from sp1_fuzzer.settings import (
     RUST_GUEST_RETURN_TYPE,
     RUST_TOOLCHAIN_VERSION,
 )
-from zkvm_fuzzer_utils.file import create_file
 from zkvm_fuzzer_utils.project import AbstractCircuitProjectGenerator
 from zkvm_fuzzer_utils.rust.common import (
     ir_type_to_str,
+    stream_batch_main_routine,
     stream_circuit_output_and_compare_routine,
-    stream_list_of_names,
-    stream_list_of_typed_identifiers,
+    stream_session_end,
+    stream_session_run_routine,
+    stream_step_bound_fields,
+    stream_step_bound_setup,
+    stream_trace_fields,
+    stream_trace_setup,
+    stream_typed_inputs_definitions,
+    stream_typed_inputs_fields,
+    stream_typed_inputs_writes,
 )
 from zkvm_fuzzer_utils.rust.ir2rust import CircIL2UnsafeRustEmitter
 
@@ -32,28 +39,30 @@ class CircuitProjectGenerator(AbstractCircuitProjectGenerator):
     def create(self):
         self.create_root_cargo_toml()
         self.create_root_rust_toolchain()
-        self.create_host_build_rs()
+        self.create_builder_cargo_toml()
+        self.create_builder_build_rs()
         self.create_host_cargo_toml()
         self.create_host_main_rs()
         self.create_guest_cargo_toml()
         self.create_guest_main_rs()
 
     def create_root_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "Cargo.toml",
             """[workspace]
 members = [
     "host",
     "guest",
+    "builder",
 ]
-default-members = [ "host" ]
+default-members = [ "host", "builder" ]
 
 resolver = "2"
 """,
         )
 
     def create_root_rust_toolchain(self):
-        create_file(
+        self.create_file(
             self.root / "rust-toolchain.toml",
             f"""[toolchain]
 channel = "{RUST_TOOLCHAIN_VERSION}"
@@ -61,9 +70,26 @@ components = ["llvm-tools", "rustc-dev"]
 """,
         )
 
-    def create_host_build_rs(self):
-        create_file(
-            self.root / "host" / "build.rs",
+    def create_builder_cargo_toml(self):
+        # NOTE: the guest is compiled by the build script of an empty crate instead of the
+        #       host's, so a new bundle does not rebuild the host, which loads the ELF at runtime
+        self.create_file(
+            self.root / "builder" / "Cargo.toml",
+            f"""[package]
+version = "0.1.0"
+name = "sp1-builder"
+edition = "2021"
+
+[build-dependencies]
+sp1-build = {{ path = "{self.zkvm_path}/crates/build" }}
+""",
+        )
+        self.create_file(self.root / "builder" / "src" / "lib.rs", "")
+
+    def create_builder_build_rs(self):
+        (self.root / "host" / "build.rs").unlink(missing_ok=True)  # NOTE: of older projects
+        self.create_file(
+            self.root / "builder" / "build.rs",
             """use sp1_build::build_program_with_args;
 
 fn main() {
@@ -94,13 +120,11 @@ sp1-sdk = {{ path = "{self.zkvm_path}/crates/sdk" }}
             buffer.write(f'fuzzer_utils = {{ path = "{self.zkvm_path}/crates/fuzzer_utils" }}\n')
 
         buffer.write(
-            f"""clap = {{ version = "4.0", features = ["derive", "env"] }}
-
-[build-dependencies]
-sp1-build = {{ path = "{self.zkvm_path}/crates/build" }}
+            """clap = { version = "4.0", features = ["derive", "env"] }
+rayon = "1"
 """
         )
-        create_file(
+        self.create_file(
             self.root / "host" / "Cargo.toml",
             buffer.getvalue(),
         )
@@ -114,20 +138,28 @@ sp1-build = {{ path = "{self.zkvm_path}/crates/build" }}
         buffer.write(
             """use clap::Parser;
 use std::time::Instant;
-use sp1_sdk::{include_elf, Prover, ProverClient, SP1Stdin};
+use std::path::PathBuf;
+use sp1_sdk::{Prover, ProverClient, SP1ProvingKey, SP1Stdin, SP1VerifyingKey};
 
-pub const SP1_GUEST_ELF: &[u8] = include_elf!("sp1-guest");
-
-#[derive(Parser, Debug)]
+"""
+        )
+        stream_typed_inputs_definitions(buffer)
+        buffer.write(
+            """#[derive(Parser, Debug)]
 #[clap(author, version, about, long_about = None)]
 struct Args {
-        """
+    #[clap(long)]
+    elf: PathBuf,
+
+"""
         )
+        stream_typed_inputs_fields(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_fields(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    #[clap(long)]\n")
-            buffer.write("    trace: bool,\n")
-            buffer.write("\n")
+            stream_trace_fields(buffer)
 
         if self.is_fault_injection:
             buffer.write('    #[arg(long, requires_all=["inject_step", "inject_kind", "seed"])]\n')
@@ -143,45 +175,34 @@ struct Args {
             buffer.write("    #[clap(long)]\n")
             buffer.write("    inject_kind: Option<String>,\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write("\n")
-            buffer.write("    #[clap(long)]\n")
-            buffer.write(f"    {e.name}: {ir_type_to_str(e.ty_hint)},\n")
-
         buffer.write(
             """}
 
-fn create_sp1_stdin"""
-        )
-        stream_list_of_typed_identifiers(
-            buffer, self.circuit_candidate.inputs, always_bracketed=True
-        )
-        buffer.write(
-            """ -> SP1Stdin {
-    let mut stdin = SP1Stdin::new();
 """
         )
-
-        for circuit in self.circuits:
-            buffer.write(f"    // -- {circuit.name} --\n")
-            for e in self.circuit_candidate.inputs:
-                buffer.write("    stdin.write(&")
-                buffer.write(e.name)
-                buffer.write(");\n")
-            buffer.write("\n")
+        stream_batch_main_routine(
+            buffer, ["sp1_sdk::utils::setup_logger();"], self.requires_fuzzer_utils
+        )
 
         buffer.write(
-            """    return stdin;
-}
+            """    // == SP1 Client ==
 
-fn main() {
-    sp1_sdk::utils::setup_logger();
-    let args = Args::parse();
+    let client = ProverClient::builder().cpu().build();
+
+    // NOTE: The guest ELF is only known per execution, so its keys are set up by the first
+    //       execution and reused until the ELF changes. The children of a fork server do
+    //       not share them and set them up on their own.
+    let keys: std::cell::RefCell<Option<(PathBuf, SP1ProvingKey, SP1VerifyingKey)>> =
+        std::cell::RefCell::new(None);
 """
         )
+        stream_session_run_routine(buffer)
+
+        if self.requires_fuzzer_utils:
+            stream_step_bound_setup(buffer)
 
         if self.is_trace_collection:
-            buffer.write("    fuzzer_utils::set_trace_logging(args.trace);\n")
+            stream_trace_setup(buffer)
 
         if self.is_fault_injection:
             buffer.write("    fuzzer_utils::set_injection(args.inject);\n")
@@ -194,38 +215,42 @@ fn main() {
             buffer.write("        fuzzer_utils::enable_assertions();\n")
             buffer.write("    }\n\n")
 
-        for e in self.circuit_candidate.inputs:
-            buffer.write(f"    let {e.name} = args.{e.name};\n")
-
+        buffer.write(
+            """
+    let mut stdin = SP1Stdin::new();
+"""
+        )
+        stream_typed_inputs_writes(buffer, "stdin.write(&value);")
         buffer.write(
             """
     // == SP1 Proof Setup ==
 
-    println!(
-        "<record>{{\\
-            \\"context\\":\\"Setup\\", \\
-            \\"status\\":\\"start\\"\\
-        }}</record>"
-    );
-    let timer = Instant::now();
-    let client = ProverClient::builder().cpu().build();
-    let stdin = create_sp1_stdin"""
+    if keys.borrow().as_ref().map_or(true, |(elf, _, _)| elf != &args.elf) {
+        println!(
+            "<record>{{\\
+                \\"context\\":\\"Setup\\", \\
+                \\"status\\":\\"start\\"\\
+            }}</record>"
+        );
+        let timer = Instant::now();
+        let (pk, vk) = client.setup(&std::fs::read(&args.elf).expect("unable to read guest elf"));
+        *keys.borrow_mut() = Some((args.elf.clone(), pk, vk));
+        println!(
+            "<record>{{\\
+                \\"context\\":\\"Setup\\", \\
+                \\"status\\":\\"success\\", \\
+                \\"time\\":\\"{:.2?}\\"\\
+            }}</record>",
+            timer.elapsed()
+        );
+    }
+    let keys = keys.borrow();
+    let (_, pk, vk) = keys.as_ref().expect("missing guest keys");
+"""
         )
 
-        stream_list_of_names(buffer, self.circuit_candidate.inputs, always_bracketed=True)
-
         buffer.write(
-            f""";
-    let (pk, vk) = client.setup(SP1_GUEST_ELF);
-    println!(
-        "<record>{{{{\\
-            \\"context\\":\\"Setup\\", \\
-            \\"status\\":\\"success\\", \\
-            \\"time\\":\\"{{:.2?}}\\"\\
-        }}}}</record>",
-        timer.elapsed()
-    );
-
+            f"""
     // == SP1 Proof Generation ==
 
     println!(
@@ -235,7 +260,7 @@ fn main() {
         }}}}</record>"
     );
     let timer = Instant::now();
-    let proof = match client.prove(&pk, &stdin)
+    let proof = match client.prove(pk, &stdin)
         .shard_batch_size(1) // this should stop parallel execution
         .cycle_limit(100000) // this should never be hit in normal runs
         .deferred_proof_verification(false) // hopefully turns off some checks (DEFAULT: true)
@@ -283,7 +308,7 @@ fn main() {
         }}</record>"
     );
     let timer = Instant::now();
-    match client.verify(&proof, &vk) {
+    match client.verify(&proof, vk) {
         Ok(_) => {
             println!(
                 "<record>{{\\
@@ -306,14 +331,14 @@ fn main() {
             panic!("{}", error);
         }
     }
-}
 """
         )
+        stream_session_end(buffer)
 
-        create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "host" / "src" / "main.rs", buffer.getvalue())
 
     def create_guest_cargo_toml(self):
-        create_file(
+        self.create_file(
             self.root / "guest" / "Cargo.toml",
             f"""[package]
 version = "0.1.0"
@@ -365,4 +390,4 @@ sp1-zkvm = {{ path = "{self.zkvm_path}/crates/zkvm/entrypoint" }}
 
         buffer.write("}\n")
 
-        create_file(self.root / "guest" / "src" / "main.rs", buffer.getvalue())
+        self.create_file(self.root / "guest" / "src" / "main.rs", buffer.getvalue())
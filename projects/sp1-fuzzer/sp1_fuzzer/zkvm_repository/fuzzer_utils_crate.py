@@ -1,6 +1,11 @@
 from pathlib import Path
 
+from sp1_fuzzer.kinds import InstrKind
 from zkvm_fuzzer_utils.file import create_file
+from zkvm_fuzzer_utils.rust.common import (
+    step_bound_definitions,
+    trace_channel_definitions,
+)
 
 
 def create_cargo_toml(root: Path):
@@ -12,7 +17,6 @@ version = "1.0.0"
 edition = "2021"
 
 [dependencies]
-lazy_static = "1.4"
 """,
     )
 
@@ -20,54 +24,45 @@ lazy_static = "1.4"
 def create_lib_rs(root: Path):
     create_file(
         root / "crates" / "fuzzer_utils" / "src" / "lib.rs",
-        """use std::sync::Mutex;
-use lazy_static::lazy_static;
+        """use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::RwLock;
 
 
 ////////////////
 // GLOBAL STATE
 /////////
 
-#[derive(Debug, Clone)]
-pub struct GlobalState {
-    pub trace_logging: bool,
-    pub injection: bool,
-    pub assertions: bool,
-    pub seed: u64,
-    pub step: u64,
-    pub pc_hint: u32,
-    pub injection_kind: String,
-    pub injection_step: u64,
-    pub instruction_override: bool,
-}
-
-impl GlobalState {
-    fn new() -> Self {
-        Self {
-            trace_logging: false,
-            injection: false,
-            assertions: true,
-            seed: 0,
-            injection_kind: String::new(),
-            step: 0,
-            pc_hint: 0,
-            injection_step: 0,
-            instruction_override: false,
-        }
-    }
-}
+// NOTE: the executor reads the flags for every executed instruction, so the configuration
+//       is kept in atomics. Only the injection kind is behind a lock.
 
-lazy_static! {
-    static ref GLOBAL_STATE: Mutex<GlobalState> = Mutex::new(GlobalState::new());
+static TRACE_LOGGING: AtomicBool = AtomicBool::new(false);
+static INJECTION: AtomicBool = AtomicBool::new(false);
+static ASSERTIONS: AtomicBool = AtomicBool::new(true);
+static SEED: AtomicU64 = AtomicU64::new(0);
+static STEP: AtomicU64 = AtomicU64::new(0);
+static INJECTION_KIND: RwLock<String> = RwLock::new(String::new());
+static INJECTION_STEP: AtomicU64 = AtomicU64::new(0);
+static INSTRUCTION_OVERRIDE: AtomicBool = AtomicBool::new(false);
+
+/// Restores the initial state, used between executions of a batched host.
+pub fn reset_state() {
+    set_trace_logging(false);
+    set_injection(false);
+    set_assertions(true);
+    set_seed(0);
+    STEP.store(0, Ordering::Relaxed);
+    set_injection_kind(String::new());
+    set_injection_step(0);
+    set_instruction_override(false);
+    reset_step_bound();
 }
 
 pub fn is_trace_logging() -> bool {
-    GLOBAL_STATE.lock().unwrap().trace_logging
+    TRACE_LOGGING.load(Ordering::Relaxed)
 }
 
 pub fn set_trace_logging(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.trace_logging = value;
+    TRACE_LOGGING.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_trace_logging() {
@@ -79,12 +74,11 @@ pub fn disable_trace_logging() {
 }
 
 pub fn is_injection() -> bool {
-    GLOBAL_STATE.lock().unwrap().injection
+    INJECTION.load(Ordering::Relaxed)
 }
 
 pub fn set_injection(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection = value;
+    INJECTION.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_injection() {
@@ -96,12 +90,11 @@ pub fn disable_injection() {
 }
 
 pub fn is_assertions() -> bool {
-    GLOBAL_STATE.lock().unwrap().assertions
+    ASSERTIONS.load(Ordering::Relaxed)
 }
 
 pub fn set_assertions(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.assertions = value;
+    ASSERTIONS.store(value, Ordering::Relaxed);
 }
 
 pub fn enable_assertions() {
@@ -113,51 +106,45 @@ pub fn disable_assertions() {
 }
 
 pub fn set_seed(value: u64) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.seed = value;
+    SEED.store(value, Ordering::Relaxed);
 }
 
 pub fn get_seed() -> u64 {
-    GLOBAL_STATE.lock().unwrap().seed
+    SEED.load(Ordering::Relaxed)
 }
 
 pub fn is_injection_kind(value: &str) -> bool {
-    GLOBAL_STATE.lock().unwrap().injection_kind == value
+    *INJECTION_KIND.read().unwrap() == value
 }
 
 pub fn set_injection_kind(value: String) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection_kind = value.clone();
+    *INJECTION_KIND.write().unwrap() = value;
 }
 
 pub fn get_injection_kind() -> String {
-    GLOBAL_STATE.lock().unwrap().injection_kind.clone()
+    INJECTION_KIND.read().unwrap().clone()
 }
 
 pub fn get_step() -> u64 {
-    GLOBAL_STATE.lock().unwrap().step
+    STEP.load(Ordering::Relaxed)
 }
 
 pub fn get_injection_step() -> u64 {
-    GLOBAL_STATE.lock().unwrap().injection_step
+    INJECTION_STEP.load(Ordering::Relaxed)
 }
 
 pub fn set_injection_step(value: u64) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.injection_step = value;
+    INJECTION_STEP.store(value, Ordering::Relaxed);
 }
 
 pub fn is_instruction_override() -> bool {
-    let state = GLOBAL_STATE.lock().unwrap();
-    state.instruction_override
+    INSTRUCTION_OVERRIDE.load(Ordering::Relaxed)
 }
 
 pub fn set_instruction_override(value: bool) {
-    let mut state = GLOBAL_STATE.lock().unwrap();
-    state.instruction_override = value;
+    INSTRUCTION_OVERRIDE.store(value, Ordering::Relaxed);
 }
 
-
 ////////////////
 // CUSTOM ASSERTION MACROS
 /////////
@@ -213,7 +200,9 @@ macro_rules! fuzzer_assert_eq {
     }};
 }
 
-""",
+"""
+        + trace_channel_definitions(InstrKind)
+        + step_bound_definitions(),
     )
 
 
@@ -97,11 +97,7 @@ impl RV32IMFaultInjectionContext {
     pub fn step(&mut self, next_pc: u32) {
         self.current_step += 1;
         self.pc_hint = next_pc;
-
-        // TODO: in the future this should be either dynamic or a setting
-        if self.current_step > 1000000 {
-            panic!("Endless loop detection step bound triggered! Bound: 1000000 steps");
-        }
+        fuzzer_utils::check_step_bound(self.current_step);
     }
 
     /// get a guess what the current pc might be
@@ -178,7 +174,12 @@ impl RV32IMFaultInjectionContext {
         executor_mode: ExecutorMode,
         clk: u32,
     ) {
-        if self.trace_info_enabled {
+        // NOTE: decoded sp1 instructions have no instruction word to disassemble, so the
+        //       step is always printed with its assembly instead of the trace channel
+        if self.trace_info_enabled
+            && fuzzer_utils::is_trace_step(self.current_step)
+            && fuzzer_utils::is_trace_pc(*pc)
+        {
             println!(
                 "<trace>{{\\
                     \\"step\\":{}, \\
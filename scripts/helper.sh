@@ -152,6 +152,23 @@ run_fuzzer_with_id_and_seed() {
     [[ $ONLY_MOD_WORD == true ]] && fuzzer_flags+=(--only-modify-word)
     [[ $NO_INLINE_ASSEMBLY == true ]] && fuzzer_flags+=(--no-inline-assembly)
     [[ $NO_SCHEDULAR == true ]] && fuzzer_flags+=(--no-schedular)
+    [[ $BATCH_EXECUTION == true ]] && fuzzer_flags+=(--batch-execution)
+    [[ $SERVER_EXECUTION == true ]] && fuzzer_flags+=(--server-execution)
+    [[ $FORK_SERVER_EXECUTION == true ]] && fuzzer_flags+=(--fork-server-execution)
+    [[ $PARALLEL_EXECUTIONS =~ ^[0-9]+$ ]] && fuzzer_flags+=(--parallel-executions "$PARALLEL_EXECUTIONS")
+    [[ $MEMORY_BUDGET =~ ^[1-9][0-9]*$ ]] && fuzzer_flags+=(--memory-budget "$MEMORY_BUDGET")
+    [[ $BUILD_AHEAD == true ]] && fuzzer_flags+=(--build-ahead)
+    [[ $BINARY_TRACE == true ]] && fuzzer_flags+=(--binary-trace)
+    [[ $TRACE_SUFFIX =~ ^[0-9]+$ ]] && fuzzer_flags+=(--trace-suffix "$TRACE_SUFFIX")
+    [[ $TRACE_CIRCUITS_ONLY == true ]] && fuzzer_flags+=(--trace-circuits-only)
+    [[ -n $INJECTION_SAMPLING ]] && fuzzer_flags+=(--injection-sampling "$INJECTION_SAMPLING")
+    [[ $INJECTIONS_PER_TRACE =~ ^[1-9][0-9]*$ ]] && fuzzer_flags+=(--injections-per-trace "$INJECTIONS_PER_TRACE")
+    [[ $STEP_BOUND =~ ^[1-9][0-9]*$ ]] && fuzzer_flags+=(--step-bound "$STEP_BOUND")
+    [[ -n $STEP_OVERFLOW ]] && fuzzer_flags+=(--step-overflow "$STEP_OVERFLOW")
+    [[ -n $CGROUP_ROOT ]] && fuzzer_flags+=(--cgroup-root "$CGROUP_ROOT")
+    [[ -n $CGROUP_CPUS ]] && fuzzer_flags+=(--cgroup-cpus "$CGROUP_CPUS")
+    [[ -n $BUILD_CACHE ]] && fuzzer_flags+=(--build-cache "$BUILD_CACHE" --build-cache-quota "$BUILD_CACHE_QUOTA")
+    [[ -n $SHARED_TARGET_DIR ]] && fuzzer_flags+=(--shared-target-dir "$SHARED_TARGET_DIR")
 
     echo "start $ZKVM_NAME-$NAME_TAG-$1 fuzzer with seed: $2"
     podman run "${podman_flags[@]}" "$ZKVM_NAME-fuzzer" run "${fuzzer_flags[@]}"
@@ -216,6 +233,8 @@ check() {
         [[ $FAULT_INJECTION == true ]] && fuzzer_flags+=(--fault-injection)
         [[ $ONLY_MOD_WORD == true ]] && fuzzer_flags+=(--only-modify-word)
         [[ $NO_INLINE_ASSEMBLY == true ]] && fuzzer_flags+=(--no-inline-assembly)
+        [[ -n $BUILD_CACHE ]] && fuzzer_flags+=(--build-cache "$BUILD_CACHE" --build-cache-quota "$BUILD_CACHE_QUOTA")
+        [[ -n $SHARED_TARGET_DIR ]] && fuzzer_flags+=(--shared-target-dir "$SHARED_TARGET_DIR")
 
         podman run "${podman_flags[@]}" "$ZKVM_NAME-fuzzer" check "/root/workspace/findings.csv" "${fuzzer_flags[@]}"
     else